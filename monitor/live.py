@@ -0,0 +1,172 @@
+"""실시간 피드 (SSE / WebSocket)
+
+대시보드가 /stats, /pending을 polling하지 않도록 서버 측 생산자 하나가
+변경 사항을 모든 연결에 fan-out한다. 연결 수와 무관하게 DB 부하는 대시보드 하나와 같다.
+
+이벤트:
+- snapshot: 연결 직후 현재 통계 전체
+- render: 렌더 지시서 상태 전환 (render_status NOTIFY, DB 조회 없음)
+- queue: 상태별 작업 수 (전환 이벤트로 즉시 조정, 통계 갱신 시 DB 값으로 보정)
+- stats: 통계 중 바뀐 항목만 (StatsCache, interval마다)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional, Protocol
+
+from monitor.stats import StatsCache
+from shared.feed import Broadcaster, Subscription
+from shared.metrics import observe_render_transition
+
+logger = logging.getLogger(__name__)
+
+# stats 이벤트 비교에서 제외하는 항목 (매번 바뀜)
+_VOLATILE_KEYS = ("timestamp",)
+
+
+class _Listener(Protocol):
+    async def wait(self, timeout: Optional[float] = None) -> list[dict[str, Any]]: ...
+
+
+def stats_delta(previous: Optional[dict[str, Any]], current: dict[str, Any]) -> dict[str, Any]:
+    """바뀐 최상위 항목만 (previous가 없으면 전체)"""
+    if previous is None:
+        return {k: v for k, v in current.items() if k not in _VOLATILE_KEYS}
+    return {
+        key: value
+        for key, value in current.items()
+        if key not in _VOLATILE_KEYS and previous.get(key) != value
+    }
+
+
+def format_sse(message: dict[str, Any]) -> str:
+    """SSE 프레임 (event: ... / data: ...)"""
+    data = json.dumps(message["data"], ensure_ascii=False, default=str)
+    return f"event: {message['event']}\ndata: {data}\n\n"
+
+
+class LiveFeed:
+    """실시간 이벤트 생산자 (프로세스당 하나)
+
+    Args:
+        stats_cache: /stats와 공유하는 통계 캐시 (같은 집계를 재사용)
+        interval: 통계 갱신 주기 (초, 구독자가 없으면 갱신하지 않음)
+        subscriber_queue_size: 연결별 큐 크기 (느린 연결은 오래된 이벤트부터 버림)
+    """
+
+    def __init__(
+        self,
+        stats_cache: StatsCache,
+        interval: float = 2.0,
+        subscriber_queue_size: int = 256,
+    ) -> None:
+        self.stats_cache = stats_cache
+        self.interval = interval
+        self._broadcaster: Broadcaster[dict[str, Any]] = Broadcaster(subscriber_queue_size)
+        self._stats: Optional[dict[str, Any]] = None
+        self._queue: dict[str, int] = {}
+        self._refreshed_at = 0.0  # time.monotonic()
+        self._task: Optional[asyncio.Task[None]] = None
+
+        # 통계 (피드 상태 확인용)
+        self.published = 0
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._broadcaster)
+
+    def subscribe(self) -> Subscription[dict[str, Any]]:
+        """이벤트 구독 (snapshot()을 먼저 보낸 뒤 구독 항목 전달)"""
+        return self._broadcaster.subscribe()
+
+    async def snapshot(self) -> dict[str, Any]:
+        """연결 직후 보낼 현재 상태 (DB 장애 시 있는 값만)"""
+        if self._stats is None:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("live feed snapshot failed: %s", e)
+        return {"event": "snapshot", "data": {**(self._stats or {}), "queue": dict(self._queue)}}
+
+    def _publish(self, event: str, data: Any) -> None:
+        self.published += 1
+        self._broadcaster.publish({"event": event, "data": data})
+
+    # ========================================
+    # 생산자
+    # ========================================
+
+    def apply_transition(self, payload: dict[str, Any]) -> None:
+        """render_status 알림 반영 → render / queue 이벤트 (+ 전환 / 대기 / 렌더 시간 메트릭)"""
+        status = payload.get("status")
+        if status is None:
+            return
+        observe_render_transition(payload)
+        previous = payload.get("previous_status")
+        if previous is not None and self._queue.get(previous, 0) > 0:
+            self._queue[previous] -= 1
+        self._queue[status] = self._queue.get(status, 0) + 1
+
+        self._publish("render", payload)
+        self._publish("queue", dict(self._queue))
+
+    async def refresh(self) -> None:
+        """통계 갱신 → stats (바뀐 항목) / queue (DB 값으로 보정) 이벤트"""
+        stats, _ = await self.stats_cache.get()
+        self._refreshed_at = time.monotonic()
+
+        # 첫 갱신은 snapshot으로 전달되므로 이벤트를 보내지 않음
+        first = self._stats is None
+        delta = stats_delta(self._stats, stats)
+        self._stats = stats
+        if delta and not first:
+            self._publish("stats", delta)
+
+        queue = dict(stats.get("render_instructions") or {})
+        if queue != self._queue:
+            self._queue = queue
+            if not first:
+                self._publish("queue", dict(queue))
+
+    async def run(self, listener: _Listener) -> None:
+        """생산 루프 (취소될 때까지)
+
+        상태 전환 알림은 바로 전달하고, 구독자가 있을 때만 interval마다 통계를 갱신한다.
+        """
+        while True:
+            events = await listener.wait(timeout=self.interval)
+            for event in events:
+                self.apply_transition(event)
+
+            due = time.monotonic() - self._refreshed_at >= self.interval
+            if due and self.subscribers:
+                try:
+                    await self.refresh()
+                except Exception as e:  # DB 장애 시에도 피드 유지 (다음 주기 재시도)
+                    logger.warning("live feed stats refresh failed: %s", e)
+                    self._refreshed_at = time.monotonic()
+
+    def start(self, listener: _Listener) -> asyncio.Task[None]:
+        """백그라운드 생산 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(listener))
+        return self._task
+
+    async def stop(self) -> None:
+        """생산 중지 + 모든 연결 종료"""
+        self._broadcaster.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def heartbeat() -> dict[str, Any]:
+    """유휴 연결 유지용 이벤트"""
+    return {"event": "ping", "data": {"at": datetime.now(timezone.utc).isoformat()}}
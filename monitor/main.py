@@ -1,22 +1,57 @@
 """모니터링 대시보드 서비스
 
 각 프로젝트 상태 확인 및 DB 통계 제공.
+/live (SSE), /ws (WebSocket)로 상태 변경을 실시간 전달.
+/metrics로 Prometheus 형식 메트릭 노출.
 """
 
+import json
+import os
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any, AsyncIterator, Optional, Union
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
-from shared.db import get_db, RenderInstructionsRepository
+from monitor.live import LiveFeed, format_sse, heartbeat
+from monitor.stats import StatsCache
+from shared.db import (
+    RENDER_STATUS_CHANNEL,
+    HandsRepository,
+    PartitionMaintainer,
+    RenderDeadLettersRepository,
+    RenderInstructionListener,
+    RenderInstructionsRepository,
+    RenderOutputsRepository,
+    get_db,
+)
+from shared.metrics import get_registry, set_pool_status, set_queue_depth
+
+# 유휴 연결 heartbeat 간격 (초, 프록시 타임아웃 방지)
+LIVE_HEARTBEAT_SECONDS = float(os.getenv("MONITOR_LIVE_HEARTBEAT", "15"))
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """앱 라이프사이클"""
-    yield
     db = get_db()
+    await db.warmup()
+
+    # 다가올 hands 파티션 생성 (시작 시 + 주기적, 남은 일수가 적으면 경고)
+    partition_maintainer = PartitionMaintainer(db)
+    partition_maintainer.start()
+
+    # 실시간 피드: 상태 전환 NOTIFY 구독 (연결 실패 시 재연결하며 통계 주기 갱신만 수행)
+    listener = RenderInstructionListener(channel=RENDER_STATUS_CHANNEL)
+    await listener.start()
+    live_feed.start(listener)
+
+    yield
+
+    await live_feed.stop()
+    await partition_maintainer.stop()
+    await listener.close()
     await db.close()
 
 
@@ -29,7 +64,7 @@ app = FastAPI(
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> dict[str, Any]:
     """헬스 체크"""
     return {
         "status": "healthy",
@@ -37,36 +72,75 @@ async def health_check():
     }
 
 
-@app.get("/stats")
-async def get_stats():
-    """전체 통계"""
+async def compute_stats() -> dict[str, Any]:
+    """DB 집계 (StatsCache를 통해서만 호출)"""
     db = get_db()
     instructions_repo = RenderInstructionsRepository(db)
 
-    try:
-        render_stats = await instructions_repo.get_stats()
+    # 서로 독립적인 집계를 동시에 실행 (응답 시간 = 가장 느린 쿼리, 풀 크기만큼만 동시 연결)
+    (
+        render_stats,
+        queue_latency,
+        render_cache,
+        dead_letters,
+        hands_count,
+        tournaments_result,
+    ) = await db.execute_many_concurrent([
+        instructions_repo.get_stats(),
+        instructions_repo.get_claim_latency(),
+        RenderOutputsRepository(db).get_cache_stats(),
+        RenderDeadLettersRepository(db).get_stats(),
+        # hands는 파티션 통계 기반 추정치 (시리즈 전체 COUNT(*) 스캔 방지)
+        HandsRepository(db).count_estimate(),
+        "SELECT COUNT(*) as total FROM tournaments",
+    ])
+    tournaments_count = tournaments_result[0]["total"] if tournaments_result else 0
 
-        # 핸드 통계
-        hands_result = await db.execute(
-            "SELECT COUNT(*) as total FROM hands"
-        )
-        hands_count = hands_result[0]["total"] if hands_result else 0
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "hands": {
+            "total": hands_count,
+            "estimated": True,
+        },
+        "tournaments": {
+            "total": tournaments_count,
+        },
+        "render_instructions": render_stats,
+        "queue_latency": queue_latency,
+        "render_cache": render_cache,
+        "dead_letters": dead_letters,
+    }
 
-        # 토너먼트 통계
-        tournaments_result = await db.execute(
-            "SELECT COUNT(*) as total FROM tournaments"
-        )
-        tournaments_count = tournaments_result[0]["total"] if tournaments_result else 0
 
+# 대시보드 공용 통계 캐시 (MONITOR_STATS_TTL초 동안 재사용)
+stats_cache = StatsCache(
+    compute_stats,
+    ttl=float(os.getenv("MONITOR_STATS_TTL", "5")),
+)
+
+# 실시간 피드 생산자 (모든 /live, /ws 연결이 공유)
+live_feed = LiveFeed(
+    stats_cache,
+    interval=float(os.getenv("MONITOR_LIVE_INTERVAL", "2")),
+)
+
+
+@app.get("/stats", response_model=None)
+async def get_stats() -> Union[dict[str, Any], JSONResponse]:
+    """전체 통계 (캐시됨, cache.age_seconds로 데이터 나이 확인)"""
+    db = get_db()
+
+    try:
+        stats, age = await stats_cache.get()
         return {
-            "timestamp": datetime.now().isoformat(),
-            "hands": {
-                "total": hands_count,
-            },
-            "tournaments": {
-                "total": tournaments_count,
+            **stats,
+            "cache": {
+                "age_seconds": round(age, 3),
+                "ttl_seconds": stats_cache.ttl,
+                "hits": stats_cache.hits,
+                "refreshes": stats_cache.refreshes,
             },
-            "render_instructions": render_stats,
+            "db_pool": db.pool_status(),
         }
     except Exception as e:
         return JSONResponse(
@@ -75,14 +149,14 @@ async def get_stats():
         )
 
 
-@app.get("/pending")
-async def get_pending_renders():
+@app.get("/pending", response_model=None)
+async def get_pending_renders() -> Union[dict[str, Any], JSONResponse]:
     """대기 중인 렌더링 작업"""
     db = get_db()
     instructions_repo = RenderInstructionsRepository(db)
 
     try:
-        pending = await instructions_repo.get_pending(limit=20)
+        pending = await instructions_repo.get_pending_summaries(limit=20)
         return {
             "count": len(pending),
             "instructions": [
@@ -90,7 +164,7 @@ async def get_pending_renders():
                     "id": inst.id,
                     "template_name": inst.template_name,
                     "priority": inst.priority,
-                    "created_at": inst.created_at.isoformat(),
+                    "created_at": inst.created_at.isoformat() if inst.created_at else None,
                 }
                 for inst in pending
             ],
@@ -102,6 +176,96 @@ async def get_pending_renders():
         )
 
 
+@app.get("/dead-letters", response_model=None)
+async def get_dead_letters(
+    template_name: Optional[str] = None, error_kind: Optional[str] = None
+) -> Union[dict[str, Any], JSONResponse]:
+    """실패 확정된 렌더링 작업 (재등록은 scripts/requeue_dead_letters.py)"""
+    db = get_db()
+
+    try:
+        dead_letters = await RenderDeadLettersRepository(db).get_recent(
+            template_name=template_name, error_kind=error_kind, limit=50
+        )
+        return {
+            "count": len(dead_letters),
+            "dead_letters": [
+                {
+                    **row,
+                    "failed_at": row["failed_at"].isoformat() if row.get("failed_at") else None,
+                }
+                for row in dead_letters
+            ],
+        }
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"error": str(e)},
+        )
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """Prometheus 메트릭 (쿼리 / Repository 시간, 렌더 대기 / 렌더 시간, 큐 깊이, 연결 풀)"""
+    db = get_db()
+
+    # 큐 깊이는 대시보드와 같은 캐시 통계 사용 (scrape마다 DB 조회하지 않음)
+    try:
+        stats, _ = await stats_cache.get()
+        set_queue_depth(stats.get("render_instructions") or {})
+    except Exception:
+        pass  # DB 장애 중에도 나머지 메트릭은 노출
+    set_pool_status(db.pool_status())
+
+    return PlainTextResponse(
+        get_registry().render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+async def live_events(
+    request: Request, heartbeat_seconds: float = LIVE_HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """SSE 스트림 (snapshot → 이벤트, 유휴 시 ping)"""
+    with live_feed.subscribe() as subscription:
+        yield format_sse(await live_feed.snapshot())
+        while not await request.is_disconnected():
+            message = await subscription.get(timeout=heartbeat_seconds)
+            if message is None:
+                if subscription.closed:
+                    return
+                message = heartbeat()
+            yield format_sse(message)
+
+
+@app.get("/live")
+async def live(request: Request) -> StreamingResponse:
+    """실시간 피드 (Server-Sent Events)"""
+    return StreamingResponse(
+        live_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/ws")
+async def live_websocket(websocket: WebSocket) -> None:
+    """실시간 피드 (WebSocket, /live와 같은 이벤트를 JSON 메시지로)"""
+    await websocket.accept()
+    with live_feed.subscribe() as subscription:
+        try:
+            await websocket.send_text(json.dumps(await live_feed.snapshot(), default=str))
+            while True:
+                message = await subscription.get(timeout=LIVE_HEARTBEAT_SECONDS)
+                if message is None:
+                    if subscription.closed:  # 서비스 종료
+                        await websocket.close()
+                        return
+                    message = heartbeat()
+                await websocket.send_text(json.dumps(message, ensure_ascii=False, default=str))
+        except WebSocketDisconnect:
+            pass
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
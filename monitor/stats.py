@@ -0,0 +1,86 @@
+"""모니터링 통계 캐시
+
+여러 대시보드가 몇 초 간격으로 /stats를 호출해도 DB 집계는 TTL당 한 번만 수행.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+
+class StatsCache:
+    """TTL 캐시 + single-flight 갱신
+
+    캐시가 만료된 상태에서 동시에 들어온 요청은 하나의 계산 결과를 공유한다.
+
+    Usage:
+        >>> cache = StatsCache(compute_stats, ttl=5.0)
+        >>> value, age = await cache.get()
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: float = 5.0,
+    ) -> None:
+        self._loader = loader
+        self.ttl = ttl
+
+        self._value: Optional[dict[str, Any]] = None
+        self._loaded_at: Optional[float] = None  # time.monotonic()
+        self.computed_at: Optional[datetime] = None
+        self._inflight: Optional[asyncio.Task[tuple[dict[str, Any], float]]] = None
+
+        # 통계 (캐시 효율 확인용)
+        self.hits = 0
+        self.refreshes = 0
+
+    @property
+    def age(self) -> Optional[float]:
+        """캐시 나이 (초), 아직 계산 전이면 None"""
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    def _cached(self) -> Optional[tuple[dict[str, Any], float]]:
+        """TTL 안의 (value, age), 계산 전이거나 만료면 None"""
+        age = self.age
+        if self._value is None or age is None or age >= self.ttl:
+            return None
+        return self._value, age
+
+    async def get(self) -> tuple[dict[str, Any], float]:
+        """캐시된 값 반환 (만료 시 갱신)
+
+        Returns:
+            (value, age_seconds) 튜플
+        """
+        cached = self._cached()
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh())
+
+        # 요청이 취소되어도 다른 대기자를 위해 계산은 계속 진행
+        # (대기 중 invalidate()가 불려도 이번 계산 결과를 반환)
+        value, loaded_at = await asyncio.shield(self._inflight)
+        return value, time.monotonic() - loaded_at
+
+    async def _refresh(self) -> tuple[dict[str, Any], float]:
+        try:
+            value = await self._loader()
+            loaded_at = time.monotonic()
+            self._value = value
+            self._loaded_at = loaded_at
+            self.computed_at = datetime.now()
+            self.refreshes += 1
+            return value, loaded_at
+        finally:
+            self._inflight = None
+
+    def invalidate(self) -> None:
+        """다음 요청에서 다시 계산"""
+        self._loaded_at = None
@@ -0,0 +1,64 @@
+"""핸드 평가기 벤치마크 (초당 평가 수)
+
+단일 평가(evaluate, 순수 파이썬)와 배치 평가(evaluate_batch, NumPy)를
+무작위 7장 핸드로 측정한다.
+
+Usage:
+    python scripts/bench_evaluator.py --hands 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np  # noqa: E402
+
+from shared.poker import evaluate, evaluate_batch, evaluate_omaha_batch  # noqa: E402
+from shared.poker.evaluator import _tables  # noqa: E402
+
+
+def random_hands(count: int, size: int, seed: int = 0) -> np.ndarray:
+    """중복 없는 무작위 카드 (count, size)"""
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((count, 52)), axis=1)[:, :size].astype(np.int16)
+
+
+def main(hands: int, scalar_hands: int) -> None:
+    started = time.perf_counter()
+    _tables().arrays()
+    print(f"table build: {time.perf_counter() - started:.2f}s")
+
+    sample = random_hands(scalar_hands, 7)
+    rows = sample.tolist()
+    started = time.perf_counter()
+    for cards in rows:
+        evaluate(cards)
+    elapsed = time.perf_counter() - started
+    print(f"evaluate (scalar, 7 cards): {scalar_hands / elapsed:>14,.0f} evals/s")
+
+    batch = random_hands(hands, 7)
+    started = time.perf_counter()
+    evaluate_batch(batch)
+    elapsed = time.perf_counter() - started
+    print(f"evaluate_batch (7 cards):   {hands / elapsed:>14,.0f} evals/s")
+
+    omaha = random_hands(hands // 60, 9)
+    started = time.perf_counter()
+    evaluate_omaha_batch(omaha[:, :4], omaha[:, 4:])
+    elapsed = time.perf_counter() - started
+    print(
+        f"evaluate_omaha_batch:       {len(omaha) / elapsed:>14,.0f} hands/s "
+        f"({len(omaha) * 60 / elapsed:,.0f} 5-card evals/s)"
+    )
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--scalar-hands", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.hands, args.scalar_hands)
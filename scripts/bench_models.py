@@ -0,0 +1,72 @@
+"""DB 행 → 모델 생성 벤치마크 (행당 시간)
+
+검증 경로(from_db_row)와 신뢰된 행 고속 경로(from_trusted_row)를
+9인 테이블 핸드 행으로 비교한다. 고속 경로는 players_json을 접근 시점에 디코딩하므로
+전부 접근했을 때의 비용도 함께 측정한다.
+
+Usage:
+    python scripts/bench_models.py --rows 10000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.models import Hand  # noqa: E402
+
+
+def hand_row(i: int) -> dict:
+    """hands 행 (9인, JSON 컬럼은 디코딩된 값)"""
+    return {
+        "id": i,
+        "table_id": "feature_1",
+        "hand_number": i,
+        "source": "rfid",
+        "hand_rank": "full_house",
+        "pot_size": 125000,
+        "winner": "Player 1",
+        "players_json": [
+            {"seat": seat, "name": f"Player {seat}", "stack": 50000 * seat,
+             "hole_cards": ["As", "Kd"]}
+            for seat in range(1, 10)
+        ],
+        "community_cards_json": ["Ah", "Ad", "Kc", "7s", "2h"],
+        "actions_json": [{"seat": 1, "action": "raise", "amount": 3000}],
+        "duration_seconds": 95,
+        "created_at": datetime(2025, 1, 1, 12, 0),
+        "updated_at": datetime(2025, 1, 1, 12, 2),
+    }
+
+
+def main(count: int) -> None:
+    rows = [hand_row(i) for i in range(count)]
+
+    started = time.perf_counter()
+    validated = [Hand.from_db_row(row) for row in rows]
+    validated_us = (time.perf_counter() - started) / count * 1e6
+
+    started = time.perf_counter()
+    trusted = [Hand.from_trusted_row(row) for row in rows]
+    trusted_us = (time.perf_counter() - started) / count * 1e6
+
+    started = time.perf_counter()
+    for hand in trusted:
+        hand.players.load()
+    loaded_us = trusted_us + (time.perf_counter() - started) / count * 1e6
+
+    if trusted[-1] != validated[-1]:
+        raise SystemExit("trusted / validated results differ")
+    print(f"from_db_row:                {validated_us:>8.1f} us/row")
+    print(f"from_trusted_row:           {trusted_us:>8.1f} us/row")
+    print(f"from_trusted_row + players: {loaded_us:>8.1f} us/row")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.rows)
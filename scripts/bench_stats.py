@@ -0,0 +1,89 @@
+"""/stats 집계 지연 벤치마크 (순차 실행 vs 동시 실행)
+
+로컬 PostgreSQL(.env 설정) 대상으로 monitor의 /stats 집계를 반복 실행하고
+p50/p99 지연을 비교한다. 캐시를 거치지 않고 집계 자체만 측정한다.
+
+Usage:
+    docker-compose up -d postgres
+    python scripts/bench_stats.py --iterations 200
+    DB_POOL_MODE=queue python scripts/bench_stats.py
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monitor.main import compute_stats  # noqa: E402
+from shared.db import (  # noqa: E402
+    HandsRepository,
+    RenderDeadLettersRepository,
+    RenderInstructionsRepository,
+    RenderOutputsRepository,
+    get_db,
+)
+
+
+async def compute_stats_sequential() -> dict:
+    """기존 방식: compute_stats와 같은 집계를 하나씩 순서대로 실행"""
+    db = get_db()
+    instructions_repo = RenderInstructionsRepository(db)
+
+    render_stats = await instructions_repo.get_stats()
+    queue_latency = await instructions_repo.get_claim_latency()
+    render_cache = await RenderOutputsRepository(db).get_cache_stats()
+    dead_letters = await RenderDeadLettersRepository(db).get_stats()
+    hands_count = await HandsRepository(db).count_estimate()
+    tournaments_result = await db.execute("SELECT COUNT(*) as total FROM tournaments")
+    return {
+        "hands": {"total": hands_count, "estimated": True},
+        "tournaments": {"total": tournaments_result[0]["total"] if tournaments_result else 0},
+        "render_instructions": render_stats,
+        "queue_latency": queue_latency,
+        "render_cache": render_cache,
+        "dead_letters": dead_letters,
+    }
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure(fn, iterations: int) -> list[float]:
+    await fn()  # 워밍업
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main(iterations: int) -> None:
+    db = get_db()
+    await db.warmup()
+    print(f"pool mode: {db.pool_status()['mode']}, iterations: {iterations}")
+    print(f"{'variant':<12} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10}")
+
+    try:
+        for name, fn in (("sequential", compute_stats_sequential), ("concurrent", compute_stats)):
+            samples = await measure(fn, iterations)
+            print(
+                f"{name:<12} {percentile(samples, 0.50):>10.2f} "
+                f"{percentile(samples, 0.99):>10.2f} {statistics.mean(samples):>10.2f}"
+            )
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
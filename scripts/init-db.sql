@@ -4,8 +4,10 @@
 -- ============================================================
 -- 1. hands 테이블 (feature_table이 저장)
 -- ============================================================
+-- created_at 일별 RANGE 파티션 (PartitionManager.ensure_partitions가 다가올 파티션 생성,
+-- RetentionJob이 보관 기간이 지난 파티션을 분리/보관)
 CREATE TABLE IF NOT EXISTS hands (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     table_id VARCHAR(50) NOT NULL,
     hand_number INTEGER NOT NULL,
     source VARCHAR(20) NOT NULL DEFAULT 'rfid',  -- rfid, csv, manual
@@ -22,17 +24,50 @@ CREATE TABLE IF NOT EXISTS hands (
 
     -- 메타데이터
     duration_seconds INTEGER,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
 
-    -- 유니크 제약 (같은 테이블의 같은 핸드 번호)
-    UNIQUE (table_id, hand_number)
-);
+    -- 파티션 테이블의 PK/유니크 제약은 파티션 키 포함 (핸드 단위 유니크는 hand_keys)
+    PRIMARY KEY (id, created_at),
+    UNIQUE (table_id, hand_number, created_at)
+) PARTITION BY RANGE (created_at);
 
 -- 인덱스
 CREATE INDEX IF NOT EXISTS idx_hands_table_id ON hands(table_id);
 CREATE INDEX IF NOT EXISTS idx_hands_hand_rank ON hands(hand_rank);
 CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_hands_created_at_id ON hands(created_at, id);  -- keyset 스트리밍
+CREATE INDEX IF NOT EXISTS idx_hands_table_created_at_id ON hands(table_id, created_at, id);
+
+-- 초기 파티션 (오늘부터 14일)
+DO $$
+DECLARE
+    today TIMESTAMPTZ := date_trunc('day', NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC';
+    day_start TIMESTAMPTZ;
+BEGIN
+    FOR i IN 0..14 LOOP
+        day_start := today + make_interval(days => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF hands FOR VALUES FROM (%L) TO (%L)',
+            'hands_p' || to_char(day_start AT TIME ZONE 'UTC', 'YYYYMMDD'),
+            day_start,
+            day_start + INTERVAL '1 day'
+        );
+    END LOOP;
+END $$;
+
+-- 미리 만든 파티션 밖의 행 (PartitionManager가 해당 날짜 파티션을 만들 때 옮김)
+CREATE TABLE IF NOT EXISTS hands_default PARTITION OF hands DEFAULT;
+
+-- 핸드별 최초 created_at ((table_id, hand_number) 유니크 보장, 재수집 시 같은 파티션으로 upsert)
+CREATE TABLE IF NOT EXISTS hand_keys (
+    table_id VARCHAR(50) NOT NULL,
+    hand_number INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (table_id, hand_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_hand_keys_created_at ON hand_keys(created_at);
 
 -- ============================================================
 -- 2. tournaments 테이블 (sub가 CSV에서 파싱)
@@ -89,6 +124,7 @@ CREATE TABLE IF NOT EXISTS render_instructions (
     -- 상태
     status VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending, processing, completed, failed
     priority INTEGER DEFAULT 5,  -- 1(최고) - 10(최저)
+    deadline_at TIMESTAMP WITH TIME ZONE,  -- 송출 시각 (스케줄러 마감)
 
     -- 트리거 정보
     trigger_type VARCHAR(50),
@@ -98,6 +134,14 @@ CREATE TABLE IF NOT EXISTS render_instructions (
     error_message TEXT,
     retry_count INTEGER DEFAULT 0,
     max_retries INTEGER DEFAULT 3,
+    next_attempt_at TIMESTAMP WITH TIME ZONE,  -- 재시도 예약 (지수 백오프)
+
+    -- 작업 점유 (claim_batch)
+    worker_id VARCHAR(100),
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+
+    -- 중복 제거 (sha256(layer_data + output_settings))
+    content_hash VARCHAR(64),
 
     -- 타임스탬프
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -108,8 +152,27 @@ CREATE TABLE IF NOT EXISTS render_instructions (
 -- 인덱스
 CREATE INDEX IF NOT EXISTS idx_render_instructions_status ON render_instructions(status);
 CREATE INDEX IF NOT EXISTS idx_render_instructions_priority ON render_instructions(priority, created_at);
-CREATE INDEX IF NOT EXISTS idx_render_instructions_pending ON render_instructions(status, priority, created_at)
+CREATE INDEX IF NOT EXISTS idx_render_instructions_pending ON render_instructions(priority, created_at)
+    WHERE status = 'pending' AND next_attempt_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_render_instructions_retry_due ON render_instructions(next_attempt_at, priority)
+    WHERE status = 'pending' AND next_attempt_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_render_instructions_deadline ON render_instructions(deadline_at)
+    WHERE status = 'pending' AND deadline_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_render_instructions_pending_created ON render_instructions(created_at)
     WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_render_instructions_finished ON render_instructions(completed_at, id)
+    WHERE status IN ('completed', 'failed');  -- RetentionJob 보관 대상
+CREATE INDEX IF NOT EXISTS idx_render_instructions_completed ON render_instructions(completed_at, template_name)
+    WHERE status = 'completed';
+CREATE INDEX IF NOT EXISTS idx_render_instructions_lease ON render_instructions(lease_expires_at)
+    WHERE status = 'processing';
+CREATE INDEX IF NOT EXISTS idx_render_instructions_trigger ON render_instructions(trigger_type, trigger_id)
+    WHERE trigger_type IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_render_instructions_content ON render_instructions(template_name, content_hash)
+    WHERE content_hash IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_render_instructions_active_content
+    ON render_instructions(template_name, content_hash)
+    WHERE status IN ('pending', 'processing');
 
 -- ============================================================
 -- 4. render_outputs 테이블 (ae가 저장)
@@ -127,6 +190,12 @@ CREATE TABLE IF NOT EXISTS render_outputs (
     status VARCHAR(20) DEFAULT 'completed',
     error_message TEXT,
 
+    -- 렌더 캐시 (재사용 원본, 적중 기록, 파일 삭제 시각)
+    cache_source_id INTEGER REFERENCES render_outputs(id) ON DELETE SET NULL,
+    hit_count INTEGER DEFAULT 0,
+    last_hit_at TIMESTAMP WITH TIME ZONE,
+    evicted_at TIMESTAMP WITH TIME ZONE,
+
     -- 타임스탬프
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     completed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -134,9 +203,79 @@ CREATE TABLE IF NOT EXISTS render_outputs (
 
 -- 인덱스
 CREATE INDEX IF NOT EXISTS idx_render_outputs_instruction_id ON render_outputs(instruction_id);
+CREATE INDEX IF NOT EXISTS idx_render_outputs_created_at_id ON render_outputs(created_at, id);  -- keyset 스트리밍
+CREATE INDEX IF NOT EXISTS idx_render_outputs_cached ON render_outputs(instruction_id, completed_at DESC)
+    WHERE status = 'completed' AND evicted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_render_outputs_output_path ON render_outputs(output_path)
+    WHERE evicted_at IS NULL;
 
 -- ============================================================
--- 5. 업데이트 트리거 (updated_at 자동 갱신)
+-- 5. tournament_leaderboard 테이블 (standings 칩 순위 인덱스)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS tournament_leaderboard (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    player_name VARCHAR(100) NOT NULL,
+    nationality VARCHAR(10) DEFAULT '',
+    chips BIGINT DEFAULT 0,
+    table_id VARCHAR(50),
+    seat INTEGER,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (tournament_id, player_name)
+);
+
+-- 인덱스 (top N / 국적별 top N)
+CREATE INDEX IF NOT EXISTS idx_tournament_leaderboard_chips
+    ON tournament_leaderboard(tournament_id, chips DESC);
+CREATE INDEX IF NOT EXISTS idx_tournament_leaderboard_nationality
+    ON tournament_leaderboard(tournament_id, nationality, chips DESC);
+
+-- ============================================================
+-- 6. render_dead_letters 테이블 (재시도 소진 / 영구 오류로 실패한 렌더 작업)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS render_dead_letters (
+    id SERIAL PRIMARY KEY,
+    instruction_id INTEGER REFERENCES render_instructions(id) ON DELETE SET NULL,
+    template_name VARCHAR(100) NOT NULL,
+
+    -- 실패 정보
+    error_kind VARCHAR(20) NOT NULL,  -- transient (재시도 소진), permanent
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+
+    failed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    requeued_at TIMESTAMP WITH TIME ZONE
+);
+
+-- 인덱스
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_open ON render_dead_letters(failed_at DESC)
+    WHERE requeued_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_template ON render_dead_letters(template_name, error_kind);
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_instruction_id ON render_dead_letters(instruction_id);
+
+-- ============================================================
+-- 7. premium_hands 테이블 (프리미엄 핸드 피드, hands 트리거로 갱신)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS premium_hands (
+    seq BIGSERIAL PRIMARY KEY,  -- 피드 커서 (추가 / 랭크·팟·승자 정정 시 새 값)
+    hand_id BIGINT NOT NULL,
+    table_id VARCHAR(50) NOT NULL,
+    hand_number INTEGER NOT NULL,
+    hand_rank VARCHAR(30) NOT NULL,
+    rank_order SMALLINT NOT NULL,  -- 1=royal_flush ... 4=full_house
+    pot_size INTEGER DEFAULT 0,
+    winner VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,  -- hands.created_at (파티션 키)
+
+    UNIQUE (table_id, hand_number)
+);
+
+-- 인덱스
+CREATE INDEX IF NOT EXISTS idx_premium_hands_rank ON premium_hands(rank_order, seq DESC);
+CREATE INDEX IF NOT EXISTS idx_premium_hands_created_at ON premium_hands(created_at);
+
+-- ============================================================
+-- 8. 트리거 (updated_at 자동 갱신, 프리미엄 핸드 피드, 렌더 상태 알림)
 -- ============================================================
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -153,6 +292,111 @@ CREATE TRIGGER update_hands_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- 프리미엄 핸드 피드
+-- 새 항목이거나 값이 바뀐 경우에만 seq를 새로 받고 NOTIFY (같은 값 재수집은 무시)
+CREATE OR REPLACE FUNCTION sync_premium_hand()
+RETURNS TRIGGER AS $$
+DECLARE
+    new_rank_order SMALLINT;
+    entry premium_hands%ROWTYPE;
+BEGIN
+    new_rank_order := CASE NEW.hand_rank
+        WHEN 'royal_flush' THEN 1
+        WHEN 'straight_flush' THEN 2
+        WHEN 'four_of_a_kind' THEN 3
+        WHEN 'full_house' THEN 4
+    END;
+
+    -- Full House 미만으로 정정되면 피드에서 제거 + 제거 알림 (새 seq, 구독 피드가 항목을 지움)
+    IF new_rank_order IS NULL THEN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM premium_hands
+            WHERE table_id = NEW.table_id AND hand_number = NEW.hand_number
+            RETURNING * INTO entry;
+
+            IF FOUND THEN
+                PERFORM pg_notify('premium_hands', json_build_object(
+                    'seq', nextval(pg_get_serial_sequence('premium_hands', 'seq')),
+                    'removed', true,
+                    'hand_id', entry.hand_id,
+                    'table_id', entry.table_id,
+                    'hand_number', entry.hand_number
+                )::text);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO premium_hands (
+        hand_id, table_id, hand_number, hand_rank, rank_order, pot_size, winner, created_at
+    ) VALUES (
+        NEW.id, NEW.table_id, NEW.hand_number, NEW.hand_rank, new_rank_order,
+        NEW.pot_size, NEW.winner, NEW.created_at
+    )
+    ON CONFLICT (table_id, hand_number) DO UPDATE SET
+        seq = nextval(pg_get_serial_sequence('premium_hands', 'seq')),
+        hand_id = EXCLUDED.hand_id,
+        hand_rank = EXCLUDED.hand_rank,
+        rank_order = EXCLUDED.rank_order,
+        pot_size = EXCLUDED.pot_size,
+        winner = EXCLUDED.winner
+    WHERE (premium_hands.hand_rank, premium_hands.pot_size, premium_hands.winner)
+        IS DISTINCT FROM (EXCLUDED.hand_rank, EXCLUDED.pot_size, EXCLUDED.winner)
+    RETURNING * INTO entry;
+
+    IF FOUND THEN
+        PERFORM pg_notify('premium_hands', json_build_object(
+            'seq', entry.seq,
+            'hand_id', entry.hand_id,
+            'table_id', entry.table_id,
+            'hand_number', entry.hand_number,
+            'hand_rank', entry.hand_rank,
+            'rank_order', entry.rank_order,
+            'pot_size', entry.pot_size,
+            'winner', entry.winner,
+            'created_at', EXTRACT(EPOCH FROM entry.created_at)
+        )::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tr_hands_premium_feed ON hands;
+CREATE TRIGGER tr_hands_premium_feed
+    AFTER INSERT OR UPDATE OF hand_rank, pot_size, winner ON hands
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_premium_hand();
+
+-- 렌더 상태 전환 알림 (monitor 실시간 피드)
+CREATE OR REPLACE FUNCTION notify_render_status()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.status IS NOT DISTINCT FROM OLD.status THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM pg_notify('render_status', json_build_object(
+        'id', NEW.id,
+        'template_name', NEW.template_name,
+        'priority', NEW.priority,
+        'status', NEW.status,
+        'previous_status', CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END,
+        'worker_id', NEW.worker_id,
+        'created_at', EXTRACT(EPOCH FROM NEW.created_at),
+        'started_at', EXTRACT(EPOCH FROM NEW.started_at),
+        'completed_at', EXTRACT(EPOCH FROM NEW.completed_at),
+        'at', EXTRACT(EPOCH FROM clock_timestamp())
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tr_render_instructions_status_notify ON render_instructions;
+CREATE TRIGGER tr_render_instructions_status_notify
+    AFTER INSERT OR UPDATE OF status ON render_instructions
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_render_status();
+
 -- tournaments 테이블 트리거
 DROP TRIGGER IF EXISTS update_tournaments_updated_at ON tournaments;
 CREATE TRIGGER update_tournaments_updated_at
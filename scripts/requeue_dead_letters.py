@@ -0,0 +1,66 @@
+"""dead letter 렌더 작업 확인 / 일괄 재등록
+
+템플릿 수정, 레이어 데이터 정정 등 원인을 해결한 뒤 실패한 작업을 pending으로 되돌린다.
+재시도 횟수는 초기화되고, 같은 내용의 작업은 하나만 재등록된다.
+
+Usage:
+    python scripts/requeue_dead_letters.py                                   # 목록만 출력
+    python scripts/requeue_dead_letters.py --template player_intro --requeue
+    python scripts/requeue_dead_letters.py --kind transient --since 2025-01-20 --requeue
+    python scripts/requeue_dead_letters.py --id 12 --id 15 --requeue
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.db import RenderDeadLettersRepository, get_db  # noqa: E402
+
+
+async def main(args: argparse.Namespace) -> None:
+    db = get_db()
+    repo = RenderDeadLettersRepository(db)
+    since = datetime.fromisoformat(args.since).astimezone() if args.since else None
+
+    try:
+        rows = await repo.get_recent(
+            template_name=args.template, error_kind=args.kind, limit=args.limit
+        )
+        print(f"{'id':>6} {'instruction':>11} {'template':<20} {'kind':<10} {'retries':>7}  error")
+        for row in rows:
+            if args.id and row["id"] not in args.id:
+                continue
+            if since and row["failed_at"] < since:
+                continue
+            error = (row["error_message"] or "")[:60]
+            print(
+                f"{row['id']:>6} {row['instruction_id'] or '-':>11} {row['template_name']:<20} "
+                f"{row['error_kind']:<10} {row['retry_count']:>7}  {error}"
+            )
+
+        if args.requeue:
+            requeued = await repo.requeue(
+                ids=args.id or None,
+                template_name=args.template,
+                error_kind=args.kind,
+                failed_since=since,
+                limit=args.limit,
+            )
+            print(f"\nrequeued {len(requeued)} instructions: {requeued}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--id", type=int, action="append", help="dead letter ID (반복 가능)")
+    parser.add_argument("--template", help="템플릿 이름")
+    parser.add_argument("--kind", choices=["transient", "permanent"], help="오류 분류")
+    parser.add_argument("--since", help="이 날짜 이후 실패 (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--requeue", action="store_true", help="조건에 맞는 작업 재등록")
+    asyncio.run(main(parser.parse_args()))
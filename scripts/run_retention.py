@@ -0,0 +1,69 @@
+"""파티션 생성 + 오래된 데이터 보관 (매일 cron 실행)
+
+다가올 hands 일별 파티션을 만들고, 보관 기간이 지난 파티션과 끝난 렌더 기록을
+ARCHIVE_DIR에 JSONL.gz로 보관한 뒤 삭제한다.
+
+Usage:
+    python scripts/run_retention.py                           # RETENTION_DAYS, ARCHIVE_DIR 사용
+    python scripts/run_retention.py --keep-days 14 --archive-dir /nas/archive
+    python scripts/run_retention.py --dry-run                 # 파티션 생성만
+    python scripts/run_retention.py --event wsop2025_me 2025-07-03 2025-07-17
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.db import PartitionManager, RetentionJob, get_db  # noqa: E402
+
+
+def parse_day(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+async def main(args: argparse.Namespace) -> None:
+    db = get_db()
+    try:
+        if args.event:
+            label, start, end = args.event
+            name = await PartitionManager(db).create_partition(
+                "hands", parse_day(start), parse_day(end), label=label
+            )
+            print(f"created event partition {name}")
+
+        job = RetentionJob(
+            db,
+            archive_dir=args.archive_dir,
+            keep_days=args.keep_days,
+            days_ahead=args.days_ahead,
+        )
+        result = await job.run(dry_run=args.dry_run)
+
+        print(f"cutoff: {result['cutoff']}")
+        print(f"created partitions: {', '.join(result['created']) or '-'}")
+        for entry in result["detached"]:
+            print(
+                f"detached {entry['partition']}: {entry['rows']} rows"
+                f" -> {entry['archive_path'] or '(not archived)'}"
+            )
+        archived = result["render_instructions"]
+        print(f"archived render instructions: {archived['rows']} {archived['files']}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keep-days", type=int, help="보관 기간 (기본: RETENTION_DAYS)")
+    parser.add_argument("--archive-dir", help="보관 디렉토리 (기본: ARCHIVE_DIR)")
+    parser.add_argument("--days-ahead", type=int, help="미리 만들 파티션 일수")
+    parser.add_argument("--dry-run", action="store_true", help="파티션 생성만, 분리/보관 안 함")
+    parser.add_argument(
+        "--event", nargs=3, metavar=("LABEL", "START", "END"),
+        help="이벤트 기간 파티션 생성 (START 포함, END 미포함, YYYY-MM-DD)",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,85 @@
+"""렌더 스케줄링 정책 비교 (기록된 하루치 큐 재생)
+
+render_instructions에 기록된 하루치 작업(생성 시각, 우선순위, 마감, 실제 렌더 시간)을
+기존 순서(priority, created_at)와 RenderScheduler 정책으로 각각 재생해
+마감 준수율과 우선순위별 대기 시간을 비교한다.
+
+Usage:
+    python scripts/simulate_scheduler.py --date 2025-01-20 --workers 4
+    RENDER_TEMPLATE_CAPS="leaderboard=1" python scripts/simulate_scheduler.py --date 2025-01-20
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.db import RenderInstructionsRepository, get_db  # noqa: E402
+from shared.render import CostModel, SchedulerPolicy, SimJob, compare  # noqa: E402
+
+
+async def main(date: str, workers: int, aging_seconds: float) -> None:
+    db = get_db()
+    repo = RenderInstructionsRepository(db)
+    start = datetime.fromisoformat(date).astimezone()
+    end = start + timedelta(days=1)
+
+    try:
+        rows = await repo.get_history(start, end)
+        costs = CostModel()
+        costs.load(await repo.get_render_durations(window_days=7))
+    finally:
+        await db.close()
+
+    jobs = [SimJob.from_history_row(row, costs) for row in rows]
+    print(f"date: {date}, jobs: {len(jobs)}, workers: {workers}")
+    if not jobs:
+        return
+
+    scheduler_policy = SchedulerPolicy.from_env().model_copy(
+        update={"aging_seconds": aging_seconds}
+    )
+    results = compare(
+        jobs,
+        {
+            "baseline": SchedulerPolicy.baseline(),
+            "no-aging": scheduler_policy.model_copy(update={"aging_seconds": None}),
+            "scheduler": scheduler_policy,
+        },
+        workers=workers,
+        costs=costs,
+    )
+
+    print(
+        f"{'policy':<12} {'on-time':>8} {'late':>6} {'lateness s':>11} "
+        f"{'wait p50':>9} {'wait p95':>9} {'wait max':>9}"
+    )
+    for result in results:
+        rate = f"{result.on_time_rate:.1%}" if result.on_time_rate is not None else "-"
+        print(
+            f"{result.policy:<12} {rate:>8} {result.late:>6} "
+            f"{result.total_lateness_seconds:>11.0f} "
+            f"{result.wait['p50_seconds']:>9.0f} {result.wait['p95_seconds']:>9.0f} "
+            f"{result.wait['max_seconds']:>9.0f}"
+        )
+
+    print("\nwait p95 by priority (s)")
+    priorities = sorted({p for result in results for p in result.wait_by_priority})
+    print(f"{'policy':<12} " + " ".join(f"{'p' + str(p):>7}" for p in priorities))
+    for result in results:
+        cells = [
+            f"{result.wait_by_priority.get(p, {}).get('p95_seconds', 0):>7.0f}" for p in priorities
+        ]
+        print(f"{result.policy:<12} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--date", required=True, help="재생할 날짜 (YYYY-MM-DD, 로컬 시간)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--aging-seconds", type=float, default=120.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.date, args.workers, args.aging_seconds))
@@ -1,18 +1,36 @@
 """DB 연결 및 Repository"""
 
 from shared.db.connection import get_db, Database
+from shared.db.notify import (
+    RenderInstructionListener,
+    RENDER_INSTRUCTIONS_CHANNEL,
+    RENDER_STATUS_CHANNEL,
+    PREMIUM_HANDS_CHANNEL,
+)
 from shared.db.repositories import (
     HandsRepository,
     TournamentsRepository,
     RenderInstructionsRepository,
     RenderOutputsRepository,
+    RenderDeadLettersRepository,
 )
+from shared.db.partitions import Partition, PartitionMaintainer, PartitionManager
+from shared.db.retention import RetentionJob
 
 __all__ = [
     "get_db",
     "Database",
+    "RenderInstructionListener",
+    "RENDER_INSTRUCTIONS_CHANNEL",
+    "RENDER_STATUS_CHANNEL",
+    "PREMIUM_HANDS_CHANNEL",
     "HandsRepository",
     "TournamentsRepository",
     "RenderInstructionsRepository",
     "RenderOutputsRepository",
+    "RenderDeadLettersRepository",
+    "Partition",
+    "PartitionMaintainer",
+    "PartitionManager",
+    "RetentionJob",
 ]
@@ -1,12 +1,26 @@
 """PostgreSQL 연결 관리"""
 
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Optional, Sequence, Union
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
 from pydantic_settings import BaseSettings
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from shared.metrics import QueryTimer
+
+# execute_many_concurrent 항목: 쿼리 문자열, (쿼리, 파라미터) 튜플 또는 조회 코루틴
+ConcurrentQuery = Union[str, tuple[str, Optional[dict[str, Any]]], Awaitable[Any]]
 
 
 class DatabaseSettings(BaseSettings):
@@ -18,6 +32,18 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "wsop_automation"
 
+    # 연결 풀
+    # - "null": 쿼리마다 새 연결 (pgbouncer transaction 모드 등 외부 풀러 사용 시)
+    # - "queue": 프로세스 내 연결 풀 유지 (TLS/인증 핸드셰이크 재사용)
+    DB_POOL_MODE: str = "null"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0           # 풀 대기 최대 시간 (초)
+    DB_POOL_PRE_PING: bool = True           # checkout 시 연결 생존 확인
+    DB_POOL_RECYCLE: int = 1800             # 연결 재생성 주기 (초, -1=비활성)
+    DB_STATEMENT_CACHE_SIZE: int = 100      # asyncpg prepared statement 캐시 (pgbouncer는 0)
+    DB_POOL_WARMUP: int = 0                 # 기동 시 미리 열어둘 연결 수
+
     @property
     def database_url(self) -> str:
         return (
@@ -25,37 +51,140 @@ class DatabaseSettings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def pooled(self) -> bool:
+        return self.DB_POOL_MODE.lower() == "queue"
+
     class Config:
         env_file = ".env"
         extra = "ignore"
 
 
+class PoolMetrics:
+    """연결 풀 checkout/대기 시간 집계 (모니터링용)"""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0           # 새로 연 물리 연결 수
+        self.checkouts = 0          # 풀에서 꺼낸 횟수
+        self.checkins = 0           # 풀에 반환한 횟수
+        self.acquires = 0           # execute/execute_write 연결 획득 횟수
+        self.wait_total = 0.0       # 연결 획득 대기 누적 (초)
+        self.wait_max = 0.0         # 연결 획득 대기 최대 (초)
+
+    def record_wait(self, seconds: float) -> None:
+        self.acquires += 1
+        self.wait_total += seconds
+        if seconds > self.wait_max:
+            self.wait_max = seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "checked_out": self.checkouts - self.checkins,
+            "acquires": self.acquires,
+            "wait_avg_ms": round(self.wait_total / self.acquires * 1000, 3)
+            if self.acquires
+            else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
+
+
 class Database:
     """비동기 PostgreSQL 연결 관리"""
 
-    def __init__(self, settings: Optional[DatabaseSettings] = None):
+    def __init__(self, settings: Optional[DatabaseSettings] = None) -> None:
         self.settings = settings or DatabaseSettings()
-        self._engine = None
-        self._session_factory = None
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self.metrics = PoolMetrics()
+
+    def _engine_options(self) -> dict[str, Any]:
+        """풀 모드별 create_async_engine 옵션"""
+        cache_size = self.settings.DB_STATEMENT_CACHE_SIZE
+        options: dict[str, Any] = {
+            "connect_args": {
+                "prepared_statement_cache_size": cache_size,
+                "statement_cache_size": cache_size,
+            },
+        }
+        if self.settings.pooled:
+            options.update(
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=self.settings.DB_POOL_SIZE,
+                max_overflow=self.settings.DB_MAX_OVERFLOW,
+                pool_timeout=self.settings.DB_POOL_TIMEOUT,
+                pool_pre_ping=self.settings.DB_POOL_PRE_PING,
+                pool_recycle=self.settings.DB_POOL_RECYCLE,
+            )
+        else:
+            options["poolclass"] = NullPool  # 연결 풀 비활성화 (외부 풀러 사용)
+        return options
 
-    def _create_engine(self):
+    def _register_pool_events(self, engine: AsyncEngine) -> None:
+        """풀 이벤트로 연결/checkout/checkin 횟수 집계"""
+        sync_engine = engine.sync_engine
+        metrics = self.metrics
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+            metrics.connects += 1
+
+        @event.listens_for(sync_engine, "checkout")
+        def _on_checkout(
+            dbapi_connection: Any, connection_record: Any, connection_proxy: Any
+        ) -> None:
+            metrics.checkouts += 1
+
+        @event.listens_for(sync_engine, "checkin")
+        def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+            metrics.checkins += 1
+
+    def _create_engine(self) -> AsyncEngine:
         """엔진 생성 (lazy initialization)"""
         if self._engine is None:
             self._engine = create_async_engine(
                 self.settings.database_url,
                 echo=os.getenv("DEBUG", "false").lower() == "true",
-                poolclass=NullPool,  # 연결 풀 비활성화 (단순화)
+                **self._engine_options(),
             )
+            self._register_pool_events(self._engine)
             self._session_factory = async_sessionmaker(
                 self._engine,
                 class_=AsyncSession,
                 expire_on_commit=False,
             )
+        return self._engine
+
+    @asynccontextmanager
+    async def _connect(self, begin: bool = False) -> AsyncGenerator[AsyncConnection, None]:
+        """연결 획득 (대기 시간 기록)
+
+        Args:
+            begin: True면 트랜잭션 시작 후 정상 종료 시 commit
+        """
+        engine = self._create_engine()
+        started = time.perf_counter()
+        conn = await engine.connect()
+        self.metrics.record_wait(time.perf_counter() - started)
+        try:
+            if begin:
+                async with conn.begin():
+                    yield conn
+            else:
+                yield conn
+        finally:
+            await conn.close()
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """세션 컨텍스트 매니저"""
         self._create_engine()
+        assert self._session_factory is not None
         async with self._session_factory() as session:
             try:
                 yield session
@@ -64,27 +193,167 @@ class Database:
                 await session.rollback()
                 raise
 
-    async def execute(self, query: str, params: Optional[dict] = None) -> list[dict]:
+    async def execute(
+        self, query: str, params: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
         """SQL 실행 (단순 쿼리용)"""
         from sqlalchemy import text
 
-        self._create_engine()
-        async with self._engine.connect() as conn:
-            result = await conn.execute(text(query), params or {})
-            rows = result.fetchall()
-            columns = result.keys()
-            return [dict(zip(columns, row)) for row in rows]
+        with QueryTimer("read") as timer:
+            async with self._connect() as conn:
+                result = await conn.execute(text(query), params or {})
+                rows = result.fetchall()
+                columns = result.keys()
+            timer.rows = len(rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    async def stream(
+        self, query: str, params: Optional[dict[str, Any]] = None, batch_size: int = 1000
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """서버 측 커서로 결과를 batch_size 행씩 조회 (대용량 조회용)
+
+        전체 결과를 메모리에 올리지 않고 첫 배치가 도착하는 즉시 반환한다.
+        반복이 끝날 때까지 연결을 점유하므로 긴 스캔은 keyset 페이지로 나눠 호출할 것.
+        """
+        from sqlalchemy import text
+
+        with QueryTimer("stream") as timer:
+            async with self._connect() as conn:
+                result = await conn.stream(
+                    text(query), params or {}, execution_options={"yield_per": batch_size}
+                )
+                columns = list(result.keys())
+                async for rows in result.partitions(batch_size):
+                    timer.rows += len(rows)
+                    yield [dict(zip(columns, row)) for row in rows]
 
-    async def execute_write(self, query: str, params: Optional[dict] = None) -> int:
+    async def execute_write(self, query: str, params: Optional[dict[str, Any]] = None) -> int:
         """SQL 실행 (INSERT/UPDATE/DELETE)"""
         from sqlalchemy import text
 
-        self._create_engine()
-        async with self._engine.begin() as conn:
-            result = await conn.execute(text(query), params or {})
-            return result.rowcount
+        with QueryTimer("write") as timer:
+            async with self._connect(begin=True) as conn:
+                result = await conn.execute(text(query), params or {})
+            timer.rows = max(result.rowcount, 0)
+        return result.rowcount
+
+    async def execute_many(self, query: str, params_list: list[dict[str, Any]]) -> int:
+        """같은 SQL을 여러 파라미터로 실행 (한 트랜잭션, asyncpg executemany)
+
+        Returns:
+            실행한 파라미터 세트 수
+        """
+        from sqlalchemy import text
+
+        if not params_list:
+            return 0
+        with QueryTimer("write_many") as timer:
+            async with self._connect(begin=True) as conn:
+                await conn.execute(text(query), params_list)
+            timer.rows = len(params_list)
+        return len(params_list)
+
+    async def execute_write_returning(
+        self, query: str, params: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """SQL 실행 (INSERT/UPDATE ... RETURNING, 트랜잭션 커밋)"""
+        from sqlalchemy import text
+
+        with QueryTimer("write") as timer:
+            async with self._connect(begin=True) as conn:
+                result = await conn.execute(text(query), params or {})
+                rows = result.fetchall()
+                columns = result.keys()
+            timer.rows = len(rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    async def execute_many_concurrent(
+        self,
+        queries: Sequence[ConcurrentQuery],
+        max_concurrency: Optional[int] = None,
+    ) -> list[Any]:
+        """서로 독립적인 조회를 동시에 실행 (각각 별도 연결)
+
+        순차 실행 시 쿼리별 왕복 시간이 누적되는 집계 엔드포인트용.
+        Repository 메서드 호출(코루틴)도 함께 넣을 수 있으며, 같은 동시 실행 제한을 받는다.
+
+        Args:
+            queries: 쿼리 문자열, (쿼리, 파라미터) 튜플 또는 조회 코루틴 목록
+            max_concurrency: 동시 실행 수 제한
+                (None이면 풀 모드에서 DB_POOL_SIZE, NullPool에서는 제한 없음)
+
+        Returns:
+            queries 순서대로 각 결과 (쿼리는 결과 행 목록, 코루틴은 반환값)
+        """
+        if max_concurrency is None and self.settings.pooled:
+            max_concurrency = self.settings.DB_POOL_SIZE
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(queries), 1))
+
+        async def run(item: ConcurrentQuery) -> Any:
+            async with semaphore:
+                if isinstance(item, str):
+                    return await self.execute(item)
+                if isinstance(item, tuple):
+                    return await self.execute(*item)
+                return await item
+
+        return list(await asyncio.gather(*(run(item) for item in queries)))
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """연결 풀 워밍업 (기동 시 호출)
+
+        풀 모드에서 지정한 수만큼 연결을 동시에 열어 핸드셰이크 비용을
+        첫 요청 전에 지불한다. NullPool 모드에서는 아무것도 하지 않는다.
+        일부 연결이 실패해도 열린 연결은 모두 풀에 반환한 뒤 첫 오류를 발생시킨다.
+
+        Returns:
+            워밍업된 연결 수
+        """
+        if not self.settings.pooled:
+            return 0
+
+        count = self.settings.DB_POOL_WARMUP if connections is None else connections
+        count = min(count, self.settings.DB_POOL_SIZE)
+        if count <= 0:
+            return 0
+
+        engine = self._create_engine()
+        from sqlalchemy import text
+
+        opened: list[AsyncConnection] = []
+
+        async def open_one() -> None:
+            conn = await engine.connect()
+            opened.append(conn)
+            await conn.execute(text("SELECT 1"))
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(count):
+                    group.create_task(open_one())
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+        finally:
+            for conn in opened:
+                await conn.close()
+        return count
+
+    def pool_status(self) -> dict[str, Any]:
+        """연결 풀 상태 + checkout/대기 통계 (모니터링용)"""
+        status: dict[str, Any] = {
+            "mode": "queue" if self.settings.pooled else "null",
+            **self.metrics.snapshot(),
+        }
+        pool = self._engine.sync_engine.pool if self._engine is not None else None
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        return status
 
-    async def close(self):
+    async def close(self) -> None:
         """연결 종료"""
         if self._engine:
             await self._engine.dispose()
@@ -104,7 +373,7 @@ def get_db() -> Database:
     return _db_instance
 
 
-def reset_db():
+def reset_db() -> None:
     """DB 인스턴스 리셋 (테스트용)"""
     global _db_instance
     _db_instance = None
@@ -0,0 +1,173 @@
+"""LISTEN/NOTIFY 기반 렌더링 지시서 알림
+
+RenderInstructionsRepository.insert가 보내는 NOTIFY를 수신하여
+ae 워커를 polling 주기 없이 즉시 깨운다. 리스너 연결이 끊기면
+재연결을 시도하는 동안 느린 polling으로 대체한다.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional
+
+import asyncpg
+
+from shared.db.connection import DatabaseSettings
+
+# insert 시 pg_notify에 사용하는 채널
+RENDER_INSTRUCTIONS_CHANNEL = "render_instructions"
+
+# render_instructions 상태 전환 트리거 채널 (monitor 실시간 피드)
+RENDER_STATUS_CHANNEL = "render_status"
+
+# premium_hands 트리거가 새 프리미엄 핸드마다 보내는 채널 (shared.feed.PremiumHandFeed)
+PREMIUM_HANDS_CHANNEL = "premium_hands"
+
+# LISTEN 연결 실패 (재연결 대상). ConnectionError/TimeoutError는 OSError 하위 클래스,
+# asyncpg.InterfaceError는 연결이 닫히는 중 add_listener 등에서 발생
+_CONNECT_ERRORS = (OSError, asyncpg.PostgresError, asyncpg.InterfaceError)
+
+
+class RenderInstructionListener:
+    """렌더링 지시서 NOTIFY 구독자 (channel을 바꾸면 다른 채널도 같은 방식으로 구독)
+
+    Usage:
+        >>> async with RenderInstructionListener() as listener:
+        ...     while True:
+        ...         claimed = await repo.claim_batch("ae-node-1", n=4)
+        ...         if not claimed:
+        ...             await listener.wait(timeout=30)
+    """
+
+    def __init__(
+        self,
+        settings: Optional[DatabaseSettings] = None,
+        channel: str = RENDER_INSTRUCTIONS_CHANNEL,
+        fallback_poll_interval: float = 5.0,
+        reconnect_interval: float = 5.0,
+    ) -> None:
+        self.settings = settings or DatabaseSettings()
+        self.channel = channel
+        self.fallback_poll_interval = fallback_poll_interval
+        self.reconnect_interval = reconnect_interval
+
+        self._conn: Optional[asyncpg.Connection] = None
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._reconnect_task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    @property
+    def connected(self) -> bool:
+        """LISTEN 연결 유지 여부 (False면 polling 대체 중)"""
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def _connect(self) -> None:
+        conn = await asyncpg.connect(
+            host=self.settings.POSTGRES_HOST,
+            port=self.settings.POSTGRES_PORT,
+            user=self.settings.POSTGRES_USER,
+            password=self.settings.POSTGRES_PASSWORD,
+            database=self.settings.POSTGRES_DB,
+        )
+        try:
+            await conn.add_listener(self.channel, self._on_notify)
+            conn.add_termination_listener(self._on_terminate)
+        except BaseException:
+            conn.terminate()
+            raise
+        self._conn = conn
+
+    def _on_notify(self, conn: Any, pid: int, channel: str, payload: str) -> None:
+        """NOTIFY 수신 콜백"""
+        try:
+            self._queue.put_nowait(json.loads(payload))
+        except (TypeError, ValueError):
+            self._queue.put_nowait({"raw": payload})
+
+    def _on_terminate(self, conn: Any) -> None:
+        """연결 끊김 콜백 → 대기 중인 워커를 깨우고 재연결 루프 시작
+
+        wait()에서 알림을 기다리던 워커는 빈 알림 대신 {"disconnected": True}를 받고,
+        다음 wait()부터 재연결될 때까지 fallback polling으로 대체한다.
+        """
+        self._conn = None
+        if self._closed:
+            return
+        self._queue.put_nowait({"disconnected": True})
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(
+                self._reconnect_loop()
+            )
+
+    async def _reconnect_loop(self) -> None:
+        try:
+            while not self._closed and not self.connected:
+                try:
+                    await self._connect()
+                except _CONNECT_ERRORS:
+                    await asyncio.sleep(self.reconnect_interval)
+        finally:
+            self._reconnect_task = None
+
+        # 끊긴 동안 놓친 알림이 있을 수 있으므로 워커를 한 번 깨운다
+        if self.connected:
+            self._queue.put_nowait({"reconnected": True})
+
+    async def start(self) -> None:
+        """LISTEN 시작 (실패 시 재연결 루프로 전환)"""
+        self._closed = False
+        try:
+            await self._connect()
+        except _CONNECT_ERRORS:
+            if self._reconnect_task is None:
+                self._reconnect_task = asyncio.get_running_loop().create_task(
+                    self._reconnect_loop()
+                )
+
+    async def wait(self, timeout: Optional[float] = None) -> list[dict[str, Any]]:
+        """다음 알림까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초). None이면 알림이 올 때까지 대기
+
+        Returns:
+            수신한 알림 payload 목록 ({"id", "priority", "template_name", "created_at"}).
+            타임아웃이거나 리스너가 끊겨 polling으로 대체 중이면 빈 리스트.
+            대기 중 연결이 끊기면 {"disconnected": True}, 재연결되면 {"reconnected": True}가
+            포함된다.
+            어느 경우든 호출자는 반환 후 claim_batch를 시도하면 된다.
+        """
+        if not self.connected:
+            delay = self.fallback_poll_interval
+            if timeout is not None:
+                delay = min(delay, timeout)
+            await asyncio.sleep(delay)
+            return self._drain()
+
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        return [first, *self._drain()]
+
+    def _drain(self) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    async def close(self) -> None:
+        """LISTEN 종료"""
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def __aenter__(self) -> "RenderInstructionListener":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
@@ -0,0 +1,379 @@
+"""시간 기준 파티션 관리 (hands)
+
+hands는 created_at RANGE 파티션 테이블이다 (20250201000000_partition_hands.sql).
+
+- ensure_partitions(): 오늘부터 days_ahead일 뒤까지 일별 파티션 생성 (이미 덮인 구간은 건너뜀)
+- create_partition(): 임의 구간 파티션 (예: 이벤트 기간 전체를 파티션 하나로)
+- detach_before(): 상한이 기준 시각 이전인 파티션을 분리 → 압축 파일로 보관 → 삭제
+- PartitionMaintainer: 서비스 시작 시 + 주기적으로 ensure_partitions, 남은 일수가 적으면 경고
+
+미리 만든 파티션이 떨어져도 저장이 실패하지 않도록 DEFAULT 파티션(hands_default)이 있다.
+DEFAULT에 들어간 행은 해당 날짜의 파티션을 만들 때 새 파티션으로 옮긴다.
+
+파티션 경계는 DDL 리터럴이라 바인드 파라미터를 쓸 수 없으므로
+테이블/파티션 이름은 정규식으로 검증하고 시각은 ISO 문자열로만 넣는다.
+
+Usage:
+    >>> partitions = PartitionManager(get_db())
+    >>> await partitions.ensure_partitions("hands", days_ahead=14)
+    >>> await partitions.create_partition("hands", event_start, event_end, label="wsop2025_me")
+    >>> PartitionMaintainer(get_db()).start()
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+from shared.db.connection import Database
+from shared.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+# 파티션 관리 대상 테이블
+PARTITIONED_TABLES = ("hands",)
+
+PARTITION_DAYS_AHEAD = get_registry().gauge(
+    "db_partition_days_ahead",
+    "Consecutive days from today covered by range partitions",
+    ("table",),
+)
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+_BOUND = re.compile(r"FROM \((?P<lower>[^)]*)\) TO \((?P<upper>[^)]*)\)")
+
+
+def _identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"invalid identifier: {name!r}")
+    return name
+
+
+def _parse_bound(value: str) -> Optional[datetime]:
+    """파티션 경계값 ('2025-01-26 00:00:00+00' 또는 MINVALUE/MAXVALUE → None)"""
+    value = value.strip()
+    if value.upper() in ("MINVALUE", "MAXVALUE"):
+        return None
+    parsed = datetime.fromisoformat(value.strip("'"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+class Partition(BaseModel):
+    """파티션 하나 (lower/upper None은 MINVALUE/MAXVALUE)"""
+
+    name: str
+    lower: Optional[datetime] = None
+    upper: Optional[datetime] = None
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """[start, end) 구간과 겹치는지"""
+        after_lower = self.lower is None or self.lower < end
+        before_upper = self.upper is None or start < self.upper
+        return after_lower and before_upper
+
+
+class PartitionManager:
+    """RANGE(created_at) 파티션 생성 / 분리 / 보관
+
+    Args:
+        db: Database 인스턴스
+        archive_dir: 분리된 파티션을 보관할 디렉토리 (None이면 보관 없이 분리만)
+    """
+
+    def __init__(self, db: Database, archive_dir: Optional[Union[str, Path]] = None):
+        self.db = db
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+
+    async def _catalog(self, table: str) -> tuple[list[Partition], Optional[str]]:
+        """(RANGE 파티션 목록 (하한 순), DEFAULT 파티션 이름)"""
+        query = """
+            SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(:table)
+        """
+        result = await self.db.execute(query, {"table": _identifier(table)})
+
+        partitions, default = [], None
+        for row in result:
+            match = _BOUND.search(row["bound"] or "")
+            if match is None:  # DEFAULT 파티션
+                default = row["name"]
+                continue
+            partitions.append(Partition(
+                name=row["name"],
+                lower=_parse_bound(match.group("lower")),
+                upper=_parse_bound(match.group("upper")),
+            ))
+        partitions.sort(key=lambda p: p.lower or datetime.min.replace(tzinfo=timezone.utc))
+        return partitions, default
+
+    async def list_partitions(self, table: str) -> list[Partition]:
+        """부모 테이블의 RANGE 파티션 목록 (하한 순, DEFAULT 제외)"""
+        partitions, _ = await self._catalog(table)
+        return partitions
+
+    async def create_partition(
+        self, table: str, start: datetime, end: datetime, label: Optional[str] = None
+    ) -> str:
+        """[start, end) 구간 파티션 생성
+
+        DEFAULT 파티션이 있으면 그 구간의 행을 새 파티션으로 옮긴 뒤 붙인다 (한 트랜잭션).
+
+        Args:
+            label: 파티션 이름 접미사 (기본: 시작일 YYYYMMDD)
+
+        Returns:
+            생성된 파티션 이름
+        """
+        if end <= start:
+            raise ValueError(f"partition end must be after start: {start} >= {end}")
+        name = _identifier(f"{_identifier(table)}_p{label or start.strftime('%Y%m%d')}")
+        lower, upper = start.isoformat(), end.isoformat()
+
+        _, default = await self._catalog(table)
+        if default is None:
+            query = (
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        else:
+            query = f"""
+                DO $$
+                BEGIN
+                    IF to_regclass('{name}') IS NULL THEN
+                        CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS);
+                        WITH moved AS (
+                            DELETE FROM {default}
+                            WHERE created_at >= '{lower}' AND created_at < '{upper}'
+                            RETURNING *
+                        )
+                        INSERT INTO {name} SELECT * FROM moved;
+                        ALTER TABLE {table} ATTACH PARTITION {name}
+                            FOR VALUES FROM ('{lower}') TO ('{upper}');
+                    END IF;
+                END $$
+            """
+        await self.db.execute_write(query)
+        logger.info("created partition %s [%s, %s)", name, start, end)
+        return name
+
+    async def ensure_partitions(
+        self, table: str, days_ahead: int = 14, today: Optional[date] = None
+    ) -> list[str]:
+        """오늘부터 days_ahead일 뒤까지 일별 파티션 생성
+
+        이벤트 파티션 등 이미 덮인 날은 건너뛴다 (일부만 겹치는 날도 건너뜀).
+        DEFAULT 파티션에 쌓인 지난 날짜의 행도 일별 파티션으로 옮긴다 (보관 대상이 되도록).
+
+        Returns:
+            새로 생성한 파티션 이름
+        """
+        today = today or datetime.now(timezone.utc).date()
+        existing, default = await self._catalog(table)
+
+        days = [today + timedelta(days=offset) for offset in range(days_ahead + 1)]
+        if default is not None:
+            stranded = await self._default_days(default)
+            if stranded:
+                logger.warning(
+                    "%s has rows for %d day(s) without a partition: %s",
+                    default, len(stranded), ", ".join(map(str, stranded)),
+                )
+            days = sorted(set(days) | set(stranded))
+
+        created = []
+        for day in days:
+            start = _day_start(day)
+            end = start + timedelta(days=1)
+            if any(p.covers(start, end) for p in existing):
+                continue
+            name = await self.create_partition(table, start, end)
+            existing.append(Partition(name=name, lower=start, upper=end))
+            created.append(name)
+        return created
+
+    async def days_ahead(self, table: str, today: Optional[date] = None) -> int:
+        """오늘부터 연속으로 RANGE 파티션이 있는 일수 (오늘 포함, 0이면 오늘 행은 DEFAULT로)"""
+        today = today or datetime.now(timezone.utc).date()
+        partitions = await self.list_partitions(table)
+
+        days = 0
+        while True:
+            start = _day_start(today + timedelta(days=days))
+            if not any(p.covers(start, start + timedelta(days=1)) for p in partitions):
+                return days
+            days += 1
+
+    async def _default_days(self, default: str) -> list[date]:
+        """DEFAULT 파티션에 행이 있는 날짜 (UTC)"""
+        query = f"""
+            SELECT DISTINCT date_trunc('day', created_at, 'UTC') AS day
+            FROM {_identifier(default)}
+        """
+        result = await self.db.execute(query)
+        return sorted(row["day"].astimezone(timezone.utc).date() for row in result)
+
+    async def detach_before(
+        self, table: str, before: datetime, drop: bool = True
+    ) -> list[dict[str, Any]]:
+        """상한이 before 이하인 파티션 분리 (+ 압축 보관, 삭제)
+
+        archive_dir가 있으면 분리된 파티션을 JSONL.gz로 저장한 뒤 삭제한다.
+        archive_dir가 없으면 분리만 하고 테이블은 남긴다 (drop 무시).
+
+        Returns:
+            [{"partition", "rows", "archive_path", "dropped"}, ...]
+        """
+        if before.tzinfo is None:
+            before = before.astimezone()
+
+        results = []
+        for partition in await self.list_partitions(table):
+            if partition.upper is None or partition.upper > before:
+                continue
+
+            await self.db.execute_write(f"ALTER TABLE {table} DETACH PARTITION {partition.name}")
+            entry = {
+                "partition": partition.name, "rows": 0, "archive_path": None, "dropped": False,
+            }
+
+            if self.archive_dir is not None:
+                path, rows = await self.archive_table(partition.name, table)
+                entry.update(rows=rows, archive_path=str(path))
+                if drop:
+                    await self.db.execute_write(f"DROP TABLE {partition.name}")
+                    entry["dropped"] = True
+
+            await self._release_keys(table, partition)
+            logger.info("detached partition %s (%d rows archived)", partition.name, entry["rows"])
+            results.append(entry)
+        return results
+
+    async def archive_table(
+        self, name: str, group: str, batch_size: int = 5000
+    ) -> tuple[Path, int]:
+        """테이블 전체를 archive_dir/group/name.jsonl.gz로 저장 (서버 측 커서로 스트리밍)"""
+        if self.archive_dir is None:
+            raise ValueError("archive_dir is not configured")
+        directory = self.archive_dir / _identifier(group)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{_identifier(name)}.jsonl.gz"
+
+        rows = 0
+        with gzip.open(path, "wt", encoding="utf-8") as fp:
+            async for batch in self.db.stream(f"SELECT * FROM {name}", batch_size=batch_size):
+                for row in batch:
+                    fp.write(json.dumps(row, ensure_ascii=False, default=str))
+                    fp.write("\n")
+                rows += len(batch)
+        return path, rows
+
+    async def _release_keys(self, table: str, partition: Partition) -> None:
+        """분리된 구간의 유니크 키 / 파생 행 정리 (hands → hand_keys, premium_hands)"""
+        if table != "hands":
+            return
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        if partition.lower is not None:
+            conditions.append("created_at >= :lower")
+            params["lower"] = partition.lower
+        conditions.append("created_at < :upper")
+        params["upper"] = partition.upper
+        where = " AND ".join(conditions)
+        await self.db.execute_write(f"DELETE FROM hand_keys WHERE {where}", params)
+        await self.db.execute_write(f"DELETE FROM premium_hands WHERE {where}", params)
+
+
+class PartitionMaintainer:
+    """다가올 파티션 유지 (서비스 시작 시 + interval마다 ensure_partitions)
+
+    남은 일수(days_ahead)가 min_days_ahead보다 적으면 경고 로그를 남기고,
+    db_partition_days_ahead 메트릭으로 노출한다 (/metrics 알림 기준).
+
+    Args:
+        db: Database 인스턴스
+        days_ahead: 미리 만들 일수 (기본: PARTITION_DAYS_AHEAD 환경 변수, 없으면 14일)
+        min_days_ahead: 경고 기준 일수 (기본: PARTITION_MIN_DAYS_AHEAD, 없으면 3일)
+        interval: 확인 주기 (초, 기본: PARTITION_MAINTENANCE_INTERVAL, 없으면 3600)
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        days_ahead: Optional[int] = None,
+        min_days_ahead: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        self.partitions = PartitionManager(db)
+        self.days_ahead = days_ahead if days_ahead is not None else int(
+            os.getenv("PARTITION_DAYS_AHEAD", "14")
+        )
+        self.min_days_ahead = min_days_ahead if min_days_ahead is not None else int(
+            os.getenv("PARTITION_MIN_DAYS_AHEAD", "3")
+        )
+        self.interval = interval if interval is not None else float(
+            os.getenv("PARTITION_MAINTENANCE_INTERVAL", "3600")
+        )
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def run_once(self, today: Optional[date] = None) -> dict[str, int]:
+        """파티션 생성 + 테이블별 남은 일수
+
+        Returns:
+            {table: days_ahead}
+        """
+        coverage = {}
+        for table in PARTITIONED_TABLES:
+            try:
+                await self.partitions.ensure_partitions(table, self.days_ahead, today)
+            except Exception as e:  # 생성 실패여도 남은 일수는 확인해 경고
+                logger.error("failed to create partitions for %s: %s", table, e)
+
+            days = await self.partitions.days_ahead(table, today)
+            PARTITION_DAYS_AHEAD.labels(table).set(days)
+            if days < self.min_days_ahead:
+                logger.warning(
+                    "%s has partitions for only %d day(s) ahead (minimum %d), "
+                    "new rows will go to the DEFAULT partition",
+                    table, days, self.min_days_ahead,
+                )
+            coverage[table] = days
+        return coverage
+
+    async def run(self) -> None:
+        """유지 루프 (취소될 때까지)"""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:  # DB 장애 시 다음 주기 재시도
+                logger.error("partition maintenance failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> Optional[asyncio.Task[None]]:
+        """백그라운드 유지 시작 (interval이 0 이하면 시작하지 않음)"""
+        if self.interval <= 0:
+            return None
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
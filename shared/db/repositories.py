@@ -3,15 +3,275 @@
 각 테이블에 대한 CRUD 로직.
 """
 
+import logging
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from sqlalchemy.exc import IntegrityError
 
 from shared.db.connection import Database
-from shared.models.hand import Hand, HandRank, SourceType
-from shared.models.tournament import Tournament
-from shared.models.render_instruction import RenderInstruction, RenderOutput, RenderStatus
+from shared.db.notify import RENDER_INSTRUCTIONS_CHANNEL
+from shared.leaderboard import Leaderboard, LeaderboardRegistry, get_leaderboards
+from shared.metrics import instrument_repository
+from shared.models.hand import Hand, HandSummary, PremiumHand
+from shared.models.render_instruction import (
+    RenderInstruction,
+    RenderInstructionSummary,
+    RenderOutput,
+    RenderStatus,
+)
+from shared.models.tournament import PlayerStanding, Tournament, TournamentSummary
+from shared.models.trusted import decode_json
+
+logger = logging.getLogger(__name__)
+
+# 모델 전체 조회용 컬럼 (JSON 컬럼은 텍스트로 받아 모델에서 접근 시 디코딩)
+_HAND_COLUMNS = (
+    "id", "table_id", "hand_number", "source", "hand_rank", "pot_size", "winner",
+    "players_json", "community_cards_json", "actions_json",
+    "duration_seconds", "created_at", "updated_at",
+)
+_TOURNAMENT_COLUMNS = (
+    "id", "name", "event_code", "event_type", "buy_in", "prize_pool",
+    "total_entries", "remaining_players", "current_level",
+    "blinds_json", "current_blinds_json", "payouts_json", "places_paid",
+    "standings_json", "start_date", "end_date", "source", "created_at", "updated_at",
+)
+_RENDER_INSTRUCTION_COLUMNS = (
+    "id", "template_name", "layer_data_json", "output_settings_json",
+    "output_path", "output_filename", "status", "priority", "deadline_at",
+    "trigger_type", "trigger_id", "error_message", "retry_count", "max_retries",
+    "next_attempt_at", "worker_id", "lease_expires_at", "created_at", "started_at", "completed_at",
+)
+
+# 점유 가능한 pending (재시도 대기 중인 작업 제외)
+_DUE_PENDING = "status = 'pending' AND (next_attempt_at IS NULL OR next_attempt_at <= NOW())"
+
+# _DUE_PENDING의 두 갈래 (바로 점유 가능 / 재시도 예약 시각 도래)
+# OR 조건 하나로는 부분 인덱스의 (priority, created_at) 순서를 쓸 수 없으므로
+# 우선순위순 조회는 갈래별로 읽어 합친다 (_due_pending_by_priority).
+_READY_PENDING = "status = 'pending' AND next_attempt_at IS NULL"
+_RETRY_DUE_PENDING = (
+    "status = 'pending' AND next_attempt_at IS NOT NULL AND next_attempt_at <= NOW()"
+)
+
+# 워커가 아직 점유 중 (lease 만료로 회수/재점유되지 않음)
+_OWNED_BY_WORKER = "worker_id = :worker_id AND status = 'processing'"
+
+
+def _due_pending_by_priority(columns: str, limit: str, lock: bool = False) -> str:
+    """점유 가능한 pending 중 (priority, created_at) 순 상위 :limit개 조회 SQL
+
+    바로 점유 가능한 작업은 idx_render_instructions_pending 순서대로, 예약 시각이 지난
+    재시도 작업은 idx_render_instructions_retry_due 범위로 읽어 각각 LIMIT한 뒤 다시 정렬한다.
+
+    Args:
+        columns: SELECT 목록 (priority, created_at 포함, 코드 상수만 사용)
+        limit: LIMIT 바인드 파라미터 이름
+        lock: True면 갈래마다 FOR UPDATE SKIP LOCKED (최대 2 * limit행을 잠시 잠금)
+    """
+    lock_clause = " FOR UPDATE SKIP LOCKED" if lock else ""
+    branches = " UNION ALL ".join(
+        f"(SELECT {columns} FROM render_instructions WHERE {where}"
+        f" ORDER BY priority ASC, created_at ASC LIMIT :{limit}{lock_clause})"
+        for where in (_READY_PENDING, _RETRY_DUE_PENDING)
+    )
+    return (
+        f"SELECT * FROM ({branches}) due"
+        f" ORDER BY priority ASC, created_at ASC LIMIT :{limit}"
+    )
+
+
+def select_list(columns: Iterable[str], alias: Optional[str] = None) -> str:
+    """SELECT/RETURNING 컬럼 목록
+
+    *_json 컬럼은 ::text로 받아 드라이버 단계의 JSON 디코딩을 생략한다.
+    (모델의 from_trusted_row가 접근 시점에 디코딩)
+
+    Args:
+        columns: 컬럼 이름 (코드 상수만 사용, 사용자 입력 금지)
+        alias: 테이블 별칭 (예: "ri" → ri.id)
+    """
+    prefix = f"{alias}." if alias else ""
+    parts = []
+    for column in columns:
+        if column.endswith("_json"):
+            parts.append(f"{prefix}{column}::text AS {column}")
+        else:
+            parts.append(f"{prefix}{column}")
+    return ", ".join(parts)
+
+
+_HAND_SELECT = select_list(_HAND_COLUMNS)
+_HAND_SUMMARY_SELECT = select_list(HandSummary.COLUMNS)
+_PREMIUM_HAND_SELECT = select_list(PremiumHand.COLUMNS)
+_TOURNAMENT_SELECT = select_list(_TOURNAMENT_COLUMNS)
+_TOURNAMENT_SUMMARY_SELECT = select_list(TournamentSummary.COLUMNS)
+_RENDER_INSTRUCTION_SELECT = select_list(_RENDER_INSTRUCTION_COLUMNS)
+_RENDER_INSTRUCTION_SUMMARY_SELECT = select_list(RenderInstructionSummary.COLUMNS)
+
+
+_RENDER_OUTPUT_COLUMNS = (
+    "id", "instruction_id", "output_path", "file_size", "frame_count",
+    "status", "error_message", "cache_source_id", "created_at", "completed_at",
+)
+_RENDER_OUTPUT_SELECT = select_list(_RENDER_OUTPUT_COLUMNS)
+
+
+async def iter_keyset(
+    db: Database,
+    table: str,
+    columns: str,
+    conditions: Iterable[str] = (),
+    params: Optional[dict[str, Any]] = None,
+    batch: int = 500,
+    page_size: int = 10_000,
+) -> AsyncIterator[dict[str, Any]]:
+    """(created_at, id) keyset 페이지네이션으로 테이블 전체 스트리밍
+
+    OFFSET 대신 마지막 행의 (created_at, id) 다음부터 조회하므로 페이지가 뒤로 가도
+    비용이 일정하다. 각 페이지는 서버 측 커서로 batch 행씩 받아 즉시 반환하고,
+    페이지 사이에는 연결을 반환해 긴 스캔이 풀을 계속 점유하지 않는다.
+
+    Args:
+        db: Database
+        table: 테이블 이름
+        columns: SELECT 목록 (created_at, id 포함)
+        conditions: 추가 WHERE 조건 (파라미터는 params로 전달)
+        params: 조건 파라미터
+        batch: 커서에서 한 번에 가져올 행 수
+        page_size: keyset 페이지 크기 (페이지당 연결 점유 단위)
+    """
+    conditions = list(conditions)
+    after: Optional[tuple[Any, Any]] = None
 
+    while True:
+        where = list(conditions)
+        page_params = {**(params or {}), "page_size": page_size}
+        if after is not None:
+            where.append("(created_at, id) > (:after_created_at, :after_id)")
+            page_params["after_created_at"], page_params["after_id"] = after
 
+        query = f"SELECT {columns} FROM {table}"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY created_at, id LIMIT :page_size"
+
+        count = 0
+        last: Optional[dict[str, Any]] = None
+        async for rows in db.stream(query, page_params, batch_size=batch):
+            for row in rows:
+                yield row
+            if rows:
+                count += len(rows)
+                last = rows[-1]
+
+        if last is None or count < page_size:
+            return
+        after = (last["created_at"], last["id"])
+
+
+# TournamentsRepository.upsert의 ON CONFLICT 갱신 컬럼 (upsert_diff 비교 대상)
+_TOURNAMENT_UPDATE_COLUMNS = (
+    "name", "total_entries", "remaining_players", "current_level",
+    "current_blinds_json", "standings_json",
+)
+# jsonb_set 패치 최대 개수 (넘으면 standings_json 전체 교체)
+_MAX_STANDINGS_PATCHES = 64
+
+
+def diff_standings(
+    old: list[dict[str, Any]], new: list[dict[str, Any]]
+) -> Optional[dict[int, dict[str, Any]]]:
+    """순위표 변경분 {인덱스: 새 항목}
+
+    플레이어 수가 달라지면 (탈락 등) 인덱스가 밀리므로 None (전체 교체).
+    """
+    if len(old) != len(new):
+        return None
+    return {index: entry for index, (before, entry) in enumerate(zip(old, new)) if before != entry}
+
+
+def _payload_size(value: Any) -> int:
+    import json
+
+    return len(json.dumps(value, default=str).encode())
+
+
+def _diff_stats(
+    tournament_id: int,
+    action: str,
+    changed: list[str],
+    standings_patched: Optional[int],
+    bytes_full: int,
+    bytes_written: int,
+) -> dict[str, Any]:
+    return {
+        "id": tournament_id,
+        "action": action,
+        "changed_columns": changed,
+        "standings_patched": standings_patched,
+        "bytes_full": bytes_full,
+        "bytes_written": bytes_written,
+        "bytes_saved": bytes_full - bytes_written,
+    }
+
+
+def _enqueue_result(
+    instruction_id: int,
+    action: str,
+    content_hash: Optional[str],
+    output_id: Optional[int] = None,
+    output_path: Optional[str] = None,
+) -> dict[str, Any]:
+    return {
+        "id": instruction_id,
+        "action": action,
+        "content_hash": content_hash,
+        "output_id": output_id,
+        "output_path": output_path,
+    }
+
+
+# hands는 created_at 기준 파티션 테이블이라 (table_id, hand_number)만으로는
+# 유니크 제약을 걸 수 없다.
+# hand_keys가 핸드별 created_at을 고정하므로 같은 핸드는 항상 같은 파티션의 같은 키로 저장된다.
+_HAND_INSERT = """
+    WITH hand_key AS (
+        INSERT INTO hand_keys (table_id, hand_number, created_at)
+        VALUES (:table_id, :hand_number, :created_at)
+        ON CONFLICT (table_id, hand_number) DO UPDATE SET table_id = EXCLUDED.table_id
+        RETURNING created_at
+    )
+    INSERT INTO hands (
+        table_id, hand_number, source, hand_rank, pot_size, winner,
+        players_json, community_cards_json, actions_json,
+        duration_seconds, created_at, updated_at
+    ) VALUES (
+        :table_id, :hand_number, :source, :hand_rank, :pot_size, :winner,
+        :players_json, :community_cards_json, :actions_json,
+        :duration_seconds, (SELECT created_at FROM hand_key), :updated_at
+    )
+"""
+
+# HandsRepository.insert_many의 (table_id, hand_number) 충돌 처리
+_HAND_CONFLICT_CLAUSES = {
+    "skip": "ON CONFLICT (table_id, hand_number, created_at) DO NOTHING",
+    "update": """ON CONFLICT (table_id, hand_number, created_at) DO UPDATE SET
+                source = EXCLUDED.source,
+                hand_rank = EXCLUDED.hand_rank,
+                pot_size = EXCLUDED.pot_size,
+                winner = EXCLUDED.winner,
+                players_json = EXCLUDED.players_json,
+                community_cards_json = EXCLUDED.community_cards_json,
+                actions_json = EXCLUDED.actions_json,
+                duration_seconds = EXCLUDED.duration_seconds,
+                updated_at = EXCLUDED.updated_at""",
+}
+
+
+@instrument_repository
 class HandsRepository:
     """핸드 데이터 Repository"""
 
@@ -22,72 +282,257 @@ class HandsRepository:
         """핸드 저장"""
         import json
 
-        query = """
-            INSERT INTO hands (
-                table_id, hand_number, source, hand_rank, pot_size, winner,
-                players_json, community_cards_json, actions_json,
-                duration_seconds, created_at, updated_at
-            ) VALUES (
-                :table_id, :hand_number, :source, :hand_rank, :pot_size, :winner,
-                :players_json, :community_cards_json, :actions_json,
-                :duration_seconds, :created_at, :updated_at
-            ) RETURNING id
-        """
+        query = f"{_HAND_INSERT} RETURNING id"
 
         db_dict = hand.to_db_dict()
         db_dict["players_json"] = json.dumps(db_dict["players_json"])
         db_dict["community_cards_json"] = json.dumps(db_dict["community_cards_json"])
         db_dict["actions_json"] = json.dumps(db_dict["actions_json"])
 
-        result = await self.db.execute(query, db_dict)
+        result = await self.db.execute_write_returning(query, db_dict)
         return result[0]["id"] if result else 0
 
+    async def insert_many(
+        self,
+        hands: Iterable[Hand],
+        on_conflict: str = "skip",
+        chunk_size: int = 1000,
+    ) -> dict[str, Any]:
+        """핸드 대량 저장 (백필 / CSV 재생용)
+
+        chunk_size 단위로 나눠 한 트랜잭션당 executemany 한 번으로 upsert한다.
+        (table_id, hand_number) 유니크 키가 충돌하면 on_conflict에 따라 처리.
+
+        Args:
+            hands: 저장할 핸드 (제너레이터 가능, chunk 단위로만 메모리에 유지)
+            on_conflict: "skip"(기존 행 유지) 또는 "update"(새 값으로 덮어쓰기)
+            chunk_size: 트랜잭션당 행 수
+
+        Returns:
+            {"rows", "chunks", "elapsed_seconds", "rows_per_second"}
+        """
+        import json
+
+        if on_conflict not in _HAND_CONFLICT_CLAUSES:
+            raise ValueError(
+                f"on_conflict must be one of {sorted(_HAND_CONFLICT_CLAUSES)}: {on_conflict!r}"
+            )
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1: {chunk_size}")
+
+        query = f"{_HAND_INSERT} {_HAND_CONFLICT_CLAUSES[on_conflict]}"
+
+        def to_params(hand: Hand) -> dict[str, Any]:
+            db_dict = hand.to_db_dict()
+            db_dict["players_json"] = json.dumps(db_dict["players_json"])
+            db_dict["community_cards_json"] = json.dumps(db_dict["community_cards_json"])
+            db_dict["actions_json"] = json.dumps(db_dict["actions_json"])
+            return db_dict
+
+        started = time.perf_counter()
+        rows = 0
+        chunks = 0
+        chunk: list[dict[str, Any]] = []
+        for hand in hands:
+            chunk.append(to_params(hand))
+            if len(chunk) >= chunk_size:
+                rows += await self.db.execute_many(query, chunk)
+                chunks += 1
+                chunk = []
+        if chunk:
+            rows += await self.db.execute_many(query, chunk)
+            chunks += 1
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            "rows": rows,
+            "chunks": chunks,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            "hands insert_many: %d rows in %d chunks (%.1f rows/s)",
+            rows, chunks, stats["rows_per_second"],
+        )
+        return stats
+
     async def get_by_id(self, hand_id: int) -> Optional[Hand]:
         """ID로 조회"""
-        query = "SELECT * FROM hands WHERE id = :id"
+        query = f"SELECT {_HAND_SELECT} FROM hands WHERE id = :id"
         result = await self.db.execute(query, {"id": hand_id})
-        return Hand.from_db_row(result[0]) if result else None
+        return Hand.from_trusted_row(result[0]) if result else None
+
+    async def count_estimate(self) -> int:
+        """전체 핸드 수 추정 (파티션별 통계 합계, COUNT(*) 전체 스캔 없음)
+
+        ANALYZE/autovacuum 시점 기준이므로 최근 삽입분은 반영이 늦을 수 있다.
+        """
+        query = """
+            SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint AS estimate
+            FROM pg_class c
+            WHERE c.oid IN (
+                SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass('hands')
+            ) OR c.oid = to_regclass('hands')
+        """
+        result = await self.db.execute(query)
+        return int(result[0]["estimate"]) if result else 0
 
     async def get_by_table_and_number(
         self, table_id: str, hand_number: int
     ) -> Optional[Hand]:
         """테이블 ID + 핸드 번호로 조회"""
-        query = """
-            SELECT * FROM hands
+        query = f"""
+            SELECT {_HAND_SELECT} FROM hands
             WHERE table_id = :table_id AND hand_number = :hand_number
         """
         result = await self.db.execute(
             query, {"table_id": table_id, "hand_number": hand_number}
         )
-        return Hand.from_db_row(result[0]) if result else None
+        return Hand.from_trusted_row(result[0]) if result else None
 
     async def get_recent(self, limit: int = 100) -> list[Hand]:
         """최근 핸드 조회"""
-        query = "SELECT * FROM hands ORDER BY created_at DESC LIMIT :limit"
+        query = f"SELECT {_HAND_SELECT} FROM hands ORDER BY created_at DESC LIMIT :limit"
         result = await self.db.execute(query, {"limit": limit})
-        return [Hand.from_db_row(row) for row in result]
+        return [Hand.from_trusted_row(row) for row in result]
+
+    async def get_recent_summaries(self, limit: int = 100) -> list[HandSummary]:
+        """최근 핸드 요약 조회 (목록용, JSON 컬럼 제외)"""
+        query = f"""
+            SELECT {_HAND_SUMMARY_SELECT} FROM hands
+            ORDER BY created_at DESC
+            LIMIT :limit
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [HandSummary.from_trusted_row(row) for row in result]
+
+    async def iter_hands(
+        self,
+        since: Optional[datetime] = None,
+        table_id: Optional[str] = None,
+        batch: int = 500,
+        page_size: int = 10_000,
+    ) -> AsyncIterator[Hand]:
+        """핸드 스트리밍 조회 (created_at, id 오름차순, 하이라이트 export용)
+
+        전체를 메모리에 올리지 않으므로 이벤트 전체(수백만 행)도 일정한 메모리로 순회한다.
+
+        Args:
+            since: 이 시각 이후 생성된 핸드만 (created_at >= since)
+            table_id: 특정 테이블만
+            batch: 커서에서 한 번에 가져올 행 수
+            page_size: keyset 페이지 크기
+
+        Usage:
+            >>> async for hand in repo.iter_hands(since=event_start, table_id="feature_1"):
+            ...     export(hand)
+        """
+        conditions = []
+        params: dict[str, Any] = {}
+        if since is not None:
+            conditions.append("created_at >= :since")
+            params["since"] = since
+        if table_id is not None:
+            conditions.append("table_id = :table_id")
+            params["table_id"] = table_id
+
+        async for row in iter_keyset(
+            self.db, "hands", _HAND_SELECT, conditions, params,
+            batch=batch, page_size=page_size,
+        ):
+            yield Hand.from_trusted_row(row)
+
+    # ========================================
+    # 프리미엄 핸드 (premium_hands, 저장 시 트리거로 갱신)
+    # ========================================
 
     async def get_premium_hands(self, limit: int = 50) -> list[Hand]:
-        """프리미엄 핸드 조회"""
-        premium_ranks = ["royal_flush", "straight_flush", "four_of_a_kind", "full_house"]
+        """최근 프리미엄 핸드 (피드 순서, 최신 먼저)"""
+        query = f"""
+            SELECT {select_list(_HAND_COLUMNS, alias="h")}
+            FROM (
+                SELECT hand_id, created_at, seq FROM premium_hands
+                ORDER BY seq DESC
+                LIMIT :limit
+            ) p
+            JOIN hands h ON h.id = p.hand_id AND h.created_at = p.created_at
+            ORDER BY p.seq DESC
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [Hand.from_trusted_row(row) for row in result]
+
+    async def get_premium_summaries(self, limit: int = 50) -> list[HandSummary]:
+        """최근 프리미엄 핸드 요약 (목록용, hands 조회 없음)"""
         query = """
-            SELECT * FROM hands
-            WHERE hand_rank = ANY(:ranks)
-            ORDER BY created_at DESC
+            SELECT hand_id AS id, table_id, hand_number, hand_rank, pot_size, winner, created_at
+            FROM premium_hands
+            ORDER BY seq DESC
+            LIMIT :limit
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [HandSummary.from_trusted_row(row) for row in result]
+
+    async def get_premium_feed(self, limit: int = 50) -> list[PremiumHand]:
+        """프리미엄 핸드 n개, 높은 랭크 먼저 (같은 랭크는 최신 먼저)
+
+        idx_premium_hands_rank (rank_order, seq DESC) 순서 그대로 limit개만 읽는다.
+        """
+        query = f"""
+            SELECT {_PREMIUM_HAND_SELECT} FROM premium_hands
+            ORDER BY rank_order, seq DESC
+            LIMIT :limit
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [PremiumHand.from_trusted_row(row) for row in result]
+
+    async def get_premium_recent(self, limit: int = 50) -> list[PremiumHand]:
+        """최근 피드 항목 (seq 내림차순)"""
+        query = f"""
+            SELECT {_PREMIUM_HAND_SELECT} FROM premium_hands
+            ORDER BY seq DESC
+            LIMIT :limit
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [PremiumHand.from_trusted_row(row) for row in result]
+
+    async def get_premium_since(self, cursor: int, limit: int = 100) -> list[PremiumHand]:
+        """커서(seq) 이후 피드 항목 (seq 순, 다음 커서는 마지막 항목의 seq)"""
+        query = f"""
+            SELECT {_PREMIUM_HAND_SELECT} FROM premium_hands
+            WHERE seq > :cursor
+            ORDER BY seq
             LIMIT :limit
         """
-        result = await self.db.execute(query, {"ranks": premium_ranks, "limit": limit})
-        return [Hand.from_db_row(row) for row in result]
+        result = await self.db.execute(query, {"cursor": cursor, "limit": limit})
+        return [PremiumHand.from_trusted_row(row) for row in result]
 
 
+@instrument_repository
 class TournamentsRepository:
-    """토너먼트 데이터 Repository"""
+    """토너먼트 데이터 Repository
 
-    def __init__(self, db: Database):
+    upsert / upsert_diff는 저장 후 칩 순위 인덱스(Leaderboard)와
+    tournament_leaderboard 테이블을 바뀐 플레이어만 갱신한다.
+    """
+
+    def __init__(self, db: Database, leaderboards: Optional[LeaderboardRegistry] = None):
         self.db = db
+        self.leaderboards = leaderboards if leaderboards is not None else get_leaderboards()
 
     async def upsert(self, tournament: Tournament) -> int:
         """토너먼트 저장 또는 업데이트"""
+        row = await self._upsert(tournament)
+        await self._sync_leaderboard(
+            row["id"], tournament, row["updated_at"], row.get("previous_updated_at")
+        )
+        return int(row["id"])
+
+    async def _upsert(self, tournament: Tournament) -> dict[str, Any]:
+        """INSERT ... ON CONFLICT 실행 → {"id", "updated_at", "previous_updated_at"}
+
+        previous_updated_at은 이 쓰기 직전의 updated_at (새로 저장했으면 None).
+        RETURNING 안의 서브쿼리는 문장 시작 시점 스냅샷을 보므로 갱신 전 값이 나온다.
+        """
         import json
 
         db_dict = tournament.to_db_dict()
@@ -117,28 +562,255 @@ class TournamentsRepository:
                 current_blinds_json = EXCLUDED.current_blinds_json,
                 standings_json = EXCLUDED.standings_json,
                 updated_at = EXCLUDED.updated_at
-            RETURNING id
+            RETURNING id, updated_at, (
+                SELECT previous.updated_at FROM tournaments previous
+                WHERE previous.event_code = :event_code
+            ) AS previous_updated_at
         """
-        result = await self.db.execute(query, db_dict)
-        return result[0]["id"] if result else 0
+        result = await self.db.execute_write_returning(query, db_dict)
+        return result[0] if result else {"id": 0, "updated_at": None, "previous_updated_at": None}
+
+    async def upsert_diff(self, tournament: Tournament) -> dict[str, Any]:
+        """변경분만 저장 (CSV 재파싱 시 upsert 대신 사용)
+
+        저장된 행과 비교해 upsert가 갱신하는 컬럼 중 바뀐 것만 UPDATE한다.
+        standings_json은 플레이어 수가 같으면 바뀐 항목만 jsonb_set으로 패치하고,
+        변경이 없으면 쓰기 자체를 생략한다 (updated_at 트리거도 발생하지 않음).
+
+        Returns:
+            {"id", "action": "inserted" | "updated" | "skipped", "changed_columns",
+             "standings_patched", "bytes_full", "bytes_written", "bytes_saved"}
+            bytes_*는 갱신 컬럼 값의 JSON 직렬화 크기 기준 (전체 upsert 대비 절감량)
+        """
+        import json
+
+        db_dict = tournament.to_db_dict()
+        new = {
+            column: json.loads(json.dumps(db_dict[column], default=str))
+            if column.endswith("_json") else db_dict[column]
+            for column in _TOURNAMENT_UPDATE_COLUMNS
+        }
+        bytes_full = sum(_payload_size(value) for value in new.values())
+
+        query = f"""
+            SELECT id, updated_at, {select_list(_TOURNAMENT_UPDATE_COLUMNS)} FROM tournaments
+            WHERE event_code = :event_code
+        """
+        result = await self.db.execute(query, {"event_code": tournament.event_code})
+        if not result:
+            tournament_id = await self.upsert(tournament)
+            return _diff_stats(tournament_id, "inserted", list(new), None, bytes_full, bytes_full)
+
+        stored = result[0]
+        old = {
+            column: decode_json(stored[column]) if column.endswith("_json") else stored[column]
+            for column in _TOURNAMENT_UPDATE_COLUMNS
+        }
+        changed = [column for column in _TOURNAMENT_UPDATE_COLUMNS if old[column] != new[column]]
+        if not changed:
+            return _diff_stats(stored["id"], "skipped", [], None, bytes_full, 0)
+
+        sets = ["updated_at = :updated_at"]
+        conditions = ["id = :id"]
+        params: dict[str, Any] = {"id": stored["id"], "updated_at": tournament.updated_at}
+        bytes_written = 0
+        standings_patched = None
+
+        for column in changed:
+            if column == "standings_json":
+                patches = diff_standings(old[column] or [], new[column] or [])
+                patch_size = sum(_payload_size(e) for e in (patches or {}).values())
+                if (
+                    patches is not None
+                    and len(patches) <= _MAX_STANDINGS_PATCHES
+                    and patch_size < _payload_size(new[column])
+                ):
+                    expression = "standings_json"
+                    for index, entry in patches.items():
+                        key = f"standing_{index}"
+                        expression = (
+                            f"jsonb_set({expression}, '{{{index}}}', CAST(:{key} AS jsonb))"
+                        )
+                        params[key] = json.dumps(entry)
+                    sets.append(f"standings_json = {expression}")
+                    # 패치 대상 배열이 그 사이 바뀌었으면 적용하지 않음 (아래에서 전체 upsert)
+                    conditions.append("jsonb_array_length(standings_json) = :standings_length")
+                    params["standings_length"] = len(new[column])
+                    bytes_written += patch_size
+                    standings_patched = len(patches)
+                    continue
+
+            value = new[column]
+            if column.endswith("_json") and value is not None:
+                value = json.dumps(value)
+            params[column] = value
+            sets.append(f"{column} = :{column}")
+            bytes_written += _payload_size(new[column])
+
+        query = f"""
+            UPDATE tournaments SET {', '.join(sets)}
+            WHERE {' AND '.join(conditions)}
+            RETURNING id, updated_at
+        """
+        updated = await self.db.execute_write_returning(query, params)
+        if not updated:
+            tournament_id = await self.upsert(tournament)
+            return _diff_stats(tournament_id, "updated", changed, None, bytes_full, bytes_full)
+
+        await self._sync_leaderboard(
+            stored["id"], tournament, updated[0]["updated_at"], stored["updated_at"]
+        )
+        stats = _diff_stats(
+            stored["id"], "updated", changed, standings_patched, bytes_full, bytes_written
+        )
+        logger.info(
+            "tournaments upsert_diff %s: %s (%d bytes saved)",
+            tournament.event_code, ", ".join(changed), stats["bytes_saved"],
+        )
+        return stats
+
+    # ========================================
+    # 칩 순위 인덱스
+    # ========================================
+
+    async def get_leaderboard(self, event_code: str) -> Optional[Leaderboard]:
+        """칩 순위 인덱스 조회 (Leaderboard / Player Stats 자막용)
+
+        메모리 인덱스가 tournaments.updated_at보다 오래되었으면 (다른 프로세스가 갱신)
+        tournament_leaderboard 테이블에서 다시 로드한다. 이후 조회는 메모리에서 처리.
+
+        Returns:
+            Leaderboard, 토너먼트가 없으면 None
+        """
+        query = "SELECT id, updated_at FROM tournaments WHERE event_code = :event_code"
+        result = await self.db.execute(query, {"event_code": event_code})
+        if not result:
+            return None
+
+        row = result[0]
+        board = self.leaderboards.get(event_code, updated_at=row["updated_at"])
+        if board is None:
+            board = await self._load_leaderboard(event_code, row["id"], row["updated_at"])
+        return board
+
+    async def _load_leaderboard(
+        self, event_code: str, tournament_id: int, updated_at: Optional[datetime]
+    ) -> Leaderboard:
+        """tournament_leaderboard 테이블에서 인덱스 생성 후 등록"""
+        query = """
+            SELECT player_name, nationality, chips, table_id, seat
+            FROM tournament_leaderboard
+            WHERE tournament_id = :tournament_id
+            ORDER BY chips DESC, player_name
+        """
+        rows = await self.db.execute(query, {"tournament_id": tournament_id})
+        standings = [
+            PlayerStanding(
+                rank=rank,
+                name=row["player_name"],
+                nationality=row["nationality"] or "",
+                chips=row["chips"] or 0,
+                table_id=row["table_id"],
+                seat=row["seat"],
+            )
+            for rank, row in enumerate(rows, start=1)
+        ]
+        board = Leaderboard(event_code, standings, updated_at, tournament_id=tournament_id)
+        self.leaderboards.put(board)
+        return board
+
+    async def _sync_leaderboard(
+        self,
+        tournament_id: int,
+        tournament: Tournament,
+        updated_at: Optional[datetime],
+        previous_updated_at: Optional[datetime] = None,
+    ) -> None:
+        """저장된 순위표를 인덱스/테이블에 반영 (바뀐 플레이어만)
+
+        Args:
+            updated_at: 이번 쓰기 후 tournaments.updated_at
+            previous_updated_at: 이번 쓰기 직전 tournaments.updated_at. 메모리 인덱스가
+                이보다 오래되었으면 (다른 프로세스가 갱신) 테이블에서 다시 로드한 뒤 비교한다.
+                오래된 인덱스와 비교하면 그 인덱스와 같은 값은 기록되지 않아 테이블이 어긋난다.
+        """
+        board = self.leaderboards.get(tournament.event_code, updated_at=previous_updated_at)
+        if board is None or board.tournament_id != tournament_id:
+            board = await self._load_leaderboard(tournament.event_code, tournament_id, updated_at)
+
+        changed, removed = board.diff(tournament.standings)
+        try:
+            if changed:
+                await self.db.execute_many(
+                    """
+                    INSERT INTO tournament_leaderboard (
+                        tournament_id, player_name, nationality, chips, table_id, seat, updated_at
+                    ) VALUES (
+                        :tournament_id, :player_name, :nationality, :chips, :table_id, :seat,
+                        NOW()
+                    )
+                    ON CONFLICT (tournament_id, player_name) DO UPDATE SET
+                        nationality = EXCLUDED.nationality,
+                        chips = EXCLUDED.chips,
+                        table_id = EXCLUDED.table_id,
+                        seat = EXCLUDED.seat,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    [
+                        {
+                            "tournament_id": tournament_id,
+                            "player_name": s.name,
+                            "nationality": s.nationality,
+                            "chips": s.chips,
+                            "table_id": s.table_id,
+                            "seat": s.seat,
+                        }
+                        for s in changed
+                    ],
+                )
+            if removed:
+                await self.db.execute_write(
+                    """
+                    DELETE FROM tournament_leaderboard
+                    WHERE tournament_id = :tournament_id AND player_name = ANY(:names)
+                    """,
+                    {"tournament_id": tournament_id, "names": removed},
+                )
+        except Exception:
+            # 테이블과 어긋났을 수 있으므로 다음 조회에서 다시 로드
+            self.leaderboards.invalidate(tournament.event_code)
+            raise
+
+        board.apply(tournament.standings, updated_at)
 
     async def get_by_event_code(self, event_code: str) -> Optional[Tournament]:
         """이벤트 코드로 조회"""
-        query = "SELECT * FROM tournaments WHERE event_code = :event_code"
+        query = f"SELECT {_TOURNAMENT_SELECT} FROM tournaments WHERE event_code = :event_code"
         result = await self.db.execute(query, {"event_code": event_code})
-        return Tournament.from_db_row(result[0]) if result else None
+        return Tournament.from_trusted_row(result[0]) if result else None
 
     async def get_active(self) -> list[Tournament]:
         """진행 중인 토너먼트 조회"""
-        query = """
-            SELECT * FROM tournaments
+        query = f"""
+            SELECT {_TOURNAMENT_SELECT} FROM tournaments
+            WHERE end_date IS NULL OR end_date > NOW()
+            ORDER BY start_date DESC
+        """
+        result = await self.db.execute(query)
+        return [Tournament.from_trusted_row(row) for row in result]
+
+    async def get_active_summaries(self) -> list[TournamentSummary]:
+        """진행 중인 토너먼트 요약 조회 (목록용, standings 등 JSON 컬럼 제외)"""
+        query = f"""
+            SELECT {_TOURNAMENT_SUMMARY_SELECT} FROM tournaments
             WHERE end_date IS NULL OR end_date > NOW()
             ORDER BY start_date DESC
         """
         result = await self.db.execute(query)
-        return [Tournament.from_db_row(row) for row in result]
+        return [TournamentSummary.from_trusted_row(row) for row in result]
 
 
+@instrument_repository
 class RenderInstructionsRepository:
     """렌더링 지시서 Repository"""
 
@@ -146,53 +818,464 @@ class RenderInstructionsRepository:
         self.db = db
 
     async def insert(self, instruction: RenderInstruction) -> int:
-        """렌더링 지시서 저장"""
+        """렌더링 지시서 저장
+
+        같은 내용(template_name + content_hash)의 진행 중 / 완료 작업이 있으면
+        새로 저장하지 않고 그 작업의 ID를 반환한다. 상세 결과는 enqueue() 사용.
+        """
+        return int((await self.enqueue(instruction))["id"])
+
+    async def enqueue(
+        self,
+        instruction: RenderInstruction,
+        dedup: bool = True,
+        reuse_outputs: bool = True,
+        coalesce_window: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """렌더링 지시서 등록 (내용 기반 중복 제거 / 병합)
+
+        같은 템플릿에 같은 layer_data + output_settings면 출력도 같으므로:
+        1. pending/processing 작업이 있으면 그 작업에 합류 ("duplicate")
+        2. 완료된 작업의 결과가 있으면 재사용 ("reused_output")
+        3. coalesce_window 안에 같은 트리거(template_name, trigger_type, trigger_id)의
+           pending 작업이 있으면 그 작업을 새 내용으로 교체 ("coalesced")
+           예: CSV 갱신마다 생성되는 리더보드는 최신 것 하나만 렌더링
+        4. 그 외 새로 저장 + NOTIFY ("inserted")
+
+        Args:
+            instruction: 렌더링 지시서
+            dedup: False면 중복 검사 없이 항상 새로 저장 (강제 재렌더)
+            reuse_outputs: 완료된 작업의 결과 재사용 여부
+            coalesce_window: 병합 대상 pending 작업의 최대 나이 (초), None이면 병합 안 함
+
+        Returns:
+            {"id", "action", "content_hash", "output_id", "output_path"}
+            output_*는 "reused_output"일 때만 값이 있음
+        """
         import json
 
+        content_hash = instruction.content_hash() if dedup else None
+
+        if dedup:
+            existing = await self._find_by_content(
+                instruction.template_name, content_hash, reuse_outputs
+            )
+            if existing:
+                return existing
+
         db_dict = instruction.to_db_dict()
         db_dict["layer_data_json"] = json.dumps(db_dict["layer_data_json"])
         db_dict["output_settings_json"] = json.dumps(db_dict["output_settings_json"])
+        db_dict["content_hash"] = content_hash
 
+        if coalesce_window is not None and instruction.trigger_type:
+            # 같은 내용의 진행 중 작업이 생겼으면 병합하지 않음 (content_hash 유니크 인덱스 충돌)
+            query = """
+                WITH target AS (
+                    SELECT id FROM render_instructions
+                    WHERE status = 'pending'
+                      AND template_name = :template_name
+                      AND trigger_type = :trigger_type
+                      AND trigger_id IS NOT DISTINCT FROM :trigger_id
+                      AND created_at >= NOW() - make_interval(secs => :coalesce_window)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM render_instructions active
+                          WHERE active.template_name = :template_name
+                            AND active.content_hash = :content_hash
+                            AND active.status IN ('pending', 'processing')
+                      )
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE render_instructions ri
+                SET layer_data_json = :layer_data_json,
+                    output_settings_json = :output_settings_json,
+                    output_path = :output_path,
+                    output_filename = :output_filename,
+                    content_hash = :content_hash,
+                    priority = LEAST(ri.priority, :priority),
+                    deadline_at = LEAST(ri.deadline_at, :deadline_at),
+                    retry_count = 0,
+                    next_attempt_at = NULL
+                FROM target
+                WHERE ri.id = target.id
+                RETURNING ri.id
+            """
+            try:
+                result = await self.db.execute_write_returning(
+                    query, {**db_dict, "coalesce_window": float(coalesce_window)}
+                )
+            except IntegrityError:
+                # 스냅샷 이후 커밋된 동시 등록과 충돌 → 그 작업에 합류
+                existing = await self._find_by_content(
+                    instruction.template_name, content_hash, False
+                )
+                if existing is None:
+                    raise
+                return existing
+            if result:
+                return _enqueue_result(result[0]["id"], "coalesced", content_hash)
+
+        # 같은 트랜잭션에서 NOTIFY → 커밋 시점에 LISTEN 중인 워커가 즉시 깨어남
+        # 동시에 같은 내용이 등록되면 부분 유니크 인덱스로 하나만 저장
         query = """
-            INSERT INTO render_instructions (
-                template_name, layer_data_json, output_settings_json,
-                output_path, output_filename, status, priority,
-                trigger_type, trigger_id, error_message,
-                retry_count, max_retries, created_at, started_at, completed_at
-            ) VALUES (
-                :template_name, :layer_data_json, :output_settings_json,
-                :output_path, :output_filename, :status, :priority,
-                :trigger_type, :trigger_id, :error_message,
-                :retry_count, :max_retries, :created_at, :started_at, :completed_at
-            ) RETURNING id
+            WITH inserted AS (
+                INSERT INTO render_instructions (
+                    template_name, layer_data_json, output_settings_json,
+                    output_path, output_filename, status, priority, deadline_at,
+                    trigger_type, trigger_id, error_message,
+                    retry_count, max_retries, created_at, started_at, completed_at,
+                    content_hash
+                ) VALUES (
+                    :template_name, :layer_data_json, :output_settings_json,
+                    :output_path, :output_filename, :status, :priority, :deadline_at,
+                    :trigger_type, :trigger_id, :error_message,
+                    :retry_count, :max_retries, :created_at, :started_at, :completed_at,
+                    :content_hash
+                )
+                ON CONFLICT (template_name, content_hash)
+                    WHERE status IN ('pending', 'processing')
+                    DO NOTHING
+                RETURNING id, template_name, priority, created_at
+            )
+            SELECT
+                id,
+                pg_notify(:channel, json_build_object(
+                    'id', id,
+                    'template_name', template_name,
+                    'priority', priority,
+                    'created_at', EXTRACT(EPOCH FROM created_at)
+                )::text) AS notified
+            FROM inserted
         """
-        result = await self.db.execute(query, db_dict)
-        return result[0]["id"] if result else 0
+        db_dict["channel"] = RENDER_INSTRUCTIONS_CHANNEL
+        result = await self.db.execute_write_returning(query, db_dict)
+        if result:
+            return _enqueue_result(result[0]["id"], "inserted", content_hash)
+
+        existing = await self._find_by_content(instruction.template_name, content_hash, False)
+        if existing:
+            return existing
+        return _enqueue_result(0, "inserted", content_hash)
+
+    async def _find_by_content(
+        self, template_name: str, content_hash: Optional[str], reuse_outputs: bool
+    ) -> Optional[dict[str, Any]]:
+        """같은 내용의 진행 중 작업 또는 결과가 있는 완료 작업 (진행 중 우선)"""
+        completed = (
+            "OR (ri.status = 'completed' AND ro.id IS NOT NULL)" if reuse_outputs else ""
+        )
+        query = f"""
+            SELECT ri.id, ri.status, ro.id AS output_id, ro.output_path
+            FROM render_instructions ri
+            LEFT JOIN LATERAL (
+                SELECT id, output_path FROM render_outputs
+                WHERE instruction_id = ri.id AND status = 'completed' AND evicted_at IS NULL
+                ORDER BY completed_at DESC
+                LIMIT 1
+            ) ro ON ri.status = 'completed'
+            WHERE ri.template_name = :template_name
+              AND ri.content_hash = :content_hash
+              AND (ri.status IN ('pending', 'processing') {completed})
+            ORDER BY (ri.status = 'completed'), ri.created_at DESC
+            LIMIT 1
+        """
+        result = await self.db.execute(
+            query, {"template_name": template_name, "content_hash": content_hash}
+        )
+        if not result:
+            return None
+
+        row = result[0]
+        if row["status"] == "completed":
+            return _enqueue_result(
+                row["id"], "reused_output", content_hash, row["output_id"], row["output_path"]
+            )
+        return _enqueue_result(row["id"], "duplicate", content_hash)
 
     async def get_pending(self, limit: int = 10) -> list[RenderInstruction]:
         """pending 상태 지시서 조회 (ae가 polling)"""
-        query = """
-            SELECT * FROM render_instructions
-            WHERE status = 'pending'
-            ORDER BY priority ASC, created_at ASC
-            LIMIT :limit
+        query = _due_pending_by_priority(_RENDER_INSTRUCTION_SELECT, "limit")
+        result = await self.db.execute(query, {"limit": limit})
+        return [RenderInstruction.from_trusted_row(row) for row in result]
+
+    async def get_pending_summaries(self, limit: int = 10) -> list[RenderInstructionSummary]:
+        """점유 가능한 pending 지시서 요약 조회 (목록용, layer_data 등 JSON 컬럼 제외)
+
+        get_pending과 같은 조건 / 순서 (재시도 대기 중인 작업 제외)
         """
+        query = _due_pending_by_priority(_RENDER_INSTRUCTION_SUMMARY_SELECT, "limit")
         result = await self.db.execute(query, {"limit": limit})
-        return [RenderInstruction.from_db_row(row) for row in result]
+        return [RenderInstructionSummary.from_trusted_row(row) for row in result]
+
+    async def claim_batch(
+        self, worker_id: str, n: int = 1, lease_seconds: float = 60
+    ) -> list[RenderInstruction]:
+        """pending 지시서 N개를 원자적으로 점유 (ae 워커용)
+
+        FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행은 건너뛰므로
+        여러 렌더 노드가 동시에 호출해도 같은 작업을 중복 점유하지 않는다.
+        점유된 행은 processing 상태와 lease 만료 시각을 가진 채 반환된다.
+
+        Args:
+            worker_id: 점유하는 워커 식별자
+            n: 최대 점유 개수
+            lease_seconds: lease 유지 시간 (초). 만료 전 renew_lease로 연장
+
+        Returns:
+            점유한 지시서 (priority, created_at 순)
+        """
+        query = f"""
+            WITH claimable AS (
+                {_due_pending_by_priority("id, priority, created_at", "n", lock=True)}
+            )
+            UPDATE render_instructions ri
+            SET status = 'processing',
+                started_at = NOW(),
+                worker_id = :worker_id,
+                lease_expires_at = NOW() + make_interval(secs => :lease_seconds)
+            FROM claimable
+            WHERE ri.id = claimable.id
+            RETURNING {select_list(_RENDER_INSTRUCTION_COLUMNS, alias="ri")}
+        """
+        result = await self.db.execute_write_returning(
+            query,
+            {"n": n, "worker_id": worker_id, "lease_seconds": float(lease_seconds)},
+        )
+        claimed = [RenderInstruction.from_trusted_row(row) for row in result]
+        claimed.sort(key=lambda inst: (inst.priority, inst.created_at))
+        return claimed
+
+    # ========================================
+    # 스케줄러 (shared.render.RenderScheduler)
+    # ========================================
+
+    async def get_schedulable(self, limit: int = 200) -> list[RenderInstructionSummary]:
+        """스케줄링 후보 pending 지시서 요약
+
+        우선순위 순만 보면 오래 기다린(aging) 저우선순위 작업이나 마감이 임박한 작업이
+        LIMIT 밖에 남을 수 있으므로 마감순 / 우선순위순 / 대기순 상위 limit개씩을 합친다.
+        """
+        query = f"""
+            SELECT {_RENDER_INSTRUCTION_SUMMARY_SELECT} FROM render_instructions
+            WHERE id IN (
+                (SELECT id FROM render_instructions
+                 WHERE {_DUE_PENDING} AND deadline_at IS NOT NULL
+                 ORDER BY deadline_at ASC LIMIT :limit)
+                UNION
+                (SELECT id FROM (
+                    {_due_pending_by_priority("id, priority, created_at", "limit")}
+                 ) by_priority)
+                UNION
+                (SELECT id FROM render_instructions
+                 WHERE {_DUE_PENDING}
+                 ORDER BY created_at ASC LIMIT :limit)
+            )
+        """
+        result = await self.db.execute(query, {"limit": limit})
+        return [RenderInstructionSummary.from_trusted_row(row) for row in result]
+
+    async def get_running_counts(self) -> dict[str, int]:
+        """템플릿별 processing 지시서 수 (템플릿 동시 실행 제한용)"""
+        query = """
+            SELECT template_name, COUNT(*) AS count
+            FROM render_instructions
+            WHERE status = 'processing'
+            GROUP BY template_name
+        """
+        result = await self.db.execute(query)
+        return {row["template_name"]: row["count"] for row in result}
+
+    async def claim_ids(
+        self, worker_id: str, ids: list[int], lease_seconds: float = 60
+    ) -> list[RenderInstruction]:
+        """지정한 pending 지시서들을 원자적으로 점유 (스케줄러가 고른 작업)
+
+        다른 워커가 먼저 점유했거나 잠근 행은 건너뛴다.
+
+        Returns:
+            점유한 지시서 (ids 순서 유지)
+        """
+        if not ids:
+            return []
+        query = f"""
+            WITH claimable AS (
+                SELECT id FROM render_instructions
+                WHERE id = ANY(:ids) AND {_DUE_PENDING}
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE render_instructions ri
+            SET status = 'processing',
+                started_at = NOW(),
+                worker_id = :worker_id,
+                lease_expires_at = NOW() + make_interval(secs => :lease_seconds)
+            FROM claimable
+            WHERE ri.id = claimable.id
+            RETURNING {select_list(_RENDER_INSTRUCTION_COLUMNS, alias="ri")}
+        """
+        result = await self.db.execute_write_returning(
+            query,
+            {"ids": list(ids), "worker_id": worker_id, "lease_seconds": float(lease_seconds)},
+        )
+        order: dict[Optional[int], int] = {
+            instruction_id: i for i, instruction_id in enumerate(ids)
+        }
+        claimed = [RenderInstruction.from_trusted_row(row) for row in result]
+        claimed.sort(key=lambda inst: order.get(inst.id, len(order)))
+        return claimed
+
+    async def get_render_durations(self, window_days: int = 7) -> list[dict[str, Any]]:
+        """템플릿별 렌더링 소요 시간 (started_at → completed_at, 예상 비용 학습용)
+
+        Returns:
+            [{"template_name", "count", "mean_seconds", "p90_seconds"}, ...]
+        """
+        query = """
+            SELECT
+                template_name,
+                COUNT(*) AS count,
+                AVG(duration) AS mean_seconds,
+                percentile_cont(0.9) WITHIN GROUP (ORDER BY duration) AS p90_seconds
+            FROM (
+                SELECT template_name, EXTRACT(EPOCH FROM completed_at - started_at) AS duration
+                FROM render_instructions
+                WHERE status = 'completed'
+                  AND started_at IS NOT NULL
+                  AND completed_at >= NOW() - make_interval(days => :window_days)
+            ) recent
+            WHERE duration >= 0
+            GROUP BY template_name
+        """
+        result = await self.db.execute(query, {"window_days": window_days})
+        return [
+            {
+                "template_name": row["template_name"],
+                "count": row["count"],
+                "mean_seconds": float(row["mean_seconds"] or 0),
+                "p90_seconds": float(row["p90_seconds"] or 0),
+            }
+            for row in result
+        ]
+
+    async def get_history(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """기간 내 생성된 지시서 기록 (스케줄러 시뮬레이션 재생용, JSON 컬럼 제외)"""
+        query = """
+            SELECT id, template_name, priority, deadline_at, status,
+                   created_at, started_at, completed_at
+            FROM render_instructions
+            WHERE created_at >= :start AND created_at < :end
+            ORDER BY created_at ASC, id ASC
+        """
+        return await self.db.execute(query, {"start": start, "end": end})
+
+    async def renew_lease(
+        self, instruction_id: int, worker_id: str, lease_seconds: float = 60
+    ) -> bool:
+        """lease 연장 (렌더링이 길어질 때 워커가 주기적으로 호출)
+
+        Returns:
+            연장 성공 여부. False면 lease가 만료되어 회수된 것이므로 작업 중단
+        """
+        query = """
+            UPDATE render_instructions
+            SET lease_expires_at = NOW() + make_interval(secs => :lease_seconds)
+            WHERE id = :id AND worker_id = :worker_id AND status = 'processing'
+        """
+        rows = await self.db.execute_write(
+            query,
+            {
+                "id": instruction_id,
+                "worker_id": worker_id,
+                "lease_seconds": float(lease_seconds),
+            },
+        )
+        return rows > 0
+
+    async def reap_expired_leases(self) -> int:
+        """lease가 만료된 processing 지시서 회수
+
+        워커가 죽거나 네트워크가 끊겨 lease를 연장하지 못한 작업을 회수한다.
+        회수도 시도 한 번으로 보고 retry_count를 올리며, max_retries를 소진한 작업은
+        pending으로 되돌리지 않고 failed + render_dead_letters(transient)로 옮긴다
+        (매번 워커를 죽이는 작업이 무한히 재점유되지 않도록).
+
+        Returns:
+            회수된 지시서 수 (dead letter로 옮긴 작업 포함)
+        """
+        query = """
+            WITH expired AS (
+                SELECT id FROM render_instructions
+                WHERE status = 'processing' AND lease_expires_at < NOW()
+                FOR UPDATE SKIP LOCKED
+            ),
+            requeued AS (
+                UPDATE render_instructions ri
+                SET status = 'pending',
+                    retry_count = ri.retry_count + 1,
+                    worker_id = NULL,
+                    lease_expires_at = NULL,
+                    started_at = NULL,
+                    error_message = :error_message
+                FROM expired
+                WHERE ri.id = expired.id AND ri.retry_count < ri.max_retries
+                RETURNING ri.id
+            ),
+            failed AS (
+                UPDATE render_instructions ri
+                SET status = 'failed',
+                    error_message = :error_message,
+                    completed_at = NOW(),
+                    next_attempt_at = NULL,
+                    worker_id = NULL,
+                    lease_expires_at = NULL
+                FROM expired
+                WHERE ri.id = expired.id AND ri.retry_count >= ri.max_retries
+                RETURNING ri.id, ri.template_name, ri.retry_count
+            ),
+            dead_letters AS (
+                INSERT INTO render_dead_letters (
+                    instruction_id, template_name, error_kind, error_message, retry_count
+                )
+                SELECT id, template_name, 'transient', :error_message, retry_count
+                FROM failed
+                RETURNING instruction_id
+            )
+            SELECT
+                (SELECT COUNT(*) FROM requeued) AS requeued,
+                (SELECT COUNT(*) FROM dead_letters) AS dead_lettered
+        """
+        result = await self.db.execute_write_returning(query, {"error_message": "lease expired"})
+        row = result[0] if result else {"requeued": 0, "dead_lettered": 0}
+        if row["dead_lettered"]:
+            logger.warning(
+                "%d render instruction(s) exhausted retries on expired leases (dead letter)",
+                row["dead_lettered"],
+            )
+        return row["requeued"] + row["dead_lettered"]
 
     async def update_status(
         self,
         instruction_id: int,
         status: RenderStatus,
         error_message: Optional[str] = None,
+        worker_id: Optional[str] = None,
     ) -> bool:
-        """상태 업데이트"""
+        """상태 업데이트
+
+        Args:
+            worker_id: 주면 이 워커가 아직 점유 중(processing)일 때만 변경
+                (lease가 만료되어 회수/재점유된 작업을 덮어쓰지 않도록)
+
+        Returns:
+            변경 여부. worker_id를 줬는데 False면 lease를 잃은 것
+        """
         now = datetime.now()
         query = """
             UPDATE render_instructions
             SET status = :status, error_message = :error_message
         """
-        params = {
+        params: dict[str, Any] = {
             "id": instruction_id,
             "status": status.value,
             "error_message": error_message,
@@ -206,21 +1289,178 @@ class RenderInstructionsRepository:
             params["completed_at"] = now
 
         query += " WHERE id = :id"
+        if worker_id is not None:
+            query += f" AND {_OWNED_BY_WORKER}"
+            params["worker_id"] = worker_id
 
         rows = await self.db.execute_write(query, params)
         return rows > 0
 
-    async def increment_retry(self, instruction_id: int) -> bool:
-        """재시도 횟수 증가"""
+    async def increment_retry(
+        self,
+        instruction_id: int,
+        delay_seconds: float = 0,
+        error_message: Optional[str] = None,
+        worker_id: Optional[str] = None,
+    ) -> bool:
+        """재시도 예약 (retry_count 증가, next_attempt_at 이후에 다시 점유 가능)
+
+        Args:
+            instruction_id: 지시서 ID
+            delay_seconds: 재시도까지 대기 시간 (초, 백오프는 shared.render.RetryHandler)
+            error_message: 이번 실패 메시지
+            worker_id: 주면 이 워커가 아직 점유 중일 때만 예약 (update_status 참고)
+
+        Returns:
+            예약 여부. False면 max_retries 소진 (dead letter로 옮길 것) 또는 lease 상실
+        """
         query = """
             UPDATE render_instructions
-            SET retry_count = retry_count + 1, status = 'pending'
+            SET retry_count = retry_count + 1,
+                status = 'pending',
+                next_attempt_at = NOW() + make_interval(secs => :delay_seconds),
+                error_message = COALESCE(:error_message, error_message),
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                started_at = NULL
             WHERE id = :id AND retry_count < max_retries
         """
-        rows = await self.db.execute_write(query, {"id": instruction_id})
+        params = {
+            "id": instruction_id,
+            "delay_seconds": float(delay_seconds),
+            "error_message": error_message,
+        }
+        if worker_id is not None:
+            query += f" AND {_OWNED_BY_WORKER}"
+            params["worker_id"] = worker_id
+
+        rows = await self.db.execute_write(query, params)
         return rows > 0
 
-    async def get_stats(self) -> dict:
+    async def move_to_dead_letter(
+        self,
+        instruction_id: int,
+        error_message: str,
+        error_kind: str,
+        worker_id: Optional[str] = None,
+    ) -> Optional[int]:
+        """실패 확정: failed 처리 + render_dead_letters에 기록 (한 트랜잭션)
+
+        Args:
+            worker_id: 주면 이 워커가 아직 점유 중일 때만 처리 (update_status 참고)
+
+        Returns:
+            dead letter ID (지시서가 없거나 lease를 잃었으면 None)
+        """
+        guard = f"AND {_OWNED_BY_WORKER}" if worker_id is not None else ""
+        query = f"""
+            WITH failed AS (
+                UPDATE render_instructions
+                SET status = 'failed',
+                    error_message = :error_message,
+                    completed_at = NOW(),
+                    next_attempt_at = NULL,
+                    worker_id = NULL,
+                    lease_expires_at = NULL
+                WHERE id = :id {guard}
+                RETURNING id, template_name, retry_count
+            )
+            INSERT INTO render_dead_letters (
+                instruction_id, template_name, error_kind, error_message, retry_count
+            )
+            SELECT id, template_name, :error_kind, :error_message, retry_count
+            FROM failed
+            RETURNING id
+        """
+        params = {"id": instruction_id, "error_message": error_message, "error_kind": error_kind}
+        if worker_id is not None:
+            params["worker_id"] = worker_id
+
+        result = await self.db.execute_write_returning(query, params)
+        return result[0]["id"] if result else None
+
+    # ========================================
+    # 보관 (shared.db.retention.RetentionJob)
+    # ========================================
+
+    async def get_archivable(
+        self, before: datetime, after_id: int = 0, limit: int = 500
+    ) -> list[dict[str, Any]]:
+        """before 이전에 끝난 completed/failed 지시서 (렌더 결과 포함, id 순)
+
+        아직 캐시로 쓰이는 결과(제거되지 않았고 before 이후 사용됨)가 있는 지시서는 제외한다.
+
+        Returns:
+            지시서 행 + outputs_json (render_outputs 행 배열 JSON 텍스트)
+        """
+        query = f"""
+            SELECT
+                {select_list(_RENDER_INSTRUCTION_COLUMNS, alias="ri")},
+                ri.content_hash,
+                COALESCE(
+                    (SELECT json_agg(ro ORDER BY ro.id)::text
+                     FROM render_outputs ro WHERE ro.instruction_id = ri.id),
+                    '[]'
+                ) AS outputs_json
+            FROM render_instructions ri
+            WHERE ri.status IN ('completed', 'failed')
+              AND ri.completed_at < :before
+              AND ri.id > :after_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM render_outputs live
+                  WHERE live.instruction_id = ri.id
+                    AND live.status = 'completed'
+                    AND live.evicted_at IS NULL
+                    AND COALESCE(live.last_hit_at, live.completed_at) >= :before
+              )
+            ORDER BY ri.id
+            LIMIT :limit
+        """
+        return await self.db.execute(
+            query, {"before": before, "after_id": after_id, "limit": limit}
+        )
+
+    async def delete_archived(self, ids: list[int]) -> int:
+        """보관된 지시서 삭제 (render_outputs는 FK CASCADE로 함께 삭제)
+
+        그 사이 다시 진행 중이 된 지시서(dead letter 재등록 등)는 남긴다.
+        """
+        if not ids:
+            return 0
+        query = """
+            DELETE FROM render_instructions
+            WHERE id = ANY(:ids) AND status IN ('completed', 'failed')
+        """
+        return await self.db.execute_write(query, {"ids": list(ids)})
+
+    async def get_claim_latency(self, window_minutes: int = 15) -> dict[str, Any]:
+        """enqueue → claim 지연 통계 (모니터링용)
+
+        최근 window_minutes 동안 처리 시작된 지시서의 created_at → started_at 간격.
+        """
+        query = """
+            SELECT
+                COUNT(*) AS count,
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY latency) AS p50,
+                percentile_cont(0.95) WITHIN GROUP (ORDER BY latency) AS p95,
+                MAX(latency) AS max
+            FROM (
+                SELECT EXTRACT(EPOCH FROM started_at - created_at) AS latency
+                FROM render_instructions
+                WHERE started_at >= NOW() - make_interval(mins => :window_minutes)
+            ) recent
+        """
+        result = await self.db.execute(query, {"window_minutes": window_minutes})
+        row = result[0] if result else {}
+        return {
+            "window_minutes": window_minutes,
+            "count": row.get("count", 0),
+            "p50_seconds": float(row["p50"]) if row.get("p50") is not None else None,
+            "p95_seconds": float(row["p95"]) if row.get("p95") is not None else None,
+            "max_seconds": float(row["max"]) if row.get("max") is not None else None,
+        }
+
+    async def get_stats(self) -> dict[str, Any]:
         """통계 조회 (모니터링용)"""
         query = """
             SELECT
@@ -233,6 +1473,7 @@ class RenderInstructionsRepository:
         return {row["status"]: row["count"] for row in result}
 
 
+@instrument_repository
 class RenderOutputsRepository:
     """렌더링 결과 Repository"""
 
@@ -244,26 +1485,298 @@ class RenderOutputsRepository:
         query = """
             INSERT INTO render_outputs (
                 instruction_id, output_path, file_size, frame_count,
-                status, error_message, created_at, completed_at
+                status, error_message, cache_source_id, created_at, completed_at
             ) VALUES (
                 :instruction_id, :output_path, :file_size, :frame_count,
-                :status, :error_message, :created_at, :completed_at
+                :status, :error_message, :cache_source_id, :created_at, :completed_at
             ) RETURNING id
         """
         db_dict = output.to_db_dict()
-        result = await self.db.execute(query, db_dict)
+        result = await self.db.execute_write_returning(query, db_dict)
         return result[0]["id"] if result else 0
 
     async def get_by_instruction_id(
         self, instruction_id: int
     ) -> Optional[RenderOutput]:
         """지시서 ID로 조회"""
-        query = "SELECT * FROM render_outputs WHERE instruction_id = :instruction_id"
+        query = f"""
+            SELECT {_RENDER_OUTPUT_SELECT} FROM render_outputs
+            WHERE instruction_id = :instruction_id
+        """
         result = await self.db.execute(query, {"instruction_id": instruction_id})
-        return RenderOutput.from_db_row(result[0]) if result else None
+        return RenderOutput.from_trusted_row(result[0]) if result else None
 
     async def get_recent(self, limit: int = 50) -> list[RenderOutput]:
         """최근 결과 조회"""
-        query = "SELECT * FROM render_outputs ORDER BY completed_at DESC LIMIT :limit"
+        query = f"""
+            SELECT {_RENDER_OUTPUT_SELECT} FROM render_outputs
+            ORDER BY completed_at DESC
+            LIMIT :limit
+        """
         result = await self.db.execute(query, {"limit": limit})
-        return [RenderOutput.from_db_row(row) for row in result]
+        return [RenderOutput.from_trusted_row(row) for row in result]
+
+    async def iter_outputs(
+        self,
+        since: Optional[datetime] = None,
+        batch: int = 500,
+        page_size: int = 10_000,
+    ) -> AsyncIterator[RenderOutput]:
+        """렌더링 결과 스트리밍 조회 (created_at, id 오름차순)
+
+        Args:
+            since: 이 시각 이후 생성된 결과만 (created_at >= since)
+            batch: 커서에서 한 번에 가져올 행 수
+            page_size: keyset 페이지 크기
+        """
+        conditions = []
+        params: dict[str, Any] = {}
+        if since is not None:
+            conditions.append("created_at >= :since")
+            params["since"] = since
+
+        async for row in iter_keyset(
+            self.db, "render_outputs", _RENDER_OUTPUT_SELECT, conditions, params,
+            batch=batch, page_size=page_size,
+        ):
+            yield RenderOutput.from_trusted_row(row)
+
+    # ========================================
+    # 렌더 캐시 (shared.render.RenderCache)
+    # ========================================
+
+    async def find_cached(
+        self,
+        template_name: str,
+        content_hash: str,
+        exclude_instruction_id: Optional[int] = None,
+        limit: int = 5,
+    ) -> list[RenderOutput]:
+        """같은 입력(template_name + content_hash)으로 완료된 결과 (최신순, 제거된 파일 제외)"""
+        query = f"""
+            SELECT {select_list(_RENDER_OUTPUT_COLUMNS, alias="ro")}
+            FROM render_instructions ri
+            JOIN render_outputs ro ON ro.instruction_id = ri.id
+            WHERE ri.template_name = :template_name
+              AND ri.content_hash = :content_hash
+              AND ri.id IS DISTINCT FROM :exclude_instruction_id
+              AND ro.status = 'completed'
+              AND ro.evicted_at IS NULL
+            ORDER BY ro.completed_at DESC
+            LIMIT :limit
+        """
+        result = await self.db.execute(
+            query,
+            {
+                "template_name": template_name,
+                "content_hash": content_hash,
+                "exclude_instruction_id": exclude_instruction_id,
+                "limit": limit,
+            },
+        )
+        return [RenderOutput.from_trusted_row(row) for row in result]
+
+    async def mark_hit(self, output_id: int) -> bool:
+        """캐시 적중 기록 (LRU 기준 시각 갱신)"""
+        query = """
+            UPDATE render_outputs
+            SET last_hit_at = NOW(), hit_count = hit_count + 1
+            WHERE id = :id
+        """
+        return await self.db.execute_write(query, {"id": output_id}) > 0
+
+    async def mark_evicted(self, output_paths: list[str]) -> int:
+        """파일이 삭제되었거나 사라진 결과 표시 (이후 캐시 조회에서 제외)"""
+        if not output_paths:
+            return 0
+        query = """
+            UPDATE render_outputs
+            SET evicted_at = NOW()
+            WHERE output_path = ANY(:paths) AND evicted_at IS NULL
+        """
+        return await self.db.execute_write(query, {"paths": list(output_paths)})
+
+    async def list_cached(self) -> list[dict[str, Any]]:
+        """캐시에 남아 있는 출력 파일 (마지막 사용이 오래된 순)
+
+        같은 경로를 가리키는 결과(캐시 적중으로 생성)는 하나로 묶는다.
+
+        Returns:
+            [{"output_path", "file_size", "last_used_at"}, ...]
+        """
+        query = """
+            SELECT
+                output_path,
+                MAX(file_size) AS file_size,
+                MAX(COALESCE(last_hit_at, completed_at)) AS last_used_at
+            FROM render_outputs
+            WHERE status = 'completed' AND evicted_at IS NULL
+            GROUP BY output_path
+            ORDER BY last_used_at ASC
+        """
+        return await self.db.execute(query)
+
+    async def get_cache_stats(self, window_minutes: int = 1440) -> dict[str, Any]:
+        """렌더 캐시 적중률 (모니터링용)
+
+        최근 window_minutes 동안 완료된 결과 중 캐시 재사용(cache_source_id) 비율.
+        """
+        query = """
+            SELECT
+                COUNT(*) FILTER (WHERE cache_source_id IS NOT NULL) AS hits,
+                COUNT(*) FILTER (WHERE cache_source_id IS NULL) AS rendered,
+                COALESCE(SUM(file_size) FILTER (WHERE cache_source_id IS NOT NULL), 0)
+                    AS bytes_reused,
+                (
+                    SELECT COALESCE(SUM(file_size), 0) FROM render_outputs
+                    WHERE status = 'completed' AND evicted_at IS NULL
+                      AND cache_source_id IS NULL
+                ) AS cached_bytes
+            FROM render_outputs
+            WHERE status = 'completed'
+              AND created_at >= NOW() - make_interval(mins => :window_minutes)
+        """
+        result = await self.db.execute(query, {"window_minutes": window_minutes})
+        row = result[0] if result else {}
+        hits = row.get("hits") or 0
+        rendered = row.get("rendered") or 0
+        total = hits + rendered
+        return {
+            "window_minutes": window_minutes,
+            "hits": hits,
+            "rendered": rendered,
+            "hit_rate": round(hits / total, 4) if total else None,
+            "bytes_reused": int(row.get("bytes_reused") or 0),
+            "cached_bytes": int(row.get("cached_bytes") or 0),
+        }
+
+
+@instrument_repository
+class RenderDeadLettersRepository:
+    """재시도를 소진했거나 영구 오류로 실패한 렌더 작업 (운영자 확인 / 일괄 재등록)"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    @staticmethod
+    def _conditions(
+        ids: Optional[list[int]],
+        template_name: Optional[str],
+        error_kind: Optional[str],
+        failed_since: Optional[datetime],
+    ) -> tuple[list[str], dict[str, Any]]:
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        if ids is not None:
+            conditions.append("dl.id = ANY(:ids)")
+            params["ids"] = list(ids)
+        if template_name is not None:
+            conditions.append("dl.template_name = :template_name")
+            params["template_name"] = template_name
+        if error_kind is not None:
+            conditions.append("dl.error_kind = :error_kind")
+            params["error_kind"] = error_kind
+        if failed_since is not None:
+            conditions.append("dl.failed_at >= :failed_since")
+            params["failed_since"] = failed_since
+        return conditions, params
+
+    async def get_recent(
+        self,
+        template_name: Optional[str] = None,
+        error_kind: Optional[str] = None,
+        include_requeued: bool = False,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """dead letter 목록 (최근 실패순)"""
+        conditions, params = self._conditions(None, template_name, error_kind, None)
+        if not include_requeued:
+            conditions.append("dl.requeued_at IS NULL")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT dl.id, dl.instruction_id, dl.template_name, dl.error_kind,
+                   dl.error_message, dl.retry_count, dl.failed_at, dl.requeued_at,
+                   ri.trigger_type, ri.trigger_id, ri.priority
+            FROM render_dead_letters dl
+            LEFT JOIN render_instructions ri ON ri.id = dl.instruction_id
+            {where}
+            ORDER BY dl.failed_at DESC
+            LIMIT :limit
+        """
+        return await self.db.execute(query, {**params, "limit": limit})
+
+    async def requeue(
+        self,
+        ids: Optional[list[int]] = None,
+        template_name: Optional[str] = None,
+        error_kind: Optional[str] = None,
+        failed_since: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> list[int]:
+        """조건에 맞는 dead letter의 지시서를 pending으로 되돌림 (재시도 횟수 초기화)
+
+        같은 내용(template_name + content_hash)은 하나만 재등록하고,
+        이미 진행 중인 같은 내용의 작업이 있으면 건너뛴다 (중복 제거 인덱스와 동일 기준).
+
+        Returns:
+            재등록된 지시서 ID
+        """
+        conditions, params = self._conditions(ids, template_name, error_kind, failed_since)
+        conditions.append("dl.requeued_at IS NULL")
+        query = f"""
+            WITH targets AS (
+                SELECT DISTINCT ON (ri.template_name, COALESCE(ri.content_hash, ri.id::text))
+                    dl.id AS dead_letter_id, ri.id AS instruction_id
+                FROM render_dead_letters dl
+                JOIN render_instructions ri ON ri.id = dl.instruction_id
+                WHERE {' AND '.join(conditions)}
+                  AND ri.status = 'failed'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM render_instructions active
+                      WHERE active.template_name = ri.template_name
+                        AND active.content_hash = ri.content_hash
+                        AND active.status IN ('pending', 'processing')
+                  )
+                ORDER BY ri.template_name, COALESCE(ri.content_hash, ri.id::text),
+                         dl.failed_at DESC
+                LIMIT :limit
+            ),
+            requeued AS (
+                UPDATE render_instructions ri
+                SET status = 'pending',
+                    retry_count = 0,
+                    next_attempt_at = NULL,
+                    error_message = NULL,
+                    worker_id = NULL,
+                    lease_expires_at = NULL,
+                    started_at = NULL,
+                    completed_at = NULL
+                FROM targets
+                WHERE ri.id = targets.instruction_id
+                RETURNING ri.id
+            )
+            UPDATE render_dead_letters dl
+            SET requeued_at = NOW()
+            FROM targets
+            WHERE dl.id = targets.dead_letter_id
+              AND targets.instruction_id IN (SELECT id FROM requeued)
+            RETURNING dl.instruction_id
+        """
+        result = await self.db.execute_write_returning(query, {**params, "limit": limit})
+        return [row["instruction_id"] for row in result]
+
+    async def get_stats(self) -> dict[str, Any]:
+        """재등록되지 않은 dead letter 수 (모니터링용)
+
+        Returns:
+            {"total": ..., "by_kind": {"permanent": ..., "transient": ...}}
+        """
+        query = """
+            SELECT error_kind, COUNT(*) AS count
+            FROM render_dead_letters
+            WHERE requeued_at IS NULL
+            GROUP BY error_kind
+        """
+        result = await self.db.execute(query)
+        by_kind = {row["error_kind"]: row["count"] for row in result}
+        return {"total": sum(by_kind.values()), "by_kind": by_kind}
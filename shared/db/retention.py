@@ -0,0 +1,128 @@
+"""보관 주기 작업 (파티션 생성/분리, 렌더 기록 보관)
+
+현재 이벤트 데이터만 자주 조회되도록 오래된 데이터를 주기적으로 압축 파일로 옮긴다.
+
+- hands: 다가올 일별 파티션을 미리 만들고, 보관 기간이 지난 파티션은 분리 → JSONL.gz → 삭제
+- render_instructions / render_outputs: 지시서 id·중복 제거 인덱스·캐시 원본 참조가 전체
+  테이블 기준이라 파티션 대신 끝난(completed/failed) 행을 id 순 배치로 JSONL.gz에 쓰고 삭제
+
+Usage:
+    >>> job = RetentionJob(get_db(), archive_dir="/nas/archive", keep_days=30)
+    >>> await job.run()
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from shared.db.connection import Database
+from shared.db.partitions import PARTITIONED_TABLES, PartitionManager
+from shared.db.repositories import RenderInstructionsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionJob:
+    """파티션 유지 + 오래된 데이터 보관
+
+    Args:
+        db: Database 인스턴스
+        archive_dir: 보관 파일 디렉토리 (기본: ARCHIVE_DIR 환경 변수, 없으면 ./archive)
+        keep_days: 보관 기간 (기본: RETENTION_DAYS 환경 변수, 없으면 30일)
+        days_ahead: 미리 만들 파티션 일수 (기본: PARTITION_DAYS_AHEAD 환경 변수, 없으면 14일)
+        batch_size: 렌더 기록 보관 배치 크기
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        archive_dir: Optional[Union[str, Path]] = None,
+        keep_days: Optional[int] = None,
+        days_ahead: Optional[int] = None,
+        batch_size: int = 500,
+    ) -> None:
+        self.archive_dir = Path(archive_dir or os.getenv("ARCHIVE_DIR") or "./archive")
+        self.keep_days = keep_days if keep_days is not None else int(
+            os.getenv("RETENTION_DAYS", "30")
+        )
+        self.days_ahead = days_ahead if days_ahead is not None else int(
+            os.getenv("PARTITION_DAYS_AHEAD", "14")
+        )
+        self.batch_size = batch_size
+        self.partitions = PartitionManager(db, self.archive_dir)
+        self.render_instructions = RenderInstructionsRepository(db)
+
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """보관 기준 시각 (UTC 자정 기준, 이전 데이터는 보관 대상)"""
+        now = now or datetime.now(timezone.utc)
+        day = (now - timedelta(days=self.keep_days)).astimezone(timezone.utc).date()
+        return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+    async def run(self, now: Optional[datetime] = None, dry_run: bool = False) -> dict[str, Any]:
+        """전체 실행
+
+        Args:
+            dry_run: True면 파티션 생성만 하고 분리/보관은 하지 않음
+
+        Returns:
+            {"cutoff", "created", "detached", "render_instructions"}
+        """
+        before = self.cutoff(now)
+        today = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).date()
+
+        created, detached = [], []
+        for table in PARTITIONED_TABLES:
+            created += await self.partitions.ensure_partitions(table, self.days_ahead, today)
+            if not dry_run:
+                detached += await self.partitions.detach_before(table, before)
+
+        archived = {"rows": 0, "files": []}
+        if not dry_run:
+            archived = await self.archive_render_instructions(before)
+
+        return {
+            "cutoff": before.isoformat(),
+            "created": created,
+            "detached": detached,
+            "render_instructions": archived,
+        }
+
+    async def archive_render_instructions(self, before: datetime) -> dict[str, Any]:
+        """before 이전에 끝난 렌더 지시서(+결과)를 보관 후 삭제
+
+        배치마다 파일 쓰기 → 삭제 순서라 중간에 실패해도 보관 안 된 행이 지워지지 않는다.
+        파일은 실행 시각별로 하나 (render_instructions/YYYYMMDDTHHMMSS.jsonl.gz).
+
+        Returns:
+            {"rows": 보관 행 수, "files": [파일 경로]}
+        """
+        directory = self.archive_dir / "render_instructions"
+        path = directory / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}.jsonl.gz"
+
+        rows, after_id = 0, 0
+        while True:
+            batch = await self.render_instructions.get_archivable(
+                before, after_id=after_id, limit=self.batch_size
+            )
+            if not batch:
+                break
+            directory.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "at", encoding="utf-8") as fp:
+                for row in batch:
+                    record = {k: v for k, v in row.items() if k != "outputs_json"}
+                    record["outputs"] = json.loads(row.get("outputs_json") or "[]")
+                    fp.write(json.dumps(record, ensure_ascii=False, default=str))
+                    fp.write("\n")
+
+            ids = [row["id"] for row in batch]
+            await self.render_instructions.delete_archived(ids)
+            rows += len(batch)
+            after_id = ids[-1]
+
+        if rows:
+            logger.info("archived %d render instructions to %s", rows, path)
+        return {"rows": rows, "files": [str(path)] if rows else []}
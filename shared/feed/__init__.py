@@ -0,0 +1,12 @@
+"""실시간 피드 (프로세스 내 fan-out, 프리미엄 핸드)"""
+
+from shared.feed.broadcast import Broadcaster, Subscription
+from shared.feed.premium import PremiumHandFeed, get_premium_feed, reset_premium_feed
+
+__all__ = [
+    "Broadcaster",
+    "Subscription",
+    "PremiumHandFeed",
+    "get_premium_feed",
+    "reset_premium_feed",
+]
@@ -0,0 +1,131 @@
+"""프로세스 내 fan-out (생산자 하나 → 구독자 여럿)
+
+구독자마다 크기 제한 큐를 두고 publish는 대기 없이 각 큐에 넣는다.
+느린 구독자의 큐가 가득 차면 가장 오래된 항목을 버리므로 생산자나 다른 구독자가 막히지 않는다.
+
+Usage:
+    >>> broadcaster = Broadcaster()
+    >>> async with broadcaster.subscribe() as subscription:
+    ...     async for item in subscription:
+    ...         send(item)
+"""
+
+import asyncio
+from typing import Generic, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+# 구독 종료 표시 (큐에 넣어 대기 중인 소비자를 깨움)
+_CLOSED = object()
+
+
+class Subscription(Generic[T]):
+    """구독 하나 (async 반복 가능, 종료되면 반복 끝)
+
+    Attributes:
+        dropped: 큐가 가득 차서 버려진 항목 수
+    """
+
+    def __init__(self, broadcaster: "Broadcaster[T]", maxsize: int) -> None:
+        self._broadcaster = broadcaster
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize)  # T 또는 _CLOSED
+        self.dropped = 0
+        self.closed = False
+
+    def _push(self, item: object) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(item)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        """다음 항목 (타임아웃 또는 종료 시 None)"""
+        if self.closed and self._queue.empty():
+            return None
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return None if item is _CLOSED else cast(T, item)
+
+    def get_nowait(self) -> list[T]:
+        """큐에 쌓인 항목 전부 (대기 없음)"""
+        items: list[T] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _CLOSED:
+                items.append(cast(T, item))
+        return items
+
+    def close(self) -> None:
+        """구독 해제 (대기 중인 반복 종료)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._broadcaster._remove(self)
+        self._push(_CLOSED)
+
+    def __aiter__(self) -> "Subscription[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return cast(T, item)
+
+    def __enter__(self) -> "Subscription[T]":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Subscription[T]":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
+
+
+class Broadcaster(Generic[T]):
+    """구독자 fan-out
+
+    Args:
+        maxsize: 구독자별 기본 큐 크기
+    """
+
+    def __init__(self, maxsize: int = 100):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1: {maxsize}")
+        self.maxsize = maxsize
+        self._subscriptions: list[Subscription[T]] = []
+
+    def subscribe(self, maxsize: Optional[int] = None) -> Subscription[T]:
+        """구독 추가 (이후 publish되는 항목부터 수신)"""
+        subscription: Subscription[T] = Subscription(self, maxsize or self.maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def publish(self, item: T) -> int:
+        """모든 구독자에게 전달 (대기 없음)
+
+        Returns:
+            전달한 구독자 수
+        """
+        for subscription in self._subscriptions:
+            subscription._push(item)
+        return len(self._subscriptions)
+
+    def close(self) -> None:
+        """모든 구독 종료"""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    def _remove(self, subscription: Subscription[T]) -> None:
+        try:
+            self._subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
@@ -0,0 +1,249 @@
+"""프리미엄 핸드 피드 (Full House 이상)
+
+premium_hands 테이블은 hands 저장 시 트리거로 갱신되고 새 항목마다
+premium_hands 채널로 NOTIFY를 보낸다 (20250203000000_premium_hand_feed.sql).
+PremiumHandFeed는 그 알림을 받아 최근 항목을 메모리에 유지하고 구독자에게 바로 전달한다.
+
+- latest(n): 최근 프리미엄 핸드 n개, 높은 랭크 먼저 (랭크별 링 버퍼, O(n))
+- since(cursor): 커서(seq) 이후 항목 (새 항목부터 역순 탐색, O(결과 수))
+- subscribe(): 새 항목 push (다시 조회하지 않음)
+- Full House 미만으로 정정된 핸드는 removed 알림으로 제거 (연결이 끊긴 동안의 제거는
+  DB에 흔적이 없으므로 sync로 복구되지 않음)
+
+메모리에 없는 구간은 HandsRepository.get_premium_feed / get_premium_since로 DB에서 조회한다
+(둘 다 premium_hands 인덱스 순서 그대로 읽으므로 정렬 없음).
+
+Usage:
+    >>> feed = get_premium_feed()
+    >>> async with RenderInstructionListener(channel=PREMIUM_HANDS_CHANNEL) as listener:
+    ...     asyncio.create_task(feed.follow(HandsRepository(db), listener))
+    ...     async with feed.subscribe() as subscription:
+    ...         async for hand in subscription:
+    ...             enqueue_premium_hand_render(hand)
+"""
+
+import logging
+from collections import deque
+from typing import Any, Optional, Protocol
+
+from shared.feed.broadcast import Broadcaster, Subscription
+from shared.models.hand import PREMIUM_RANK_ORDER, HandRank, PremiumHand
+
+logger = logging.getLogger(__name__)
+
+# 랭크 순서 (높은 랭크 먼저)
+_RANKS: tuple[HandRank, ...] = tuple(
+    sorted(PREMIUM_RANK_ORDER, key=lambda rank: PREMIUM_RANK_ORDER[rank])
+)
+
+
+class _PremiumSource(Protocol):
+    async def get_premium_recent(self, limit: int = 50) -> list[PremiumHand]: ...
+
+    async def get_premium_since(self, cursor: int, limit: int = 100) -> list[PremiumHand]: ...
+
+
+class _Listener(Protocol):
+    async def wait(self, timeout: Optional[float] = None) -> list[dict[str, Any]]: ...
+
+
+class PremiumHandFeed:
+    """프리미엄 핸드 링 버퍼 + 구독자 fan-out
+
+    Args:
+        capacity: 보관 항목 수 (전체 / 랭크별 각각)
+        subscriber_queue_size: 구독자별 큐 크기 (가득 차면 오래된 항목부터 버림)
+    """
+
+    def __init__(self, capacity: int = 500, subscriber_queue_size: int = 100):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1: {capacity}")
+        self.capacity = capacity
+        self._entries: deque[PremiumHand] = deque(maxlen=capacity)
+        self._by_rank: dict[HandRank, deque[PremiumHand]] = {
+            rank: deque(maxlen=capacity) for rank in _RANKS
+        }
+        # 랭크별 버퍼에 남아 있는 항목 (랭크별 버퍼 ⊇ 전체 버퍼)
+        self._by_key: dict[tuple[str, int], PremiumHand] = {}
+        self._broadcaster: Broadcaster[PremiumHand] = Broadcaster(subscriber_queue_size)
+        self.last_seq = 0
+        # 이 seq 이후 항목은 빠짐없이 보관 중 (그 이전은 DB 조회)
+        self._floor = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========================================
+    # 갱신
+    # ========================================
+
+    def add(self, entry: PremiumHand) -> bool:
+        """항목 추가 + 구독자 전달
+
+        이미 받은 seq는 무시한다. 같은 핸드가 더 큰 seq로 다시 오면 (랭크/팟 정정)
+        기존 항목을 교체한다.
+
+        Returns:
+            추가 여부
+        """
+        if entry.seq <= self.last_seq:
+            return False
+        self.last_seq = entry.seq
+
+        self._forget(entry.key)
+
+        if len(self._entries) == self._entries.maxlen:
+            self._floor = self._entries[0].seq
+        # 전체 버퍼에서 밀려나도 랭크별 버퍼에 남아 있으면 latest()에 나오므로
+        # 키는 랭크별 버퍼에서 밀려날 때 지운다 (남겨 두어야 이후 정정이 교체됨)
+        ranked = self._by_rank[entry.hand_rank]
+        if len(ranked) == ranked.maxlen:
+            dropped = ranked[0]
+            if self._by_key.get(dropped.key) is dropped:
+                del self._by_key[dropped.key]
+        self._entries.append(entry)
+        ranked.append(entry)
+        self._by_key[entry.key] = entry
+
+        self._broadcaster.publish(entry)
+        return True
+
+    def remove(self, seq: int, key: tuple[str, int]) -> bool:
+        """프리미엄에서 빠진 핸드 제거 (Full House 미만으로 정정, removed 알림)
+
+        Returns:
+            제거 여부 (이미 받은 seq이거나 보관하지 않은 핸드면 False)
+        """
+        if seq <= self.last_seq:
+            return False
+        self.last_seq = seq
+        return self._forget(key)
+
+    def _forget(self, key: tuple[str, int]) -> bool:
+        """핸드의 기존 항목을 버퍼에서 제거"""
+        previous = self._by_key.pop(key, None)
+        if previous is None:
+            return False
+        # 정정은 드물고 버퍼 크기가 작으므로 선형 제거로 충분
+        self._discard(self._entries, previous)
+        self._discard(self._by_rank[previous.hand_rank], previous)
+        return True
+
+    @staticmethod
+    def _discard(entries: deque[PremiumHand], entry: PremiumHand) -> None:
+        try:
+            entries.remove(entry)
+        except ValueError:
+            pass
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def latest(self, n: int = 50) -> list[PremiumHand]:
+        """최근 프리미엄 핸드 n개 (높은 랭크 먼저, 같은 랭크는 최신 먼저)"""
+        result: list[PremiumHand] = []
+        for rank in _RANKS:
+            for entry in reversed(self._by_rank[rank]):
+                if len(result) >= n:
+                    return result
+                result.append(entry)
+        return result
+
+    def since(self, cursor: int, limit: int = 100) -> Optional[list[PremiumHand]]:
+        """cursor 이후 항목 (seq 순, 최대 limit개)
+
+        Returns:
+            항목 목록. 버퍼에서 밀려난 구간이 포함되면 None (호출자가 DB에서 조회)
+        """
+        if cursor < self._floor:
+            return None
+        if cursor >= self.last_seq:
+            return []
+
+        newer: list[PremiumHand] = []
+        for entry in reversed(self._entries):
+            if entry.seq <= cursor:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer[:limit]
+
+    # ========================================
+    # 구독 / 동기화
+    # ========================================
+
+    def subscribe(self, maxsize: Optional[int] = None) -> Subscription[PremiumHand]:
+        """새 프리미엄 핸드 구독 (이후 추가되는 항목부터)"""
+        return self._broadcaster.subscribe(maxsize)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._broadcaster)
+
+    async def sync(self, repo: _PremiumSource, batch_size: int = 500) -> int:
+        """DB에서 last_seq 이후 항목을 가져와 반영 (시작 / 재연결 / 누락 보정)
+
+        처음에는 최근 capacity개만 읽는다 (전체 이력을 읽지 않음).
+
+        Returns:
+            추가된 항목 수
+        """
+        if self.last_seq == 0:
+            recent = await repo.get_premium_recent(limit=self.capacity)
+            if len(recent) == self.capacity:
+                self._floor = recent[-1].seq - 1
+            return sum(self.add(row) for row in reversed(recent))
+
+        added = 0
+        while True:
+            rows = await repo.get_premium_since(self.last_seq, limit=batch_size)
+            added += sum(self.add(row) for row in rows)
+            if len(rows) < batch_size:
+                return added
+
+    async def follow(
+        self, repo: _PremiumSource, listener: _Listener, sync_interval: float = 30.0
+    ) -> None:
+        """NOTIFY를 받아 피드 갱신 (취소될 때까지)
+
+        알림 payload로 바로 추가 / 제거하고, 타임아웃 / 재연결 / polling 대체 중에는
+        DB와 동기화한다.
+        """
+        await self.sync(repo)
+        while True:
+            events = await listener.wait(timeout=sync_interval)
+            if not events or any("seq" not in event for event in events):
+                added = await self.sync(repo)
+                if added:
+                    logger.info("premium feed synced %d hands from DB", added)
+                continue
+            for event in events:
+                if event.get("removed"):
+                    self.remove(event["seq"], (event["table_id"], event["hand_number"]))
+                else:
+                    self.add(PremiumHand.from_notification(event))
+
+    def close(self) -> None:
+        """모든 구독 종료"""
+        self._broadcaster.close()
+
+
+# 전역 인스턴스
+_feed: Optional[PremiumHandFeed] = None
+
+
+def get_premium_feed() -> PremiumHandFeed:
+    """전역 PremiumHandFeed"""
+    global _feed
+    if _feed is None:
+        _feed = PremiumHandFeed()
+    return _feed
+
+
+def reset_premium_feed() -> None:
+    """전역 PremiumHandFeed 초기화 (테스트용)"""
+    global _feed
+    if _feed is not None:
+        _feed.close()
+    _feed = None
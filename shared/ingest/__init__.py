@@ -0,0 +1,13 @@
+"""외부 데이터 적재 (PokerGFX 세션 등)"""
+
+from shared.ingest.gfx_session import (
+    GfxIngestStats,
+    GfxSessionIngester,
+    iter_gfx_session,
+)
+
+__all__ = [
+    "GfxIngestStats",
+    "GfxSessionIngester",
+    "iter_gfx_session",
+]
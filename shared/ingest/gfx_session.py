@@ -0,0 +1,550 @@
+"""PokerGFX 세션 스트리밍 적재
+
+세션 export(JSON)를 json.load로 통째로 읽지 않고, 청크 단위로 읽으며
+Hands 배열을 핸드 하나씩 해석 → 검증 → 배치 단위로
+poker_sessions / poker_hands / poker_players / poker_events에 저장한다.
+메모리 사용량은 파일 크기와 무관하게 (청크 + 배치 크기)로 제한된다.
+"""
+
+import codecs
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+from pydantic import BaseModel, Field
+from sqlalchemy import text
+
+from shared.db.connection import Database
+from shared.validators import SchemaValidator
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\n\r"
+_DURATION_PATTERN = re.compile(r"^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d*)?)S)?$")
+
+
+# =========================================================
+# Streaming JSON
+# =========================================================
+
+
+class _JsonStream:
+    """파일을 청크 단위로 읽으며 JSON 값을 순서대로 해석"""
+
+    def __init__(self, fp: IO[Any], chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder: Optional[codecs.IncrementalDecoder] = None
+
+    def _fill(self) -> bool:
+        """다음 청크를 버퍼에 추가 (이미 해석한 앞부분은 버림)"""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if isinstance(chunk, bytes):
+            if self._bytes_decoder is None:
+                self._bytes_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._bytes_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (EOF면 빈 문자열)"""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid GFX session JSON: expected {char!r}, got {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나를 해석"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 숫자/리터럴이 청크 경계에서 잘렸을 수 있으므로 다음 문자를 확인
+            if end >= len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_gfx_session(
+    fp: IO[Any], chunk_size: int = 64 * 1024
+) -> Iterator[tuple[str, Any]]:
+    """PokerGFX 세션 JSON 스트리밍 해석
+
+    Args:
+        fp: 텍스트 또는 바이너리 파일 객체
+        chunk_size: 한 번에 읽을 크기
+
+    Yields:
+        ("session", header): Hands 배열 직전까지의 세션 필드 (Hands 제외)
+        ("hand", hand): 핸드 dict (파일 순서대로)
+        ("session_end", header): Hands 뒤에 나온 필드까지 포함한 전체 세션 필드
+    """
+    stream = _JsonStream(fp, chunk_size)
+    header: dict[str, Any] = {}
+    session_emitted = False
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == "Hands":
+                yield "session", dict(header)
+                session_emitted = True
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield "hand", stream.value()
+                        if stream.peek() == ",":
+                            stream.expect(",")
+                            continue
+                        stream.expect("]")
+                        break
+            else:
+                header[key] = stream.value()
+
+            if stream.peek() == ",":
+                stream.expect(",")
+                continue
+            stream.expect("}")
+            break
+
+    if not session_emitted:
+        yield "session", dict(header)
+    yield "session_end", header
+
+
+# =========================================================
+# Row Builders
+# =========================================================
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """ISO 8601 문자열 → datetime (PokerGFX의 7자리 소수초 포함)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """ISO 8601 Duration (예: PT2M56.2628165S) → 초"""
+    if not value:
+        return None
+    match = _DURATION_PATTERN.match(value)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+
+
+def _community_cards(hand: dict[str, Any]) -> list[str]:
+    """BOARD_CARD 이벤트에서 첫 번째 보드의 커뮤니티 카드 수집"""
+    cards: list[str] = []
+    for event in hand.get("Events") or []:
+        if event.get("Type") == "BOARD_CARD" and event.get("BoardNum") in (None, 1):
+            cards.extend(event.get("BoardCards") or [])
+    return cards
+
+
+def _hand_row(hand: dict[str, Any]) -> dict[str, Any]:
+    """GFX 핸드 → poker_hands 행"""
+    blinds = hand.get("FlopDrawBlinds") or {}
+    return {
+        "hand_num": hand["HandNum"],
+        "game_variant": hand.get("GameVariant", "HOLDEM"),
+        "game_class": hand.get("GameClass", "FLOP"),
+        "bet_structure": hand.get("BetStructure", "NOLIMIT"),
+        "duration_seconds": _parse_duration(hand.get("Duration")),
+        "started_at_utc": _parse_datetime(hand.get("StartDateTimeUTC")),
+        "num_boards": hand.get("NumBoards", 1),
+        "run_it_num_times": hand.get("RunItNumTimes", 1),
+        "community_cards": json.dumps(_community_cards(hand)),
+        "button_seat": blinds.get("ButtonPlayerNum"),
+        "sb_seat": blinds.get("SmallBlindPlayerNum"),
+        "sb_amount": blinds.get("SmallBlindAmt"),
+        "bb_seat": blinds.get("BigBlindPlayerNum"),
+        "bb_amount": blinds.get("BigBlindAmt"),
+        "ante_type": blinds.get("AnteType", "NONE"),
+        "blind_level": blinds.get("BlindLevel"),
+    }
+
+
+def _player_rows(hand_id: int, hand: dict[str, Any]) -> list[dict[str, Any]]:
+    """GFX 핸드 → poker_players 행"""
+    rows = []
+    for player in hand.get("Players") or []:
+        stats = player.get("Stats") or {}
+        rows.append({
+            "hand_id": hand_id,
+            "seat_num": player["PlayerNum"],
+            "name": player["Name"],
+            "long_name": player.get("LongName"),
+            "start_stack": player.get("StartStack") or 0,
+            "end_stack": player.get("EndStack") or 0,
+            "cumulative_winnings": player.get("CumulativeWinnings") or 0,
+            "hole_cards": json.dumps(player.get("HoleCards") or []),
+            "sitting_out": player.get("SittingOut", False),
+            "elimination_rank": player.get("EliminationRank", -1),
+            "vpip_percent": stats.get("VPIPPercent"),
+            "pfr_percent": stats.get("PFRPercent"),
+            "af_percent": stats.get("AFPercent"),
+            "wtsd_percent": stats.get("WTSDPercent"),
+        })
+    return rows
+
+
+def _event_rows(hand_id: int, hand: dict[str, Any]) -> list[dict[str, Any]]:
+    """GFX 핸드 → poker_events 행
+
+    Order가 하나라도 없으면 모든 이벤트에 배열 순서를 사용한다
+    (Order와 배열 순서를 섞으면 (hand_id, event_order)가 겹칠 수 있음).
+    """
+    events = hand.get("Events") or []
+    use_order = all(event.get("Order") is not None for event in events)
+    rows = []
+    for index, event in enumerate(events):
+        board_cards = event.get("BoardCards")
+        rows.append({
+            "hand_id": hand_id,
+            "event_order": event["Order"] if use_order else index,
+            "event_type": event["Type"],
+            "seat_num": event.get("PlayerNum"),
+            "bet_amount": event.get("BetAmt"),
+            "pot_amount": event.get("PotAmt"),
+            "board_cards": json.dumps(board_cards) if board_cards is not None else None,
+            "board_num": event.get("BoardNum"),
+            "cards_drawn": event.get("CardsDrawn"),
+            "won_amount": event.get("WonAmt"),
+            "event_at_utc": _parse_datetime(event.get("DateTimeUTC")),
+        })
+    return rows
+
+
+# =========================================================
+# SQL
+# =========================================================
+
+_SESSION_UPSERT = """
+    INSERT INTO poker_sessions (
+        gfx_session_id, event_title, table_type, software_version,
+        payouts, created_at_utc
+    ) VALUES (
+        :gfx_session_id, :event_title, :table_type, :software_version,
+        :payouts, :created_at_utc
+    )
+    ON CONFLICT (gfx_session_id) DO UPDATE SET
+        event_title = EXCLUDED.event_title,
+        table_type = EXCLUDED.table_type,
+        software_version = EXCLUDED.software_version,
+        payouts = EXCLUDED.payouts,
+        created_at_utc = EXCLUDED.created_at_utc
+    RETURNING id
+"""
+
+# 배치 전체를 배열 파라미터로 넘겨 한 번의 INSERT ... SELECT unnest로 저장
+_HANDS_UPSERT = """
+    INSERT INTO poker_hands (
+        session_id, hand_num, game_variant, game_class, bet_structure,
+        duration_seconds, started_at_utc, num_boards, run_it_num_times,
+        community_cards, button_seat, sb_seat, sb_amount, bb_seat, bb_amount,
+        ante_type, blind_level
+    )
+    SELECT :session_id, * FROM unnest(
+        CAST(:hand_num AS integer[]),
+        CAST(:game_variant AS varchar[]),
+        CAST(:game_class AS varchar[]),
+        CAST(:bet_structure AS varchar[]),
+        CAST(:duration_seconds AS float8[]),
+        CAST(:started_at_utc AS timestamptz[]),
+        CAST(:num_boards AS integer[]),
+        CAST(:run_it_num_times AS integer[]),
+        CAST(:community_cards AS jsonb[]),
+        CAST(:button_seat AS integer[]),
+        CAST(:sb_seat AS integer[]),
+        CAST(:sb_amount AS integer[]),
+        CAST(:bb_seat AS integer[]),
+        CAST(:bb_amount AS integer[]),
+        CAST(:ante_type AS varchar[]),
+        CAST(:blind_level AS integer[])
+    )
+    ON CONFLICT (session_id, hand_num) DO UPDATE SET
+        game_variant = EXCLUDED.game_variant,
+        game_class = EXCLUDED.game_class,
+        bet_structure = EXCLUDED.bet_structure,
+        duration_seconds = EXCLUDED.duration_seconds,
+        started_at_utc = EXCLUDED.started_at_utc,
+        num_boards = EXCLUDED.num_boards,
+        run_it_num_times = EXCLUDED.run_it_num_times,
+        community_cards = EXCLUDED.community_cards,
+        button_seat = EXCLUDED.button_seat,
+        sb_seat = EXCLUDED.sb_seat,
+        sb_amount = EXCLUDED.sb_amount,
+        bb_seat = EXCLUDED.bb_seat,
+        bb_amount = EXCLUDED.bb_amount,
+        ante_type = EXCLUDED.ante_type,
+        blind_level = EXCLUDED.blind_level
+    RETURNING id, hand_num
+"""
+
+_PLAYERS_UPSERT = """
+    INSERT INTO poker_players (
+        hand_id, seat_num, name, long_name, start_stack, end_stack,
+        cumulative_winnings, hole_cards, sitting_out, elimination_rank,
+        vpip_percent, pfr_percent, af_percent, wtsd_percent
+    ) VALUES (
+        :hand_id, :seat_num, :name, :long_name, :start_stack, :end_stack,
+        :cumulative_winnings, :hole_cards, :sitting_out, :elimination_rank,
+        :vpip_percent, :pfr_percent, :af_percent, :wtsd_percent
+    )
+    ON CONFLICT (hand_id, seat_num) DO UPDATE SET
+        name = EXCLUDED.name,
+        long_name = EXCLUDED.long_name,
+        start_stack = EXCLUDED.start_stack,
+        end_stack = EXCLUDED.end_stack,
+        cumulative_winnings = EXCLUDED.cumulative_winnings,
+        hole_cards = EXCLUDED.hole_cards,
+        sitting_out = EXCLUDED.sitting_out,
+        elimination_rank = EXCLUDED.elimination_rank,
+        vpip_percent = EXCLUDED.vpip_percent,
+        pfr_percent = EXCLUDED.pfr_percent,
+        af_percent = EXCLUDED.af_percent,
+        wtsd_percent = EXCLUDED.wtsd_percent
+"""
+
+_EVENTS_UPSERT = """
+    INSERT INTO poker_events (
+        hand_id, event_order, event_type, seat_num, bet_amount, pot_amount,
+        board_cards, board_num, cards_drawn, won_amount, event_at_utc
+    ) VALUES (
+        :hand_id, :event_order, :event_type, :seat_num, :bet_amount, :pot_amount,
+        :board_cards, :board_num, :cards_drawn, :won_amount, :event_at_utc
+    )
+    ON CONFLICT (hand_id, event_order) DO UPDATE SET
+        event_type = EXCLUDED.event_type,
+        seat_num = EXCLUDED.seat_num,
+        bet_amount = EXCLUDED.bet_amount,
+        pot_amount = EXCLUDED.pot_amount,
+        board_cards = EXCLUDED.board_cards,
+        board_num = EXCLUDED.board_num,
+        cards_drawn = EXCLUDED.cards_drawn,
+        won_amount = EXCLUDED.won_amount,
+        event_at_utc = EXCLUDED.event_at_utc
+"""
+
+
+# =========================================================
+# Ingester
+# =========================================================
+
+
+class GfxIngestStats(BaseModel):
+    """세션 적재 결과 + 단계별 처리 시간"""
+
+    gfx_session_id: Optional[int] = None
+    session_id: Optional[int] = None        # poker_sessions.id
+    hands: int = 0
+    players: int = 0
+    events: int = 0
+    invalid_hands: int = 0
+    batches: int = 0
+    errors: list[str] = Field(default_factory=list)
+
+    # 단계별 누적 시간 (초): parse, validate, write
+    stage_seconds: dict[str, float] = Field(
+        default_factory=lambda: {"parse": 0.0, "validate": 0.0, "write": 0.0}
+    )
+
+    @property
+    def throughput(self) -> dict[str, float]:
+        """단계별 처리량 (hands/s)"""
+        processed = self.hands + self.invalid_hands
+        return {
+            stage: round(processed / seconds, 1) if seconds > 0 else 0.0
+            for stage, seconds in self.stage_seconds.items()
+        }
+
+
+class GfxSessionIngester:
+    """PokerGFX 세션 export → poker_* 테이블 스트리밍 적재
+
+    Usage:
+        >>> ingester = GfxSessionIngester(get_db(), batch_size=200)
+        >>> stats = await ingester.ingest_file("/nas/pokergfx/session.json")
+        >>> stats.hands, stats.throughput
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        batch_size: int = 200,
+        validate: bool = True,
+        chunk_size: int = 64 * 1024,
+        max_errors: int = 100,
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.validate = validate
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    async def ingest_file(self, path: Union[str, Path]) -> GfxIngestStats:
+        """파일 경로에서 적재"""
+        with open(path, "rb") as fp:
+            return await self.ingest(fp)
+
+    async def ingest(self, fp: IO[Any]) -> GfxIngestStats:
+        """파일 객체에서 적재
+
+        Raises:
+            ValueError: 세션 ID가 Hands 배열보다 뒤에 있거나 JSON이 손상된 경우
+            ValidationError: 세션 헤더가 gfx/session 스키마에 맞지 않는 경우
+        """
+        stats = GfxIngestStats()
+        items = iter_gfx_session(fp, self.chunk_size)
+        header: dict[str, Any] = {}
+        batch: list[dict[str, Any]] = []
+
+        while True:
+            started = time.perf_counter()
+            try:
+                kind, payload = next(items)
+            except StopIteration:
+                stats.stage_seconds["parse"] += time.perf_counter() - started
+                break
+            stats.stage_seconds["parse"] += time.perf_counter() - started
+
+            if kind == "session":
+                header = payload
+                await self._write_session(header, stats)
+            elif kind == "hand":
+                if self.validate and not self._validate_hand(payload, stats):
+                    continue
+                batch.append(payload)
+                if len(batch) >= self.batch_size:
+                    await self._write_batch(batch, stats)
+                    batch = []
+            elif kind == "session_end" and payload != header:
+                # Hands 뒤에 나온 세션 필드 반영
+                await self._write_session(payload, stats)
+
+        if batch:
+            await self._write_batch(batch, stats)
+
+        logger.info(
+            "GFX session %s: %d hands (%d invalid), %d players, %d events, throughput %s",
+            stats.gfx_session_id, stats.hands, stats.invalid_hands,
+            stats.players, stats.events, stats.throughput,
+        )
+        return stats
+
+    def _record_error(self, stats: GfxIngestStats, message: str) -> None:
+        if len(stats.errors) < self.max_errors:
+            stats.errors.append(message)
+
+    def _validate_hand(self, hand: Any, stats: GfxIngestStats) -> bool:
+        started = time.perf_counter()
+        valid, errors = SchemaValidator.validate_gfx_hand(hand)
+        stats.stage_seconds["validate"] += time.perf_counter() - started
+
+        if not valid:
+            stats.invalid_hands += 1
+            hand_num = hand.get("HandNum") if isinstance(hand, dict) else None
+            for error in errors:
+                self._record_error(stats, f"hand {hand_num}: {error}")
+        return valid
+
+    async def _write_session(self, header: dict[str, Any], stats: GfxIngestStats) -> None:
+        if "ID" not in header:
+            raise ValueError("GFX session 'ID' must appear before 'Hands'")
+
+        if self.validate:
+            started = time.perf_counter()
+            SchemaValidator.validate_or_raise({**header, "Hands": []}, "gfx/session")
+            stats.stage_seconds["validate"] += time.perf_counter() - started
+
+        payouts = header.get("Payouts")
+        params = {
+            "gfx_session_id": header["ID"],
+            "event_title": header.get("EventTitle"),
+            "table_type": header.get("Type", "FEATURE_TABLE"),
+            "software_version": header.get("SoftwareVersion"),
+            "payouts": json.dumps(payouts) if payouts is not None else None,
+            "created_at_utc": _parse_datetime(header.get("CreatedDateTimeUTC")),
+        }
+
+        started = time.perf_counter()
+        result = await self.db.execute_write_returning(_SESSION_UPSERT, params)
+        stats.stage_seconds["write"] += time.perf_counter() - started
+
+        stats.gfx_session_id = header["ID"]
+        stats.session_id = result[0]["id"] if result else None
+
+    async def _write_batch(self, batch: list[dict[str, Any]], stats: GfxIngestStats) -> None:
+        """핸드 배치를 한 트랜잭션으로 저장 (hands 1회 + players/events executemany)"""
+        # 같은 배치 안의 중복 HandNum은 마지막 것만 사용 (ON CONFLICT 중복 갱신 방지)
+        hands = list({hand["HandNum"]: hand for hand in batch}.values())
+        hand_rows = [_hand_row(hand) for hand in hands]
+        params: dict[str, Any] = {"session_id": stats.session_id}
+        for column in hand_rows[0]:
+            params[column] = [row[column] for row in hand_rows]
+
+        started = time.perf_counter()
+        async with self.db.session() as session:
+            result = await session.execute(text(_HANDS_UPSERT), params)
+            hand_ids = {row.hand_num: row.id for row in result}
+
+            player_rows: list[dict[str, Any]] = []
+            event_rows: list[dict[str, Any]] = []
+            for hand in hands:
+                hand_id = hand_ids[hand["HandNum"]]
+                player_rows.extend(_player_rows(hand_id, hand))
+                event_rows.extend(_event_rows(hand_id, hand))
+
+            if player_rows:
+                await session.execute(text(_PLAYERS_UPSERT), player_rows)
+            if event_rows:
+                await session.execute(text(_EVENTS_UPSERT), event_rows)
+        stats.stage_seconds["write"] += time.perf_counter() - started
+
+        stats.batches += 1
+        stats.hands += len(hands)
+        stats.players += len(player_rows)
+        stats.events += len(event_rows)
@@ -0,0 +1,15 @@
+"""토너먼트 리더보드 (칩 순위 인덱스)"""
+
+from shared.leaderboard.index import (
+    Leaderboard,
+    LeaderboardRegistry,
+    get_leaderboards,
+    reset_leaderboards,
+)
+
+__all__ = [
+    "Leaderboard",
+    "LeaderboardRegistry",
+    "get_leaderboards",
+    "reset_leaderboards",
+]
@@ -0,0 +1,244 @@
+"""칩 순위 인덱스
+
+Leaderboard / Player Stats 자막이 매 요청마다 standings를 정렬하지 않도록
+칩 순으로 정렬된 인덱스를 메모리에 유지한다.
+
+- top N / 국적별 top N
+- 플레이어 칩 순위, 바로 위 순위와의 칩 차이
+- upsert 시 바뀐 플레이어만 갱신 (apply)
+- tournaments.updated_at으로 다른 프로세스의 변경 감지 (LeaderboardRegistry.get)
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from shared.models.tournament import PlayerStanding
+
+# 칩 순위에 영향을 주거나 자막에 표시되는 필드 (CSV rank만 바뀐 경우는 무시)
+_TRACKED_FIELDS = ("nationality", "chips", "table_id", "seat")
+
+
+def _key(standing: PlayerStanding) -> tuple[int, str]:
+    """정렬 키 (칩 내림차순, 같으면 이름순)"""
+    return (-standing.chips, standing.name)
+
+
+class Leaderboard:
+    """토너먼트 하나의 칩 순위 인덱스
+
+    정렬된 키 리스트를 bisect로 유지하므로 조회는 O(log n),
+    플레이어 한 명 갱신은 O(n) memmove (수천 명 기준 수 마이크로초).
+
+    Usage:
+        >>> board = Leaderboard("WSOP2025-001", tournament.standings)
+        >>> board.top(10)
+        >>> board.rank_of("John Doe"), board.chip_gap("John Doe")
+    """
+
+    def __init__(
+        self,
+        event_code: str,
+        standings: Iterable[PlayerStanding] = (),
+        updated_at: Optional[datetime] = None,
+        tournament_id: Optional[int] = None,
+    ):
+        self.event_code = event_code
+        self.tournament_id = tournament_id
+        self.updated_at = updated_at
+
+        self._players: dict[str, PlayerStanding] = {}
+        self._keys: list[tuple[int, str]] = []
+        self._by_nationality: dict[str, list[tuple[int, str]]] = {}
+
+        for standing in standings:
+            self._players[standing.name] = standing
+        self._keys = sorted(_key(s) for s in self._players.values())
+        for standing in self._players.values():
+            self._by_nationality.setdefault(standing.nationality, []).append(_key(standing))
+        for keys in self._by_nationality.values():
+            keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._players
+
+    # ========================================
+    # 갱신
+    # ========================================
+
+    def upsert_player(self, standing: PlayerStanding) -> None:
+        """플레이어 추가 또는 갱신"""
+        self.remove_player(standing.name)
+        key = _key(standing)
+        self._players[standing.name] = standing
+        insort(self._keys, key)
+        insort(self._by_nationality.setdefault(standing.nationality, []), key)
+
+    def remove_player(self, name: str) -> bool:
+        """플레이어 제거 (탈락)"""
+        standing = self._players.pop(name, None)
+        if standing is None:
+            return False
+        key = _key(standing)
+        del self._keys[bisect_left(self._keys, key)]
+        keys = self._by_nationality[standing.nationality]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            del self._by_nationality[standing.nationality]
+        return True
+
+    def diff(self, standings: Iterable[PlayerStanding]) -> tuple[list[PlayerStanding], list[str]]:
+        """새 순위표와 비교한 변경분
+
+        Returns:
+            (추가/변경된 플레이어, 제거된 플레이어 이름)
+        """
+        incoming = {s.name: s for s in standings}
+        changed = []
+        for name, standing in incoming.items():
+            current = self._players.get(name)
+            if current is None or any(
+                getattr(current, field) != getattr(standing, field) for field in _TRACKED_FIELDS
+            ):
+                changed.append(standing)
+        removed = [name for name in self._players if name not in incoming]
+        return changed, removed
+
+    def apply(
+        self,
+        standings: Iterable[PlayerStanding],
+        updated_at: Optional[datetime] = None,
+    ) -> tuple[list[PlayerStanding], list[str]]:
+        """새 순위표를 반영 (바뀐 플레이어만 갱신)
+
+        Returns:
+            diff()와 같은 (추가/변경된 플레이어, 제거된 플레이어 이름)
+        """
+        changed, removed = self.diff(standings)
+        for name in removed:
+            self.remove_player(name)
+        for standing in changed:
+            self.upsert_player(standing)
+        if updated_at is not None:
+            self.updated_at = updated_at
+        return changed, removed
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def _row(self, key: tuple[int, str]) -> dict[str, Any]:
+        standing = self._players[key[1]]
+        return {
+            "rank": bisect_left(self._keys, key) + 1,
+            "name": standing.name,
+            "nationality": standing.nationality,
+            "chips": standing.chips,
+            "table_id": standing.table_id,
+            "seat": standing.seat,
+        }
+
+    def top(self, n: int = 10, nationality: Optional[str] = None) -> list[dict[str, Any]]:
+        """칩 상위 N명
+
+        Args:
+            n: 인원 수
+            nationality: 지정 시 해당 국적만 (rank는 전체 순위)
+
+        Returns:
+            [{"rank", "name", "nationality", "chips", "table_id", "seat"}, ...]
+        """
+        keys = self._keys if nationality is None else self._by_nationality.get(nationality, [])
+        return [self._row(key) for key in keys[:n]]
+
+    def get(self, name: str) -> Optional[dict[str, Any]]:
+        """플레이어 한 명 (top()과 같은 형식)"""
+        standing = self._players.get(name)
+        return self._row(_key(standing)) if standing else None
+
+    def rank_of(self, name: str) -> Optional[int]:
+        """칩 순위 (1부터), 없는 플레이어면 None"""
+        standing = self._players.get(name)
+        if standing is None:
+            return None
+        return bisect_left(self._keys, _key(standing)) + 1
+
+    def chip_gap(self, name: str) -> Optional[int]:
+        """바로 위 순위 플레이어와의 칩 차이 (1위 또는 없는 플레이어면 None)"""
+        rank = self.rank_of(name)
+        if rank is None or rank == 1:
+            return None
+        above = self._keys[rank - 2]
+        return -above[0] - self._players[name].chips
+
+    def nationalities(self) -> dict[str, int]:
+        """국적별 인원"""
+        return {nationality: len(keys) for nationality, keys in self._by_nationality.items()}
+
+    def is_stale(self, updated_at: Optional[datetime]) -> bool:
+        """DB의 tournaments.updated_at보다 오래된 인덱스인지"""
+        if updated_at is None:
+            return False
+        if self.updated_at is None:
+            return True
+        if (self.updated_at.tzinfo is None) != (updated_at.tzinfo is None):
+            return True  # 비교 불가 (naive/aware 혼용) → 다시 로드
+        return self.updated_at < updated_at
+
+
+class LeaderboardRegistry:
+    """이벤트 코드별 Leaderboard 보관소 (프로세스 전역)"""
+
+    def __init__(self) -> None:
+        self._boards: dict[str, Leaderboard] = {}
+
+    def get(self, event_code: str, updated_at: Optional[datetime] = None) -> Optional[Leaderboard]:
+        """인덱스 조회
+
+        Args:
+            updated_at: DB의 tournaments.updated_at. 인덱스가 이보다 오래되었으면
+                (다른 프로세스가 갱신) 무효화하고 None 반환
+
+        Returns:
+            유효한 인덱스, 없거나 무효화되었으면 None (호출자가 다시 로드)
+        """
+        board = self._boards.get(event_code)
+        if board is not None and board.is_stale(updated_at):
+            self.invalidate(event_code)
+            return None
+        return board
+
+    def put(self, board: Leaderboard) -> None:
+        """인덱스 등록"""
+        self._boards[board.event_code] = board
+
+    def invalidate(self, event_code: Optional[str] = None) -> None:
+        """인덱스 무효화 (event_code가 None이면 전체)"""
+        if event_code is None:
+            self._boards.clear()
+        else:
+            self._boards.pop(event_code, None)
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+
+# 전역 인스턴스
+_registry: Optional[LeaderboardRegistry] = None
+
+
+def get_leaderboards() -> LeaderboardRegistry:
+    """전역 LeaderboardRegistry"""
+    global _registry
+    if _registry is None:
+        _registry = LeaderboardRegistry()
+    return _registry
+
+
+def reset_leaderboards() -> None:
+    """전역 LeaderboardRegistry 초기화 (테스트용)"""
+    global _registry
+    _registry = None
@@ -0,0 +1,31 @@
+"""메트릭 (Prometheus 텍스트 형식, DB / 렌더 계측)"""
+
+from shared.metrics.instrument import (
+    QueryTimer,
+    current_operation,
+    instrument_repository,
+    observe_render_transition,
+    set_pool_status,
+    set_queue_depth,
+)
+from shared.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_registry,
+)
+
+__all__ = [
+    "QueryTimer",
+    "current_operation",
+    "instrument_repository",
+    "observe_render_transition",
+    "set_pool_status",
+    "set_queue_depth",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_registry",
+]
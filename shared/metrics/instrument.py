@@ -0,0 +1,183 @@
+"""DB / 렌더 계측
+
+- instrument_repository: Repository 클래스의 public async 메서드마다 호출 시간 / 오류 기록,
+  실행 중 쿼리는 메서드 이름(예: HandsRepository.insert)으로 라벨링
+- QueryTimer: Database.execute 등에서 쿼리 시간 / 행 수 / 오류 기록
+- observe_render_transition: render_status 알림으로 대기(생성→시작) / 렌더(시작→완료) 시간 기록
+- set_queue_depth / set_pool_status: 상태별 작업 수, 연결 풀 상태 (/metrics 요청 시 갱신)
+"""
+
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from shared.metrics.registry import get_registry
+
+T = TypeVar("T", bound=type)
+
+# 현재 실행 중인 Repository 메서드 (쿼리 라벨)
+_operation: ContextVar[str] = ContextVar("db_operation", default="adhoc")
+
+# render_instructions.status (집계에 없어도 0으로 노출)
+_STATUSES = ("pending", "processing", "completed", "failed")
+
+# 렌더 시간 구간 (초)
+RENDER_BUCKETS = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+_registry = get_registry()
+
+REPOSITORY_CALL_SECONDS = _registry.histogram(
+    "repository_call_duration_seconds",
+    "Repository method latency (all queries in the call)",
+    ("method",),
+)
+REPOSITORY_CALL_ERRORS = _registry.counter(
+    "repository_call_errors_total",
+    "Repository method calls that raised",
+    ("method", "error"),
+)
+DB_QUERY_SECONDS = _registry.histogram(
+    "db_query_duration_seconds",
+    "Query latency including connection acquire",
+    ("operation", "kind"),
+)
+DB_QUERY_ROWS = _registry.counter(
+    "db_query_rows_total",
+    "Rows returned (read) or affected (write)",
+    ("operation", "kind"),
+)
+DB_QUERY_ERRORS = _registry.counter(
+    "db_query_errors_total",
+    "Queries that raised",
+    ("operation", "kind", "error"),
+)
+RENDER_QUEUE_DEPTH = _registry.gauge(
+    "render_queue_depth",
+    "Render instructions by status",
+    ("status",),
+)
+RENDER_TRANSITIONS = _registry.counter(
+    "render_transitions_total",
+    "Render instruction status transitions",
+    ("status",),
+)
+RENDER_QUEUE_WAIT_SECONDS = _registry.histogram(
+    "render_queue_wait_seconds",
+    "Enqueue to start (created_at -> started_at)",
+    ("template",),
+    RENDER_BUCKETS,
+)
+RENDER_RUN_SECONDS = _registry.histogram(
+    "render_run_seconds",
+    "Start to completion (started_at -> completed_at)",
+    ("template", "status"),
+    RENDER_BUCKETS,
+)
+
+
+def current_operation() -> str:
+    """현재 쿼리 라벨 (Repository 메서드 밖이면 "adhoc")"""
+    return _operation.get()
+
+
+class QueryTimer:
+    """쿼리 하나의 시간 / 행 수 / 오류 기록
+
+    Usage:
+        >>> with QueryTimer("read") as timer:
+        ...     rows = ...
+        ...     timer.rows = len(rows)
+    """
+
+    __slots__ = ("kind", "rows", "_started")
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.rows = 0
+        self._started = 0.0
+
+    def __enter__(self) -> "QueryTimer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if not _registry.enabled:
+            return
+        operation = _operation.get()
+        DB_QUERY_SECONDS.labels(operation, self.kind).observe(time.perf_counter() - self._started)
+        if exc_type is None:
+            DB_QUERY_ROWS.labels(operation, self.kind).inc(self.rows)
+        elif issubclass(exc_type, Exception):  # 취소 / 제너레이터 종료는 오류가 아님
+            DB_QUERY_ERRORS.labels(operation, self.kind, exc_type.__name__).inc()
+
+
+def _instrument(
+    name: str, method: Callable[..., Awaitable[Any]]
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _registry.enabled:
+            return await method(*args, **kwargs)
+        token = _operation.set(name)
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        except Exception as e:
+            REPOSITORY_CALL_ERRORS.labels(name, type(e).__name__).inc()
+            raise
+        finally:
+            REPOSITORY_CALL_SECONDS.labels(name).observe(time.perf_counter() - started)
+            _operation.reset(token)
+
+    return wrapper
+
+
+def instrument_repository(cls: T) -> T:
+    """Repository 클래스 데코레이터 (public async 메서드만, async 제너레이터 제외)"""
+    for attr, method in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, attr, _instrument(f"{cls.__name__}.{attr}", method))
+    return cls
+
+
+def set_queue_depth(counts: dict[str, int]) -> None:
+    """상태별 작업 수 (없는 상태는 0)"""
+    for status in (*_STATUSES, *counts):
+        RENDER_QUEUE_DEPTH.labels(status).set(counts.get(status, 0))
+
+
+def set_pool_status(status: dict[str, Any]) -> None:
+    """Database.pool_status()의 숫자 항목 → db_pool_<항목> Gauge"""
+    for key, value in status.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        _registry.gauge(f"db_pool_{key}", f"Connection pool {key}").set(value)
+
+
+def observe_render_transition(payload: dict[str, Any]) -> None:
+    """render_status 알림 반영 (created_at / started_at / completed_at은 epoch 초)"""
+    if not _registry.enabled:
+        return
+    status = payload.get("status")
+    if status is None:
+        return
+    RENDER_TRANSITIONS.labels(status).inc()
+
+    template = payload.get("template_name") or ""
+    created_at: Optional[float] = payload.get("created_at")
+    started_at: Optional[float] = payload.get("started_at")
+    completed_at: Optional[float] = payload.get("completed_at")
+
+    if status == "processing" and created_at is not None and started_at is not None:
+        RENDER_QUEUE_WAIT_SECONDS.labels(template).observe(max(0.0, started_at - created_at))
+    elif status in ("completed", "failed") and started_at is not None and completed_at is not None:
+        RENDER_RUN_SECONDS.labels(template, status).observe(max(0.0, completed_at - started_at))
@@ -0,0 +1,244 @@
+"""메트릭 집계 + Prometheus 텍스트 형식 출력
+
+prometheus_client 없이 Counter / Gauge / Histogram만 구현한다.
+관측 한 번은 라벨 튜플 dict 조회 + (Histogram) bisect 한 번이라 운영 중 상시 사용 가능.
+값은 프로세스 메모리에만 있으므로 /metrics를 노출하는 프로세스의 관측만 보인다.
+
+Usage:
+    >>> registry = MetricsRegistry()
+    >>> latency = registry.histogram("db_query_duration_seconds", "쿼리 시간", ("operation",))
+    >>> latency.labels("HandsRepository.insert").observe(0.004)
+    >>> print(registry.render())
+"""
+
+import math
+import os
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Generic, Iterable, Optional, TypeVar
+
+# 기본 Histogram 구간 (초, DB 쿼리 기준)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+_Child = TypeVar("_Child")
+
+
+class _Metric(ABC, Generic[_Child]):
+    """라벨별 값 보관 (라벨 값 튜플 → 자식)"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], _Child] = {}
+
+    def labels(self, *values: str) -> _Child:
+        """라벨 값에 해당하는 자식 (처음이면 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values!r}"
+                )
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> _Child:
+        """라벨 조합별 값 객체"""
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 형식 줄 목록"""
+
+    def clear(self) -> None:
+        self._children.clear()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric[_Value]):
+    """누적 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for values, child in self._children.items():
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}{labels} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """현재 값 (큐 깊이, 연결 수 등)"""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """라벨 없는 게이지 설정"""
+        self.labels().set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric[_HistogramValue]):
+    """분포 (구간별 누적 수, 합계, 개수)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """라벨 없는 히스토그램 관측"""
+        self.labels().observe(value)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        bounds = (*self.buckets, math.inf)
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                labels = _format_labels(self.labelnames, values, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric[Any])
+
+
+class MetricsRegistry:
+    """메트릭 목록 (이름 중복 등록 시 기존 메트릭 반환)
+
+    Args:
+        enabled: False면 관측을 건너뜀 (계측 코드가 enabled를 확인, 기본: METRICS_ENABLED)
+    """
+
+    def __init__(self, enabled: Optional[bool] = None) -> None:
+        if enabled is None:
+            enabled = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+        self.enabled = enabled
+        self._metrics: dict[str, _Metric[Any]] = {}
+
+    def _register(self, metric: _MetricT) -> _MetricT:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"metric {metric.name} already registered differently")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric[Any]]:
+        return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """모든 값 초기화 (메트릭 정의는 유지, 테스트용)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 인스턴스
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_registry() -> MetricsRegistry:
+    """전역 MetricsRegistry"""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
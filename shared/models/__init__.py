@@ -1,17 +1,26 @@
 """공유 데이터 모델"""
 
-from shared.models.hand import Hand, HandRank, SourceType
-from shared.models.tournament import Tournament, BlindLevel, PayoutEntry
-from shared.models.render_instruction import RenderInstruction, RenderOutput, RenderStatus
+from shared.models.hand import Hand, HandRank, HandSummary, PremiumHand, SourceType
+from shared.models.render_instruction import (
+    RenderInstruction,
+    RenderInstructionSummary,
+    RenderOutput,
+    RenderStatus,
+)
+from shared.models.tournament import BlindLevel, PayoutEntry, Tournament, TournamentSummary
 
 __all__ = [
     "Hand",
     "HandRank",
+    "HandSummary",
+    "PremiumHand",
     "SourceType",
     "Tournament",
+    "TournamentSummary",
     "BlindLevel",
     "PayoutEntry",
     "RenderInstruction",
+    "RenderInstructionSummary",
     "RenderOutput",
     "RenderStatus",
 ]
@@ -3,11 +3,18 @@
 feature_table에서 RFID JSON을 파싱하여 저장하는 핸드 정보.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
+
+from shared.models.trusted import (
+    LazyJSONList,
+    LazyModelList,
+    construct_trusted,
+    load_lazy_fields,
+)
 
 
 class SourceType(str, Enum):
@@ -37,13 +44,21 @@ class HandRank(str, Enum):
     @property
     def is_premium(self) -> bool:
         """Full House 이상 프리미엄 핸드 여부"""
-        premium_ranks = {
-            HandRank.ROYAL_FLUSH,
-            HandRank.STRAIGHT_FLUSH,
-            HandRank.FOUR_OF_A_KIND,
-            HandRank.FULL_HOUSE,
-        }
-        return self in premium_ranks
+        return self in PREMIUM_RANK_ORDER
+
+    @property
+    def premium_order(self) -> Optional[int]:
+        """프리미엄 핸드 순위 (1=Royal Flush ... 4=Full House, 프리미엄이 아니면 None)"""
+        return PREMIUM_RANK_ORDER.get(self)
+
+
+# 프리미엄 핸드 순위 (premium_hands.rank_order와 동일)
+PREMIUM_RANK_ORDER = {
+    HandRank.ROYAL_FLUSH: 1,
+    HandRank.STRAIGHT_FLUSH: 2,
+    HandRank.FOUR_OF_A_KIND: 3,
+    HandRank.FULL_HOUSE: 4,
+}
 
 
 class PlayerInfo(BaseModel):
@@ -71,20 +86,26 @@ class Hand(BaseModel):
     # 상세 정보 (JSON으로 저장)
     players: list[PlayerInfo] = Field(default_factory=list)
     community_cards: list[str] = Field(default_factory=list)
-    actions: list[dict] = Field(default_factory=list)
+    actions: list[dict[str, Any]] = Field(default_factory=list)
 
     # 메타데이터
     duration_seconds: Optional[int] = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        load_lazy_fields(self)
+        return handler(self)
+
     @property
     def is_premium(self) -> bool:
         """프리미엄 핸드 여부"""
         return self.hand_rank is not None and self.hand_rank.is_premium
 
-    def to_db_dict(self) -> dict:
+    def to_db_dict(self) -> dict[str, Any]:
         """DB 저장용 딕셔너리"""
+        load_lazy_fields(self)
         return {
             "table_id": self.table_id,
             "hand_number": self.hand_number,
@@ -101,7 +122,7 @@ class Hand(BaseModel):
         }
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "Hand":
+    def from_db_row(cls, row: dict[str, Any]) -> "Hand":
         """DB 행에서 생성"""
         players = [PlayerInfo(**p) for p in row.get("players_json", [])]
         hand_rank = HandRank(row["hand_rank"]) if row.get("hand_rank") else None
@@ -121,3 +142,116 @@ class Hand(BaseModel):
             created_at=row.get("created_at", datetime.now()),
             updated_at=row.get("updated_at", datetime.now()),
         )
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "Hand":
+        """DB 행에서 생성 (검증 생략, JSON 컬럼은 처음 접근할 때 변환)
+
+        hands 테이블에서 읽은 행 전용. 외부 입력은 from_db_row 사용.
+        JSON 컬럼은 디코딩된 값 또는 텍스트(컬럼::text) 모두 받는다.
+        """
+        hand_rank = row.get("hand_rank")
+        return construct_trusted(cls, {
+            "id": row.get("id"),
+            "table_id": row["table_id"],
+            "hand_number": row["hand_number"],
+            "source": SourceType(row["source"]),
+            "hand_rank": HandRank(hand_rank) if hand_rank else None,
+            "pot_size": row.get("pot_size", 0),
+            "winner": row.get("winner"),
+            "players": LazyModelList(PlayerInfo, row.get("players_json") or []),
+            "community_cards": LazyJSONList(row.get("community_cards_json")),
+            "actions": LazyJSONList(row.get("actions_json")),
+            "duration_seconds": row.get("duration_seconds"),
+            "created_at": row.get("created_at") or datetime.now(),
+            "updated_at": row.get("updated_at") or datetime.now(),
+        })
+
+
+class HandSummary(BaseModel):
+    """핸드 요약 (목록 조회용, JSON 컬럼 제외)"""
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id", "table_id", "hand_number", "hand_rank", "pot_size", "winner", "created_at",
+    )
+
+    id: int
+    table_id: str
+    hand_number: int
+    hand_rank: Optional[HandRank] = None
+    pot_size: int = 0
+    winner: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @property
+    def is_premium(self) -> bool:
+        """프리미엄 핸드 여부"""
+        return self.hand_rank is not None and self.hand_rank.is_premium
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "HandSummary":
+        """DB 행(COLUMNS 프로젝션)에서 생성 (검증 생략)"""
+        hand_rank = row.get("hand_rank")
+        return construct_trusted(cls, {
+            "id": row["id"],
+            "table_id": row["table_id"],
+            "hand_number": row["hand_number"],
+            "hand_rank": HandRank(hand_rank) if hand_rank else None,
+            "pot_size": row.get("pot_size") or 0,
+            "winner": row.get("winner"),
+            "created_at": row.get("created_at"),
+        })
+
+
+class PremiumHand(BaseModel):
+    """프리미엄 핸드 피드 항목 (premium_hands 행 / NOTIFY payload)
+
+    seq는 피드 커서: 새 프리미엄 핸드가 저장되거나 기존 항목의 랭크/팟/승자가 바뀔 때마다 증가한다.
+    """
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "seq", "hand_id", "table_id", "hand_number", "hand_rank", "rank_order",
+        "pot_size", "winner", "created_at",
+    )
+
+    seq: int
+    hand_id: int
+    table_id: str
+    hand_number: int
+    hand_rank: HandRank
+    rank_order: int
+    pot_size: int = 0
+    winner: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @property
+    def key(self) -> tuple[str, int]:
+        """핸드 식별 키 (table_id, hand_number)"""
+        return (self.table_id, self.hand_number)
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "PremiumHand":
+        """premium_hands 행(COLUMNS 프로젝션)에서 생성 (검증 생략)"""
+        return construct_trusted(cls, {
+            "seq": row["seq"],
+            "hand_id": row["hand_id"],
+            "table_id": row["table_id"],
+            "hand_number": row["hand_number"],
+            "hand_rank": HandRank(row["hand_rank"]),
+            "rank_order": row["rank_order"],
+            "pot_size": row.get("pot_size") or 0,
+            "winner": row.get("winner"),
+            "created_at": row.get("created_at"),
+        })
+
+    @classmethod
+    def from_notification(cls, payload: dict[str, Any]) -> "PremiumHand":
+        """premium_hands NOTIFY payload에서 생성 (created_at은 epoch 초)"""
+        created_at = payload.get("created_at")
+        return cls.from_trusted_row({
+            **payload,
+            "created_at": (
+                datetime.fromtimestamp(created_at, tz=timezone.utc)
+                if created_at is not None else None
+            ),
+        })
@@ -3,11 +3,20 @@
 automation_sub에서 생성하여 automation_ae가 처리하는 렌더링 작업.
 """
 
+import hashlib
+import json
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
+
+from shared.models.trusted import (
+    LazyJSONDict,
+    construct_trusted,
+    decode_json,
+    load_lazy_fields,
+)
 
 
 class RenderStatus(str, Enum):
@@ -47,7 +56,7 @@ class RenderInstruction(BaseModel):
     template_name: str          # AE 템플릿 이름
 
     # 레이어 데이터 (AE 템플릿에 주입)
-    layer_data: dict = Field(default_factory=dict)
+    layer_data: dict[str, Any] = Field(default_factory=dict)
     # 예: {"player_name": "John Doe", "chip_count": "$1,000,000"}
 
     # 출력 설정
@@ -58,6 +67,7 @@ class RenderInstruction(BaseModel):
     # 상태
     status: RenderStatus = RenderStatus.PENDING
     priority: int = 5           # 1(최고) - 10(최저)
+    deadline_at: Optional[datetime] = None  # 방송 송출 시각 (이 전에 완료되어야 함)
 
     # 트리거 정보 (어떤 이벤트로 생성되었는지)
     trigger_type: str = ""      # 예: "premium_hand", "elimination"
@@ -67,14 +77,44 @@ class RenderInstruction(BaseModel):
     error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    next_attempt_at: Optional[datetime] = None  # 재시도 대기 (이 시각 전에는 점유하지 않음)
+
+    # 작업 점유 (claim_batch로 가져간 워커와 lease 만료 시각)
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
 
     # 타임스탬프
     created_at: datetime = Field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    def to_db_dict(self) -> dict:
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        load_lazy_fields(self)
+        return handler(self)
+
+    def content_hash(self) -> str:
+        """렌더 결과를 결정하는 내용의 해시 (중복 제거 키, template_name과 함께 사용)
+
+        layer_data + output_settings의 정규화 JSON(sha256). 같은 템플릿에 같은 값이면
+        출력이 동일하므로 한 번만 렌더링한다.
+        """
+        load_lazy_fields(self)
+        canonical = json.dumps(
+            {
+                "layer_data": self.layer_data,
+                "output_settings": self.output_settings.model_dump(mode="json"),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def to_db_dict(self) -> dict[str, Any]:
         """DB 저장용 딕셔너리"""
+        load_lazy_fields(self)
         return {
             "template_name": self.template_name,
             "layer_data_json": self.layer_data,
@@ -83,6 +123,7 @@ class RenderInstruction(BaseModel):
             "output_filename": self.output_filename,
             "status": self.status.value,
             "priority": self.priority,
+            "deadline_at": self.deadline_at,
             "trigger_type": self.trigger_type,
             "trigger_id": self.trigger_id,
             "error_message": self.error_message,
@@ -94,7 +135,7 @@ class RenderInstruction(BaseModel):
         }
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "RenderInstruction":
+    def from_db_row(cls, row: dict[str, Any]) -> "RenderInstruction":
         """DB 행에서 생성"""
         output_settings = OutputSettings(**row.get("output_settings_json", {}))
 
@@ -107,16 +148,88 @@ class RenderInstruction(BaseModel):
             output_filename=row.get("output_filename"),
             status=RenderStatus(row.get("status", "pending")),
             priority=row.get("priority", 5),
+            deadline_at=row.get("deadline_at"),
             trigger_type=row.get("trigger_type", ""),
             trigger_id=row.get("trigger_id"),
             error_message=row.get("error_message"),
             retry_count=row.get("retry_count", 0),
             max_retries=row.get("max_retries", 3),
+            next_attempt_at=row.get("next_attempt_at"),
+            worker_id=row.get("worker_id"),
+            lease_expires_at=row.get("lease_expires_at"),
             created_at=row.get("created_at", datetime.now()),
             started_at=row.get("started_at"),
             completed_at=row.get("completed_at"),
         )
 
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "RenderInstruction":
+        """DB 행에서 생성 (검증 생략, layer_data는 처음 접근할 때 디코딩)
+
+        render_instructions 테이블에서 읽은 행 전용. 외부 입력은 from_db_row 사용.
+        JSON 컬럼은 디코딩된 값 또는 텍스트(컬럼::text) 모두 받는다.
+        """
+        settings = dict(decode_json(row.get("output_settings_json")) or {})
+        if "format" in settings:
+            settings["format"] = OutputFormat(settings["format"])
+
+        return construct_trusted(cls, {
+            "id": row.get("id"),
+            "template_name": row["template_name"],
+            "layer_data": LazyJSONDict(row.get("layer_data_json")),
+            "output_settings": construct_trusted(OutputSettings, settings),
+            "output_path": row.get("output_path"),
+            "output_filename": row.get("output_filename"),
+            "status": RenderStatus(row.get("status", "pending")),
+            "priority": row.get("priority", 5),
+            "deadline_at": row.get("deadline_at"),
+            "trigger_type": row.get("trigger_type") or "",
+            "trigger_id": row.get("trigger_id"),
+            "error_message": row.get("error_message"),
+            "retry_count": row.get("retry_count", 0),
+            "max_retries": row.get("max_retries", 3),
+            "next_attempt_at": row.get("next_attempt_at"),
+            "worker_id": row.get("worker_id"),
+            "lease_expires_at": row.get("lease_expires_at"),
+            "created_at": row.get("created_at") or datetime.now(),
+            "started_at": row.get("started_at"),
+            "completed_at": row.get("completed_at"),
+        })
+
+
+class RenderInstructionSummary(BaseModel):
+    """렌더링 지시서 요약 (목록 조회용, JSON 컬럼 제외)"""
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id", "template_name", "status", "priority", "deadline_at", "trigger_type",
+        "retry_count", "worker_id", "created_at",
+    )
+
+    id: int
+    template_name: str
+    status: RenderStatus = RenderStatus.PENDING
+    priority: int = 5
+    deadline_at: Optional[datetime] = None
+    trigger_type: str = ""
+    retry_count: int = 0
+    worker_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "RenderInstructionSummary":
+        """DB 행(COLUMNS 프로젝션)에서 생성 (검증 생략)"""
+        return construct_trusted(cls, {
+            "id": row["id"],
+            "template_name": row["template_name"],
+            "status": RenderStatus(row.get("status") or "pending"),
+            "priority": row.get("priority", 5),
+            "deadline_at": row.get("deadline_at"),
+            "trigger_type": row.get("trigger_type") or "",
+            "retry_count": row.get("retry_count") or 0,
+            "worker_id": row.get("worker_id"),
+            "created_at": row.get("created_at"),
+        })
+
 
 class RenderOutput(BaseModel):
     """렌더링 결과
@@ -137,11 +250,14 @@ class RenderOutput(BaseModel):
     status: RenderStatus = RenderStatus.COMPLETED
     error_message: Optional[str] = None
 
+    # 렌더 캐시 재사용 시 원본 결과 ID (AE가 직접 렌더링했으면 None)
+    cache_source_id: Optional[int] = None
+
     # 타임스탬프
     created_at: datetime = Field(default_factory=datetime.now)
     completed_at: datetime = Field(default_factory=datetime.now)
 
-    def to_db_dict(self) -> dict:
+    def to_db_dict(self) -> dict[str, Any]:
         """DB 저장용 딕셔너리"""
         return {
             "instruction_id": self.instruction_id,
@@ -150,12 +266,13 @@ class RenderOutput(BaseModel):
             "frame_count": self.frame_count,
             "status": self.status.value,
             "error_message": self.error_message,
+            "cache_source_id": self.cache_source_id,
             "created_at": self.created_at,
             "completed_at": self.completed_at,
         }
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "RenderOutput":
+    def from_db_row(cls, row: dict[str, Any]) -> "RenderOutput":
         """DB 행에서 생성"""
         return cls(
             id=row.get("id"),
@@ -165,6 +282,26 @@ class RenderOutput(BaseModel):
             frame_count=row.get("frame_count"),
             status=RenderStatus(row.get("status", "completed")),
             error_message=row.get("error_message"),
+            cache_source_id=row.get("cache_source_id"),
             created_at=row.get("created_at", datetime.now()),
             completed_at=row.get("completed_at", datetime.now()),
         )
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "RenderOutput":
+        """DB 행에서 생성 (검증 생략)
+
+        render_outputs 테이블에서 읽은 행 전용. 외부 입력은 from_db_row 사용.
+        """
+        return construct_trusted(cls, {
+            "id": row.get("id"),
+            "instruction_id": row["instruction_id"],
+            "output_path": row["output_path"],
+            "file_size": row.get("file_size") or 0,
+            "frame_count": row.get("frame_count"),
+            "status": RenderStatus(row.get("status") or "completed"),
+            "error_message": row.get("error_message"),
+            "cache_source_id": row.get("cache_source_id"),
+            "created_at": row.get("created_at") or datetime.now(),
+            "completed_at": row.get("completed_at") or datetime.now(),
+        })
@@ -4,9 +4,16 @@ automation_sub에서 WSOP+ CSV를 파싱하여 저장하는 토너먼트 정보.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
+
+from shared.models.trusted import (
+    LazyModelList,
+    construct_trusted,
+    decode_json,
+    load_lazy_fields,
+)
 
 
 class BlindLevel(BaseModel):
@@ -72,8 +79,14 @@ class Tournament(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
-    def to_db_dict(self) -> dict:
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        load_lazy_fields(self)
+        return handler(self)
+
+    def to_db_dict(self) -> dict[str, Any]:
         """DB 저장용 딕셔너리"""
+        load_lazy_fields(self)
         return {
             "name": self.name,
             "event_code": self.event_code,
@@ -96,7 +109,7 @@ class Tournament(BaseModel):
         }
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "Tournament":
+    def from_db_row(cls, row: dict[str, Any]) -> "Tournament":
         """DB 행에서 생성"""
         blinds = [BlindLevel(**b) for b in row.get("blinds_json", [])]
         payouts = [PayoutEntry(**p) for p in row.get("payouts_json", [])]
@@ -128,3 +141,69 @@ class Tournament(BaseModel):
             created_at=row.get("created_at", datetime.now()),
             updated_at=row.get("updated_at", datetime.now()),
         )
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "Tournament":
+        """DB 행에서 생성 (검증 생략, blinds/payouts/standings는 처음 접근할 때 변환)
+
+        tournaments 테이블에서 읽은 행 전용. 외부 입력은 from_db_row 사용.
+        JSON 컬럼은 디코딩된 값 또는 텍스트(컬럼::text) 모두 받는다.
+        """
+        current_blinds = decode_json(row.get("current_blinds_json"))
+        return construct_trusted(cls, {
+            "id": row.get("id"),
+            "name": row["name"],
+            "event_code": row["event_code"],
+            "event_type": row.get("event_type", "HOLDEM"),
+            "buy_in": row.get("buy_in", 0),
+            "prize_pool": row.get("prize_pool", 0),
+            "total_entries": row.get("total_entries", 0),
+            "remaining_players": row.get("remaining_players", 0),
+            "current_level": row.get("current_level", 1),
+            "blinds": LazyModelList(BlindLevel, row.get("blinds_json") or []),
+            "current_blinds": (
+                construct_trusted(BlindLevel, current_blinds) if current_blinds else None
+            ),
+            "payouts": LazyModelList(PayoutEntry, row.get("payouts_json") or []),
+            "places_paid": row.get("places_paid", 0),
+            "standings": LazyModelList(PlayerStanding, row.get("standings_json") or []),
+            "start_date": row.get("start_date"),
+            "end_date": row.get("end_date"),
+            "source": row.get("source", "csv"),
+            "created_at": row.get("created_at") or datetime.now(),
+            "updated_at": row.get("updated_at") or datetime.now(),
+        })
+
+
+class TournamentSummary(BaseModel):
+    """토너먼트 요약 (목록 조회용, JSON 컬럼 제외)"""
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id", "name", "event_code", "event_type", "total_entries",
+        "remaining_players", "current_level", "start_date", "updated_at",
+    )
+
+    id: int
+    name: str
+    event_code: str
+    event_type: str = "HOLDEM"
+    total_entries: int = 0
+    remaining_players: int = 0
+    current_level: int = 1
+    start_date: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_trusted_row(cls, row: dict[str, Any]) -> "TournamentSummary":
+        """DB 행(COLUMNS 프로젝션)에서 생성 (검증 생략)"""
+        return construct_trusted(cls, {
+            "id": row["id"],
+            "name": row["name"],
+            "event_code": row["event_code"],
+            "event_type": row.get("event_type") or "HOLDEM",
+            "total_entries": row.get("total_entries") or 0,
+            "remaining_players": row.get("remaining_players") or 0,
+            "current_level": row.get("current_level") or 1,
+            "start_date": row.get("start_date"),
+            "updated_at": row.get("updated_at"),
+        })
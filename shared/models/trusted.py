@@ -0,0 +1,202 @@
+"""신뢰된 DB 행에서 모델 생성 (검증 생략)
+
+우리 테이블에서 읽은 행은 저장 시 이미 검증되었으므로 조회 시 다시 검증하지 않는다.
+
+- construct_trusted(): 검증 없이 인스턴스 생성 (model_construct와 같은 결과)
+- LazyModelList: JSON 배열 컬럼(players_json 등)을 처음 접근할 때 모델로 변환
+  (배열 전체를 TypeAdapter로 한 번에 변환 - 항목별 Python 생성보다 빠름)
+- LazyJSONList / LazyJSONDict: JSON 텍스트 컬럼을 처음 접근할 때 디코딩
+
+model_construct는 pydantic 2.x에서 호출마다 필드 순회/default_factory 시그니처 검사를 하므로
+오히려 검증보다 느릴 수 있어, 모델별 기본값 계획을 캐시하고 인스턴스 __dict__를 직접 구성한다.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _defaults_plan(
+    cls: type[BaseModel],
+) -> tuple[tuple[str, Any, Optional[Callable[..., Any]]], ...]:
+    """모델별 (필드명, 기본값, default_factory) 목록"""
+    plan: list[tuple[str, Any, Optional[Callable[..., Any]]]] = []
+    for name, field in cls.model_fields.items():
+        default = None if field.default is PydanticUndefined else field.default
+        plan.append((name, default, field.default_factory))
+    return tuple(plan)
+
+
+def construct_trusted(cls: type[M], data: dict[str, Any]) -> M:
+    """검증 없이 모델 생성 (신뢰된 DB 행 전용)
+
+    data에 없는 필드는 기본값으로 채운다. 타입 변환(Enum 등)은 호출자가 수행.
+    """
+    values: dict[str, Any] = {}
+    for name, default, factory in _defaults_plan(cls):
+        if name in data:
+            values[name] = data[name]
+        elif factory is not None:
+            values[name] = factory()
+        else:
+            values[name] = default
+
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]  # 런타임에 정해지는 모델
+
+
+def decode_json(raw: Any) -> Any:
+    """JSON 컬럼 값 디코딩 (텍스트면 json.loads, 이미 디코딩된 값이면 그대로)"""
+    if isinstance(raw, (str, bytes)):
+        return json.loads(raw)
+    return raw
+
+
+class LazyModelList(list[Any]):
+    """JSON 배열 → 모델 리스트 (처음 접근할 때 변환)
+
+    목록 조회처럼 중첩 필드를 쓰지 않는 경우 변환 비용이 들지 않는다.
+    raw는 디코딩된 리스트 또는 JSON 텍스트(컬럼::text)를 받는다.
+    """
+
+    __slots__ = ("_model", "_raw")
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        raw: Optional[Union[Iterable[dict[str, Any]], str, bytes]],
+    ) -> None:
+        super().__init__()
+        self._model = model
+        self._raw = raw
+
+    @property
+    def loaded(self) -> bool:
+        """변환 여부"""
+        return self._raw is None
+
+    def load(self) -> "LazyModelList":
+        """아직 변환되지 않았으면 변환"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            adapter = _list_adapter(self._model)
+            if isinstance(raw, (str, bytes)):
+                list.extend(self, adapter.validate_json(raw))
+            else:
+                list.extend(self, adapter.validate_python(raw))
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # 변환 후 일반 list로 직렬화 (pickle / copy / multiprocessing)
+        return (list, (list(self),))
+
+
+class LazyJSONList(list[Any]):
+    """JSON 텍스트 → list (처음 접근할 때 디코딩)"""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Optional[Union[str, bytes, list[Any]]]) -> None:
+        super().__init__()
+        self._raw = raw
+
+    @property
+    def loaded(self) -> bool:
+        """디코딩 여부"""
+        return self._raw is None
+
+    def load(self) -> "LazyJSONList":
+        """아직 디코딩되지 않았으면 디코딩"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            list.extend(self, decode_json(raw) or [])
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+class LazyJSONDict(dict[str, Any]):
+    """JSON 텍스트 → dict (처음 접근할 때 디코딩)"""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Optional[Union[str, bytes, dict[str, Any]]]) -> None:
+        super().__init__()
+        self._raw = raw
+
+    @property
+    def loaded(self) -> bool:
+        """디코딩 여부"""
+        return self._raw is None
+
+    def load(self) -> "LazyJSONDict":
+        """아직 디코딩되지 않았으면 디코딩"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            dict.update(self, decode_json(raw) or {})
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+_LAZY_TYPES = (LazyModelList, LazyJSONList, LazyJSONDict)
+
+
+def _loading(base: type, name: str) -> Callable[..., Any]:
+    method = getattr(base, name)
+
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return method(self.load(), *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# 모든 연산 전에 변환되므로 일반 list/dict와 동일하게 사용할 수 있다.
+# 단 json.dumps는 list 내부 저장소를 직접 읽으므로 load_lazy_fields() 후 직렬화할 것.
+_COMMON_METHODS = (
+    "__getitem__", "__setitem__", "__delitem__", "__iter__", "__reversed__",
+    "__len__", "__contains__", "__eq__", "__ne__", "__repr__",
+    "copy", "clear", "pop",
+)
+_LIST_METHODS = _COMMON_METHODS + (
+    "__lt__", "__le__", "__gt__", "__ge__",
+    "__add__", "__iadd__", "__mul__", "__imul__", "__rmul__",
+    "append", "extend", "insert", "remove", "index", "count", "sort", "reverse",
+)
+_DICT_METHODS = _COMMON_METHODS + (
+    "__or__", "__ror__", "__ior__",
+    "get", "keys", "values", "items", "popitem", "setdefault", "update",
+)
+
+for _cls, _base, _names in (
+    (LazyModelList, list, _LIST_METHODS),
+    (LazyJSONList, list, _LIST_METHODS),
+    (LazyJSONDict, dict, _DICT_METHODS),
+):
+    for _name in _names:
+        setattr(_cls, _name, _loading(_base, _name))
+
+
+def load_lazy_fields(instance: BaseModel) -> None:
+    """인스턴스의 지연 필드를 모두 변환 (직렬화 전 호출)"""
+    for value in instance.__dict__.values():
+        if type(value) in _LAZY_TYPES:
+            value.load()
@@ -0,0 +1,45 @@
+"""포커 핸드 평가 / 승률 계산"""
+
+from shared.poker.equity import EquityEngine, EquityResult, calculate_equity
+from shared.poker.evaluator import (
+    NUM_RANK_VALUES,
+    PREMIUM_MAX_RANK_VALUE,
+    best_hand_rank,
+    best_rank_values,
+    card_index,
+    encode_cards,
+    evaluate,
+    evaluate_batch,
+    evaluate_omaha,
+    evaluate_omaha_batch,
+    fill_hand_ranks,
+    gfx_boards,
+    hand_rank,
+    premium_mask,
+    rank_categories,
+    rank_category,
+    rank_gfx_hands,
+)
+
+__all__ = [
+    "EquityEngine",
+    "EquityResult",
+    "calculate_equity",
+    "NUM_RANK_VALUES",
+    "PREMIUM_MAX_RANK_VALUE",
+    "best_hand_rank",
+    "best_rank_values",
+    "card_index",
+    "encode_cards",
+    "evaluate",
+    "evaluate_batch",
+    "evaluate_omaha",
+    "evaluate_omaha_batch",
+    "fill_hand_ranks",
+    "gfx_boards",
+    "hand_rank",
+    "premium_mask",
+    "rank_categories",
+    "rank_category",
+    "rank_gfx_hands",
+]
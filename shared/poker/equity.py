@@ -0,0 +1,433 @@
+"""승률(equity) 계산 엔진
+
+진행 중인 핸드의 플레이어별 승/무 확률 (Hand Info 자막, RenderInstruction.layer_data용).
+
+- 남은 보드 카드가 2장 이하 (플랍/턴/리버): 모든 런아웃 완전 열거
+- 프리플랍: 고정 샘플 수 Monte Carlo (게임 상태별 고정 시드 → 같은 상태는 같은 결과)
+- 런아웃 평가는 evaluate_batch로 벡터화, 샘플은 프로세스 풀로 분할 가능
+- 결과는 (홀카드, 보드, 데드카드) 기준 LRU 캐시
+
+Usage:
+    >>> from shared.poker import EquityEngine
+    >>> engine = EquityEngine(workers=4)
+    >>> result = engine.calculate([["As", "Ad"], ["Kc", "Qc"]], board=["2c", "7c", "9d"])
+    >>> result.to_layer_data()
+"""
+
+import asyncio
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from shared.poker.evaluator import (
+    RANKS,
+    SUITS,
+    CardLike,
+    _require_numpy,
+    _tables,
+    card_index,
+    evaluate_batch,
+    evaluate_omaha_batch,
+)
+
+# 완전 열거 대상: 남은 보드 카드 수 (플랍 이후)
+EXACT_MAX_MISSING = 2
+
+# 프리플랍 Monte Carlo 기본 샘플 수
+DEFAULT_SAMPLES = 20_000
+
+# 한 번에 평가할 핸드 수 (런아웃 × 플레이어 × 런아웃당 조합 수, 메모리 제한)
+_CHUNK_EVALUATIONS = 100_000
+
+# 플레이어 한 명의 런아웃 하나를 평가하는 조합 수 (홀덤 7장 1회, 오마하 C(4,2) × C(5,3))
+_COMBOS_PER_RUNOUT = {2: 1, 4: 60}
+
+# (홀카드, 보드, 데드카드) 캐시 키
+EquityKey = tuple[tuple[tuple[int, ...], ...], tuple[int, ...], tuple[int, ...]]
+
+# 계산 작업 결과: 플레이어별 (승리 수, 공동 승리 수, 지분 합), 평가한 런아웃 수
+EquityPart = tuple[list[int], list[int], list[float], int]
+
+
+class EquityResult(BaseModel):
+    """플레이어별 승률 (입력 순서)"""
+
+    hole_cards: list[list[str]]
+    board: list[str]                  # 요청한 순서
+    win: list[float]                  # 단독 승리 확률
+    tie: list[float]                  # 공동 승리 확률
+    equity: list[float]               # 팟 기대 지분 (win + 공동 승리 시 분할 몫)
+    runouts: int                      # 평가한 런아웃 수
+    exact: bool                       # 완전 열거 여부
+    elapsed_seconds: float = 0.0
+    cached: bool = False
+    computed_at: float = Field(default_factory=time.time)
+
+    def to_layer_data(self) -> dict[str, Any]:
+        """RenderInstruction.layer_data용 (퍼센트, 소수 첫째 자리)"""
+        return {
+            "board": self.board,
+            "players": [
+                {
+                    "hole_cards": cards,
+                    "win_percent": round(win * 100, 1),
+                    "tie_percent": round(tie * 100, 1),
+                    "equity_percent": round(equity * 100, 1),
+                }
+                for cards, win, tie, equity in zip(self.hole_cards, self.win, self.tie, self.equity)
+            ],
+            "exact": self.exact,
+        }
+
+
+# =========================================================
+# Core (프로세스 풀 워커에서도 실행)
+# =========================================================
+
+def _tally(
+    hole: tuple[tuple[int, ...], ...], board: tuple[int, ...], runouts: Any
+) -> tuple[list[int], list[int], list[float]]:
+    """런아웃 (S, missing) 평가 → 플레이어별 (승리 수, 공동 승리 수, 지분 합)"""
+    np = _require_numpy()
+    count = len(runouts)
+    boards = np.concatenate(
+        [np.broadcast_to(np.array(board, dtype=np.int16), (count, len(board))), runouts],
+        axis=1,
+    )                                                                  # (S, 5)
+    hole_array = np.array(hole, dtype=np.int16)                        # (P, H)
+
+    if hole_array.shape[1] == 4:
+        values = evaluate_omaha_batch(hole_array[:, None, :], boards[None, :, :])
+    else:
+        cards = np.concatenate(
+            [np.broadcast_to(hole_array[:, None, :], (len(hole), count, hole_array.shape[1])),
+             np.broadcast_to(boards[None, :, :], (len(hole), count, 5))],
+            axis=2,
+        )
+        values = evaluate_batch(cards)                                 # (P, S)
+
+    best = values.min(axis=0)
+    winners = values == best
+    winner_count = winners.sum(axis=0)
+    solo = winners & (winner_count == 1)
+    shared = winners & (winner_count > 1)
+    share = np.where(winners, 1.0 / winner_count, 0.0)
+    return solo.sum(axis=1).tolist(), shared.sum(axis=1).tolist(), share.sum(axis=1).tolist()
+
+
+def _chunk_runouts(hole: tuple[tuple[int, ...], ...]) -> int:
+    """한 번에 평가할 런아웃 수 (플레이어 수와 게임 종류에 따라)"""
+    per_runout = len(hole) * _COMBOS_PER_RUNOUT[len(hole[0])]
+    return max(1, _CHUNK_EVALUATIONS // per_runout)
+
+
+def _tally_chunks(
+    hole: tuple[tuple[int, ...], ...], board: tuple[int, ...], runouts: Any
+) -> tuple[list[int], list[int], list[float]]:
+    """런아웃을 청크로 나누어 _tally 합산"""
+    chunk = _chunk_runouts(hole)
+    wins, ties, shares = [0] * len(hole), [0] * len(hole), [0.0] * len(hole)
+    for start in range(0, len(runouts), chunk):
+        solo, shared, share = _tally(hole, board, runouts[start:start + chunk])
+        for p in range(len(hole)):
+            wins[p] += solo[p]
+            ties[p] += shared[p]
+            shares[p] += share[p]
+    return wins, ties, shares
+
+
+def _enumerate(
+    hole: tuple[tuple[int, ...], ...], board: tuple[int, ...], deck: Sequence[int], missing: int
+) -> EquityPart:
+    """모든 런아웃 완전 열거 (플랍 이후 최대 C(45,2)=990개)"""
+    np = _require_numpy()
+    combos = list(combinations(deck, missing))
+    runouts = np.array(combos, dtype=np.int16).reshape(len(combos), missing)
+    solo, shared, share = _tally_chunks(hole, board, runouts)
+    return solo, shared, share, len(runouts)
+
+
+def _sample(
+    hole: tuple[tuple[int, ...], ...],
+    board: tuple[int, ...],
+    deck: Sequence[int],
+    missing: int,
+    samples: int,
+    seed: int,
+) -> EquityPart:
+    """Monte Carlo: 남은 덱에서 비복원 추출한 런아웃 samples개 평가"""
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    deck_array = np.array(deck, dtype=np.int16)
+    chunk = _chunk_runouts(hole)
+    wins, ties, shares = [0] * len(hole), [0] * len(hole), [0.0] * len(hole)
+    for start in range(0, samples, chunk):
+        count = min(chunk, samples - start)
+        order = np.argsort(rng.random((count, len(deck_array))), axis=1)[:, :missing]
+        solo, shared, share = _tally(hole, board, deck_array[order])
+        for p in range(len(hole)):
+            wins[p] += solo[p]
+            ties[p] += shared[p]
+            shares[p] += share[p]
+    return wins, ties, shares, samples
+
+
+# =========================================================
+# Engine
+# =========================================================
+
+class EquityEngine:
+    """승률 계산기 (캐시 + 프로세스 풀)
+
+    여러 그래픽이 같은 게임 상태를 요청하면 캐시된 결과를 반환한다.
+    """
+
+    def __init__(
+        self,
+        samples: int = DEFAULT_SAMPLES,
+        workers: int = 1,
+        cache_size: int = 1024,
+    ) -> None:
+        self.samples = samples
+        self.workers = workers
+        self.cache_size = cache_size
+        self._cache: OrderedDict[EquityKey, EquityResult] = OrderedDict()
+        self._inflight: dict[EquityKey, asyncio.Future[EquityResult]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------------------------------------------------
+    # Cache
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        hole_cards: Sequence[Sequence[CardLike]],
+        board: Sequence[CardLike] = (),
+        dead: Sequence[CardLike] = (),
+    ) -> EquityKey:
+        """캐시 키 (홀카드/보드/데드카드 순서는 결과와 무관하므로 정렬, 플레이어 순서는 유지)
+
+        Raises:
+            ValueError: 잘못된/중복된 카드, 플레이어 수/홀카드/보드 장수 오류
+        """
+        hole = tuple(tuple(sorted(card_index(c) for c in cards)) for cards in hole_cards)
+        board_key = tuple(sorted(card_index(c) for c in board))
+        dead_key = tuple(sorted(card_index(c) for c in dead))
+
+        if len(hole) < 2:
+            raise ValueError("Equity needs at least 2 players")
+        sizes = {len(cards) for cards in hole}
+        if sizes not in ({2}, {4}):
+            raise ValueError(f"All players need 2 (Hold'em) or 4 (Omaha) hole cards: {sizes}")
+        if len(board_key) not in (0, 3, 4, 5):
+            raise ValueError(f"Board must have 0, 3, 4 or 5 cards, got {len(board_key)}")
+        known = [c for cards in hole for c in cards] + list(board_key) + list(dead_key)
+        if len(set(known)) != len(known):
+            raise ValueError("Duplicate cards in hole cards / board / dead cards")
+        return hole, board_key, dead_key
+
+    def _cache_get(self, key: EquityKey) -> Optional[EquityResult]:
+        result = self._cache.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return result.model_copy(update={"cached": True})
+
+    def _cache_put(self, key: EquityKey, result: EquityResult) -> None:
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """캐시 초기화"""
+        self._cache.clear()
+
+    # ---------------------------------------------------------
+    # Calculation
+    # ---------------------------------------------------------
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_warm_tables
+            )
+        return self._executor
+
+    def _jobs(self, key: EquityKey) -> tuple[list[tuple[Any, ...]], bool]:
+        """계산 작업 목록 (워커 수만큼 분할) 및 완전 열거 여부"""
+        hole, board, dead = key
+        known = {c for cards in hole for c in cards} | set(board) | set(dead)
+        deck = [c for c in range(52) if c not in known]
+        missing = 5 - len(board)
+
+        if missing <= EXACT_MAX_MISSING:
+            # 런아웃이 적어 프로세스 풀 전송 비용이 더 큼 → 항상 현재 프로세스
+            return [(_enumerate, hole, board, deck, missing)], True
+
+        # 프리플랍: 샘플을 워커 수만큼 나누어 Monte Carlo (파트별 고정 시드)
+        seed = zlib.crc32(repr(key).encode())
+        parts = max(1, min(self.workers, self.samples // 1000))
+        per_part = -(-self.samples // parts)
+        jobs = [
+            (_sample, hole, board, deck, missing, min(per_part, self.samples - start), seed + i)
+            for i, start in enumerate(range(0, self.samples, per_part))
+        ]
+        return jobs, False
+
+    def _result(
+        self, key: EquityKey, parts: list[EquityPart], exact: bool, started: float
+    ) -> EquityResult:
+        hole, board, _ = key
+        players = len(hole)
+        wins, ties, shares = [0] * players, [0] * players, [0.0] * players
+        runouts = 0
+        for solo, shared, share, count in parts:
+            for p in range(players):
+                wins[p] += solo[p]
+                ties[p] += shared[p]
+                shares[p] += share[p]
+            runouts += count
+
+        names = [[_card_name(c) for c in cards] for cards in hole]
+        return EquityResult(
+            hole_cards=names,
+            board=[_card_name(c) for c in board],
+            win=[w / runouts for w in wins],
+            tie=[t / runouts for t in ties],
+            equity=[s / runouts for s in shares],
+            runouts=runouts,
+            exact=exact,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def calculate(
+        self,
+        hole_cards: Sequence[Sequence[CardLike]],
+        board: Sequence[CardLike] = (),
+        dead: Sequence[CardLike] = (),
+    ) -> EquityResult:
+        """플레이어별 승률 계산 (동기)
+
+        Args:
+            hole_cards: 플레이어별 홀카드 (홀덤 2장, 오마하 4장)
+            board: 공개된 보드 (0, 3, 4, 5장)
+            dead: 제외할 카드 (폴드/번 카드 등 공개된 카드)
+        """
+        key = self.make_key(hole_cards, board, dead)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return _in_request_order(cached, hole_cards, board)
+
+        started = time.perf_counter()
+        jobs, exact = self._jobs(key)
+        if len(jobs) == 1:
+            parts = [fn(*args) for fn, *args in jobs]
+        else:
+            executor = self._get_executor()
+            parts = [f.result() for f in [executor.submit(fn, *args) for fn, *args in jobs]]
+
+        result = self._result(key, parts, exact, started)
+        self._cache_put(key, result)
+        return _in_request_order(result, hole_cards, board)
+
+    async def calculate_async(
+        self,
+        hole_cards: Sequence[Sequence[CardLike]],
+        board: Sequence[CardLike] = (),
+        dead: Sequence[CardLike] = (),
+    ) -> EquityResult:
+        """플레이어별 승률 계산 (비동기, 이벤트 루프를 막지 않음)
+
+        같은 게임 상태의 동시 요청은 하나의 계산을 공유한다.
+        """
+        key = self.make_key(hole_cards, board, dead)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return _in_request_order(cached, hole_cards, board)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._calculate_async(key))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result = await asyncio.shield(inflight)
+        return _in_request_order(result, hole_cards, board)
+
+    async def _calculate_async(self, key: EquityKey) -> EquityResult:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        jobs, exact = self._jobs(key)
+        executor = self._get_executor() if len(jobs) > 1 else None
+        parts = await asyncio.gather(
+            *(loop.run_in_executor(executor, fn, *args) for fn, *args in jobs)
+        )
+        result = self._result(key, list(parts), exact, started)
+        self._cache_put(key, result)
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """캐시 통계 (모니터링용)"""
+        total = self.hits + self.misses
+        return {
+            "cached_states": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _warm_tables() -> None:
+    """워커 시작 시 lookup table 미리 생성"""
+    _tables().arrays()
+
+
+def _in_request_order(
+    result: EquityResult,
+    hole_cards: Sequence[Sequence[CardLike]],
+    board: Sequence[CardLike] = (),
+) -> EquityResult:
+    """캐시 키는 홀카드/보드를 정렬하므로 결과의 hole_cards, board를 요청한 순서로 되돌림"""
+    names = [[_card_name(card_index(c)) for c in cards] for cards in hole_cards]
+    board_names = [_card_name(card_index(c)) for c in board]
+    if names == result.hole_cards and board_names == result.board:
+        return result
+    return result.model_copy(update={"hole_cards": names, "board": board_names})
+
+
+def _card_name(index: int) -> str:
+    return RANKS[index >> 2] + SUITS[index & 3]
+
+
+# 기본 엔진 (단일 프로세스)
+_default_engine: Optional[EquityEngine] = None
+
+
+def calculate_equity(
+    hole_cards: Sequence[Sequence[CardLike]],
+    board: Sequence[CardLike] = (),
+    dead: Sequence[CardLike] = (),
+) -> EquityResult:
+    """기본 엔진으로 승률 계산 (프로세스 내 캐시 공유)"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = EquityEngine()
+    return _default_engine.calculate(hole_cards, board, dead)
+
@@ -0,0 +1,546 @@
+"""포커 핸드 평가기 (lookup table 기반)
+
+카드 5~7장 → rank_value (1=Royal Flush ... 7462=7-5-4-3-2 high).
+hand_results.rank_value와 같은 체계이며, 값이 작을수록 강한 핸드.
+
+- evaluate(): 단일 핸드 (순수 파이썬)
+- evaluate_batch(): 수천 개 핸드/런아웃을 한 번의 NumPy 연산으로 평가
+
+Usage:
+    >>> from shared.poker import evaluate, rank_category
+    >>> rank_category(evaluate(["As", "Ks", "Qs", "Js", "Ts", "2d", "3c"]))
+    <HandRank.ROYAL_FLUSH: 'royal_flush'>
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from itertools import combinations, combinations_with_replacement
+from types import ModuleType
+from typing import Any, Optional, Sequence, Union
+
+from shared.models.hand import Hand, HandRank
+
+# 선택 의존성 (배치 평가 전용, _require_numpy()로 접근)
+_numpy: Optional[ModuleType]
+try:
+    _numpy = import_module("numpy")
+except ImportError:  # pragma: no cover
+    _numpy = None
+
+# 카드 표기 (common/card.schema.json): 랭크 + 수트
+RANKS = "23456789TJQKA"
+SUITS = "hdcs"
+
+# rank_value 범위 (Cactus Kev 동치류 수)
+NUM_RANK_VALUES = 7462
+
+# 카테고리별 가장 약한 rank_value (오름차순)
+_CATEGORY_BOUNDS: list[tuple[int, HandRank]] = [
+    (10, HandRank.STRAIGHT_FLUSH),
+    (166, HandRank.FOUR_OF_A_KIND),
+    (322, HandRank.FULL_HOUSE),
+    (1599, HandRank.FLUSH),
+    (1609, HandRank.STRAIGHT),
+    (2467, HandRank.THREE_OF_A_KIND),
+    (3325, HandRank.TWO_PAIR),
+    (6185, HandRank.ONE_PAIR),
+    (NUM_RANK_VALUES, HandRank.HIGH_CARD),
+]
+
+# 프리미엄 기준 (Full House 이상, HandRank.is_premium과 동일)
+PREMIUM_MAX_RANK_VALUE = 322
+
+# 내부 강도 카테고리 (클수록 강함)
+(
+    _HIGH_CARD, _PAIR, _TWO_PAIR, _TRIPS, _STRAIGHT,
+    _FLUSH, _FULL_HOUSE, _QUADS, _STRAIGHT_FLUSH,
+) = range(9)
+
+# 오마하: 홀카드 2장 + 보드 3장 조합 (6 x 10 = 60)
+_OMAHA_HOLE_PAIRS = list(combinations(range(4), 2))
+_OMAHA_BOARD_TRIPLES = list(combinations(range(5), 3))
+
+CardLike = Union[str, int]
+
+
+# =========================================================
+# Card Encoding
+# =========================================================
+
+def card_index(card: CardLike) -> int:
+    """카드 → 0~51 인덱스 (rank * 4 + suit)
+
+    Raises:
+        ValueError: 카드 표기가 잘못된 경우
+    """
+    if isinstance(card, int):
+        if not 0 <= card < 52:
+            raise ValueError(f"Invalid card index: {card}")
+        return card
+    if len(card) != 2 or card[0] not in RANKS or card[1] not in SUITS:
+        raise ValueError(f"Invalid card: {card!r}")
+    return RANKS.index(card[0]) * 4 + SUITS.index(card[1])
+
+
+def encode_cards(cards: Sequence[CardLike], width: int) -> list[int]:
+    """카드 목록 → 길이 width 인덱스 목록 (빈 자리는 -1, 배치 입력용)"""
+    if len(cards) > width:
+        raise ValueError(f"Too many cards for width {width}: {list(cards)}")
+    return [card_index(c) for c in cards] + [-1] * (width - len(cards))
+
+
+# =========================================================
+# Lookup Tables
+# =========================================================
+
+def _pack(category: int, ranks: Sequence[int]) -> int:
+    """카테고리 + 키커 랭크 → 비교 가능한 강도 정수"""
+    strength = category << 20
+    for i, rank in enumerate(ranks):
+        strength |= (rank + 1) << (16 - 4 * i)
+    return strength
+
+
+def _straight_high(mask: int) -> int:
+    """랭크 비트마스크에서 가장 높은 스트레이트의 탑 랭크 (없으면 -1, 휠은 5)"""
+    for high in range(12, 3, -1):
+        window = 0b11111 << (high - 4)
+        if mask & window == window:
+            return high
+    if mask & 0b1000000001111 == 0b1000000001111:
+        return 3
+    return -1
+
+
+def _rank_strength(counts: Sequence[int]) -> int:
+    """플러시가 아닌 카드 조합의 최고 5장 강도"""
+    mask = 0
+    for rank, count in enumerate(counts):
+        if count:
+            mask |= 1 << rank
+    groups = sorted(((c, r) for r, c in enumerate(counts) if c), reverse=True)
+    (top_count, top), second = groups[0], groups[1] if len(groups) > 1 else (0, -1)
+
+    def kickers(*used: int, n: int) -> list[int]:
+        return [r for r in range(12, -1, -1) if counts[r] and r not in used][:n]
+
+    if top_count == 4:
+        return _pack(_QUADS, [top] + kickers(top, n=1))
+    if top_count == 3 and second[0] >= 2:
+        return _pack(_FULL_HOUSE, [top, second[1]])
+    straight = _straight_high(mask)
+    if straight >= 0:
+        return _pack(_STRAIGHT, [straight])
+    if top_count == 3:
+        return _pack(_TRIPS, [top] + kickers(top, n=2))
+    if top_count == 2 and second[0] == 2:
+        return _pack(_TWO_PAIR, [top, second[1]] + kickers(top, second[1], n=1))
+    if top_count == 2:
+        return _pack(_PAIR, [top] + kickers(top, n=3))
+    return _pack(_HIGH_CARD, kickers(n=5))
+
+
+def _flush_strength(mask: int) -> int:
+    """같은 수트 5장 이상 랭크 비트마스크의 최고 5장 강도"""
+    straight = _straight_high(mask)
+    if straight >= 0:
+        return _pack(_STRAIGHT_FLUSH, [straight])
+    ranks = [r for r in range(12, -1, -1) if mask >> r & 1][:5]
+    return _pack(_FLUSH, ranks)
+
+
+class _Tables:
+    """평가용 lookup table
+
+    - rank_values: 랭크 조합 키(Σ 5^rank) → rank_value (5~7장, 플러시 제외)
+    - flush_values: 수트별 랭크 비트마스크(13bit) → rank_value (5장 미만이면 0)
+    """
+
+    def __init__(self) -> None:
+        # 5장 동치류 7462개를 강도순으로 정렬하여 rank_value 부여
+        strengths = set()
+        combo: tuple[int, ...]
+        for combo in combinations_with_replacement(range(13), 5):
+            counts = [combo.count(r) for r in range(13)]
+            if max(counts) <= 4:
+                strengths.add(_rank_strength(counts))
+        for combo in combinations(range(13), 5):
+            strengths.add(_flush_strength(sum(1 << r for r in combo)))
+        order = {s: i + 1 for i, s in enumerate(sorted(strengths, reverse=True))}
+        assert len(order) == NUM_RANK_VALUES
+
+        # 6~7장은 한 장씩 뺀 조합 중 최고값 (최고 5장은 그 안에 포함됨)
+        self.rank_values: dict[int, int] = {}
+        for size in (5, 6, 7):
+            for combo in combinations_with_replacement(range(13), size):
+                if any(combo[i] == combo[i + 4] for i in range(size - 4)):
+                    continue  # 같은 랭크 5장 이상
+                key = sum(5 ** r for r in combo)
+                if size == 5:
+                    counts = [combo.count(r) for r in range(13)]
+                    self.rank_values[key] = order[_rank_strength(counts)]
+                else:
+                    self.rank_values[key] = min(
+                        self.rank_values[key - 5 ** r] for r in set(combo)
+                    )
+
+        self.flush_values: list[int] = [0] * (1 << 13)
+        for mask in range(1 << 13):
+            if bin(mask).count("1") >= 5:
+                self.flush_values[mask] = order[_flush_strength(mask)]
+
+        self._arrays: Optional[_BatchTables] = None
+
+    def arrays(self) -> "_BatchTables":
+        """배치 평가용 NumPy 테이블"""
+        if self._arrays is None:
+            self._arrays = _BatchTables(self)
+        return self._arrays
+
+
+class _BatchTables:
+    """evaluate_batch용 NumPy 테이블
+
+    랭크 조합 키(Σ 5^rank)를 하위 7랭크(2~8)와 상위 6랭크(9~A) 부분으로 나누고,
+    각 부분을 압축 인덱스로 바꿔 2차원 표를 직접 조회한다 (정렬 탐색 없음).
+    카드별 배열은 card_index + 1로 조회한다 (0 = 빈 자리).
+    """
+
+    LOW_RANKS = 7
+
+    def __init__(self, tables: _Tables) -> None:
+        np = _require_numpy()
+        low_base = 5 ** self.LOW_RANKS
+        keys = np.fromiter(tables.rank_values, dtype=np.int64)
+        values = np.fromiter(tables.rank_values.values(), dtype=np.uint16)
+        low, high = keys % low_base, keys // low_base
+
+        low_keys = np.unique(low)
+        high_keys = np.unique(high)
+        self.low_index = np.zeros(low_base, dtype=np.int32)
+        self.low_index[low_keys] = np.arange(len(low_keys))
+        self.high_index = np.zeros(int(high_keys[-1]) + 1, dtype=np.int32)
+        self.high_index[high_keys] = np.arange(len(high_keys)) * len(low_keys)
+
+        self.rank_values = np.zeros(len(low_keys) * len(high_keys), dtype=np.uint16)
+        self.rank_values[self.high_index[high] + self.low_index[low]] = values
+        self.flush_values = np.array(tables.flush_values, dtype=np.uint16)
+
+        self.card_low = np.zeros(53, dtype=np.int32)
+        self.card_high = np.zeros(53, dtype=np.int32)
+        self.card_bits = np.zeros(53, dtype=np.int64)
+        for index in range(52):
+            rank, suit = index >> 2, index & 3
+            if rank < self.LOW_RANKS:
+                self.card_low[index + 1] = 5 ** rank
+            else:
+                self.card_high[index + 1] = 5 ** (rank - self.LOW_RANKS)
+            self.card_bits[index + 1] = 1 << (rank + 13 * suit)
+
+
+@lru_cache(maxsize=1)
+def _tables() -> _Tables:
+    """lookup table (첫 평가 시 생성)"""
+    return _Tables()
+
+
+def _require_numpy() -> Any:
+    """numpy 모듈 (설치되지 않았으면 ImportError)"""
+    if _numpy is None:
+        raise ImportError(
+            "NumPy is required for batch evaluation: pip install 'automation-hub[eval]'"
+        )
+    return _numpy
+
+
+# =========================================================
+# Single Evaluation
+# =========================================================
+
+def evaluate(cards: Sequence[CardLike]) -> int:
+    """카드 5~7장의 최고 5장 rank_value (1=Royal Flush, 7462=최약)
+
+    Raises:
+        ValueError: 카드 수가 5~7장이 아니거나 잘못된/중복된 카드
+    """
+    indices = [card_index(c) for c in cards]
+    if not 5 <= len(indices) <= 7:
+        raise ValueError(f"Expected 5-7 cards, got {len(indices)}")
+    if len(set(indices)) != len(indices):
+        raise ValueError(f"Duplicate cards: {list(cards)}")
+
+    tables = _tables()
+    key = 0
+    suit_masks = [0, 0, 0, 0]
+    for index in indices:
+        rank = index >> 2
+        key += 5 ** rank
+        suit_masks[index & 3] |= 1 << rank
+
+    value = tables.rank_values[key]
+    for mask in suit_masks:
+        flush = tables.flush_values[mask]
+        if flush and flush < value:
+            value = flush
+    return value
+
+
+def evaluate_omaha(hole: Sequence[CardLike], board: Sequence[CardLike]) -> int:
+    """오마하 rank_value (홀카드 정확히 2장 + 보드 정확히 3장, 보드는 플랍~리버 3-5장)"""
+    if len(hole) != 4 or not 3 <= len(board) <= 5:
+        raise ValueError("Omaha evaluation needs 4 hole cards and 3-5 board cards")
+    triples = _OMAHA_BOARD_TRIPLES if len(board) == 5 else list(combinations(range(len(board)), 3))
+    return min(
+        evaluate([hole[a], hole[b], board[x], board[y], board[z]])
+        for a, b in _OMAHA_HOLE_PAIRS
+        for x, y, z in triples
+    )
+
+
+def rank_category(rank_value: int) -> HandRank:
+    """rank_value → HandRank"""
+    if not 1 <= rank_value <= NUM_RANK_VALUES:
+        raise ValueError(f"Invalid rank value: {rank_value}")
+    if rank_value == 1:
+        return HandRank.ROYAL_FLUSH
+    for bound, category in _CATEGORY_BOUNDS:
+        if rank_value <= bound:
+            return category
+    raise AssertionError("unreachable")
+
+
+def hand_rank(
+    hole_cards: Sequence[CardLike], community_cards: Sequence[CardLike]
+) -> Optional[HandRank]:
+    """홀카드 + 커뮤니티 카드 → HandRank (카드가 5장 미만이면 None)
+
+    홀카드 4장이면 보드 장수와 무관하게 오마하 규칙(2+3)으로 평가한다 (보드 3장 미만이면 None).
+    """
+    if len(hole_cards) == 4:
+        if not 3 <= len(community_cards) <= 5:
+            return None
+        return rank_category(evaluate_omaha(hole_cards, community_cards))
+    cards = list(hole_cards) + list(community_cards)
+    if len(cards) < 5:
+        return None
+    return rank_category(evaluate(cards[:7]))
+
+
+def best_hand_rank(hand: Hand) -> Optional[HandRank]:
+    """핸드에서 공개된 플레이어 카드 중 최고 HandRank (Hand.hand_rank 채우기용)"""
+    best: Optional[int] = None
+    for player in hand.players:
+        if not player.hole_cards:
+            continue
+        if len(player.hole_cards) == 4:
+            if not 3 <= len(hand.community_cards) <= 5:
+                continue
+            value = evaluate_omaha(player.hole_cards, hand.community_cards)
+        else:
+            cards = list(player.hole_cards) + list(hand.community_cards)
+            if not 5 <= len(cards) <= 7:
+                continue
+            value = evaluate(cards)
+        if best is None or value < best:
+            best = value
+    return rank_category(best) if best is not None else None
+
+
+# =========================================================
+# Batch Evaluation (NumPy)
+# =========================================================
+
+def evaluate_batch(cards: Any) -> Any:
+    """카드 인덱스 배열 (..., k) → rank_value 배열 (...)
+
+    k는 7 이하, 빈 자리는 -1. 유효 카드가 5장 미만이면 0.
+    파이썬 루프 없이 lookup table 조회만으로 평가한다.
+
+    Args:
+        cards: 정수 배열 (card_index/encode_cards 인코딩)
+
+    Returns:
+        uint16 배열 (값이 작을수록 강한 핸드, 0 = 평가 불가)
+    """
+    np = _require_numpy()
+    tables = _tables().arrays()
+
+    cards = np.asarray(cards, dtype=np.int16)
+    if cards.shape[-1] > 7:
+        raise ValueError(f"At most 7 cards per hand, got {cards.shape[-1]}")
+    slots = np.moveaxis(cards + 1, -1, 0)  # -1(빈 자리) → 0, 카드 축을 앞으로
+
+    low = tables.card_low[slots].sum(axis=0)
+    high = tables.card_high[slots].sum(axis=0)
+    result = tables.rank_values[tables.high_index[high] + tables.low_index[low]]
+
+    # 수트별 13bit 랭크 마스크를 하나의 정수에 모아 수트당 한 번만 조회
+    suit_bits = tables.card_bits[slots].sum(axis=0)
+    for suit in range(4):
+        flush = tables.flush_values[(suit_bits >> (13 * suit)) & 0x1FFF]
+        better = (flush > 0) & ((result == 0) | (flush < result))
+        result = np.where(better, flush, result)
+    return result
+
+
+def _join(left: Any, right: Any) -> Any:
+    """앞쪽 차원은 broadcast, 마지막 차원(카드)은 이어 붙임"""
+    np = _require_numpy()
+    shape = np.broadcast_shapes(left.shape[:-1], right.shape[:-1])
+    return np.concatenate(
+        [
+            np.broadcast_to(left, shape + left.shape[-1:]),
+            np.broadcast_to(right, shape + right.shape[-1:]),
+        ],
+        axis=-1,
+    )
+
+
+def _best(values: Any, axis: Union[int, tuple[int, ...]]) -> Any:
+    """0(평가 불가)을 제외한 최솟값, 전부 0이면 0"""
+    np = _require_numpy()
+    masked = np.where(values == 0, NUM_RANK_VALUES + 1, values.astype(np.int32))
+    best = masked.min(axis=axis)
+    return np.where(best > NUM_RANK_VALUES, 0, best).astype(np.uint16)
+
+
+def evaluate_omaha_batch(hole: Any, board: Any) -> Any:
+    """오마하 배치 평가: 홀카드 (..., 4) + 보드 (..., 5) → rank_value (...)"""
+    np = _require_numpy()
+    hole = np.asarray(hole, dtype=np.int16)
+    board = np.asarray(board, dtype=np.int16)
+    hole_pairs = hole[..., np.array(_OMAHA_HOLE_PAIRS)]            # (..., 6, 2)
+    board_triples = board[..., np.array(_OMAHA_BOARD_TRIPLES)]     # (..., 10, 3)
+    combos = _join(hole_pairs[..., :, None, :], board_triples[..., None, :, :])  # (..., 6, 10, 5)
+    return _best(evaluate_batch(combos), axis=(-2, -1))
+
+
+def best_rank_values(hole: Any, boards: Any, omaha: bool = False) -> Any:
+    """핸드별 최고 rank_value (플레이어 × 보드 전체)
+
+    Run It Twice 등 여러 보드가 있는 핸드를 루프 없이 평가한다.
+
+    Args:
+        hole: 홀카드 (N, P, H), 빈 자리 -1
+        boards: 보드 (N, B, 5), 빈 자리 -1
+        omaha: True면 오마하 규칙 (H=4, 2+3)
+
+    Returns:
+        (N,) rank_value 배열 (0 = 공개 카드 부족)
+    """
+    np = _require_numpy()
+    hole = np.asarray(hole, dtype=np.int16)[:, :, None, :]         # (N, P, 1, H)
+    boards = np.asarray(boards, dtype=np.int16)[:, None, :, :]     # (N, 1, B, 5)
+    if omaha:
+        values = evaluate_omaha_batch(hole, boards)
+    else:
+        values = evaluate_batch(_join(hole, boards))
+    return _best(values, axis=(1, 2))
+
+
+def rank_categories(rank_values: Any) -> list[Optional[HandRank]]:
+    """rank_value 배열 → HandRank 목록 (0은 None)"""
+    return [rank_category(int(v)) if v else None for v in rank_values]
+
+
+def premium_mask(rank_values: Any) -> Any:
+    """프리미엄(Full House 이상) 여부 배열"""
+    np = _require_numpy()
+    rank_values = np.asarray(rank_values)
+    return (rank_values > 0) & (rank_values <= PREMIUM_MAX_RANK_VALUE)
+
+
+# =========================================================
+# Hand / GFX Helpers
+# =========================================================
+
+def gfx_boards(hand: dict[str, Any]) -> list[list[str]]:
+    """GFX 핸드의 BOARD_CARD 이벤트 → 보드별 카드
+
+    Run It Twice 등에서 2번째 이후 보드는 분기 이후 카드만 기록되므로
+    앞부분은 1번 보드의 공용 카드로 채운다.
+    """
+    boards: dict[int, list[str]] = {}
+    for event in hand.get("Events") or []:
+        if event.get("Type") == "BOARD_CARD":
+            board_num = event.get("BoardNum") or 1
+            boards.setdefault(board_num, []).extend(event.get("BoardCards") or [])
+
+    first = boards.get(1, [])
+    result = [first]
+    for board_num in sorted(n for n in boards if n > 1):
+        cards = boards[board_num]
+        shared_count = max(0, 5 - len(cards))
+        result.append(first[:shared_count] + cards)
+    return result
+
+
+def rank_gfx_hands(hands: Sequence[dict[str, Any]]) -> Any:
+    """GFX 핸드 목록 → 핸드별 최고 rank_value (N,) (0 = 공개 카드 부족)
+
+    홀덤/오마하를 각각 한 번의 배치 평가로 처리한다 (핸드별 파이썬 평가 루프 없음).
+    """
+    np = _require_numpy()
+    result = np.zeros(len(hands), dtype=np.uint16)
+
+    for omaha in (False, True):
+        selected = [
+            i for i, hand in enumerate(hands)
+            if str(hand.get("GameVariant", "HOLDEM")).startswith("OMAHA") is omaha
+        ]
+        if not selected:
+            continue
+        width = 4 if omaha else 2
+        players = max(len(hands[i].get("Players") or []) for i in selected) or 1
+        boards = [gfx_boards(hands[i]) for i in selected]
+        num_boards = max(len(b) for b in boards)
+
+        hole = np.full((len(selected), players, width), -1, dtype=np.int16)
+        board = np.full((len(selected), num_boards, 5), -1, dtype=np.int16)
+        for row, i in enumerate(selected):
+            for p, player in enumerate(hands[i].get("Players") or []):
+                cards = player.get("HoleCards") or []
+                if len(cards) <= width:
+                    hole[row, p] = encode_cards(cards, width)
+            for b, cards in enumerate(boards[row]):
+                board[row, b] = encode_cards(cards[:5], 5)
+
+        result[selected] = best_rank_values(hole, board, omaha=omaha)
+    return result
+
+
+def fill_hand_ranks(hands: Sequence[Hand], overwrite: bool = False) -> int:
+    """Hand.hand_rank을 카드로부터 일괄 계산하여 채움 (백필용)
+
+    Args:
+        hands: Hand 목록
+        overwrite: True면 이미 값이 있는 핸드도 다시 계산
+
+    Returns:
+        hand_rank이 채워진 핸드 수
+    """
+    targets = [h for h in hands if overwrite or h.hand_rank is None]
+    if not targets:
+        return 0
+
+    if _numpy is None:
+        ranks = [best_hand_rank(h) for h in targets]
+    else:
+        gfx_like = [
+            {
+                "GameVariant": (
+                    "OMAHA" if any(len(p.hole_cards) == 4 for p in h.players) else "HOLDEM"
+                ),
+                "Players": [{"HoleCards": p.hole_cards} for p in h.players],
+                "Events": [{"Type": "BOARD_CARD", "BoardCards": h.community_cards}],
+            }
+            for h in targets
+        ]
+        ranks = rank_categories(rank_gfx_hands(gfx_like))
+
+    filled = 0
+    for hand, rank in zip(targets, ranks):
+        if rank is not None:
+            hand.hand_rank = rank
+            filled += 1
+    return filled
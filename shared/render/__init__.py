@@ -0,0 +1,31 @@
+"""렌더 작업 처리 (캐시 재사용, 스케줄링, 실패 재시도, 출력 디렉토리 정리)"""
+
+from shared.render.cache import RenderCache, RenderCacheStats, artifact_size
+from shared.render.retry import ErrorKind, RetryHandler, RetryPolicy, classify_error
+from shared.render.scheduler import (
+    CostModel,
+    RenderScheduler,
+    SchedulerPolicy,
+    schedule_key,
+    select_jobs,
+)
+from shared.render.simulator import SimJob, SimulationResult, compare, simulate
+
+__all__ = [
+    "RenderCache",
+    "RenderCacheStats",
+    "artifact_size",
+    "ErrorKind",
+    "RetryHandler",
+    "RetryPolicy",
+    "classify_error",
+    "CostModel",
+    "RenderScheduler",
+    "SchedulerPolicy",
+    "schedule_key",
+    "select_jobs",
+    "SimJob",
+    "SimulationResult",
+    "compare",
+    "simulate",
+]
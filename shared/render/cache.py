@@ -0,0 +1,251 @@
+"""렌더 결과 캐시
+
+블라인드 레벨 카드, 스폰서 슬레이트, 플레이어 소개처럼 같은 입력으로 반복 요청되는
+그래픽은 이미 렌더링된 파일을 재사용한다.
+
+- 키: template_name + RenderInstruction.content_hash() (layer_data + output_settings)
+- 적중 조건: 같은 키의 완료된 render_outputs가 있고, 파일이 존재하며 크기가 기록과 일치
+- 적중 시 AE를 거치지 않고 지시서를 완료 처리 (cache_source_id로 원본 결과 기록)
+- 출력 디렉토리가 max_bytes를 넘으면 마지막 사용이 오래된 결과부터 삭제 (LRU)
+
+캐시 인덱스는 DB(render_outputs)이므로 여러 AE 노드가 같은 캐시를 공유한다.
+
+Usage:
+    >>> cache = RenderCache(get_db(), output_dir="/nas/renders", max_bytes=200 * 1024**3)
+    >>> for inst in await instructions_repo.claim_batch("ae-node-1", n=4):
+    ...     if await cache.try_complete(inst):
+    ...         continue  # 캐시 적중: AE 렌더링 생략
+    ...     ...  # AE 렌더링
+    >>> await cache.evict()
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+from shared.db.connection import Database
+from shared.db.repositories import RenderInstructionsRepository, RenderOutputsRepository
+from shared.models.render_instruction import RenderInstruction, RenderOutput, RenderStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else None
+
+
+def artifact_size(path: Union[str, Path]) -> Optional[int]:
+    """출력물 크기 (바이트)
+
+    단일 파일은 파일 크기, 이미지 시퀀스 디렉토리는 포함된 파일 크기 합계.
+    존재하지 않으면 None.
+    """
+    path = Path(path)
+    try:
+        if path.is_file():
+            return path.stat().st_size
+        if path.is_dir():
+            return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    except OSError:
+        return None
+    return None
+
+
+def _remove_artifact(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class RenderCacheStats(BaseModel):
+    """프로세스 내 캐시 카운터 (전체 적중률은 RenderOutputsRepository.get_cache_stats)"""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0              # DB에는 있으나 파일이 없거나 크기가 달라 제외된 결과
+    evicted_files: int = 0
+    evicted_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """조회 대비 적중 비율"""
+        total = self.hits + self.misses
+        return round(self.hits / total, 4) if total else None
+
+
+class RenderCache:
+    """렌더 결과 재사용 + 출력 디렉토리 LRU 정리
+
+    Args:
+        db: Database 인스턴스
+        output_dir: AE 출력 디렉토리 (이 아래 파일만 삭제, 기본: RENDER_OUTPUT_DIR)
+        max_bytes: 출력 디렉토리 최대 크기 (기본: RENDER_CACHE_MAX_BYTES, None이면 무제한)
+        max_candidates: 키당 확인할 최근 결과 수
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        output_dir: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = None,
+        max_candidates: int = 5,
+    ):
+        self.db = db
+        self.outputs = RenderOutputsRepository(db)
+        self.instructions = RenderInstructionsRepository(db)
+
+        output_dir = output_dir or os.getenv("RENDER_OUTPUT_DIR") or None
+        self.output_dir = Path(output_dir).resolve() if output_dir else None
+        self.max_bytes = max_bytes if max_bytes is not None else _env_int("RENDER_CACHE_MAX_BYTES")
+        self.max_candidates = max_candidates
+        self.stats = RenderCacheStats()
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    async def lookup(self, instruction: RenderInstruction) -> Optional[RenderOutput]:
+        """같은 입력의 재사용 가능한 결과 (없으면 None)
+
+        파일이 사라졌거나 크기가 기록과 다른 결과는 evicted로 표시해 다음 조회에서 제외한다.
+        """
+        candidates = await self.outputs.find_cached(
+            instruction.template_name,
+            instruction.content_hash(),
+            exclude_instruction_id=instruction.id,
+            limit=self.max_candidates,
+        )
+
+        stale_paths = []
+        found = None
+        for output in candidates:
+            if await asyncio.to_thread(self._verify, output):
+                found = output
+                break
+            stale_paths.append(output.output_path)
+
+        if stale_paths:
+            self.stats.stale += len(stale_paths)
+            await self.outputs.mark_evicted(stale_paths)
+
+        if found is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return found
+
+    def _verify(self, output: RenderOutput) -> bool:
+        """파일 존재 + 크기 확인 (file_size 0은 크기 미기록으로 간주)"""
+        size = artifact_size(output.output_path)
+        if not size:
+            return False
+        return output.file_size == 0 or size == output.file_size
+
+    async def try_complete(self, instruction: RenderInstruction) -> Optional[RenderOutput]:
+        """캐시 적중 시 AE 없이 지시서 완료 처리
+
+        점유한 워커(instruction.worker_id)가 있으면 아직 그 워커가 점유 중일 때만 완료한다.
+
+        Args:
+            instruction: 점유한 지시서 (id 필수)
+
+        Returns:
+            새로 기록된 RenderOutput (캐시 미스이거나 lease를 잃었으면 None)
+        """
+        if instruction.id is None:
+            raise ValueError("try_complete requires a stored instruction (id is None)")
+
+        source = await self.lookup(instruction)
+        if source is None:
+            return None
+
+        # 완료 처리를 먼저 해 lease를 잃은 작업에 결과를 기록하지 않음
+        completed = await self.instructions.update_status(
+            instruction.id, RenderStatus.COMPLETED, worker_id=instruction.worker_id
+        )
+        if not completed and instruction.worker_id is not None:
+            logger.warning(
+                "render cache hit for instruction %s skipped: %s lost its lease",
+                instruction.id, instruction.worker_id,
+            )
+            return None
+
+        output = RenderOutput(
+            instruction_id=instruction.id,
+            output_path=source.output_path,
+            file_size=source.file_size,
+            frame_count=source.frame_count,
+            cache_source_id=source.id,
+        )
+        output.id = await self.outputs.insert(output)
+        if source.id is not None:
+            await self.outputs.mark_hit(source.id)
+
+        logger.info(
+            "render cache hit: instruction %s reuses output %s (%s)",
+            instruction.id, source.id, source.output_path,
+        )
+        return output
+
+    # ========================================
+    # 정리 (LRU)
+    # ========================================
+
+    def _is_managed(self, path: Path) -> bool:
+        return self.output_dir is not None and path.is_relative_to(self.output_dir)
+
+    async def evict(self, max_bytes: Optional[int] = None) -> dict[str, Any]:
+        """출력 디렉토리 크기를 max_bytes 이하로 정리
+
+        마지막 사용(적중 또는 완료) 시각이 오래된 결과부터 파일을 삭제하고
+        render_outputs에 evicted_at을 기록한다. output_dir 밖의 파일은 건드리지 않는다.
+
+        Returns:
+            {"total_bytes": ..., "evicted_files": ..., "evicted_bytes": ..., "remaining_bytes": ...}
+        """
+        limit = max_bytes if max_bytes is not None else self.max_bytes
+        result = {"total_bytes": 0, "evicted_files": 0, "evicted_bytes": 0, "remaining_bytes": 0}
+        if self.output_dir is None or limit is None:
+            return result
+
+        entries = []
+        for row in await self.outputs.list_cached():
+            path = Path(row["output_path"]).resolve()
+            if self._is_managed(path):
+                entries.append((path, row["output_path"], int(row.get("file_size") or 0)))
+
+        total = sum(size for _, _, size in entries)
+        result["total_bytes"] = total
+
+        evicted_paths = []
+        for path, stored_path, size in entries:
+            if total <= limit:
+                break
+            await asyncio.to_thread(_remove_artifact, path)
+            evicted_paths.append(stored_path)
+            total -= size
+            result["evicted_bytes"] += size
+
+        if evicted_paths:
+            await self.outputs.mark_evicted(evicted_paths)
+            logger.info(
+                "render cache evicted %d files (%d bytes)",
+                len(evicted_paths), result["evicted_bytes"],
+            )
+
+        result["evicted_files"] = len(evicted_paths)
+        result["remaining_bytes"] = total
+        self.stats.evicted_files += result["evicted_files"]
+        self.stats.evicted_bytes += result["evicted_bytes"]
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """프로세스 내 캐시 통계"""
+        return {**self.stats.model_dump(), "hit_rate": self.stats.hit_rate}
@@ -0,0 +1,176 @@
+"""렌더 실패 처리 (오류 분류, 지수 백오프 재시도, dead letter)
+
+- 일시적 오류 (AE 응답 없음, 네트워크/NAS 끊김 등): next_attempt_at에 지수 백오프 + jitter로 재시도
+- 영구 오류 (템플릿 없음, 잘못된 레이어 데이터 등): 재시도 없이 바로 dead letter
+- max_retries 소진: dead letter
+
+dead letter는 render_dead_letters에 기록되며 운영자가 RenderDeadLettersRepository.requeue로
+원인 수정 후 일괄 재등록한다.
+
+Usage:
+    >>> handler = RetryHandler(get_db())
+    >>> try:
+    ...     render(inst)
+    ... except Exception as e:
+    ...     await handler.fail(inst, e)  # {"action": "retry" | "dead_letter", ...}
+"""
+
+import logging
+import os
+import random
+import re
+from enum import Enum
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+
+from shared.db.connection import Database
+from shared.db.repositories import RenderInstructionsRepository
+from shared.models.render_instruction import RenderInstruction
+
+logger = logging.getLogger(__name__)
+
+# error_message 저장 최대 길이
+_MAX_MESSAGE_LENGTH = 2000
+
+
+class ErrorKind(str, Enum):
+    """렌더 오류 분류"""
+    TRANSIENT = "transient"       # 재시도하면 성공할 수 있음
+    PERMANENT = "permanent"       # 입력이 바뀌지 않으면 계속 실패
+
+
+# 메시지로 판단하는 영구 오류 (AE/aerender 출력, 워커 예외 메시지)
+PERMANENT_PATTERNS = (
+    r"template .*not found",
+    r"composition .*not found",
+    r"missing (template|composition|layer|footage)",
+    r"(corrupt|invalid|malformed) (layer|layer_data|project|template)",
+    r"unsupported (format|codec|output)",
+    r"schema validation",
+)
+
+# 예외 타입으로 판단하는 영구 오류 (입력 데이터 문제)
+PERMANENT_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ValidationError,
+    ValueError,
+    KeyError,
+    TypeError,
+)
+
+_permanent_re = re.compile("|".join(PERMANENT_PATTERNS), re.IGNORECASE)
+
+
+def classify_error(error: Union[BaseException, str]) -> ErrorKind:
+    """오류 분류 (판단할 수 없으면 일시적 오류로 보고 재시도)"""
+    if isinstance(error, BaseException):
+        if isinstance(error, PERMANENT_EXCEPTIONS):
+            return ErrorKind.PERMANENT
+        message = f"{type(error).__name__}: {error}"
+    else:
+        message = error
+    return ErrorKind.PERMANENT if _permanent_re.search(message) else ErrorKind.TRANSIENT
+
+
+class RetryPolicy(BaseModel):
+    """지수 백오프 + jitter
+
+    n번째 재시도 대기 = min(max_seconds, base_seconds * factor^(n-1)),
+    그중 jitter 비율만큼은 무작위 (여러 작업이 같은 원인으로 실패해도 동시에 몰리지 않음)
+    """
+
+    base_seconds: float = 30.0
+    factor: float = 2.0
+    max_seconds: float = 1800.0
+    jitter: float = 0.5
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """RENDER_RETRY_BASE_SECONDS, RENDER_RETRY_MAX_SECONDS 환경 변수"""
+        return cls(
+            base_seconds=float(os.getenv("RENDER_RETRY_BASE_SECONDS", "30")),
+            max_seconds=float(os.getenv("RENDER_RETRY_MAX_SECONDS", "1800")),
+        )
+
+    def delay(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """attempt번째 재시도까지 대기 시간 (초, attempt는 1부터)"""
+        ceiling = min(self.max_seconds, self.base_seconds * self.factor ** max(0, attempt - 1))
+        fixed = ceiling * (1 - self.jitter)
+        return fixed + (rng or random).uniform(0, ceiling - fixed)
+
+
+class RetryHandler:
+    """렌더 실패 → 재시도 예약 또는 dead letter
+
+    Args:
+        db: Database 인스턴스
+        policy: 백오프 정책 (기본: RetryPolicy.from_env())
+        rng: jitter 난수 생성기 (테스트용)
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        policy: Optional[RetryPolicy] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.repo = RenderInstructionsRepository(db)
+        self.policy = policy or RetryPolicy.from_env()
+        self.rng = rng
+
+    async def fail(
+        self,
+        instruction: RenderInstruction,
+        error: Union[BaseException, str],
+        kind: Optional[ErrorKind] = None,
+    ) -> dict[str, Any]:
+        """실패 처리
+
+        점유한 워커(instruction.worker_id)가 있으면 아직 그 워커가 점유 중일 때만 처리한다.
+        lease가 만료되어 회수/재점유된 작업은 건드리지 않는다 (action "lease_lost").
+
+        Args:
+            instruction: 실패한 지시서 (id, retry_count, worker_id 사용)
+            error: 예외 또는 오류 메시지
+            kind: 오류 분류 (생략 시 classify_error)
+
+        Returns:
+            {"action": "retry", "error_kind", "delay_seconds"},
+            {"action": "dead_letter", "error_kind", "dead_letter_id"} 또는
+            {"action": "lease_lost", "error_kind"}
+        """
+        if instruction.id is None:
+            raise ValueError("fail requires a stored instruction (id is None)")
+
+        kind = kind or classify_error(error)
+        if isinstance(error, BaseException):
+            message = f"{type(error).__name__}: {error}"
+        else:
+            message = str(error)
+        message = message[:_MAX_MESSAGE_LENGTH]
+        worker_id = instruction.worker_id
+
+        if kind == ErrorKind.TRANSIENT and instruction.retry_count < instruction.max_retries:
+            delay = self.policy.delay(instruction.retry_count + 1, self.rng)
+            if await self.repo.increment_retry(instruction.id, delay, message, worker_id):
+                logger.info(
+                    "render %s failed (%s), retry %d/%d in %.0fs",
+                    instruction.id, kind.value, instruction.retry_count + 1,
+                    instruction.max_retries, delay,
+                )
+                return {"action": "retry", "error_kind": kind.value, "delay_seconds": delay}
+
+        dead_letter_id = await self.repo.move_to_dead_letter(
+            instruction.id, message, kind.value, worker_id
+        )
+        if dead_letter_id is None and worker_id is not None:
+            logger.warning(
+                "render %s failed after %s lost its lease, leaving it to the new owner: %s",
+                instruction.id, worker_id, message,
+            )
+            return {"action": "lease_lost", "error_kind": kind.value}
+        logger.warning(
+            "render %s moved to dead letter %s (%s): %s",
+            instruction.id, dead_letter_id, kind.value, message,
+        )
+        return {"action": "dead_letter", "error_kind": kind.value, "dead_letter_id": dead_letter_id}
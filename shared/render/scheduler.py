@@ -0,0 +1,295 @@
+"""렌더 작업 스케줄러 (마감 시각, 우선순위 aging, 템플릿 동시 실행 제한)
+
+claim_batch는 priority, created_at 순으로만 점유하므로 바쁜 시간대에는
+저우선순위 작업이 무한히 밀리고, 송출 시각이 정해진 작업도 순서를 기다려야 한다.
+RenderScheduler는 pending 후보를 읽어 다음 순서로 고른 뒤 claim_ids로 점유한다.
+
+1. 긴급: deadline_at까지 남은 여유(마감 - 현재 - 예상 렌더 시간)가 urgent_window 이하
+   → 여유가 적은 순 (least slack first). 이미 늦은 작업은 긴급에서 제외 (일반 순서)
+2. 일반: 유효 우선순위 = priority - 대기 시간 / aging_seconds (min_priority까지)
+   → 같은 유효 우선순위면 오래 기다린 순
+3. template_caps: 템플릿별 동시 processing 수 제한 (여러 워커가 동시에 고르면 넘을 수 있는 soft cap)
+
+예상 렌더 시간은 템플릿별 과거 started_at → completed_at (CostModel)에서 학습한다.
+같은 선택 로직을 shared.render.simulator가 기록된 큐 재생에 사용한다.
+
+Usage:
+    >>> scheduler = RenderScheduler(get_db(), SchedulerPolicy.from_env())
+    >>> claimed = await scheduler.claim("ae-node-1", n=2, lease_seconds=120)
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional, Protocol, Sequence, TypeVar
+
+from pydantic import BaseModel, Field, field_validator
+
+from shared.db.connection import Database
+from shared.db.repositories import RenderInstructionsRepository
+from shared.models.render_instruction import RenderInstruction
+
+
+class SchedulableJob(Protocol):
+    """스케줄링에 필요한 필드 (RenderInstructionSummary, SimJob, 읽기 전용)"""
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def template_name(self) -> str: ...
+
+    @property
+    def priority(self) -> int: ...
+
+    @property
+    def deadline_at(self) -> Optional[datetime]: ...
+
+    @property
+    def created_at(self) -> Optional[datetime]: ...
+
+
+_JobT = TypeVar("_JobT", bound=SchedulableJob)
+
+
+def _aware(value: datetime) -> datetime:
+    """naive datetime은 로컬 시간으로 간주 (DB TIMESTAMPTZ와 비교 가능하게)"""
+    return value if value.tzinfo is not None else value.astimezone()
+
+
+def _seconds(later: Optional[datetime], earlier: datetime) -> float:
+    if later is None:
+        return 0.0
+    return (_aware(later) - _aware(earlier)).total_seconds()
+
+
+# =========================================================
+# 정책 / 예상 비용
+# =========================================================
+
+
+class SchedulerPolicy(BaseModel):
+    """스케줄링 정책
+
+    baseline()은 기존 claim_batch 순서(priority, created_at)와 같다.
+    """
+
+    # 대기 시간 aging_seconds마다 유효 우선순위 1단계 상승 (None이면 aging 없음)
+    aging_seconds: Optional[float] = 120.0
+    min_priority: float = 1.0
+
+    # 마감 여유가 이 값(초) 이하면 긴급 작업으로 우선 처리
+    use_deadlines: bool = True
+    urgent_window_seconds: float = 300.0
+
+    # 템플릿별 최대 동시 processing 수 (없는 템플릿은 default_template_cap)
+    template_caps: dict[str, int] = Field(default_factory=dict)
+    default_template_cap: Optional[int] = None
+
+    @field_validator("template_caps")
+    @classmethod
+    def _positive_caps(cls, value: dict[str, int]) -> dict[str, int]:
+        for template, cap in value.items():
+            if cap < 1:
+                raise ValueError(f"template cap for {template!r} must be >= 1")
+        return value
+
+    @classmethod
+    def baseline(cls) -> "SchedulerPolicy":
+        """기존 순서 (priority, created_at) - 시뮬레이션 비교용"""
+        return cls(aging_seconds=None, use_deadlines=False)
+
+    @classmethod
+    def from_env(cls) -> "SchedulerPolicy":
+        """환경 변수에서 정책 생성
+
+        RENDER_SCHEDULER_AGING_SECONDS, RENDER_SCHEDULER_URGENT_SECONDS,
+        RENDER_TEMPLATE_CAPS (예: "leaderboard=2,player_intro=1")
+        """
+        caps = {}
+        for item in os.getenv("RENDER_TEMPLATE_CAPS", "").split(","):
+            if "=" in item:
+                template, cap = item.split("=", 1)
+                caps[template.strip()] = int(cap)
+
+        aging = os.getenv("RENDER_SCHEDULER_AGING_SECONDS", "120").strip()
+        return cls(
+            aging_seconds=float(aging) if aging and float(aging) > 0 else None,
+            urgent_window_seconds=float(os.getenv("RENDER_SCHEDULER_URGENT_SECONDS", "300")),
+            template_caps=caps,
+        )
+
+    def cap_for(self, template_name: str) -> Optional[int]:
+        """템플릿 동시 실행 제한 (None이면 무제한)"""
+        return self.template_caps.get(template_name, self.default_template_cap)
+
+
+class CostModel:
+    """템플릿별 예상 렌더 시간 (초)
+
+    DB 기록(get_render_durations의 p90)으로 초기화하고,
+    워커가 렌더링을 마칠 때마다 observe()로 지수 이동 평균 갱신.
+    """
+
+    def __init__(
+        self,
+        default_seconds: float = 30.0,
+        alpha: float = 0.2,
+        estimates: Optional[dict[str, float]] = None,
+    ):
+        self.default_seconds = default_seconds
+        self.alpha = alpha
+        self.estimates: dict[str, float] = dict(estimates or {})
+
+    def estimate(self, template_name: str) -> float:
+        """예상 렌더 시간 (기록이 없으면 default_seconds)"""
+        return self.estimates.get(template_name, self.default_seconds)
+
+    def observe(self, template_name: str, seconds: float) -> None:
+        """실제 렌더 시간 반영"""
+        if seconds < 0:
+            return
+        current = self.estimates.get(template_name)
+        if current is None:
+            self.estimates[template_name] = seconds
+        else:
+            self.estimates[template_name] = current + self.alpha * (seconds - current)
+
+    def load(self, rows: Iterable[dict[str, Any]]) -> None:
+        """get_render_durations 결과로 교체 (마감 계산은 보수적으로 p90 사용)"""
+        for row in rows:
+            seconds = row.get("p90_seconds") or row.get("mean_seconds")
+            if seconds:
+                self.estimates[row["template_name"]] = float(seconds)
+
+
+# =========================================================
+# 선택 로직 (스케줄러 / 시뮬레이터 공용)
+# =========================================================
+
+
+def schedule_key(
+    job: SchedulableJob, now: datetime, policy: SchedulerPolicy, costs: CostModel
+) -> tuple[int, float, float]:
+    """정렬 키 (작을수록 먼저)
+
+    (0, 마감 여유, -대기) - 긴급 작업
+    (1, 유효 우선순위, -대기) - 그 외
+    """
+    waited = max(0.0, _seconds(now, job.created_at)) if job.created_at else 0.0
+
+    if policy.use_deadlines and job.deadline_at is not None:
+        slack = _seconds(job.deadline_at, now) - costs.estimate(job.template_name)
+        if 0 <= slack <= policy.urgent_window_seconds:
+            return (0, slack, -waited)
+
+    effective = float(job.priority)
+    if policy.aging_seconds:
+        effective = max(policy.min_priority, effective - waited / policy.aging_seconds)
+    return (1, effective, -waited)
+
+
+def select_jobs(
+    candidates: Sequence[_JobT],
+    n: int,
+    now: datetime,
+    policy: SchedulerPolicy,
+    costs: Optional[CostModel] = None,
+    running: Optional[dict[str, int]] = None,
+) -> list[_JobT]:
+    """후보 중 다음에 실행할 작업 최대 n개
+
+    Args:
+        candidates: pending 작업
+        n: 최대 선택 수 (빈 워커 수)
+        now: 현재 시각
+        policy: 스케줄링 정책
+        costs: 예상 렌더 시간 (None이면 기본값)
+        running: 템플릿별 현재 processing 수 (template_caps 적용)
+    """
+    costs = costs or CostModel()
+    active = dict(running or {})
+    ordered = sorted(candidates, key=lambda job: schedule_key(job, now, policy, costs))
+
+    selected: list[_JobT] = []
+    for job in ordered:
+        if len(selected) >= n:
+            break
+        cap = policy.cap_for(job.template_name)
+        if cap is not None and active.get(job.template_name, 0) >= cap:
+            continue
+        active[job.template_name] = active.get(job.template_name, 0) + 1
+        selected.append(job)
+    return selected
+
+
+# =========================================================
+# 스케줄러
+# =========================================================
+
+
+class RenderScheduler:
+    """render_instructions 위의 스케줄링 계층 (claim_batch 대체)
+
+    Args:
+        db: Database 인스턴스
+        policy: 스케줄링 정책 (기본: SchedulerPolicy.from_env())
+        costs: 예상 렌더 시간 (기본: DB 기록에서 학습)
+        candidate_limit: 정렬 기준별 후보 조회 수
+        cost_ttl: 예상 렌더 시간을 DB에서 다시 읽는 주기 (초)
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        policy: Optional[SchedulerPolicy] = None,
+        costs: Optional[CostModel] = None,
+        candidate_limit: int = 200,
+        cost_ttl: float = 300.0,
+    ):
+        self.repo = RenderInstructionsRepository(db)
+        self.policy = policy or SchedulerPolicy.from_env()
+        self.costs = costs or CostModel()
+        self.candidate_limit = candidate_limit
+        self.cost_ttl = cost_ttl
+        self._costs_loaded_at: Optional[float] = None if costs is None else time.monotonic()
+
+    async def refresh_costs(self, window_days: int = 7) -> None:
+        """DB 기록에서 템플릿별 예상 렌더 시간 갱신"""
+        self.costs.load(await self.repo.get_render_durations(window_days))
+        self._costs_loaded_at = time.monotonic()
+
+    async def claim(
+        self, worker_id: str, n: int = 1, lease_seconds: float = 60
+    ) -> list[RenderInstruction]:
+        """정책에 따라 다음 작업 최대 n개 점유
+
+        다른 워커와 경합해 일부를 놓치면 n개보다 적게 반환될 수 있다.
+
+        Returns:
+            점유한 지시서 (스케줄 순)
+        """
+        loaded_at = self._costs_loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.cost_ttl:
+            await self.refresh_costs()
+
+        candidates = await self.repo.get_schedulable(self.candidate_limit)
+        if not candidates:
+            return []
+        running = await self.repo.get_running_counts() if self._uses_caps() else {}
+
+        selected = select_jobs(
+            candidates, n, datetime.now().astimezone(), self.policy, self.costs, running
+        )
+        return await self.repo.claim_ids(worker_id, [job.id for job in selected], lease_seconds)
+
+    def observe(self, instruction: RenderInstruction, seconds: Optional[float] = None) -> None:
+        """렌더링 완료 후 소요 시간 반영 (seconds 생략 시 started_at → completed_at)"""
+        if seconds is None:
+            if instruction.started_at is None or instruction.completed_at is None:
+                return
+            seconds = _seconds(instruction.completed_at, instruction.started_at)
+        self.costs.observe(instruction.template_name, seconds)
+
+    def _uses_caps(self) -> bool:
+        return bool(self.policy.template_caps) or self.policy.default_template_cap is not None
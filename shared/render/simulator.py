@@ -0,0 +1,181 @@
+"""렌더 큐 시뮬레이터 (스케줄링 정책 비교)
+
+기록된 하루치 render_instructions(생성 시각, 우선순위, 마감, 실제 렌더 시간)를
+이산 이벤트 방식으로 재생해 정책별 마감 준수율과 대기 시간을 비교한다.
+작업 선택은 실제 스케줄러와 같은 select_jobs를 사용한다.
+
+Usage:
+    >>> rows = await RenderInstructionsRepository(db).get_history(start, end)
+    >>> jobs = [SimJob.from_history_row(row, costs) for row in rows]
+    >>> compare(jobs, {"baseline": SchedulerPolicy.baseline(), "scheduler": policy}, workers=4)
+"""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from shared.render.scheduler import CostModel, SchedulerPolicy, select_jobs
+
+
+class SimJob(BaseModel):
+    """재생할 작업 하나"""
+
+    id: int
+    template_name: str
+    priority: int = 5
+    created_at: datetime
+    deadline_at: Optional[datetime] = None
+    duration_seconds: float
+
+    @classmethod
+    def from_history_row(cls, row: dict[str, Any], costs: Optional[CostModel] = None) -> "SimJob":
+        """get_history 행에서 생성
+
+        실제 렌더 시간(started_at → completed_at)이 없으면 (실패/미처리) 예상 비용 사용.
+        """
+        started, completed = row.get("started_at"), row.get("completed_at")
+        if started is not None and completed is not None and completed >= started:
+            duration = (completed - started).total_seconds()
+        else:
+            duration = (costs or CostModel()).estimate(row["template_name"])
+        return cls(
+            id=row["id"],
+            template_name=row["template_name"],
+            priority=row.get("priority") or 5,
+            created_at=row["created_at"],
+            deadline_at=row.get("deadline_at"),
+            duration_seconds=duration,
+        )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _wait_summary(waits: list[float]) -> dict[str, Any]:
+    ordered = sorted(waits)
+    return {
+        "count": len(ordered),
+        "p50_seconds": round(_percentile(ordered, 0.50), 1),
+        "p95_seconds": round(_percentile(ordered, 0.95), 1),
+        "max_seconds": round(ordered[-1], 1) if ordered else 0.0,
+    }
+
+
+class SimulationResult(BaseModel):
+    """정책 하나의 재생 결과"""
+
+    policy: str
+    jobs: int = 0
+    deadline_jobs: int = 0
+    on_time: int = 0
+    late: int = 0
+    # 마감 초과 시간 합계 (초)
+    total_lateness_seconds: float = 0.0
+    # 생성 → 시작 대기 시간: 전체 / 우선순위별
+    wait: dict[str, Any] = Field(default_factory=dict)
+    wait_by_priority: dict[int, dict[str, Any]] = Field(default_factory=dict)
+    makespan_seconds: float = 0.0
+
+    @property
+    def on_time_rate(self) -> Optional[float]:
+        """마감 있는 작업 중 제시간 완료 비율"""
+        return round(self.on_time / self.deadline_jobs, 4) if self.deadline_jobs else None
+
+
+def simulate(
+    jobs: list[SimJob],
+    policy: SchedulerPolicy,
+    workers: int = 4,
+    costs: Optional[CostModel] = None,
+    name: str = "",
+) -> SimulationResult:
+    """작업 목록을 workers개 렌더 노드로 재생
+
+    스케줄러는 costs(예상 렌더 시간)만 알고, 실제 소요는 각 작업의 duration_seconds.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    result = SimulationResult(policy=name, jobs=len(jobs))
+    if not jobs:
+        return result
+
+    arrivals = sorted(jobs, key=lambda job: (job.created_at, job.id))
+    start = arrivals[0].created_at
+    now = start
+    next_arrival = 0
+    pending: list[SimJob] = []
+    running: list[tuple[datetime, int, SimJob]] = []  # (완료 시각, id, 작업) heap
+    running_counts: dict[str, int] = {}
+    waits: list[float] = []
+    waits_by_priority: dict[int, list[float]] = {}
+    finished_at = start
+
+    while next_arrival < len(arrivals) or pending or running:
+        # 완료 처리
+        while running and running[0][0] <= now:
+            done_at, _, job = heapq.heappop(running)
+            running_counts[job.template_name] -= 1
+            finished_at = max(finished_at, done_at)
+            if job.deadline_at is not None:
+                lateness = (done_at - job.deadline_at).total_seconds()
+                if lateness <= 0:
+                    result.on_time += 1
+                else:
+                    result.late += 1
+                    result.total_lateness_seconds += lateness
+
+        # 도착 처리
+        while next_arrival < len(arrivals) and arrivals[next_arrival].created_at <= now:
+            pending.append(arrivals[next_arrival])
+            next_arrival += 1
+
+        # 빈 워커에 배정
+        free = workers - len(running)
+        if free > 0 and pending:
+            for job in select_jobs(pending, free, now, policy, costs, running_counts):
+                pending.remove(job)
+                running_counts[job.template_name] = running_counts.get(job.template_name, 0) + 1
+                heapq.heappush(
+                    running, (now + timedelta(seconds=job.duration_seconds), job.id, job)
+                )
+                wait = (now - job.created_at).total_seconds()
+                waits.append(wait)
+                waits_by_priority.setdefault(job.priority, []).append(wait)
+
+        # 다음 이벤트로 이동
+        upcoming = []
+        if running:
+            upcoming.append(running[0][0])
+        if next_arrival < len(arrivals):
+            upcoming.append(arrivals[next_arrival].created_at)
+        if not upcoming:
+            break
+        now = max(now, min(upcoming))
+
+    result.deadline_jobs = sum(1 for job in jobs if job.deadline_at is not None)
+    result.total_lateness_seconds = round(result.total_lateness_seconds, 1)
+    result.wait = _wait_summary(waits)
+    result.wait_by_priority = {
+        priority: _wait_summary(values) for priority, values in sorted(waits_by_priority.items())
+    }
+    result.makespan_seconds = round((finished_at - start).total_seconds(), 1)
+    return result
+
+
+def compare(
+    jobs: list[SimJob],
+    policies: dict[str, SchedulerPolicy],
+    workers: int = 4,
+    costs: Optional[CostModel] = None,
+) -> list[SimulationResult]:
+    """같은 작업 목록을 여러 정책으로 재생"""
+    return [
+        simulate(jobs, policy, workers=workers, costs=costs, name=name)
+        for name, policy in policies.items()
+    ]
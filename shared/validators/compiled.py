@@ -0,0 +1,427 @@
+"""JSON Schema → Python 검증 함수 컴파일
+
+스키마를 로드할 때 한 번 파이썬 소스로 변환(exec)하여, 매 호출마다
+Draft202012Validator가 키워드 dict를 순회하고 $ref를 해석하는 비용을 없앤다.
+
+- is_valid: 첫 위반에서 바로 False를 반환하는 boolean 경로 (에러 수집 없음)
+- iter_errors: Draft202012Validator.iter_errors와 같은 순서/경로/메시지의 에러 목록
+
+지원하지 않는 키워드가 있으면 UnsupportedSchemaError를 발생시키며,
+호출자(SchemaValidator)는 해당 스키마에 대해 기본 검증기를 사용한다.
+"""
+
+import numbers
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Protocol, Union
+
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT202012
+
+# 검증에 영향을 주지 않는 키워드 (format은 format_checker 없이 주석 취급)
+_ANNOTATION_KEYWORDS = frozenset({
+    "$schema", "$id", "$defs", "definitions", "$comment", "$anchor",
+    "title", "description", "default", "examples", "format",
+    "readOnly", "writeOnly", "deprecated",
+    "contentMediaType", "contentEncoding", "contentSchema",
+    "then", "else",     # if 키워드에서 함께 처리
+})
+
+# 타입별 검사식 (jsonschema draft 2020-12 TYPE_CHECKER와 동일한 규칙)
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+}
+
+
+class Resolver(Protocol):
+    """$ref 해석기 (referencing Resolver 중 사용하는 메서드, 패키지 최상위에 공개되지 않음)"""
+
+    def in_subresource(self, subresource: Resource[Any]) -> "Resolver": ...
+
+    def lookup(self, ref: str) -> Any: ...
+
+
+def _equal(one: Any, two: Any) -> bool:
+    """enum/const 비교 (jsonschema와 같은 규칙: True/1, False/0을 구분, 배열/객체는 재귀)"""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key]) for key, value in one.items()
+        )
+    if isinstance(one, bool) or isinstance(two, bool):
+        return False  # 같은 bool이면 위의 is에서 걸러짐
+    return bool(one == two)
+
+
+def _extras_msg(extras: list[Any]) -> str:
+    """추가 속성 메시지 조각 ("'a', 'b' were")"""
+    verb = "was" if len(extras) == 1 else "were"
+    return f"{', '.join(repr(extra) for extra in extras)} {verb}"
+
+
+# 스키마 노드 (dict 또는 true/false)
+Schema = dict[str, Any]
+
+# 검증 위반 (instance 경로, 메시지)
+ValidationIssue = tuple[tuple[Union[str, int], ...], str]
+
+# 키워드 코드 조각 (boolean 함수 줄, 에러 수집 함수 줄)
+_Code = tuple[list[str], list[str]]
+
+
+class UnsupportedSchemaError(Exception):
+    """컴파일러가 지원하지 않는 키워드/형태"""
+
+
+class CompiledSchema:
+    """컴파일된 스키마 검증 함수 묶음"""
+
+    def __init__(
+        self,
+        is_valid: Callable[[Any], bool],
+        collect_errors: Callable[[Any, tuple[()], list[ValidationIssue]], None],
+        source: str,
+    ):
+        self.is_valid = is_valid
+        self._collect_errors = collect_errors
+        self.source = source  # 디버깅용 생성 소스
+
+    def iter_errors(self, data: Any) -> list[ValidationIssue]:
+        """(instance 경로, 메시지) 목록. 유효하면 빈 리스트"""
+        if self.is_valid(data):
+            return []
+        errors: list[ValidationIssue] = []
+        self._collect_errors(data, (), errors)
+        return errors
+
+
+class _Compiler:
+    """스키마 노드마다 boolean 함수(_vN)와 에러 수집 함수(_eN)를 생성"""
+
+    def __init__(self, registry: Registry[Any]) -> None:
+        self.registry = registry
+        self.namespace: dict[str, Any] = {
+            "_Number": numbers.Number,
+            "_equal": _equal,
+            "_extras_msg": _extras_msg,
+        }
+        self.lines: list[str] = []
+        self._ids: dict[int, int] = {}
+        self._keep: list[Any] = []      # id() 재사용 방지
+        self._pending: list[tuple[int, Any, Resolver]] = []
+
+    def const(self, value: Any) -> str:
+        """상수를 네임스페이스에 등록하고 이름 반환"""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def node(self, schema: Any, resolver: Resolver) -> int:
+        """스키마 노드의 함수 번호 (처음 보면 생성 대기열에 추가)"""
+        key = id(schema)
+        if key not in self._ids:
+            if isinstance(schema, dict) and "$id" in schema:
+                resolver = resolver.in_subresource(DRAFT202012.create_resource(schema))
+            index = len(self._ids)
+            self._ids[key] = index
+            self._keep.append(schema)
+            self._pending.append((index, schema, resolver))
+        return self._ids[key]
+
+    def build(self, schema: Schema) -> CompiledSchema:
+        root_resource = DRAFT202012.create_resource(schema)
+        resolver = self.registry.resolver_with_root(root_resource)
+        root = self.node(schema, resolver)
+
+        while self._pending:
+            index, node, node_resolver = self._pending.pop()
+            self._emit(index, node, node_resolver)
+
+        source = "\n".join(self.lines)
+        exec(compile(source, "<compiled-schema>", "exec"), self.namespace)
+        return CompiledSchema(
+            is_valid=self.namespace[f"_v{root}"],
+            collect_errors=self.namespace[f"_e{root}"],
+            source=source,
+        )
+
+    # -----------------------------------------------------
+    # 코드 생성
+    # -----------------------------------------------------
+
+    def _emit(self, index: int, schema: Any, resolver: Resolver) -> None:
+        bool_body: list[str] = []
+        error_body: list[str] = []
+
+        if schema is True:
+            pass
+        elif schema is False:
+            bool_body.append("return False")
+            error_body.append(
+                "errors.append((path, f'False schema does not allow {d!r}'))"
+            )
+        elif isinstance(schema, dict):
+            for keyword, value in schema.items():
+                if keyword in _ANNOTATION_KEYWORDS:
+                    continue
+                handler = getattr(self, f"_kw_{keyword.lstrip('$')}", None)
+                if handler is None:
+                    raise UnsupportedSchemaError(f"Unsupported keyword: {keyword}")
+                checks, collects = handler(value, schema, resolver)
+                bool_body.extend(checks)
+                error_body.extend(collects)
+        else:
+            raise UnsupportedSchemaError(f"Invalid schema: {schema!r}")
+
+        self.lines.append(f"def _v{index}(d):")
+        self.lines.extend(f"    {line}" for line in bool_body)
+        self.lines.append("    return True")
+        self.lines.append(f"def _e{index}(d, path, errors):")
+        self.lines.extend(f"    {line}" for line in error_body or ["pass"])
+
+    # 각 _kw_* 는 (boolean 함수 줄, 에러 수집 함수 줄)을 반환
+
+    def _kw_type(self, types: Any, schema: Schema, resolver: Resolver) -> _Code:
+        types = [types] if isinstance(types, str) else list(types)
+        for each in types:
+            if each not in _TYPE_CHECKS:
+                raise UnsupportedSchemaError(f"Unknown type: {each}")
+        cond = " or ".join(_TYPE_CHECKS[each].format(v="d") for each in types)
+        reprs = ", ".join(repr(each) for each in types)
+        return (
+            [f"if not ({cond}): return False"],
+            [f"if not ({cond}): errors.append((path, f'{{d!r}} is not of type ' {reprs!r}))"],
+        )
+
+    def _kw_enum(self, enums: Any, schema: Schema, resolver: Resolver) -> _Code:
+        enums_name = self.const(enums)
+        message = f"f'{{d!r}} is not one of ' + {self.const(repr(enums))}"
+        if enums and all(isinstance(each, str) for each in enums):
+            members = self.const(frozenset(enums))
+            cond = f"not (isinstance(d, str) and d in {members})"
+        else:
+            cond = f"all(not _equal(each, d) for each in {enums_name})"
+        return (
+            [f"if {cond}: return False"],
+            [f"if {cond}: errors.append((path, {message}))"],
+        )
+
+    def _kw_const(self, const: Any, schema: Schema, resolver: Resolver) -> _Code:
+        name = self.const(const)
+        message = self.const(f"{const!r} was expected")
+        return (
+            [f"if not _equal(d, {name}): return False"],
+            [f"if not _equal(d, {name}): errors.append((path, {message}))"],
+        )
+
+    def _number_bound(self, bound: float, op: str, text: str) -> _Code:
+        name = self.const(bound)
+        suffix = self.const(f" {text} {bound!r}")
+        cond = f"isinstance(d, _Number) and not isinstance(d, bool) and d {op} {name}"
+        return (
+            [f"if {cond}: return False"],
+            [f"if {cond}: errors.append((path, repr(d) + {suffix}))"],
+        )
+
+    def _kw_minimum(self, minimum: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._number_bound(minimum, "<", "is less than the minimum of")
+
+    def _kw_maximum(self, maximum: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._number_bound(maximum, ">", "is greater than the maximum of")
+
+    def _kw_exclusiveMinimum(self, minimum: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._number_bound(
+            minimum, "<=", "is less than or equal to the minimum of"
+        )
+
+    def _kw_exclusiveMaximum(self, maximum: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._number_bound(
+            maximum, ">=", "is greater than or equal to the maximum of"
+        )
+
+    def _length_bound(
+        self, check: str, bound: int, op: str, edge: int, edge_text: str, text: str
+    ) -> _Code:
+        cond = f"{check} and len(d) {op} {bound}"
+        suffix = self.const(f" {edge_text if bound == edge else text}")
+        return (
+            [f"if {cond}: return False"],
+            [f"if {cond}: errors.append((path, repr(d) + {suffix}))"],
+        )
+
+    def _kw_maxLength(self, bound: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._length_bound(
+            "isinstance(d, str)", bound, ">", 0, "is expected to be empty", "is too long"
+        )
+
+    def _kw_minLength(self, bound: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._length_bound(
+            "isinstance(d, str)", bound, "<", 1, "should be non-empty", "is too short"
+        )
+
+    def _kw_maxItems(self, bound: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._length_bound(
+            "isinstance(d, list)", bound, ">", 0, "is expected to be empty", "is too long"
+        )
+
+    def _kw_minItems(self, bound: Any, schema: Schema, resolver: Resolver) -> _Code:
+        return self._length_bound(
+            "isinstance(d, list)", bound, "<", 1, "should be non-empty", "is too short"
+        )
+
+    def _kw_pattern(self, pattern: Any, schema: Schema, resolver: Resolver) -> _Code:
+        regex = self.const(re.compile(pattern))
+        suffix = self.const(f" does not match {pattern!r}")
+        cond = f"isinstance(d, str) and not {regex}.search(d)"
+        return (
+            [f"if {cond}: return False"],
+            [f"if {cond}: errors.append((path, repr(d) + {suffix}))"],
+        )
+
+    def _kw_required(self, required: Any, schema: Schema, resolver: Resolver) -> _Code:
+        names = self.const(tuple(required))
+        messages = self.const(tuple(f"{each!r} is a required property" for each in required))
+        return (
+            [
+                "if isinstance(d, dict):",
+                f"    for key in {names}:",
+                "        if key not in d: return False",
+            ],
+            [
+                "if isinstance(d, dict):",
+                f"    for key, message in zip({names}, {messages}):",
+                "        if key not in d: errors.append((path, message))",
+            ],
+        )
+
+    def _kw_properties(self, properties: Any, schema: Schema, resolver: Resolver) -> _Code:
+        checks = ["if isinstance(d, dict):"]
+        collects = ["if isinstance(d, dict):"]
+        for key, subschema in properties.items():
+            if subschema is True:
+                continue
+            sub = self.node(subschema, resolver)
+            key_name = self.const(key)
+            checks.append(
+                f"    if {key_name} in d and not _v{sub}(d[{key_name}]): return False"
+            )
+            collects.append(
+                f"    if {key_name} in d: _e{sub}(d[{key_name}], path + ({key_name},), errors)"
+            )
+        if len(checks) == 1:
+            return [], []
+        return checks, collects
+
+    def _kw_additionalProperties(
+        self, additional: Any, schema: Schema, resolver: Resolver
+    ) -> _Code:
+        if additional is True:
+            return [], []
+        if "patternProperties" in schema:
+            raise UnsupportedSchemaError("additionalProperties with patternProperties")
+        known = self.const(frozenset(schema.get("properties", {})))
+        if additional is False:
+            return (
+                [
+                    "if isinstance(d, dict):",
+                    "    for key in d:",
+                    f"        if key not in {known}: return False",
+                ],
+                [
+                    "if isinstance(d, dict):",
+                    f"    extras = [key for key in d if key not in {known}]",
+                    "    if extras:",
+                    "        errors.append((path, 'Additional properties are not allowed "
+                    "(%s unexpected)' % _extras_msg(sorted(extras, key=str))))",
+                ],
+            )
+        sub = self.node(additional, resolver)
+        return (
+            [
+                "if isinstance(d, dict):",
+                "    for key, value in d.items():",
+                f"        if key not in {known} and not _v{sub}(value): return False",
+            ],
+            [
+                "if isinstance(d, dict):",
+                "    for key, value in d.items():",
+                f"        if key not in {known}: _e{sub}(value, path + (key,), errors)",
+            ],
+        )
+
+    def _kw_items(self, items: Any, schema: Schema, resolver: Resolver) -> _Code:
+        if "prefixItems" in schema or items is False:
+            raise UnsupportedSchemaError("prefixItems / items: false")
+        if items is True:
+            return [], []
+        sub = self.node(items, resolver)
+        return (
+            [
+                "if isinstance(d, list):",
+                "    for item in d:",
+                f"        if not _v{sub}(item): return False",
+            ],
+            [
+                "if isinstance(d, list):",
+                "    for index, item in enumerate(d):",
+                f"        _e{sub}(item, path + (index,), errors)",
+            ],
+        )
+
+    def _kw_ref(self, ref: Any, schema: Schema, resolver: Resolver) -> _Code:
+        resolved = resolver.lookup(ref)
+        sub = self.node(resolved.contents, resolved.resolver)
+        return (
+            [f"if not _v{sub}(d): return False"],
+            [f"_e{sub}(d, path, errors)"],
+        )
+
+    def _kw_allOf(self, subschemas: Any, schema: Schema, resolver: Resolver) -> _Code:
+        checks: list[str] = []
+        collects: list[str] = []
+        for subschema in subschemas:
+            sub = self.node(subschema, resolver)
+            checks.append(f"if not _v{sub}(d): return False")
+            collects.append(f"_e{sub}(d, path, errors)")
+        return checks, collects
+
+    def _kw_if(self, if_schema: Any, schema: Schema, resolver: Resolver) -> _Code:
+        cond = self.node(if_schema, resolver)
+        checks: list[str] = []
+        collects: list[str] = []
+        if "then" in schema:
+            then = self.node(schema["then"], resolver)
+            checks.append(f"if _v{cond}(d) and not _v{then}(d): return False")
+            collects.append(f"if _v{cond}(d): _e{then}(d, path, errors)")
+        if "else" in schema:
+            else_ = self.node(schema["else"], resolver)
+            checks.append(f"if not _v{cond}(d) and not _v{else_}(d): return False")
+            collects.append(f"if not _v{cond}(d): _e{else_}(d, path, errors)")
+        return checks, collects
+
+
+def compile_schema(schema: Schema, registry: Registry[Any]) -> CompiledSchema:
+    """스키마를 검증 함수로 컴파일
+
+    Args:
+        schema: 루트 스키마 ($id 포함)
+        registry: $ref 해석용 referencing Registry
+
+    Raises:
+        UnsupportedSchemaError: 컴파일할 수 없는 키워드가 있는 경우
+    """
+    return _Compiler(registry).build(schema)
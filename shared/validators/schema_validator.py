@@ -4,15 +4,40 @@
 """
 
 import json
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
+from urllib.parse import urldefrag, urljoin
 
-from jsonschema import Draft202012Validator, RefResolver
+from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012
+
+from shared.validators.compiled import (
+    CompiledSchema,
+    UnsupportedSchemaError,
+    compile_schema,
+)
+
+logger = logging.getLogger(__name__)
 
 # 스키마 기본 경로
 SCHEMA_BASE_PATH = Path(__file__).parent.parent.parent / "schemas" / "v1"
 
+# 스키마 레지스트리 (스키마 목록/경로/버전)
+SCHEMA_REGISTRY_PATH = SCHEMA_BASE_PATH.parent / "registry.json"
+
+# registry.json에 baseUri가 없을 때 사용하는 $id 접두어
+DEFAULT_BASE_URI = "https://automation-hub/schemas/v1"
+
+# 사전 파싱 번들 포맷 버전 (구조 변경 시 증가)
+BUNDLE_FORMAT = 1
+
 
 class SchemaValidator:
     """JSON Schema 검증기
@@ -26,30 +51,168 @@ class SchemaValidator:
 
     _schemas: dict[str, dict[str, Any]] = {}
     _validators: dict[str, Draft202012Validator] = {}
-    _resolver: RefResolver | None = None
-
-    @classmethod
-    def _get_resolver(cls) -> RefResolver:
-        """$ref 해석용 resolver 생성"""
-        if cls._resolver is None:
-            # 기본 스키마 로드 (common/enums, common/card)
-            store: dict[str, dict[str, Any]] = {}
-
-            # 모든 스키마 파일 로드하여 store에 추가
-            for schema_file in SCHEMA_BASE_PATH.rglob("*.schema.json"):
-                with open(schema_file, encoding="utf-8") as f:
-                    schema = json.load(f)
-                    if "$id" in schema:
-                        store[schema["$id"]] = schema
-
-            # RefResolver 생성
-            cls._resolver = RefResolver(
-                base_uri=f"file:///{SCHEMA_BASE_PATH.as_posix()}/",
-                referrer={},
-                store=store,
-            )
+    _compiled: dict[str, CompiledSchema | None] = {}
+    _registry: Registry | None = None
+
+    # 스키마 인덱스: schema_id -> 파일 경로, $id URI -> schema_id
+    _index: dict[str, Path] | None = None
+    _uris: dict[str, str] = {}
+    _resources: dict[str, Resource] = {}
+
+    # 사전 파싱 번들 (환경 변수 SCHEMA_VALIDATOR_BUNDLE로 지정 시 첫 로드 때 사용)
+    _bundle_path: str | None = os.getenv("SCHEMA_VALIDATOR_BUNDLE") or None
+
+    # 컴파일 모드 (opt-in): 스키마를 파이썬 검증 함수로 변환하여 사용
+    _compiled_mode: bool = os.getenv("SCHEMA_VALIDATOR_COMPILED", "false").lower() == "true"
+
+    @classmethod
+    def _get_index(cls) -> dict[str, Path]:
+        """schemas/registry.json 기반 스키마 인덱스 (파일은 읽지 않음)
+
+        registry.json이 없으면 스키마 디렉토리를 탐색하여 구성한다.
+        """
+        if cls._index is None:
+            index: dict[str, Path] = {}
+            base_uri = DEFAULT_BASE_URI
+
+            if SCHEMA_REGISTRY_PATH.exists():
+                with open(SCHEMA_REGISTRY_PATH, encoding="utf-8") as f:
+                    registry = json.load(f)
+                base_uri = registry.get("baseUri", base_uri).rstrip("/")
+                for entry in registry.get("schemas", {}).values():
+                    path = SCHEMA_REGISTRY_PATH.parent / entry["path"]
+                    index[cls._schema_id(path)] = path
+            else:
+                for path in SCHEMA_BASE_PATH.rglob("*.schema.json"):
+                    index[cls._schema_id(path)] = path
+
+            uris: dict[str, str] = {}
+            for schema_id in index:
+                uris[f"{base_uri}/{schema_id}"] = schema_id
+                # 상대 $ref("player.schema.json" 등)는 파일명 기준으로 해석됨
+                uris[f"{base_uri}/{schema_id}.schema.json"] = schema_id
+
+            cls._index = index
+            cls._uris = uris
+
+            if cls._bundle_path:
+                cls.load_bundle(cls._bundle_path)
+
+        return cls._index
+
+    @staticmethod
+    def _schema_id(path: Path) -> str:
+        """파일 경로 -> 스키마 ID (예: .../v1/gfx/hand.schema.json -> "gfx/hand")"""
+        rel_path = path.relative_to(SCHEMA_BASE_PATH)
+        return str(rel_path).replace("\\", "/").replace(".schema.json", "")
+
+    @classmethod
+    def _retrieve(cls, uri: str) -> Resource:
+        """$ref 대상 스키마를 처음 참조될 때 로드"""
+        resource = cls._resources.get(uri)
+        if resource is None:
+            schema_id = cls._uris.get(uri)
+            if schema_id is None:
+                # referencing의 attrs 클래스 생성자는 mypy가 인식하지 못함
+                raise NoSuchResource(ref=uri)  # type: ignore[call-arg]
+            resource = DRAFT202012.create_resource(cls.load_schema(schema_id))
+            cls._resources[uri] = resource
+            # 이후 생성되는 검증기는 retrieve 없이 바로 조회
+            cls._registry = cls._get_registry().with_resource(uri, resource)
+        return resource
+
+    @classmethod
+    def _preload_refs(cls, schema: dict[str, Any]) -> Registry:
+        """스키마가 (간접 포함) $ref로 참조하는 스키마만 미리 로드
+
+        검증 중 매 $ref마다 retrieve를 거치지 않도록 registry에 등록해 둔다.
+        """
+        pending = [schema]
+        seen: set[str] = set()
+        while pending:
+            current = pending.pop()
+            base_uri = current.get("$id", "")
+            for ref in _iter_refs(current):
+                uri = urldefrag(urljoin(base_uri, ref)).url
+                if uri in seen or uri == base_uri or uri not in cls._uris:
+                    continue
+                seen.add(uri)
+                pending.append(cls._retrieve(uri).contents)
+        return cls._get_registry()
+
+    @classmethod
+    def _get_registry(cls) -> Registry:
+        """$ref 해석용 referencing Registry 생성 (스키마는 지연 로드)"""
+        if cls._registry is None:
+            cls._get_index()
+            cls._registry = Registry(retrieve=cls._retrieve)  # type: ignore[call-arg]
+
+        return cls._registry
+
+    # =========================================================
+    # Bundle (사전 파싱된 전체 스키마)
+    # =========================================================
+
+    @classmethod
+    def _fingerprint(cls) -> list[tuple[str, int, int]]:
+        """번들 유효성 확인용 (스키마 ID, 파일 크기, 수정 시각)"""
+        fingerprint = []
+        for schema_id, path in sorted(cls._get_index().items()):
+            stat = path.stat()
+            fingerprint.append((schema_id, stat.st_size, stat.st_mtime_ns))
+        return fingerprint
+
+    @classmethod
+    def build_bundle(cls, path: str | Path) -> int:
+        """모든 스키마를 파싱하여 하나의 번들 파일로 저장
+
+        워커 시작/첫 검증 시 스키마 파일을 개별로 읽고 파싱하는 비용을 줄인다.
+
+        Returns:
+            번들에 포함된 스키마 수
+        """
+        schemas = {schema_id: cls.load_schema(schema_id) for schema_id in cls._get_index()}
+        bundle = {
+            "format": BUNDLE_FORMAT,
+            "fingerprint": cls._fingerprint(),
+            "schemas": schemas,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return len(schemas)
+
+    @classmethod
+    def load_bundle(cls, path: str | Path) -> bool:
+        """번들 파일에서 스키마 캐시 로드
+
+        스키마 파일이 번들 생성 이후 변경되었으면 번들을 무시한다.
+
+        Returns:
+            번들 사용 여부
+        """
+        try:
+            with open(path, "rb") as f:
+                bundle = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning("Schema bundle not loaded (%s): %s", path, e)
+            return False
+
+        if bundle.get("format") != BUNDLE_FORMAT or bundle.get("fingerprint") != cls._fingerprint():
+            logger.warning("Schema bundle is stale, ignoring: %s", path)
+            return False
 
-        return cls._resolver
+        for schema_id, schema in bundle["schemas"].items():
+            cls._schemas.setdefault(schema_id, schema)
+        return True
+
+    @classmethod
+    def set_compiled_mode(cls, enabled: bool = True) -> None:
+        """컴파일 모드 전환
+
+        활성화하면 validate/is_valid가 스키마별로 생성된 검증 함수를 사용한다.
+        (환경 변수 SCHEMA_VALIDATOR_COMPILED=true로도 활성화 가능)
+        """
+        cls._compiled_mode = enabled
 
     @classmethod
     def load_schema(cls, schema_id: str) -> dict[str, Any]:
@@ -61,8 +224,9 @@ class SchemaValidator:
         Returns:
             로드된 JSON Schema dict
         """
+        index = cls._get_index()
         if schema_id not in cls._schemas:
-            schema_path = SCHEMA_BASE_PATH / f"{schema_id}.schema.json"
+            schema_path = index.get(schema_id, SCHEMA_BASE_PATH / f"{schema_id}.schema.json")
             if not schema_path.exists():
                 raise FileNotFoundError(f"Schema not found: {schema_path}")
 
@@ -76,12 +240,35 @@ class SchemaValidator:
         """Validator 인스턴스 반환 (캐싱)"""
         if schema_id not in cls._validators:
             schema = cls.load_schema(schema_id)
-            resolver = cls._get_resolver()
             cls._validators[schema_id] = Draft202012Validator(
-                schema, resolver=resolver
+                schema, registry=cls._preload_refs(schema)
             )
         return cls._validators[schema_id]
 
+    @classmethod
+    def get_compiled(cls, schema_id: str) -> CompiledSchema | None:
+        """컴파일된 검증 함수 반환 (캐싱)
+
+        Returns:
+            컴파일 결과. 지원하지 않는 키워드가 있으면 None (기본 검증기 사용)
+        """
+        if schema_id not in cls._compiled:
+            schema = cls.load_schema(schema_id)
+            try:
+                cls._compiled[schema_id] = compile_schema(schema, cls._preload_refs(schema))
+            except UnsupportedSchemaError:
+                cls._compiled[schema_id] = None
+        return cls._compiled[schema_id]
+
+    @classmethod
+    def is_valid(cls, data: Any, schema_id: str) -> bool:
+        """유효성만 빠르게 확인 (에러 메시지 수집 없음)"""
+        if cls._compiled_mode:
+            compiled = cls.get_compiled(schema_id)
+            if compiled is not None:
+                return compiled.is_valid(data)
+        return bool(cls.get_validator(schema_id).is_valid(data))
+
     @classmethod
     def validate(cls, data: Any, schema_id: str) -> tuple[bool, list[str]]:
         """데이터 검증
@@ -95,14 +282,82 @@ class SchemaValidator:
             - valid: 검증 성공 여부
             - errors: 에러 메시지 리스트
         """
-        validator = cls.get_validator(schema_id)
+        errors = cls._collect_errors(data, schema_id)
+        return (len(errors) == 0, errors)
+
+    @classmethod
+    def _collect_errors(
+        cls, data: Any, schema_id: str, prefix: tuple[Any, ...] = ()
+    ) -> list[str]:
+        """에러 메시지 수집 ("[경로] 메시지" 형식, prefix는 경로 앞에 추가)"""
+        compiled = cls.get_compiled(schema_id) if cls._compiled_mode else None
+        found: Iterable[tuple[tuple[Any, ...], str]]
+        if compiled is not None:
+            found = compiled.iter_errors(data)
+        else:
+            validator = cls.get_validator(schema_id)
+            found = (
+                (tuple(error.absolute_path), error.message)
+                for error in validator.iter_errors(data)
+            )
+
         errors: list[str] = []
+        for error_path, message in found:
+            path = " -> ".join(str(p) for p in prefix + tuple(error_path)) or "root"
+            errors.append(f"[{path}] {message}")
+        return errors
 
-        for error in validator.iter_errors(data):
-            path = " -> ".join(str(p) for p in error.absolute_path) or "root"
-            errors.append(f"[{path}] {error.message}")
+    @classmethod
+    def validate_many(
+        cls,
+        items: Sequence[Any],
+        schema_id: str,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> list[tuple[bool, list[str]]]:
+        """여러 데이터 일괄 검증
+
+        items를 청크로 나누어 프로세스 풀에서 병렬 검증한다.
+        각 워커는 시작 시 스키마/검증기 캐시를 미리 로드한다.
 
-        return (len(errors) == 0, errors)
+        Args:
+            items: 검증할 데이터 목록
+            schema_id: 스키마 ID
+            workers: 프로세스 수 (None이면 CPU 수, 1 이하면 현재 프로세스에서 검증)
+            chunk_size: 청크당 항목 수 (None이면 워커당 4개 청크가 되도록 자동 결정)
+
+        Returns:
+            items 순서대로 (valid, errors) 튜플 리스트.
+            에러 경로는 항목 인덱스로 시작한다 (예: "[12 -> Players -> 0] ...")
+        """
+        items = list(items)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(items))
+
+        if workers <= 1:
+            return _validate_chunk(schema_id, 0, items)
+
+        if chunk_size is None:
+            chunk_size = -(-len(items) // (workers * 4))
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1: {chunk_size}")
+
+        starts = range(0, len(items), chunk_size)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(schema_id, cls._compiled_mode),
+        ) as pool:
+            futures = [
+                pool.submit(_validate_chunk, schema_id, start, items[start:start + chunk_size])
+                for start in starts
+            ]
+            results: list[tuple[bool, list[str]]] = []
+            for future in futures:
+                results.extend(future.result())
+
+        return results
 
     @classmethod
     def validate_or_raise(cls, data: Any, schema_id: str) -> None:
@@ -164,17 +419,52 @@ class SchemaValidator:
 
     @classmethod
     def list_schemas(cls) -> list[str]:
-        """사용 가능한 스키마 목록 반환"""
-        schemas: list[str] = []
-        for schema_file in SCHEMA_BASE_PATH.rglob("*.schema.json"):
-            rel_path = schema_file.relative_to(SCHEMA_BASE_PATH)
-            schema_id = str(rel_path).replace("\\", "/").replace(".schema.json", "")
-            schemas.append(schema_id)
-        return sorted(schemas)
+        """사용 가능한 스키마 목록 반환 (registry.json 기준)"""
+        return sorted(cls._get_index())
 
     @classmethod
     def clear_cache(cls) -> None:
         """캐시 초기화 (테스트용)"""
         cls._schemas.clear()
         cls._validators.clear()
-        cls._resolver = None
+        cls._compiled.clear()
+        cls._registry = None
+        cls._index = None
+        cls._uris = {}
+        cls._resources.clear()
+
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    """스키마 내 모든 $ref 값"""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        for value in node.values():
+            yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_refs(value)
+
+
+# =========================================================
+# Process Pool Workers (validate_many)
+# =========================================================
+
+def _init_worker(schema_id: str, compiled_mode: bool) -> None:
+    """워커 프로세스 초기화: 검증 모드를 맞추고 캐시를 미리 로드"""
+    SchemaValidator.set_compiled_mode(compiled_mode)
+    if compiled_mode and SchemaValidator.get_compiled(schema_id) is not None:
+        return
+    SchemaValidator.get_validator(schema_id)
+
+
+def _validate_chunk(
+    schema_id: str, start: int, items: Sequence[Any]
+) -> list[tuple[bool, list[str]]]:
+    """청크 검증 (에러 경로 앞에 전체 목록 기준 인덱스 추가)"""
+    results: list[tuple[bool, list[str]]] = []
+    for index, data in enumerate(items, start):
+        errors = SchemaValidator._collect_errors(data, schema_id, prefix=(index,))
+        results.append((len(errors) == 0, errors))
+    return results
@@ -0,0 +1,33 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Instruction Leases
+-- Version: 1.1.0
+-- Date: 2025-01-15
+-- Description: 여러 ae 렌더 노드의 원자적 작업 점유 (claim + lease)
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 점유 컬럼
+-- ============================================================
+ALTER TABLE render_instructions
+    ADD COLUMN IF NOT EXISTS worker_id VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
+
+COMMENT ON COLUMN render_instructions.worker_id IS 'claim_batch로 작업을 점유한 워커 ID';
+COMMENT ON COLUMN render_instructions.lease_expires_at IS 'lease 만료 시각 - 지나면 reaper가 pending으로 회수';
+
+-- ============================================================
+-- PART 2: 인덱스
+-- ============================================================
+
+-- 만료 lease 회수용 (idx_render_instructions_processing과 같은 부분 조건)
+CREATE INDEX IF NOT EXISTS idx_render_instructions_lease
+    ON render_instructions(lease_expires_at)
+    WHERE status = 'processing';
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render instruction leases migration completed!';
+END $$;
@@ -0,0 +1,32 @@
+-- ============================================================
+-- WSOP Automation Hub - Keyset Pagination Indexes
+-- Version: 1.2.0
+-- Date: 2025-01-20
+-- Description: (created_at, id) keyset 스트리밍 조회용 인덱스 (iter_hands, iter_outputs)
+-- ============================================================
+
+-- ============================================================
+-- PART 1: hands
+-- ============================================================
+
+-- 전체 export: WHERE (created_at, id) > (...) ORDER BY created_at, id
+CREATE INDEX IF NOT EXISTS idx_hands_created_at_id
+    ON hands(created_at, id);
+
+-- 테이블별 export: WHERE table_id = ... AND (created_at, id) > (...)
+CREATE INDEX IF NOT EXISTS idx_hands_table_created_at_id
+    ON hands(table_id, created_at, id);
+
+-- ============================================================
+-- PART 2: render_outputs
+-- ============================================================
+CREATE INDEX IF NOT EXISTS idx_render_outputs_created_at_id
+    ON render_outputs(created_at, id);
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Keyset pagination indexes migration completed!';
+END $$;
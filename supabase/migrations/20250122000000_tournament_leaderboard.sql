@@ -0,0 +1,59 @@
+-- ============================================================
+-- WSOP Automation Hub - Tournament Leaderboard
+-- Version: 1.3.0
+-- Date: 2025-01-22
+-- Description: standings 칩 순위 인덱스 (Leaderboard / Player Stats 자막)
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 테이블
+-- ============================================================
+CREATE TABLE IF NOT EXISTS tournament_leaderboard (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    player_name VARCHAR(100) NOT NULL,
+    nationality VARCHAR(10) DEFAULT '',
+    chips BIGINT DEFAULT 0,
+    table_id VARCHAR(50),
+    seat INTEGER,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+
+    PRIMARY KEY (tournament_id, player_name)
+);
+
+COMMENT ON TABLE tournament_leaderboard IS 'TournamentsRepository.upsert/upsert_diff가 바뀐 플레이어만 갱신';
+
+-- ============================================================
+-- PART 2: 인덱스
+-- ============================================================
+
+-- top N
+CREATE INDEX IF NOT EXISTS idx_tournament_leaderboard_chips
+    ON tournament_leaderboard(tournament_id, chips DESC);
+
+-- 국적별 top N
+CREATE INDEX IF NOT EXISTS idx_tournament_leaderboard_nationality
+    ON tournament_leaderboard(tournament_id, nationality, chips DESC);
+
+-- ============================================================
+-- PART 3: 기존 standings_json에서 초기 데이터
+-- ============================================================
+INSERT INTO tournament_leaderboard (tournament_id, player_name, nationality, chips, table_id, seat)
+SELECT
+    t.id,
+    s->>'name',
+    COALESCE(s->>'nationality', ''),
+    COALESCE((s->>'chips')::bigint, 0),
+    s->>'table_id',
+    (s->>'seat')::integer
+FROM tournaments t
+CROSS JOIN LATERAL jsonb_array_elements(COALESCE(t.standings_json, '[]'::jsonb)) AS s
+WHERE s->>'name' IS NOT NULL
+ON CONFLICT (tournament_id, player_name) DO NOTHING;
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Tournament leaderboard migration completed!';
+END $$;
@@ -0,0 +1,36 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Instruction Deduplication
+-- Version: 1.4.0
+-- Date: 2025-01-24
+-- Description: 내용 기반 렌더 작업 중복 제거 (template_name + content_hash)
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 컬럼
+-- ============================================================
+ALTER TABLE render_instructions
+    ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+COMMENT ON COLUMN render_instructions.content_hash IS 'sha256(layer_data + output_settings) - 같은 템플릿이면 출력 동일';
+
+-- ============================================================
+-- PART 2: 인덱스
+-- ============================================================
+
+-- 완료된 결과 재사용 조회
+CREATE INDEX IF NOT EXISTS idx_render_instructions_content
+    ON render_instructions(template_name, content_hash)
+    WHERE content_hash IS NOT NULL;
+
+-- 진행 중 작업은 같은 내용 하나만 (동시 enqueue 경합 방지, ON CONFLICT 대상)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_render_instructions_active_content
+    ON render_instructions(template_name, content_hash)
+    WHERE status IN ('pending', 'processing');
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render instruction dedup migration completed!';
+END $$;
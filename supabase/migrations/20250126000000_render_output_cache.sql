@@ -0,0 +1,41 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Output Cache
+-- Version: 1.5.0
+-- Date: 2025-01-26
+-- Description: 같은 입력의 렌더 결과 재사용 (적중 기록, LRU 정리)
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 컬럼
+-- ============================================================
+ALTER TABLE render_outputs
+    ADD COLUMN IF NOT EXISTS cache_source_id INTEGER REFERENCES render_outputs(id) ON DELETE SET NULL,
+    ADD COLUMN IF NOT EXISTS hit_count INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS last_hit_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS evicted_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN render_outputs.cache_source_id IS '캐시 적중으로 재사용한 원본 결과 (AE 렌더링이면 NULL)';
+COMMENT ON COLUMN render_outputs.last_hit_at IS '마지막 캐시 적중 시각 (LRU 정리 기준)';
+COMMENT ON COLUMN render_outputs.evicted_at IS '파일 삭제/유실 시각 (이후 캐시 조회에서 제외)';
+
+-- ============================================================
+-- PART 2: 인덱스
+-- ============================================================
+
+-- 캐시 조회: 지시서 → 완료된 결과 (제거되지 않은 것)
+CREATE INDEX IF NOT EXISTS idx_render_outputs_cached
+    ON render_outputs(instruction_id, completed_at DESC)
+    WHERE status = 'completed' AND evicted_at IS NULL;
+
+-- LRU 정리: 경로별 결과
+CREATE INDEX IF NOT EXISTS idx_render_outputs_output_path
+    ON render_outputs(output_path)
+    WHERE evicted_at IS NULL;
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render output cache migration completed!';
+END $$;
@@ -0,0 +1,41 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Scheduler
+-- Version: 1.6.0
+-- Date: 2025-01-28
+-- Description: 렌더 작업 마감 시각 (송출 시각) + 스케줄러 조회 인덱스
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 컬럼
+-- ============================================================
+ALTER TABLE render_instructions
+    ADD COLUMN IF NOT EXISTS deadline_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN render_instructions.deadline_at IS '송출 시각 - 이 전에 완료되어야 함 (NULL이면 마감 없음)';
+
+-- ============================================================
+-- PART 2: 인덱스
+-- ============================================================
+
+-- 마감 임박 pending 후보 조회
+CREATE INDEX IF NOT EXISTS idx_render_instructions_deadline
+    ON render_instructions(deadline_at)
+    WHERE status = 'pending' AND deadline_at IS NOT NULL;
+
+-- 오래 기다린 pending 후보 조회 (aging)
+CREATE INDEX IF NOT EXISTS idx_render_instructions_pending_created
+    ON render_instructions(created_at)
+    WHERE status = 'pending';
+
+-- 템플릿별 렌더 시간 학습 (최근 완료 작업)
+CREATE INDEX IF NOT EXISTS idx_render_instructions_completed
+    ON render_instructions(completed_at, template_name)
+    WHERE status = 'completed';
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render scheduler migration completed!';
+END $$;
@@ -0,0 +1,65 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Retry Backoff + Dead Letters
+-- Version: 1.7.0
+-- Date: 2025-01-30
+-- Description: 재시도 예약 시각 (지수 백오프) + 실패 확정 작업 테이블
+-- ============================================================
+
+-- ============================================================
+-- PART 1: 컬럼
+-- ============================================================
+ALTER TABLE render_instructions
+    ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN render_instructions.next_attempt_at IS '재시도 예약 시각 - 이 전에는 점유하지 않음 (NULL이면 즉시)';
+
+-- ============================================================
+-- PART 2: render_dead_letters 테이블
+-- ============================================================
+CREATE TABLE IF NOT EXISTS render_dead_letters (
+    id SERIAL PRIMARY KEY,
+    instruction_id INTEGER REFERENCES render_instructions(id) ON DELETE SET NULL,
+    template_name VARCHAR(100) NOT NULL,
+
+    -- 실패 정보
+    error_kind VARCHAR(20) NOT NULL,  -- transient (재시도 소진), permanent
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+
+    failed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    requeued_at TIMESTAMP WITH TIME ZONE
+);
+
+COMMENT ON TABLE render_dead_letters IS '재시도 소진 / 영구 오류로 실패한 렌더 작업 (운영자 확인 후 일괄 재등록)';
+
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_open
+    ON render_dead_letters(failed_at DESC)
+    WHERE requeued_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_template
+    ON render_dead_letters(template_name, error_kind);
+CREATE INDEX IF NOT EXISTS idx_render_dead_letters_instruction_id
+    ON render_dead_letters(instruction_id);
+
+-- ============================================================
+-- PART 3: pending 조회 인덱스
+-- ============================================================
+-- 인덱스 조건에는 NOW()를 쓸 수 없으므로 바로 점유 가능한 작업(next_attempt_at IS NULL)과
+-- 재시도 대기 작업을 나눠 인덱싱한다. 우선순위순 pending 조회는 두 인덱스를 각각 읽어
+-- LIMIT한 뒤 합친다 (shared/db/repositories.py _due_pending_by_priority).
+-- 기존 폴링 인덱스(initial_schema)는 아직 예약 시각이 안 된 작업까지 포함하므로 대체한다.
+DROP INDEX IF EXISTS idx_render_instructions_pending_poll;
+CREATE INDEX IF NOT EXISTS idx_render_instructions_pending
+    ON render_instructions(priority ASC, created_at ASC)
+    WHERE status = 'pending' AND next_attempt_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_render_instructions_retry_due
+    ON render_instructions(next_attempt_at, priority)
+    WHERE status = 'pending' AND next_attempt_at IS NOT NULL;
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render retry / dead letter migration completed!';
+END $$;
@@ -0,0 +1,186 @@
+-- ============================================================
+-- WSOP Automation Hub - Partition Hands by Day
+-- Version: 1.8.0
+-- Date: 2025-02-01
+-- Description: hands를 created_at RANGE 파티션 테이블로 전환 + hand_keys
+-- ============================================================
+-- 기존 hands는 hands_legacy로 이름을 바꿔 (MINVALUE ~ cutover) 파티션으로 붙인다.
+-- 데이터 복사 없이 전환되며, 보관 기간이 지나면 RetentionJob이 통째로 분리/보관한다.
+-- 이후 일별 파티션은 PartitionMaintainer(monitor 시작 시 + 1시간마다)가 미리 만든다.
+-- 미리 만든 파티션이 떨어져도 저장이 실패하지 않도록 hands_default를 두며, 여기 쌓인 행은
+-- 해당 날짜 파티션을 만들 때 옮겨진다.
+--
+-- render_instructions / render_outputs는 파티션하지 않는다. 지시서 id가 render_outputs,
+-- render_dead_letters의 FK와 캐시 원본(cache_source_id)으로 쓰이고 중복 제거 인덱스가
+-- 테이블 전체 기준이어야 하므로, 끝난 행을 보관 후 삭제하는 방식으로 크기를 유지한다.
+
+-- ============================================================
+-- PART 1: 기존 테이블 정리
+-- ============================================================
+-- v_premium_hands는 이름 변경을 따라 hands_legacy를 가리키게 되므로 먼저 제거 (PART 4에서 재생성)
+DROP VIEW IF EXISTS v_premium_hands;
+
+ALTER TABLE hands RENAME TO hands_legacy;
+
+UPDATE hands_legacy SET created_at = COALESCE(updated_at, NOW()) WHERE created_at IS NULL;
+ALTER TABLE hands_legacy ALTER COLUMN created_at SET NOT NULL;
+
+DROP TRIGGER IF EXISTS tr_hands_updated_at ON hands_legacy;
+DROP POLICY IF EXISTS "Service role full access on hands" ON hands_legacy;
+DROP POLICY IF EXISTS "Authenticated read access on hands" ON hands_legacy;
+
+-- 파티션으로 붙이면 부모 인덱스와 이름이 겹치므로 기존 인덱스 제거
+ALTER TABLE hands_legacy DROP CONSTRAINT IF EXISTS uq_hands_table_hand;
+ALTER TABLE hands_legacy DROP CONSTRAINT IF EXISTS hands_pkey;
+DROP INDEX IF EXISTS idx_hands_table_id;
+DROP INDEX IF EXISTS idx_hands_hand_rank;
+DROP INDEX IF EXISTS idx_hands_created_at;
+DROP INDEX IF EXISTS idx_hands_source;
+DROP INDEX IF EXISTS idx_hands_premium;
+DROP INDEX IF EXISTS idx_hands_players_gin;
+DROP INDEX IF EXISTS idx_hands_created_at_id;
+DROP INDEX IF EXISTS idx_hands_table_created_at_id;
+
+-- ============================================================
+-- PART 2: 파티션 부모 테이블
+-- ============================================================
+CREATE TABLE hands (
+    LIKE hands_legacy INCLUDING DEFAULTS,
+    PRIMARY KEY (id, created_at),
+    CONSTRAINT uq_hands_table_hand UNIQUE (table_id, hand_number, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE hands_id_seq OWNED BY hands.id;
+
+COMMENT ON TABLE hands IS '핸드 데이터 (created_at 일별 RANGE 파티션, 이벤트 기간 파티션 가능)';
+
+CREATE INDEX idx_hands_table_id ON hands(table_id);
+CREATE INDEX idx_hands_hand_rank ON hands(hand_rank) WHERE hand_rank IS NOT NULL;
+CREATE INDEX idx_hands_created_at ON hands(created_at DESC);
+CREATE INDEX idx_hands_source ON hands(source);
+CREATE INDEX idx_hands_premium ON hands(hand_rank, created_at DESC)
+    WHERE hand_rank IN ('royal_flush', 'straight_flush', 'four_of_a_kind', 'full_house');
+CREATE INDEX idx_hands_players_gin ON hands USING GIN (players_json);
+CREATE INDEX idx_hands_created_at_id ON hands(created_at, id);
+CREATE INDEX idx_hands_table_created_at_id ON hands(table_id, created_at, id);
+
+CREATE TRIGGER tr_hands_updated_at
+    BEFORE UPDATE ON hands
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+ALTER TABLE hands ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on hands"
+    ON hands
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+CREATE POLICY "Authenticated read access on hands"
+    ON hands
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+-- ============================================================
+-- PART 3: 기존 데이터 + 초기 파티션
+-- ============================================================
+-- 기존 데이터: ~ cutover, 이후: 일별 파티션 14일치, 그 밖: hands_default
+--
+-- cutover는 기존 데이터 기준으로 정한다: 마지막 created_at 다음 날 00:00 UTC와
+-- 내일 00:00 UTC 중 늦은 쪽 (빈 테이블이면 max가 NULL이라 내일).
+-- 오늘 저장된 행이나 PART 1에서 updated_at으로 채운 행(미래 시각일 수 있음)이
+-- hands_legacy 범위 밖에 있으면 ATTACH가 "partition constraint is violated"로 실패한다.
+-- 예) 마이그레이션 시각 2025-02-01 09:00 UTC, 기존 행 2025-02-01 08:30 UTC
+--     → cutover 2025-02-02 00:00 UTC, hands_legacy = [MINVALUE, 2025-02-02),
+--       일별 파티션은 hands_p20250202부터 (오늘 남은 시간의 새 행도 hands_legacy에 저장)
+DO $$
+DECLARE
+    tomorrow TIMESTAMPTZ :=
+        (date_trunc('day', NOW() AT TIME ZONE 'UTC') + INTERVAL '1 day') AT TIME ZONE 'UTC';
+    cutover TIMESTAMPTZ;
+    day_start TIMESTAMPTZ;
+BEGIN
+    SELECT GREATEST(
+        (date_trunc('day', max(created_at) AT TIME ZONE 'UTC') + INTERVAL '1 day')
+            AT TIME ZONE 'UTC',
+        tomorrow
+    )
+    INTO cutover
+    FROM hands_legacy;
+
+    EXECUTE format(
+        'ALTER TABLE hands ATTACH PARTITION hands_legacy FOR VALUES FROM (MINVALUE) TO (%L)',
+        cutover
+    );
+    FOR i IN 0..14 LOOP
+        day_start := cutover + make_interval(days => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF hands FOR VALUES FROM (%L) TO (%L)',
+            'hands_p' || to_char(day_start AT TIME ZONE 'UTC', 'YYYYMMDD'),
+            day_start,
+            day_start + INTERVAL '1 day'
+        );
+    END LOOP;
+END $$;
+
+CREATE TABLE IF NOT EXISTS hands_default PARTITION OF hands DEFAULT;
+
+-- ============================================================
+-- PART 4: v_premium_hands
+-- ============================================================
+-- 파티션 부모 hands 기준으로 재생성 (정의는 20250108000000과 동일)
+CREATE VIEW v_premium_hands AS
+SELECT
+    h.*,
+    CASE h.hand_rank
+        WHEN 'royal_flush' THEN 1
+        WHEN 'straight_flush' THEN 2
+        WHEN 'four_of_a_kind' THEN 3
+        WHEN 'full_house' THEN 4
+        ELSE 5
+    END as rank_order
+FROM hands h
+WHERE h.hand_rank IN ('royal_flush', 'straight_flush', 'four_of_a_kind', 'full_house')
+ORDER BY rank_order, h.created_at DESC;
+
+COMMENT ON VIEW v_premium_hands IS '프리미엄 핸드 조회용 뷰 (Full House 이상)';
+
+-- ============================================================
+-- PART 5: hand_keys (핸드 유니크 키)
+-- ============================================================
+-- 파티션 테이블의 유니크 제약에는 파티션 키가 포함돼야 하므로
+-- (table_id, hand_number)별 created_at을 여기서 고정해 재수집 시 같은 행으로 upsert되게 한다.
+CREATE TABLE IF NOT EXISTS hand_keys (
+    table_id VARCHAR(50) NOT NULL,
+    hand_number INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (table_id, hand_number)
+);
+
+COMMENT ON TABLE hand_keys IS '핸드별 최초 created_at (파티션 간 (table_id, hand_number) 유니크 보장)';
+
+CREATE INDEX IF NOT EXISTS idx_hand_keys_created_at ON hand_keys(created_at);
+
+INSERT INTO hand_keys (table_id, hand_number, created_at)
+SELECT table_id, hand_number, MIN(created_at)
+FROM hands
+GROUP BY table_id, hand_number
+ON CONFLICT (table_id, hand_number) DO NOTHING;
+
+-- ============================================================
+-- PART 6: 보관 조회 인덱스
+-- ============================================================
+CREATE INDEX IF NOT EXISTS idx_render_instructions_finished
+    ON render_instructions(completed_at, id)
+    WHERE status IN ('completed', 'failed');
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Hands partitioning migration completed!';
+END $$;
@@ -0,0 +1,167 @@
+-- ============================================================
+-- WSOP Automation Hub - Premium Hand Feed
+-- Version: 1.9.0
+-- Date: 2025-02-03
+-- Description: hands 저장 시 트리거로 갱신되는 프리미엄 핸드 피드 + NOTIFY
+-- ============================================================
+-- v_premium_hands는 계산된 CASE 랭크로 정렬하고 get_premium_hands는 hand_rank = ANY(...)로
+-- 걸러서 매 조회마다 해당 핸드 전체를 다시 정렬했다. premium_hands는 rank_order와 seq를
+-- 저장해 두므로 "높은 랭크 먼저 최근 N개"와 "커서 이후"가 인덱스 순서 그대로 읽힌다.
+
+-- ============================================================
+-- PART 1: premium_hands 테이블
+-- ============================================================
+CREATE TABLE IF NOT EXISTS premium_hands (
+    seq BIGSERIAL PRIMARY KEY,  -- 피드 커서 (추가 / 랭크·팟·승자 정정 시 새 값)
+    hand_id BIGINT NOT NULL,
+    table_id VARCHAR(50) NOT NULL,
+    hand_number INTEGER NOT NULL,
+    hand_rank VARCHAR(30) NOT NULL,
+    rank_order SMALLINT NOT NULL,  -- 1=royal_flush ... 4=full_house
+    pot_size INTEGER DEFAULT 0,
+    winner VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,  -- hands.created_at (파티션 키)
+
+    CONSTRAINT uq_premium_hands_hand UNIQUE (table_id, hand_number)
+);
+
+COMMENT ON TABLE premium_hands IS '프리미엄 핸드 피드 (Full House 이상, hands 트리거로 갱신)';
+
+CREATE INDEX IF NOT EXISTS idx_premium_hands_rank ON premium_hands(rank_order, seq DESC);
+CREATE INDEX IF NOT EXISTS idx_premium_hands_created_at ON premium_hands(created_at);
+
+ALTER TABLE premium_hands ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on premium_hands"
+    ON premium_hands
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+CREATE POLICY "Authenticated read access on premium_hands"
+    ON premium_hands
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+-- ============================================================
+-- PART 2: 트리거
+-- ============================================================
+-- 새 항목이거나 값이 바뀐 경우에만 seq를 새로 받고 NOTIFY (같은 값 재수집은 무시)
+CREATE OR REPLACE FUNCTION sync_premium_hand()
+RETURNS TRIGGER AS $$
+DECLARE
+    new_rank_order SMALLINT;
+    entry premium_hands%ROWTYPE;
+BEGIN
+    new_rank_order := CASE NEW.hand_rank
+        WHEN 'royal_flush' THEN 1
+        WHEN 'straight_flush' THEN 2
+        WHEN 'four_of_a_kind' THEN 3
+        WHEN 'full_house' THEN 4
+    END;
+
+    -- Full House 미만으로 정정되면 피드에서 제거 + 제거 알림 (새 seq, 구독 피드가 항목을 지움)
+    IF new_rank_order IS NULL THEN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM premium_hands
+            WHERE table_id = NEW.table_id AND hand_number = NEW.hand_number
+            RETURNING * INTO entry;
+
+            IF FOUND THEN
+                PERFORM pg_notify('premium_hands', json_build_object(
+                    'seq', nextval(pg_get_serial_sequence('premium_hands', 'seq')),
+                    'removed', true,
+                    'hand_id', entry.hand_id,
+                    'table_id', entry.table_id,
+                    'hand_number', entry.hand_number
+                )::text);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO premium_hands (
+        hand_id, table_id, hand_number, hand_rank, rank_order, pot_size, winner, created_at
+    ) VALUES (
+        NEW.id, NEW.table_id, NEW.hand_number, NEW.hand_rank, new_rank_order,
+        NEW.pot_size, NEW.winner, NEW.created_at
+    )
+    ON CONFLICT (table_id, hand_number) DO UPDATE SET
+        seq = nextval(pg_get_serial_sequence('premium_hands', 'seq')),
+        hand_id = EXCLUDED.hand_id,
+        hand_rank = EXCLUDED.hand_rank,
+        rank_order = EXCLUDED.rank_order,
+        pot_size = EXCLUDED.pot_size,
+        winner = EXCLUDED.winner
+    WHERE (premium_hands.hand_rank, premium_hands.pot_size, premium_hands.winner)
+        IS DISTINCT FROM (EXCLUDED.hand_rank, EXCLUDED.pot_size, EXCLUDED.winner)
+    RETURNING * INTO entry;
+
+    IF FOUND THEN
+        PERFORM pg_notify('premium_hands', json_build_object(
+            'seq', entry.seq,
+            'hand_id', entry.hand_id,
+            'table_id', entry.table_id,
+            'hand_number', entry.hand_number,
+            'hand_rank', entry.hand_rank,
+            'rank_order', entry.rank_order,
+            'pot_size', entry.pot_size,
+            'winner', entry.winner,
+            'created_at', EXTRACT(EPOCH FROM entry.created_at)
+        )::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tr_hands_premium_feed ON hands;
+CREATE TRIGGER tr_hands_premium_feed
+    AFTER INSERT OR UPDATE OF hand_rank, pot_size, winner ON hands
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_premium_hand();
+
+-- ============================================================
+-- PART 3: 기존 데이터
+-- ============================================================
+INSERT INTO premium_hands (
+    hand_id, table_id, hand_number, hand_rank, rank_order, pot_size, winner, created_at
+)
+SELECT
+    id, table_id, hand_number, hand_rank,
+    CASE hand_rank
+        WHEN 'royal_flush' THEN 1
+        WHEN 'straight_flush' THEN 2
+        WHEN 'four_of_a_kind' THEN 3
+        WHEN 'full_house' THEN 4
+    END,
+    pot_size, winner, created_at
+FROM hands
+WHERE hand_rank IN ('royal_flush', 'straight_flush', 'four_of_a_kind', 'full_house')
+ORDER BY created_at, id
+ON CONFLICT (table_id, hand_number) DO NOTHING;
+
+-- ============================================================
+-- PART 4: v_premium_hands
+-- ============================================================
+-- premium_hands 기준으로 재정의
+DROP VIEW IF EXISTS v_premium_hands;
+CREATE VIEW v_premium_hands AS
+SELECT
+    h.*,
+    p.rank_order,
+    p.seq
+FROM premium_hands p
+JOIN hands h ON h.id = p.hand_id AND h.created_at = p.created_at
+ORDER BY p.rank_order, p.seq DESC;
+
+COMMENT ON VIEW v_premium_hands IS '프리미엄 핸드 조회용 뷰 (Full House 이상, premium_hands 순서)';
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Premium hand feed migration completed!';
+END $$;
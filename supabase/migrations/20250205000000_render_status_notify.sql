@@ -0,0 +1,45 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Status Notifications
+-- Version: 1.10.0
+-- Date: 2025-02-05
+-- Description: render_instructions 상태 전환 NOTIFY (monitor 실시간 피드)
+-- ============================================================
+-- monitor의 /live, /ws는 이 알림을 받아 상태 전환과 상태별 작업 수를
+-- DB를 다시 조회하지 않고 모든 연결에 전달한다.
+
+-- ============================================================
+-- PART 1: 트리거
+-- ============================================================
+CREATE OR REPLACE FUNCTION notify_render_status()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.status IS NOT DISTINCT FROM OLD.status THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM pg_notify('render_status', json_build_object(
+        'id', NEW.id,
+        'template_name', NEW.template_name,
+        'priority', NEW.priority,
+        'status', NEW.status,
+        'previous_status', CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END,
+        'worker_id', NEW.worker_id,
+        'at', EXTRACT(EPOCH FROM clock_timestamp())
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tr_render_instructions_status_notify ON render_instructions;
+CREATE TRIGGER tr_render_instructions_status_notify
+    AFTER INSERT OR UPDATE OF status ON render_instructions
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_render_status();
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render status notification migration completed!';
+END $$;
@@ -0,0 +1,42 @@
+-- ============================================================
+-- WSOP Automation Hub - Render Status Timings
+-- Version: 1.11.0
+-- Date: 2025-02-07
+-- Description: render_status 알림에 created_at / started_at / completed_at 추가
+-- ============================================================
+-- monitor의 /metrics는 이 시각들로 대기 시간(생성→시작)과 렌더 시간(시작→완료)
+-- 히스토그램을 채운다. 상태 전환마다 render_instructions를 다시 조회하지 않는다.
+
+-- ============================================================
+-- PART 1: 트리거 함수
+-- ============================================================
+CREATE OR REPLACE FUNCTION notify_render_status()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.status IS NOT DISTINCT FROM OLD.status THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM pg_notify('render_status', json_build_object(
+        'id', NEW.id,
+        'template_name', NEW.template_name,
+        'priority', NEW.priority,
+        'status', NEW.status,
+        'previous_status', CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END,
+        'worker_id', NEW.worker_id,
+        'created_at', EXTRACT(EPOCH FROM NEW.created_at),
+        'started_at', EXTRACT(EPOCH FROM NEW.started_at),
+        'completed_at', EXTRACT(EPOCH FROM NEW.completed_at),
+        'at', EXTRACT(EPOCH FROM clock_timestamp())
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- 완료 메시지
+-- ============================================================
+DO $$
+BEGIN
+    RAISE NOTICE 'Render status timings migration completed!';
+END $$;
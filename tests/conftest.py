@@ -0,0 +1,82 @@
+"""공용 테스트 대역 (실제 PostgreSQL 없이 Repository / 작업 클래스 검증)"""
+
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+
+class FakeDatabase:
+    """Database 대역
+
+    테이블 대신 응답 규칙을 등록한다. on(keyword, result)은 쿼리에 keyword가 들어 있으면
+    result를 반환하며, result가 함수면 params를 넘겨 호출한 결과를 반환한다
+    (함수 안에서 테스트의 상태를 바꿔 행 삭제 / 상태 전환 등을 흉내 냄).
+    먼저 등록한 규칙이 우선이고, 맞는 규칙이 없으면 조회는 [], 쓰기는 0을 반환한다.
+
+    Usage:
+        >>> db = FakeDatabase().on("FROM premium_hands", rows)
+        >>> await HandsRepository(db).get_premium_recent(10)
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self._rules: list[tuple[str, Optional[str], Any]] = []
+
+    def on(self, keyword: str, result: Any, method: Optional[str] = None) -> "FakeDatabase":
+        """응답 규칙 등록 (method를 주면 해당 메서드 호출에만 적용, 예: "execute_write")"""
+        self._rules.append((keyword, method, result))
+        return self
+
+    def _reply(self, method: str, query: str, params: Any, default: Any) -> Any:
+        self.calls.append((query, params))
+        for keyword, only, result in self._rules:
+            if keyword in query and only in (None, method):
+                return result(params) if callable(result) else result
+        return default
+
+    async def execute(self, query: str, params: Optional[dict] = None) -> list[dict]:
+        return self._reply("execute", query, params, [])
+
+    async def execute_write(self, query: str, params: Optional[dict] = None) -> int:
+        return self._reply("execute_write", query, params, 0)
+
+    async def execute_write_returning(
+        self, query: str, params: Optional[dict] = None
+    ) -> list[dict]:
+        return self._reply("execute_write_returning", query, params, [])
+
+    async def execute_many(self, query: str, params_list: list[dict]) -> int:
+        return self._reply("execute_many", query, list(params_list), len(params_list))
+
+    async def stream(self, query: str, params: Optional[dict] = None, batch_size: int = 1000):
+        rows = self._reply("stream", query, params, [])
+        for i in range(0, len(rows), batch_size):
+            yield rows[i:i + batch_size]
+
+
+class FakeListener:
+    """NOTIFY 구독 대역 (테스트가 넣은 이벤트 묶음을 차례로 반환, 시간 초과 시 [])"""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[list[dict]] = asyncio.Queue()
+
+    def notify(self, *events: dict) -> None:
+        self.queue.put_nowait(list(events))
+
+    async def wait(self, timeout: Optional[float] = None) -> list[dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+
+@pytest.fixture
+def db() -> FakeDatabase:
+    return FakeDatabase()
+
+
+@pytest.fixture
+def listener() -> FakeListener:
+    return FakeListener()
+
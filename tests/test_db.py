@@ -0,0 +1,250 @@
+"""DB 연결 테스트 (실제 PostgreSQL 연결 없이 검증 가능한 부분)"""
+
+import asyncio
+
+import asyncpg
+import pytest
+
+from shared.db.connection import Database, DatabaseSettings, PoolMetrics
+from shared.db.notify import RENDER_INSTRUCTIONS_CHANNEL, RenderInstructionListener
+
+
+class TestDatabasePool:
+    """연결 풀 설정 테스트"""
+
+    def test_null_pool_by_default(self):
+        """기본값은 NullPool"""
+        db = Database(DatabaseSettings(_env_file=None))
+        db._create_engine()
+
+        status = db.pool_status()
+        assert status["mode"] == "null"
+        assert "size" not in status
+
+    def test_queue_pool_settings(self):
+        """queue 모드는 풀 크기/overflow 설정 반영"""
+        settings = DatabaseSettings(
+            _env_file=None, DB_POOL_MODE="queue", DB_POOL_SIZE=7, DB_MAX_OVERFLOW=3
+        )
+        db = Database(settings)
+        db._create_engine()
+
+        status = db.pool_status()
+        assert status["mode"] == "queue"
+        assert status["size"] == 7
+        assert db._engine.sync_engine.pool._max_overflow == 3
+
+    async def test_warmup_skipped_without_pool(self):
+        """NullPool 모드에서는 워밍업하지 않음"""
+        db = Database(DatabaseSettings(_env_file=None, DB_POOL_WARMUP=3))
+        assert await db.warmup() == 0
+
+    async def test_warmup_closes_opened_connections_on_failure(self):
+        """일부 연결이 실패해도 열린 연결은 모두 닫고 오류 전달"""
+        engine = FlakyEngine(fail_on=3)
+        db = Database(
+            DatabaseSettings(_env_file=None, DB_POOL_MODE="queue", DB_POOL_SIZE=4)
+        )
+        db._engine = engine
+
+        with pytest.raises(ConnectionRefusedError):
+            await db.warmup(4)
+
+        assert engine.attempts == 4
+        assert len(engine.opened) == 3
+        assert all(conn.closed for conn in engine.opened)
+
+        engine.fail_on = None
+        assert await db.warmup(2) == 2
+        assert all(conn.closed for conn in engine.opened)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    async def execute(self, statement):
+        await asyncio.sleep(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class FlakyEngine:
+    """fail_on번째 connect만 실패하는 엔진 대역"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.attempts = 0
+        self.opened: list[FakeConnection] = []
+
+    async def connect(self):
+        self.attempts += 1
+        if self.attempts == self.fail_on:
+            await asyncio.sleep(0.05)  # 다른 연결이 모두 열린 뒤 실패
+            raise ConnectionRefusedError("db down")
+        await asyncio.sleep(0.01)
+        conn = FakeConnection()
+        self.opened.append(conn)
+        return conn
+
+
+class SlowQueryDatabase(Database):
+    """execute를 대체하여 동시 실행 수를 기록"""
+
+    def __init__(self, settings: DatabaseSettings):
+        super().__init__(settings)
+        self.running = 0
+        self.peak = 0
+
+    async def execute(self, query, params=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return [{"query": query, "params": params}]
+
+
+class TestExecuteManyConcurrent:
+    """execute_many_concurrent 테스트"""
+
+    async def test_results_in_order(self):
+        """결과는 입력 순서, 쿼리는 동시에 실행"""
+        db = SlowQueryDatabase(DatabaseSettings(_env_file=None))
+
+        results = await db.execute_many_concurrent(
+            ["SELECT 1", ("SELECT :x", {"x": 2}), "SELECT 3"]
+        )
+
+        assert [r[0]["query"] for r in results] == ["SELECT 1", "SELECT :x", "SELECT 3"]
+        assert results[1][0]["params"] == {"x": 2}
+        assert db.peak == 3
+
+    async def test_limited_by_pool_size(self):
+        """풀 모드에서는 DB_POOL_SIZE 이상 동시에 연결하지 않음"""
+        db = SlowQueryDatabase(
+            DatabaseSettings(_env_file=None, DB_POOL_MODE="queue", DB_POOL_SIZE=2)
+        )
+
+        results = await db.execute_many_concurrent([f"SELECT {i}" for i in range(6)])
+
+        assert len(results) == 6
+        assert db.peak == 2
+
+    async def test_coroutines_share_limit(self):
+        """Repository 호출(코루틴)도 쿼리와 같은 동시 실행 제한"""
+        db = SlowQueryDatabase(
+            DatabaseSettings(_env_file=None, DB_POOL_MODE="queue", DB_POOL_SIZE=2)
+        )
+
+        async def count():
+            rows = await db.execute("SELECT COUNT(*)")
+            return len(rows)
+
+        results = await db.execute_many_concurrent([count(), "SELECT 1", count(), count()])
+
+        assert results[0] == 1
+        assert results[1][0]["query"] == "SELECT 1"
+        assert db.peak == 2
+
+    async def test_empty(self):
+        """빈 목록"""
+        db = SlowQueryDatabase(DatabaseSettings(_env_file=None))
+        assert await db.execute_many_concurrent([]) == []
+
+
+class TestPoolMetrics:
+    """PoolMetrics 테스트"""
+
+    def test_wait_snapshot(self):
+        """대기 시간 평균/최대"""
+        metrics = PoolMetrics()
+        metrics.record_wait(0.002)
+        metrics.record_wait(0.004)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["acquires"] == 2
+        assert snapshot["wait_avg_ms"] == pytest.approx(3.0)
+        assert snapshot["wait_max_ms"] == pytest.approx(4.0)
+
+
+class TestRenderInstructionListener:
+    """NOTIFY 구독자 테스트 (연결 없이 콜백/대체 polling 검증)"""
+
+    async def test_fallback_poll_when_disconnected(self):
+        """연결이 없으면 fallback 주기만큼 기다린 뒤 빈 리스트 반환"""
+        listener = RenderInstructionListener(
+            DatabaseSettings(_env_file=None), fallback_poll_interval=0.01
+        )
+
+        assert listener.connected is False
+        assert await listener.wait(timeout=1) == []
+
+    async def test_notify_payload_drained(self):
+        """수신한 payload는 한 번의 wait로 모두 반환"""
+
+        class _OpenConnection:
+            def is_closed(self):
+                return False
+
+        listener = RenderInstructionListener(DatabaseSettings(_env_file=None))
+        listener._conn = _OpenConnection()
+        listener._on_notify(None, 1, RENDER_INSTRUCTIONS_CHANNEL, '{"id": 1, "priority": 3}')
+        listener._on_notify(None, 1, RENDER_INSTRUCTIONS_CHANNEL, '{"id": 2, "priority": 5}')
+
+        events = await listener.wait(timeout=1)
+        assert [e["id"] for e in events] == [1, 2]
+
+    async def test_disconnect_wakes_blocked_waiter(self):
+        """알림을 무기한 기다리던 워커도 연결이 끊기면 깨어나 polling으로 전환"""
+
+        class _OpenConnection:
+            def is_closed(self):
+                return False
+
+        async def refuse():
+            raise ConnectionRefusedError("db down")
+
+        listener = RenderInstructionListener(
+            DatabaseSettings(_env_file=None), fallback_poll_interval=0.01, reconnect_interval=0.01
+        )
+        listener._conn = _OpenConnection()
+        listener._connect = refuse
+        waiter = asyncio.create_task(listener.wait(timeout=None))
+        await asyncio.sleep(0)
+
+        listener._on_terminate(None)
+
+        assert await asyncio.wait_for(waiter, 1) == [{"disconnected": True}]
+        assert listener.connected is False
+        assert await listener.wait(timeout=1) == []
+        await listener.close()
+
+    async def test_listen_failure_closes_connection(self, monkeypatch):
+        """connect 후 LISTEN 등록이 실패하면 연결을 닫고 재연결 루프로 전환"""
+
+        class _BrokenConnection:
+            terminated = False
+
+            async def add_listener(self, channel, callback):
+                raise asyncpg.InterfaceError("connection is closed")
+
+            def terminate(self):
+                self.terminated = True
+
+        conn = _BrokenConnection()
+
+        async def connect(**kwargs):
+            return conn
+
+        monkeypatch.setattr(asyncpg, "connect", connect)
+        listener = RenderInstructionListener(
+            DatabaseSettings(_env_file=None), reconnect_interval=0.01
+        )
+
+        await listener.start()
+
+        assert conn.terminated is True
+        assert listener.connected is False
+        assert listener._reconnect_task is not None
+        await listener.close()
@@ -0,0 +1,213 @@
+"""GFX 세션 스트리밍 적재 테스트"""
+
+import io
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from shared.ingest.gfx_session import (
+    GfxSessionIngester,
+    _event_rows,
+    _hand_row,
+    _parse_duration,
+    _player_rows,
+    iter_gfx_session,
+)
+
+SESSION = {
+    "ID": 638961999170907267,
+    "CreatedDateTimeUTC": "2025-10-15T10:54:43.1234567Z",
+    "EventTitle": "WSOP 2025 Main Event",
+    "Type": "FEATURE_TABLE",
+    "Hands": [
+        {
+            "HandNum": 1,
+            "Duration": "PT2M56.2628165S",
+            "FlopDrawBlinds": {"ButtonPlayerNum": 2, "BigBlindAmt": 2000},
+            "Players": [
+                {"PlayerNum": 1, "Name": "Alice", "HoleCards": ["As", "Kh"],
+                 "Stats": {"VPIPPercent": 25.0}},
+                {"PlayerNum": 2, "Name": "Bob", "HoleCards": ["Qd", "Qc"]},
+            ],
+            "Events": [
+                {"Type": "BET", "PlayerNum": 1, "BetAmt": 5000},
+                {"Type": "BOARD_CARD", "BoardCards": ["2c", "7d", "Ts"]},
+                {"Type": "BOARD_CARD", "BoardCards": ["Jh"], "BoardNum": 1},
+            ],
+        },
+        {"HandNum": 2, "Players": [], "Events": []},
+    ],
+    "SoftwareVersion": "3.2.1",
+}
+
+
+class TestIterGfxSession:
+    """스트리밍 파서 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_matches_json_load(self, chunk_size):
+        """청크 경계와 무관하게 json.load와 같은 결과"""
+        raw = json.dumps(SESSION, indent=2)
+        items = list(iter_gfx_session(io.StringIO(raw), chunk_size=chunk_size))
+
+        kinds = [kind for kind, _ in items]
+        assert kinds == ["session", "hand", "hand", "session_end"]
+        assert items[0][1]["ID"] == SESSION["ID"]
+        assert "SoftwareVersion" not in items[0][1]
+        assert [hand for kind, hand in items if kind == "hand"] == SESSION["Hands"]
+        assert items[-1][1]["SoftwareVersion"] == "3.2.1"
+
+    def test_bytes_input(self):
+        """바이너리 파일 (UTF-8 멀티바이트가 청크 경계에 걸려도)"""
+        raw = json.dumps({"ID": 1, "EventTitle": "월드 시리즈", "Hands": []}, ensure_ascii=False)
+        items = list(iter_gfx_session(io.BytesIO(raw.encode("utf-8")), chunk_size=3))
+
+        assert items[0] == ("session", {"ID": 1, "EventTitle": "월드 시리즈"})
+
+    def test_truncated_file(self):
+        """잘린 파일은 ValueError"""
+        raw = json.dumps(SESSION)[:-40]
+        with pytest.raises(ValueError):
+            list(iter_gfx_session(io.StringIO(raw), chunk_size=16))
+
+
+class TestRowBuilders:
+    """poker_* 행 변환 테스트"""
+
+    def test_hand_row(self):
+        hand = SESSION["Hands"][0]
+        row = _hand_row(hand)
+
+        assert row["hand_num"] == 1
+        assert row["duration_seconds"] == pytest.approx(176.2628165)
+        assert row["button_seat"] == 2
+        assert json.loads(row["community_cards"]) == ["2c", "7d", "Ts", "Jh"]
+
+    def test_player_and_event_rows(self):
+        hand = SESSION["Hands"][0]
+
+        players = _player_rows(10, hand)
+        events = _event_rows(10, hand)
+
+        assert [p["seat_num"] for p in players] == [1, 2]
+        assert players[0]["vpip_percent"] == 25.0
+        assert [e["event_order"] for e in events] == [0, 1, 2]
+        assert events[0]["board_cards"] is None
+
+    def test_event_order_mixed_uses_index(self):
+        """Order가 일부만 있으면 배열 순서로 통일 (핸드 안에서 event_order 유일)"""
+        hand = {"Events": [
+            {"Type": "BET", "Order": 1},
+            {"Type": "CALL"},
+            {"Type": "FOLD", "Order": 0},
+        ]}
+
+        assert [e["event_order"] for e in _event_rows(10, hand)] == [0, 1, 2]
+
+        hand = {"Events": [{"Type": "BET", "Order": 5}, {"Type": "CALL", "Order": 7}]}
+        assert [e["event_order"] for e in _event_rows(10, hand)] == [5, 7]
+
+    def test_parse_duration(self):
+        assert _parse_duration("PT1H2M3S") == 3723
+        assert _parse_duration("bogus") is None
+
+
+class IngestFakeDatabase:
+    """세션 upsert / 배치 트랜잭션을 기록하는 Database 대역
+
+    poker_hands upsert는 hand_num + 100을 id로 돌려준다.
+    """
+
+    def __init__(self):
+        self.session_params: list[dict] = []
+        self.transactions: list[list[tuple[str, object]]] = []
+
+    async def execute_write_returning(self, query, params=None):
+        self.session_params.append(params)
+        return [{"id": 5}]
+
+    @asynccontextmanager
+    async def session(self):
+        calls: list[tuple[str, object]] = []
+        self.transactions.append(calls)
+        yield FakeSession(calls)
+
+
+class FakeSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def execute(self, statement, params=None):
+        query = str(statement)
+        self.calls.append((query, params))
+        if "INSERT INTO poker_hands" in query:
+            return [SimpleNamespace(id=num + 100, hand_num=num) for num in params["hand_num"]]
+        return []
+
+
+def session_with_hands(*hand_nums):
+    hands = [
+        {**SESSION["Hands"][0], "HandNum": num} if num == 1 else {"HandNum": num}
+        for num in hand_nums
+    ]
+    return io.StringIO(json.dumps({**SESSION, "Hands": hands}))
+
+
+class TestGfxSessionIngester:
+    """배치 저장 테스트 (hands unnest 1회 + players/events executemany)"""
+
+    async def test_batches(self):
+        db = IngestFakeDatabase()
+        ingester = GfxSessionIngester(db, batch_size=2, validate=False)
+
+        stats = await ingester.ingest(session_with_hands(1, 2, 3, 4, 5))
+
+        assert stats.session_id == 5
+        assert stats.gfx_session_id == SESSION["ID"]
+        assert (stats.hands, stats.batches) == (5, 3)
+        assert (stats.players, stats.events) == (2, 3)
+        assert len(db.transactions) == 3
+        # SoftwareVersion은 Hands 뒤에 있으므로 세션을 한 번 더 갱신
+        assert [p["software_version"] for p in db.session_params] == [None, "3.2.1"]
+
+    async def test_hands_unnest_upsert(self):
+        """배치 전체를 배열 파라미터 하나로, 같은 HandNum은 마지막 것만"""
+        db = IngestFakeDatabase()
+        ingester = GfxSessionIngester(db, validate=False)
+
+        await ingester.ingest(session_with_hands(1, 2, 2))
+
+        [calls] = db.transactions
+        query, params = calls[0]
+        assert "FROM unnest(" in query
+        assert "ON CONFLICT (session_id, hand_num) DO UPDATE" in query
+        assert params["session_id"] == 5
+        assert params["hand_num"] == [1, 2]
+        assert params["button_seat"] == [2, None]
+        assert [json.loads(c) for c in params["community_cards"]] == [["2c", "7d", "Ts", "Jh"], []]
+
+    async def test_players_and_events_executemany(self):
+        """players / events는 핸드 id를 붙여 executemany 한 번씩"""
+        db = IngestFakeDatabase()
+        ingester = GfxSessionIngester(db, validate=False)
+
+        await ingester.ingest(session_with_hands(1, 2))
+
+        [calls] = db.transactions
+        assert len(calls) == 3
+        players_query, players = calls[1]
+        events_query, events = calls[2]
+        assert "INSERT INTO poker_players" in players_query
+        assert [(p["hand_id"], p["seat_num"]) for p in players] == [(101, 1), (101, 2)]
+        assert "INSERT INTO poker_events" in events_query
+        assert [(e["hand_id"], e["event_order"]) for e in events] == [(101, 0), (101, 1), (101, 2)]
+
+    async def test_no_players_or_events_skips_executemany(self):
+        db = IngestFakeDatabase()
+
+        await GfxSessionIngester(db, validate=False).ingest(session_with_hands(2))
+
+        [calls] = db.transactions
+        assert len(calls) == 1
@@ -0,0 +1,123 @@
+"""칩 순위 인덱스 테스트"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from shared.leaderboard import Leaderboard, LeaderboardRegistry
+from shared.models.tournament import PlayerStanding
+
+
+def standings(count: int) -> list[PlayerStanding]:
+    nationalities = ["US", "KR", "FR"]
+    return [
+        PlayerStanding(
+            rank=i + 1,
+            name=f"Player {i:04d}",
+            nationality=nationalities[i % 3],
+            chips=(count - i) * 1000,
+        )
+        for i in range(count)
+    ]
+
+
+class TestLeaderboard:
+    """Leaderboard 조회/갱신 테스트"""
+
+    def test_top_and_rank(self):
+        """칩 순 top N, 순위, 칩 차이"""
+        board = Leaderboard("WSOP2025-001", reversed(standings(10)))
+
+        top = board.top(3)
+        assert [row["name"] for row in top] == ["Player 0000", "Player 0001", "Player 0002"]
+        assert [row["rank"] for row in top] == [1, 2, 3]
+        assert board.rank_of("Player 0005") == 6
+        assert board.chip_gap("Player 0005") == 1000
+        assert board.chip_gap("Player 0000") is None
+        assert board.rank_of("Nobody") is None
+
+    def test_nationality_slice(self):
+        """국적별 top N (rank는 전체 순위)"""
+        board = Leaderboard("WSOP2025-001", standings(10))
+
+        korean = board.top(2, nationality="KR")
+        assert [row["name"] for row in korean] == ["Player 0001", "Player 0004"]
+        assert [row["rank"] for row in korean] == [2, 5]
+        assert board.top(5, nationality="JP") == []
+        assert board.nationalities() == {"US": 4, "KR": 3, "FR": 3}
+
+    def test_ties_ordered_by_name(self):
+        """같은 칩이면 이름순"""
+        board = Leaderboard("E", [
+            PlayerStanding(rank=1, name="Bob", chips=500),
+            PlayerStanding(rank=2, name="Alice", chips=500),
+        ])
+
+        assert [row["name"] for row in board.top()] == ["Alice", "Bob"]
+        assert board.chip_gap("Bob") == 0
+
+    def test_apply_incremental(self):
+        """바뀐 플레이어만 갱신"""
+        board = Leaderboard("WSOP2025-001", standings(10))
+        new = standings(10)
+        new[9] = PlayerStanding(rank=1, name="Player 0009", nationality="FR", chips=99_000)
+        new[3] = new[3].model_copy(update={"rank": 99})  # CSV rank만 변경 → 무시
+        del new[5]
+
+        changed, removed = board.apply(new)
+
+        assert [s.name for s in changed] == ["Player 0009"]
+        assert removed == ["Player 0005"]
+        assert board.rank_of("Player 0009") == 1
+        assert board.chip_gap("Player 0000") == 89_000
+        assert len(board) == 9
+        assert "Player 0005" not in board
+        assert board.nationalities() == {"US": 3, "KR": 3, "FR": 3}
+
+    def test_queries_sub_millisecond(self):
+        """5000명 기준 조회/갱신이 1ms 미만"""
+        board = Leaderboard("WSOP2025-001", standings(5000))
+
+        started = time.perf_counter()
+        for _ in range(100):
+            board.top(10)
+            board.top(10, nationality="KR")
+            board.rank_of("Player 2500")
+            board.chip_gap("Player 2500")
+        per_query = (time.perf_counter() - started) / 400
+
+        started = time.perf_counter()
+        for chips in range(100):
+            board.upsert_player(PlayerStanding(
+                rank=1, name="Player 4999", nationality="KR", chips=10_000_000 + chips,
+            ))
+        per_update = (time.perf_counter() - started) / 100
+
+        assert per_query < 0.001
+        assert per_update < 0.001
+        assert board.rank_of("Player 4999") == 1
+
+
+class TestLeaderboardRegistry:
+    """updated_at 기반 무효화 테스트"""
+
+    def test_stale_board_invalidated(self):
+        """DB updated_at이 더 새로우면 None (다시 로드)"""
+        loaded_at = datetime(2025, 1, 20, 12, 0, tzinfo=timezone.utc)
+        registry = LeaderboardRegistry()
+        registry.put(Leaderboard("E", standings(3), updated_at=loaded_at))
+
+        assert registry.get("E", updated_at=loaded_at) is not None
+        assert registry.get("E") is not None
+        assert registry.get("E", updated_at=loaded_at + timedelta(seconds=1)) is None
+        assert len(registry) == 0
+
+    def test_invalidate(self):
+        """명시적 무효화"""
+        registry = LeaderboardRegistry()
+        registry.put(Leaderboard("A"))
+        registry.put(Leaderboard("B"))
+
+        registry.invalidate("A")
+        assert registry.get("A") is None and registry.get("B") is not None
+        registry.invalidate()
+        assert len(registry) == 0
@@ -0,0 +1,242 @@
+"""메트릭 / 계측 테스트"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from monitor.stats import StatsCache
+from shared.db.connection import Database, DatabaseSettings
+from shared.db.repositories import RenderDeadLettersRepository, RenderInstructionsRepository
+from shared.metrics import (
+    MetricsRegistry,
+    current_operation,
+    get_registry,
+    observe_render_transition,
+    set_queue_depth,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    get_registry().clear()
+    yield
+    get_registry().clear()
+
+
+def sample(name, **labels):
+    """전역 레지스트리 출력에서 값 하나 찾기"""
+    selector = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    prefix = f"{name}{{{selector}}} " if labels else f"{name} "
+    for line in get_registry().render().splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix):])
+    return None
+
+
+class TestRegistry:
+    """Prometheus 텍스트 형식"""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry(enabled=True)
+        requests = registry.counter("requests_total", "Requests", ("path",))
+        depth = registry.gauge("queue_depth", "Depth")
+
+        requests.labels("/stats").inc()
+        requests.labels("/stats").inc(2)
+        requests.labels('/a"b').inc()
+        depth.set(4)
+
+        assert registry.render().splitlines() == [
+            "# HELP requests_total Requests",
+            "# TYPE requests_total counter",
+            'requests_total{path="/stats"} 3',
+            'requests_total{path="/a\\"b"} 1',
+            "# HELP queue_depth Depth",
+            "# TYPE queue_depth gauge",
+            "queue_depth 4",
+        ]
+
+    def test_histogram_cumulative_buckets(self):
+        registry = MetricsRegistry(enabled=True)
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+        assert "latency_seconds_sum 3.65" in lines
+
+    def test_register_is_idempotent(self):
+        registry = MetricsRegistry(enabled=True)
+        first = registry.counter("jobs_total", "Jobs", ("kind",))
+
+        assert registry.counter("jobs_total", "Jobs", ("kind",)) is first
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total", "Jobs", ("kind",))
+        with pytest.raises(ValueError):
+            first.labels("a", "b")
+
+
+DEAD_LETTER_ROWS = [
+    {"error_kind": "permanent", "count": 2},
+    {"error_kind": "transient", "count": 1},
+]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+        self.rowcount = len(rows)
+
+    def keys(self):
+        return list(self.rows[0]) if self.rows else []
+
+    def fetchall(self):
+        return [tuple(row.values()) for row in self.rows]
+
+
+class FakeConnection:
+    def __init__(self, database):
+        self.database = database
+
+    async def execute(self, statement, params):
+        self.database.operations.append(current_operation())
+        if self.database.fail:
+            raise ConnectionError("db down")
+        return FakeResult(self.database.rows)
+
+
+class ConnectionlessDatabase(Database):
+    """실제 Database 메서드(계측 포함)를 연결 대신 고정 결과로 실행"""
+
+    def __init__(self, rows=(), fail=False):
+        super().__init__(DatabaseSettings(_env_file=None))
+        self.rows = list(rows)
+        self.fail = fail
+        self.operations: list[str] = []
+
+    @asynccontextmanager
+    async def _connect(self, begin=False):
+        yield FakeConnection(self)
+
+
+class TestQueryInstrumentation:
+    """쿼리 / Repository 메서드 계측"""
+
+    async def test_queries_labeled_by_repository_method(self):
+        db = ConnectionlessDatabase(rows=DEAD_LETTER_ROWS)
+
+        stats = await RenderDeadLettersRepository(db).get_stats()
+        await db.execute("SELECT 1")
+
+        assert stats["total"] == 3
+        method = "RenderDeadLettersRepository.get_stats"
+        assert db.operations == [method, "adhoc"]
+        labels = {"operation": method, "kind": "read"}
+        assert sample("db_query_duration_seconds_count", **labels) == 1
+        assert sample("db_query_rows_total", **labels) == 2
+        assert sample("db_query_rows_total", operation="adhoc", kind="read") == 2
+        assert sample("repository_call_duration_seconds_count", method=method) == 1
+        assert current_operation() == "adhoc"
+
+    async def test_write_rows(self):
+        db = ConnectionlessDatabase(rows=[{"id": 1}])
+
+        assert await RenderInstructionsRepository(db).renew_lease(1, "ae-node-1") is True
+
+        labels = {"operation": "RenderInstructionsRepository.renew_lease", "kind": "write"}
+        assert sample("db_query_rows_total", **labels) == 1
+
+    async def test_errors_counted(self):
+        db = ConnectionlessDatabase(fail=True)
+
+        with pytest.raises(ConnectionError):
+            await RenderInstructionsRepository(db).get_stats()
+
+        method = "RenderInstructionsRepository.get_stats"
+        assert sample(
+            "db_query_errors_total", operation=method, kind="read", error="ConnectionError"
+        ) == 1
+        assert sample(
+            "repository_call_errors_total", method=method, error="ConnectionError"
+        ) == 1
+
+    async def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(get_registry(), "enabled", False)
+        db = ConnectionlessDatabase(rows=DEAD_LETTER_ROWS)
+
+        await RenderDeadLettersRepository(db).get_stats()
+
+        assert db.operations == ["adhoc"]
+        assert "db_query_rows_total{" not in get_registry().render()
+
+
+class TestRenderMetrics:
+    """렌더 대기 / 렌더 시간, 큐 깊이"""
+
+    def test_transition_timings(self):
+        base = 1_738_000_000.0
+        observe_render_transition({
+            "id": 1, "template_name": "leaderboard", "status": "processing",
+            "created_at": base, "started_at": base + 12, "completed_at": None,
+        })
+        observe_render_transition({
+            "id": 1, "template_name": "leaderboard", "status": "completed",
+            "created_at": base, "started_at": base + 12, "completed_at": base + 40,
+        })
+        observe_render_transition({"id": 2, "template_name": "sponsor", "status": "pending"})
+
+        assert sample("render_transitions_total", status="processing") == 1
+        assert sample("render_transitions_total", status="pending") == 1
+        assert sample("render_queue_wait_seconds_sum", template="leaderboard") == 12
+        assert sample(
+            "render_run_seconds_sum", template="leaderboard", status="completed"
+        ) == 28
+        assert sample("render_queue_wait_seconds_count", template="sponsor") is None
+
+    def test_queue_depth_reports_missing_statuses_as_zero(self):
+        set_queue_depth({"pending": 4, "failed": 1})
+
+        assert sample("render_queue_depth", status="pending") == 4
+        assert sample("render_queue_depth", status="processing") == 0
+
+
+class TestMetricsEndpoint:
+    """/metrics"""
+
+    def test_exposition(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        import monitor.main
+
+        async def loader():
+            return {"render_instructions": {"pending": 5, "processing": 2}}
+
+        monkeypatch.setattr(monitor.main, "stats_cache", StatsCache(loader, ttl=60))
+
+        response = TestClient(monitor.main.app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'render_queue_depth{status="pending"} 5' in response.text
+        assert "# TYPE db_query_duration_seconds histogram" in response.text
+        assert "db_pool_checkouts " in response.text
+
+    def test_stats_failure_still_exposes(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        import monitor.main
+
+        async def loader():
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(monitor.main, "stats_cache", StatsCache(loader, ttl=60))
+
+        response = TestClient(monitor.main.app).get("/metrics")
+
+        assert response.status_code == 200
+        assert "render_queue_depth{" not in response.text
@@ -165,3 +165,164 @@ class TestRenderOutputModel:
         assert output.instruction_id == 1
         assert output.status == RenderStatus.COMPLETED
         assert output.file_size == 1024000
+
+
+class TestTrustedRows:
+    """신뢰된 DB 행 고속 생성 테스트"""
+
+    @staticmethod
+    def hand_row(i: int = 1) -> dict:
+        return {
+            "id": i,
+            "table_id": "feature_1",
+            "hand_number": i,
+            "source": "rfid",
+            "hand_rank": "full_house",
+            "pot_size": 125000,
+            "winner": "Player 1",
+            "players_json": [
+                {"seat": seat, "name": f"Player {seat}", "stack": 50000 * seat,
+                 "hole_cards": ["As", "Kd"]}
+                for seat in range(1, 10)
+            ],
+            "community_cards_json": ["Ah", "Ad", "Kc", "7s", "2h"],
+            "actions_json": [{"seat": 1, "action": "raise", "amount": 3000}],
+            "duration_seconds": 95,
+            "created_at": datetime(2025, 1, 1, 12, 0),
+            "updated_at": datetime(2025, 1, 1, 12, 2),
+        }
+
+    def test_hand_matches_validated(self):
+        """검증 경로와 동일한 결과"""
+        row = self.hand_row()
+        trusted = Hand.from_trusted_row(row)
+        validated = Hand.from_db_row(row)
+
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.to_db_dict() == validated.to_db_dict()
+        assert trusted == validated
+        assert trusted.is_premium is True
+
+    def test_players_parsed_lazily(self):
+        """players는 처음 접근할 때 변환"""
+        hand = Hand.from_trusted_row(self.hand_row())
+
+        assert hand.players.loaded is False
+        assert hand.table_id == "feature_1"
+        assert hand.players.loaded is False
+
+        assert len(hand.players) == 9
+        assert hand.players.loaded is True
+        assert isinstance(hand.players[0], PlayerInfo)
+        assert hand.players[0].hole_cards == ["As", "Kd"]
+
+    def test_dump_loads_lazy_fields(self):
+        """직렬화 시 지연 필드도 포함"""
+        hand = Hand.from_trusted_row(self.hand_row())
+        dumped = hand.model_dump_json()
+
+        assert '"name":"Player 9"' in dumped
+
+    def test_missing_optional_columns(self):
+        """NULL/누락 컬럼은 기본값"""
+        hand = Hand.from_trusted_row({
+            "table_id": "feature_1", "hand_number": 1, "source": "csv",
+            "players_json": None, "hand_rank": None,
+        })
+
+        assert hand.players == []
+        assert hand.hand_rank is None
+        assert hand.source == SourceType.CSV
+        assert isinstance(hand.created_at, datetime)
+
+    def test_json_text_columns(self):
+        """JSON 텍스트(컬럼::text)는 접근 시 디코딩"""
+        import json
+
+        row = self.hand_row()
+        for key in ("players_json", "community_cards_json", "actions_json"):
+            row[key] = json.dumps(row[key])
+        hand = Hand.from_trusted_row(row)
+
+        assert hand.actions.loaded is False
+        assert hand.actions[0]["action"] == "raise"
+        assert hand.actions.loaded is True
+
+        # json.dumps는 list 내부 저장소를 직접 읽으므로 to_db_dict에서 먼저 디코딩
+        db_dict = Hand.from_trusted_row(row).to_db_dict()
+        assert json.loads(json.dumps(db_dict["community_cards_json"])) == [
+            "Ah", "Ad", "Kc", "7s", "2h"
+        ]
+        assert hand == Hand.from_db_row(self.hand_row())
+
+    def test_pickle_round_trip(self):
+        """지연 필드가 있는 모델도 pickle 가능 (변환 여부와 무관)"""
+        import pickle
+
+        row = self.hand_row()
+        row["actions_json"] = '[{"seat": 1, "action": "raise", "amount": 3000}]'
+        hand = Hand.from_trusted_row(row)
+        instruction = RenderInstruction.from_trusted_row({
+            "id": 1, "template_name": "leaderboard", "layer_data_json": '{"player_name": "John"}',
+        })
+
+        assert pickle.loads(pickle.dumps(hand)) == Hand.from_db_row(self.hand_row())
+        assert pickle.loads(pickle.dumps(hand.players))[8].name == "Player 9"
+        assert pickle.loads(pickle.dumps(instruction)).layer_data == {"player_name": "John"}
+
+        hand.actions.load()
+        assert pickle.loads(pickle.dumps(hand)).actions[0]["amount"] == 3000
+
+    def test_layer_data_lazy_dict(self):
+        """layer_data는 접근 시 디코딩"""
+        instruction = RenderInstruction.from_trusted_row({
+            "id": 1,
+            "template_name": "leaderboard",
+            "layer_data_json": '{"player_name": "John"}',
+            "output_settings_json": '{"fps": 60}',
+        })
+
+        assert instruction.layer_data.loaded is False
+        assert instruction.output_settings.fps == 60
+        assert instruction.model_dump()["layer_data"] == {"player_name": "John"}
+        assert instruction.layer_data.get("player_name") == "John"
+
+    def test_tournament_matches_validated(self):
+        """토너먼트 중첩 필드"""
+        row = {
+            "id": 3,
+            "name": "Main Event",
+            "event_code": "WSOP2025-001",
+            "blinds_json": [{"level": 1, "small_blind": 100, "big_blind": 200}],
+            "current_blinds_json": {"level": 1, "small_blind": 100, "big_blind": 200},
+            "payouts_json": [{"position": 1, "amount": 1000000}],
+            "standings_json": [
+                {"rank": r, "name": f"P{r}", "chips": 1000 * r} for r in range(1, 301)
+            ],
+        }
+        trusted = Tournament.from_trusted_row(row)
+        validated = Tournament.from_db_row(row)
+
+        assert trusted.current_blinds.duration_minutes == 60
+        assert trusted.standings[299].name == "P300"
+        dumped = trusted.model_dump(exclude={"created_at", "updated_at"})
+        assert dumped == validated.model_dump(exclude={"created_at", "updated_at"})
+
+    def test_instruction_matches_validated(self):
+        """렌더링 지시서 출력 설정"""
+        row = {
+            "id": 7,
+            "template_name": "premium_hand",
+            "layer_data_json": {"player_name": "John"},
+            "output_settings_json": {"format": "mov_alpha", "width": 1280},
+            "status": "processing",
+            "priority": 2,
+            "worker_id": "ae-1",
+            "created_at": datetime(2025, 1, 1),
+        }
+        trusted = RenderInstruction.from_trusted_row(row)
+
+        assert trusted.output_settings.format == OutputFormat.MOV_ALPHA
+        assert trusted.output_settings.height == 1080
+        assert trusted.status == RenderStatus.PROCESSING
+        assert trusted.model_dump() == RenderInstruction.from_db_row(row).model_dump()
@@ -0,0 +1,243 @@
+"""모니터링 서비스 테스트 (DB 없이 검증 가능한 부분)"""
+
+import asyncio
+
+import pytest
+
+from monitor.stats import StatsCache
+
+
+class CountingLoader:
+    """호출 횟수를 기록하는 통계 로더"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("db down")
+        return {"hands": {"total": self.calls}}
+
+
+class TestStatsCache:
+    """/stats 캐시 테스트"""
+
+    async def test_single_flight(self):
+        """동시 요청은 하나의 계산을 공유"""
+        loader = CountingLoader(delay=0.05)
+        cache = StatsCache(loader, ttl=60)
+
+        results = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+        assert loader.calls == 1
+        assert all(value == {"hands": {"total": 1}} for value, _ in results)
+
+    async def test_ttl_reuse_and_expiry(self):
+        """TTL 안에서는 재사용, 만료 후 재계산"""
+        loader = CountingLoader()
+        cache = StatsCache(loader, ttl=0.05)
+
+        await cache.get()
+        value, age = await cache.get()
+        assert loader.calls == 1
+        assert cache.hits == 1
+        assert 0 <= age < 0.05
+
+        await asyncio.sleep(0.06)
+        value, _ = await cache.get()
+        assert loader.calls == 2
+        assert value == {"hands": {"total": 2}}
+
+    async def test_error_not_cached(self):
+        """실패는 모든 대기자에게 전달되고 다음 요청에서 재시도"""
+        loader = CountingLoader(delay=0.01, fail=True)
+        cache = StatsCache(loader, ttl=60)
+
+        results = await asyncio.gather(cache.get(), cache.get(), return_exceptions=True)
+        assert loader.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.age is None
+
+        loader.fail = False
+        value, _ = await cache.get()
+        assert value == {"hands": {"total": 2}}
+
+    async def test_cancelled_request_keeps_refresh(self):
+        """요청이 취소되어도 진행 중인 계산은 완료"""
+        loader = CountingLoader(delay=0.05)
+        cache = StatsCache(loader, ttl=60)
+
+        request = asyncio.create_task(cache.get())
+        await asyncio.sleep(0.01)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+        value, _ = await cache.get()
+        assert loader.calls == 1
+        assert value == {"hands": {"total": 1}}
+
+    async def test_invalidate(self):
+        """invalidate 후 재계산"""
+        loader = CountingLoader()
+        cache = StatsCache(loader, ttl=60)
+
+        await cache.get()
+        cache.invalidate()
+        await cache.get()
+
+        assert loader.calls == 2
+
+    async def test_invalidate_while_waiting(self):
+        """계산 완료 직후 invalidate되어도 대기자는 이번 결과와 나이를 받음"""
+        loader = CountingLoader(delay=0.01)
+        cache = StatsCache(loader, ttl=60)
+
+        request = asyncio.create_task(cache.get())
+        await asyncio.sleep(0)
+        cache._inflight.add_done_callback(lambda _: cache.invalidate())
+        value, age = await request
+
+        assert value == {"hands": {"total": 1}}
+        assert age is not None and age >= 0
+
+
+class StatsLoader:
+    """render_instructions 상태별 수를 바꿔 가며 반환하는 통계 로더"""
+
+    def __init__(self):
+        self.calls = 0
+        self.queue = {"pending": 3, "processing": 1}
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        return {
+            "timestamp": f"t{self.calls}",
+            "hands": {"total": 100},
+            "render_instructions": dict(self.queue),
+        }
+
+
+def drain(subscription):
+    return [(m["event"], m["data"]) for m in subscription.get_nowait()]
+
+
+class TestLiveFeed:
+    """실시간 피드 생산자"""
+
+    async def test_transition_adjusts_queue_without_db(self):
+        from monitor.live import LiveFeed
+
+        loader = StatsLoader()
+        feed = LiveFeed(StatsCache(loader, ttl=60))
+        await feed.refresh()
+        subscription = feed.subscribe()
+
+        feed.apply_transition({"id": 7, "status": "processing", "previous_status": "pending"})
+        feed.apply_transition({"id": 8, "status": "pending", "previous_status": None})
+
+        assert drain(subscription) == [
+            ("render", {"id": 7, "status": "processing", "previous_status": "pending"}),
+            ("queue", {"pending": 2, "processing": 2}),
+            ("render", {"id": 8, "status": "pending", "previous_status": None}),
+            ("queue", {"pending": 3, "processing": 2}),
+        ]
+        assert loader.calls == 1
+
+    async def test_refresh_sends_only_changes(self):
+        from monitor.live import LiveFeed
+
+        loader = StatsLoader()
+        cache = StatsCache(loader, ttl=0)
+        feed = LiveFeed(cache)
+        await feed.refresh()
+        subscription = feed.subscribe()
+
+        await feed.refresh()  # timestamp만 바뀜
+        assert drain(subscription) == []
+
+        loader.queue = {"pending": 0, "processing": 2, "completed": 2}
+        await feed.refresh()
+        assert drain(subscription) == [
+            ("stats", {"render_instructions": loader.queue}),
+            ("queue", loader.queue),
+        ]
+
+    async def test_one_producer_for_many_subscribers(self, listener):
+        """구독자 수와 무관하게 통계는 주기당 한 번만 계산, 구독자가 없으면 계산 안 함"""
+        from monitor.live import LiveFeed
+
+        loader = StatsLoader()
+        feed = LiveFeed(StatsCache(loader, ttl=0), interval=0.01)
+
+        task = feed.start(listener)
+        await asyncio.sleep(0.05)
+        assert loader.calls == 0
+
+        subscriptions = [feed.subscribe() for _ in range(30)]
+        transition = {"id": 1, "status": "completed", "previous_status": "processing"}
+        listener.notify(transition)
+        await asyncio.sleep(0.05)
+        await feed.stop()
+
+        assert task.done()
+        assert 1 <= loader.calls <= 10
+        for subscription in subscriptions:
+            events = [event for event, _ in drain(subscription)]
+            assert "render" in events
+            assert subscription.closed
+
+    def test_format_sse(self):
+        from monitor.live import format_sse
+
+        frame = format_sse({"event": "queue", "data": {"pending": 2}})
+
+        assert frame == 'event: queue\ndata: {"pending": 2}\n\n'
+
+
+class TestLiveEndpoints:
+    """/live (SSE), /ws (WebSocket)"""
+
+    @pytest.fixture
+    def feed(self, monkeypatch):
+        import monitor.main
+        from monitor.live import LiveFeed
+
+        feed = LiveFeed(StatsCache(StatsLoader(), ttl=60))
+        monkeypatch.setattr(monitor.main, "live_feed", feed)
+        return feed
+
+    async def test_sse_stream(self, feed):
+        from monitor.main import live_events
+
+        class FakeRequest:
+            async def is_disconnected(self):
+                return False
+
+        stream = live_events(FakeRequest(), heartbeat_seconds=0.01)
+
+        snapshot = await stream.__anext__()
+        assert snapshot.startswith("event: snapshot\n")
+        assert '"pending": 3' in snapshot
+        assert feed.subscribers == 1
+
+        assert (await stream.__anext__()).startswith("event: ping\n")
+        feed.apply_transition({"id": 9, "status": "failed", "previous_status": "processing"})
+        assert (await stream.__anext__()).startswith("event: render\n")
+
+        await stream.aclose()
+        assert feed.subscribers == 0
+
+    def test_websocket(self, feed):
+        from fastapi.testclient import TestClient
+
+        from monitor.main import app
+
+        with TestClient(app).websocket_connect("/ws") as websocket:
+            snapshot = websocket.receive_json()
+            assert snapshot["event"] == "snapshot"
+            assert snapshot["data"]["queue"] == {"pending": 3, "processing": 1}
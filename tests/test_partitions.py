@@ -0,0 +1,385 @@
+"""파티션 관리 / 보관 작업 테스트"""
+
+import asyncio
+import gzip
+import json
+import re
+from datetime import date, datetime, timezone
+
+import pytest
+
+from shared.db import HandsRepository, PartitionMaintainer, PartitionManager, RetentionJob
+from shared.db.partitions import Partition
+from shared.metrics import get_registry
+from shared.models.hand import Hand
+
+UTC = timezone.utc
+
+_CREATE = re.compile(
+    r"CREATE TABLE IF NOT EXISTS (?P<name>\w+) PARTITION OF (?P<table>\w+) "
+    r"FOR VALUES FROM \('(?P<lower>[^']+)'\) TO \('(?P<upper>[^']+)'\)"
+)
+_ATTACH = re.compile(
+    r"ATTACH PARTITION (?P<name>\w+)\s+"
+    r"FOR VALUES FROM \('(?P<lower>[^']+)'\) TO \('(?P<upper>[^']+)'\)"
+)
+
+
+def day(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=UTC)
+
+
+class Catalog:
+    """hands 파티션 / hand_keys / 렌더 보관 대상을 메모리에 두고 FakeDatabase에 연결
+
+    partitions: {이름: (lower, upper)} - 'YYYY-MM-DD' 또는 MINVALUE (하한 없음)
+    default_rows: DEFAULT 파티션의 행 (default=None이면 DEFAULT 파티션 없음)
+    """
+
+    def __init__(
+        self, db, partitions=None, rows=(), archivable=(), hand_keys=None,
+        default="hands_default", default_rows=(),
+    ):
+        self.partitions = dict(partitions or {})
+        self.rows = {name: list(rows) for name in self.partitions}
+        self.default = default
+        self.default_rows = list(default_rows)
+        self.archivable = list(archivable)
+        self.hand_keys = dict(hand_keys or {})
+        self.dropped: list[str] = []
+        self.db = db
+        db.on("pg_get_expr", self.list_partitions)
+        db.on("CREATE TABLE", self.create)
+        db.on("DETACH PARTITION", self.detach)
+        db.on("DROP TABLE", self.drop)
+        db.on("DELETE FROM hand_keys", self.release_keys)
+        db.on("outputs_json", self.get_archivable)
+        db.on("DELETE FROM render_instructions", self.delete_archived)
+        db.on("INSERT INTO hand_keys", self.insert_hand)
+        db.on("reltuples", [{"estimate": 1_250_000}])
+        db.on("date_trunc", self.default_days)
+        db.on("SELECT * FROM", self.table_rows, method="stream")
+
+    @property
+    def query(self):
+        return self.db.calls[-1][0]
+
+    def list_partitions(self, params):
+        rows = []
+        for name, (lower, upper) in self.partitions.items():
+            lower = lower if lower == "MINVALUE" else f"'{lower} 00:00:00+00'"
+            rows.append({
+                "name": name, "bound": f"FOR VALUES FROM ({lower}) TO ('{upper} 00:00:00+00')",
+            })
+        if self.default:
+            rows.append({"name": self.default, "bound": "DEFAULT"})
+        return rows
+
+    def create(self, params):
+        match = _CREATE.search(self.query)
+        if match is None:  # DEFAULT 파티션이 있으면 행을 옮긴 뒤 ATTACH
+            assert f"DELETE FROM {self.default}" in self.query
+            match = _ATTACH.search(self.query)
+            lower, upper = day(match["lower"][:10]), day(match["upper"][:10])
+            moved = [r for r in self.default_rows if lower <= r["created_at"] < upper]
+            self.default_rows = [r for r in self.default_rows if r not in moved]
+            self.rows[match["name"]] = moved
+        self.partitions[match["name"]] = (match["lower"][:10], match["upper"][:10])
+        return 0
+
+    def default_days(self, params):
+        days = {r["created_at"].replace(hour=0, minute=0, second=0) for r in self.default_rows}
+        return [{"day": d} for d in sorted(days)]
+
+    def detach(self, params):
+        name = self.query.split()[-1]
+        del self.partitions[name]
+        return 0
+
+    def drop(self, params):
+        self.dropped.append(self.query.split()[-1])
+        return 0
+
+    def release_keys(self, params):
+        lower, upper = params.get("lower"), params["upper"]
+        released = [
+            key for key, created_at in self.hand_keys.items()
+            if (lower is None or created_at >= lower) and created_at < upper
+        ]
+        for key in released:
+            del self.hand_keys[key]
+        return len(released)
+
+    def table_rows(self, params):
+        return self.rows.get(self.query.split()[-1], [])
+
+    def get_archivable(self, params):
+        batch = [r for r in self.archivable if r["id"] > params["after_id"]]
+        return batch[: params["limit"]]
+
+    def delete_archived(self, params):
+        self.archivable = [r for r in self.archivable if r["id"] not in params["ids"]]
+        return len(params["ids"])
+
+    def insert_hand(self, params):
+        key = (params["table_id"], params["hand_number"])
+        created_at = self.hand_keys.setdefault(key, params["created_at"])
+        return [{"id": len(self.hand_keys), "created_at": created_at}]
+
+
+def read_jsonl_gz(path):
+    with gzip.open(path, "rt", encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp]
+
+
+class TestPartitionManager:
+    """파티션 목록 / 생성 / 분리"""
+
+    async def test_list_partitions_skips_default(self, db):
+        Catalog(db, partitions={
+            "hands_p20250202": ("2025-02-02", "2025-02-03"),
+            "hands_legacy": ("MINVALUE", "2025-02-01"),
+        })
+
+        partitions = await PartitionManager(db).list_partitions("hands")
+
+        assert [p.name for p in partitions] == ["hands_legacy", "hands_p20250202"]
+        assert partitions[0].lower is None
+        assert partitions[1].upper == day("2025-02-03")
+
+    async def test_ensure_partitions_skips_covered_days(self, db):
+        """이벤트 파티션이 덮는 날은 일별 파티션을 만들지 않음"""
+        catalog = Catalog(db, partitions={
+            "hands_p20250201": ("2025-02-01", "2025-02-02"),
+            "hands_pwsop2025_me": ("2025-02-03", "2025-02-05"),
+        })
+        manager = PartitionManager(db)
+
+        created = await manager.ensure_partitions("hands", days_ahead=5, today=date(2025, 2, 1))
+
+        assert created == ["hands_p20250202", "hands_p20250205", "hands_p20250206"]
+        assert catalog.partitions["hands_p20250202"] == ("2025-02-02", "2025-02-03")
+        assert await manager.ensure_partitions("hands", days_ahead=5, today=date(2025, 2, 1)) == []
+
+    async def test_create_partition_without_default(self, db):
+        catalog = Catalog(db, default=None)
+
+        await PartitionManager(db).create_partition("hands", day("2025-02-01"), day("2025-02-02"))
+
+        assert catalog.query.startswith("CREATE TABLE IF NOT EXISTS hands_p20250201 PARTITION OF")
+        assert catalog.partitions == {"hands_p20250201": ("2025-02-01", "2025-02-02")}
+
+    async def test_ensure_partitions_rehomes_default_rows(self, db):
+        """파티션이 떨어진 동안 DEFAULT에 쌓인 행을 일별 파티션으로 옮김"""
+        stranded = [
+            {"id": 1, "created_at": datetime(2025, 1, 30, 9, tzinfo=UTC)},
+            {"id": 2, "created_at": datetime(2025, 1, 30, 23, tzinfo=UTC)},
+            {"id": 3, "created_at": datetime(2025, 2, 1, 1, tzinfo=UTC)},
+        ]
+        catalog = Catalog(
+            db, partitions={"hands_p20250129": ("2025-01-29", "2025-01-30")},
+            default_rows=stranded,
+        )
+
+        created = await PartitionManager(db).ensure_partitions(
+            "hands", days_ahead=1, today=date(2025, 2, 1)
+        )
+
+        assert created == ["hands_p20250130", "hands_p20250201", "hands_p20250202"]
+        assert catalog.default_rows == []
+        assert [r["id"] for r in catalog.rows["hands_p20250130"]] == [1, 2]
+        assert [r["id"] for r in catalog.rows["hands_p20250201"]] == [3]
+
+    async def test_days_ahead(self, db):
+        Catalog(db, partitions={
+            "hands_p20250201": ("2025-02-01", "2025-02-02"),
+            "hands_pwsop2025_me": ("2025-02-02", "2025-02-04"),
+            "hands_p20250205": ("2025-02-05", "2025-02-06"),
+        })
+        manager = PartitionManager(db)
+
+        assert await manager.days_ahead("hands", today=date(2025, 2, 1)) == 3
+        assert await manager.days_ahead("hands", today=date(2025, 2, 4)) == 0
+
+    async def test_create_partition_validates_input(self, db):
+        catalog = Catalog(db)
+        manager = PartitionManager(db)
+        start, end = day("2025-07-03"), day("2025-07-17")
+
+        with pytest.raises(ValueError):
+            await manager.create_partition("hands", start, end, label="me; DROP TABLE hands")
+        with pytest.raises(ValueError):
+            await manager.create_partition("hands", end, start)
+        assert catalog.partitions == {}
+
+        assert await manager.create_partition("hands", start, end, label="wsop2025_me") == (
+            "hands_pwsop2025_me"
+        )
+        assert catalog.partitions == {"hands_pwsop2025_me": ("2025-07-03", "2025-07-17")}
+
+    async def test_detach_archives_and_drops(self, db, tmp_path):
+        catalog = Catalog(
+            db,
+            partitions={
+                "hands_legacy": ("MINVALUE", "2025-01-01"),
+                "hands_p20250101": ("2025-01-01", "2025-01-02"),
+                "hands_p20250102": ("2025-01-02", "2025-01-03"),
+            },
+            rows=[{"id": i, "hand_number": i, "created_at": "2024-12-31"} for i in range(3)],
+            hand_keys={
+                ("T1", 1): day("2024-12-31"),
+                ("T1", 2): day("2025-01-01"),
+                ("T1", 3): day("2025-01-02"),
+            },
+        )
+        manager = PartitionManager(db, archive_dir=tmp_path)
+
+        results = await manager.detach_before("hands", day("2025-01-02"))
+
+        assert [r["partition"] for r in results] == ["hands_legacy", "hands_p20250101"]
+        assert all(r["dropped"] and r["rows"] == 3 for r in results)
+        assert list(catalog.partitions) == ["hands_p20250102"]
+        assert catalog.dropped == ["hands_legacy", "hands_p20250101"]
+        assert read_jsonl_gz(tmp_path / "hands" / "hands_legacy.jsonl.gz")[2]["hand_number"] == 2
+
+        # 분리된 구간의 hand_keys 정리 (legacy는 하한 없음)
+        assert list(catalog.hand_keys) == [("T1", 3)]
+
+    async def test_detach_without_archive_dir_keeps_table(self, db):
+        catalog = Catalog(db, partitions={"hands_p20250101": ("2025-01-01", "2025-01-02")})
+
+        results = await PartitionManager(db).detach_before("hands", day("2025-02-01"))
+
+        assert results[0]["dropped"] is False
+        assert catalog.partitions == {}
+        assert catalog.dropped == []
+
+    def test_covers(self):
+        event = Partition(name="hands_pme", lower=day("2025-02-03"), upper=day("2025-02-05"))
+        assert event.covers(day("2025-02-04"), day("2025-02-05"))
+        assert not event.covers(day("2025-02-05"), day("2025-02-06"))
+
+
+class TestPartitionMaintainer:
+    """시작 시 / 주기적 파티션 생성, 남은 일수 경고"""
+
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        get_registry().clear()
+        yield
+        get_registry().clear()
+
+    async def test_run_once_creates_and_reports(self, db, caplog):
+        catalog = Catalog(db)
+        maintainer = PartitionMaintainer(db, days_ahead=2, min_days_ahead=2)
+
+        coverage = await maintainer.run_once(today=date(2025, 2, 1))
+
+        assert coverage == {"hands": 3}
+        assert sorted(catalog.partitions) == [
+            "hands_p20250201", "hands_p20250202", "hands_p20250203",
+        ]
+        assert 'db_partition_days_ahead{table="hands"} 3' in get_registry().render()
+        assert "partitions for only" not in caplog.text
+
+    async def test_warns_when_creation_fails(self, db, caplog):
+        def deny(params):
+            raise PermissionError("denied")
+
+        db.on("CREATE TABLE", deny)  # Catalog.create보다 먼저 등록
+        Catalog(db, partitions={"hands_p20250201": ("2025-02-01", "2025-02-02")})
+        maintainer = PartitionMaintainer(db, days_ahead=14, min_days_ahead=3)
+
+        coverage = await maintainer.run_once(today=date(2025, 2, 1))
+
+        assert coverage == {"hands": 1}
+        assert "failed to create partitions for hands: denied" in caplog.text
+        assert "hands has partitions for only 1 day(s) ahead (minimum 3)" in caplog.text
+
+    async def test_start_runs_immediately(self, db):
+        catalog = Catalog(db)
+        maintainer = PartitionMaintainer(db, days_ahead=0, interval=3600)
+
+        task = maintainer.start()
+        while not catalog.partitions:
+            await asyncio.sleep(0)
+        await maintainer.stop()
+
+        assert task.cancelled()
+        assert len(catalog.partitions) == 1
+        assert PartitionMaintainer(db, interval=0).start() is None
+
+
+class TestRetentionJob:
+    """보관 작업"""
+
+    def archivable(self, n):
+        return [
+            {
+                "id": i, "template_name": "leaderboard", "status": "completed",
+                "outputs_json": json.dumps([{"id": i * 10, "output_path": f"/nas/out/{i}.mov"}]),
+            }
+            for i in range(1, n + 1)
+        ]
+
+    async def test_archives_render_instructions_in_batches(self, db, tmp_path):
+        catalog = Catalog(db, archivable=self.archivable(5))
+        job = RetentionJob(db, archive_dir=tmp_path, keep_days=30, days_ahead=0, batch_size=2)
+
+        result = await job.archive_render_instructions(day("2025-01-01"))
+
+        assert result["rows"] == 5
+        assert catalog.archivable == []
+        records = read_jsonl_gz(result["files"][0])
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+        assert records[0]["outputs"] == [{"id": 10, "output_path": "/nas/out/1.mov"}]
+        assert "outputs_json" not in records[0]
+
+    async def test_run(self, db, tmp_path):
+        catalog = Catalog(
+            db,
+            partitions={"hands_p20250101": ("2025-01-01", "2025-01-02")},
+            archivable=self.archivable(1),
+        )
+        job = RetentionJob(db, archive_dir=tmp_path, keep_days=30, days_ahead=1)
+
+        result = await job.run(now=datetime(2025, 2, 10, 15, 30, tzinfo=UTC))
+
+        assert result["cutoff"] == "2025-01-11T00:00:00+00:00"
+        assert result["created"] == ["hands_p20250210", "hands_p20250211"]
+        assert [d["partition"] for d in result["detached"]] == ["hands_p20250101"]
+        assert result["render_instructions"]["rows"] == 1
+        assert sorted(catalog.partitions) == ["hands_p20250210", "hands_p20250211"]
+
+    async def test_dry_run_only_creates(self, db, tmp_path):
+        catalog = Catalog(
+            db,
+            partitions={"hands_p20250101": ("2025-01-01", "2025-01-02")},
+            archivable=self.archivable(1),
+        )
+        job = RetentionJob(db, archive_dir=tmp_path, keep_days=30, days_ahead=0)
+
+        result = await job.run(now=datetime(2025, 2, 10, tzinfo=UTC), dry_run=True)
+
+        assert result["created"] == ["hands_p20250210"]
+        assert sorted(catalog.partitions) == ["hands_p20250101", "hands_p20250210"]
+        assert len(catalog.archivable) == 1
+
+
+class TestHandsPartitionKeys:
+    """파티션 테이블 핸드 저장"""
+
+    async def test_insert_pins_created_at_via_hand_keys(self, db):
+        catalog = Catalog(db)
+        repo = HandsRepository(db)
+        first = datetime(2025, 2, 1, 20, 0, tzinfo=UTC)
+
+        await repo.insert(Hand(table_id="T1", hand_number=42, created_at=first))
+        await repo.insert(Hand(table_id="T1", hand_number=42, created_at=first.replace(hour=23)))
+
+        # 재수집된 핸드도 처음 created_at (같은 파티션)에 저장
+        assert catalog.hand_keys == {("T1", 42): first}
+
+    async def test_count_estimate(self, db):
+        Catalog(db)
+        assert await HandsRepository(db).count_estimate() == 1_250_000
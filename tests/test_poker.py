@@ -0,0 +1,360 @@
+"""핸드 평가기 테스트"""
+
+import asyncio
+import itertools
+import random
+
+import pytest
+
+from shared.models import Hand, HandRank
+from shared.models.hand import PlayerInfo
+from shared.poker import (
+    NUM_RANK_VALUES,
+    best_hand_rank,
+    card_index,
+    evaluate,
+    evaluate_omaha,
+    fill_hand_ranks,
+    gfx_boards,
+    hand_rank,
+    rank_category,
+)
+
+
+def _random_cards(rng: random.Random, count: int) -> list[str]:
+    deck = [r + s for r in "23456789TJQKA" for s in "hdcs"]
+    return rng.sample(deck, count)
+
+
+class TestEvaluate:
+    """단일 평가 테스트"""
+
+    @pytest.mark.parametrize(
+        "cards, expected",
+        [
+            (["As", "Ks", "Qs", "Js", "Ts"], 1),
+            (["Ah", "2h", "3h", "4h", "5h"], 10),
+            (["Ac", "Ad", "Ah", "As", "Kd"], 11),
+            (["7d", "5c", "4h", "3s", "2d"], NUM_RANK_VALUES),
+        ],
+    )
+    def test_known_values(self, cards, expected):
+        """rank_value 경계값 (hand_results.rank_value 체계)"""
+        assert evaluate(cards) == expected
+
+    @pytest.mark.parametrize(
+        "cards, expected",
+        [
+            (["As", "Ks", "Qs", "Js", "Ts", "2d", "3c"], HandRank.ROYAL_FLUSH),
+            (["9s", "8s", "7s", "6s", "5s", "Ad", "Ac"], HandRank.STRAIGHT_FLUSH),
+            (["Kc", "Kd", "Kh", "Ks", "2d", "3c", "4h"], HandRank.FOUR_OF_A_KIND),
+            (["Kc", "Kd", "Kh", "2s", "2d", "3c", "3h"], HandRank.FULL_HOUSE),
+            (["Ah", "9h", "7h", "4h", "2h", "Kd", "Kc"], HandRank.FLUSH),
+            (["Ah", "2c", "3d", "4s", "5h", "Kd", "9c"], HandRank.STRAIGHT),
+            (["Qh", "Qc", "Qd", "4s", "5h", "Kd", "9c"], HandRank.THREE_OF_A_KIND),
+            (["Qh", "Qc", "4d", "4s", "5h", "5d", "9c"], HandRank.TWO_PAIR),
+            (["Qh", "Qc", "4d", "8s", "5h", "Kd", "9c"], HandRank.ONE_PAIR),
+            (["Qh", "2c", "4d", "8s", "5h", "Kd", "9c"], HandRank.HIGH_CARD),
+        ],
+    )
+    def test_categories(self, cards, expected):
+        """카테고리 판정"""
+        assert rank_category(evaluate(cards)) == expected
+
+    def test_best_five_of_seven(self):
+        """7장 평가 = 5장 부분집합 중 최고값"""
+        rng = random.Random(7)
+        for _ in range(300):
+            cards = _random_cards(rng, 7)
+            assert evaluate(cards) == min(
+                evaluate(list(five)) for five in itertools.combinations(cards, 5)
+            )
+
+    def test_invalid_cards(self):
+        """잘못된 카드 / 중복 / 장수"""
+        with pytest.raises(ValueError):
+            card_index("1s")
+        with pytest.raises(ValueError):
+            evaluate(["As", "As", "Kd", "Qd", "Jd"])
+        with pytest.raises(ValueError):
+            evaluate(["As", "Kd", "Qd", "Jd"])
+
+    def test_omaha_uses_two_hole_cards(self):
+        """오마하는 홀카드 정확히 2장 (보드 4장 플러시 + 홀카드 1장은 플러시 아님)"""
+        hole = ["Ah", "Kc", "Qd", "2s"]
+        board = ["3h", "7h", "9h", "Jh", "4c"]
+        assert rank_category(evaluate_omaha(hole, board)) == HandRank.HIGH_CARD
+        assert hand_rank(["Ah", "Kc"], board) == HandRank.FLUSH
+
+    def test_omaha_flop_and_turn(self):
+        """보드 3-4장에서도 오마하 규칙 (홀카드 4장 스트레이트 플러시 아님)"""
+        hole = ["Ah", "Kh", "Qh", "Jh"]
+        assert hand_rank(hole, ["Th", "2c", "3d"]) == HandRank.HIGH_CARD
+        assert hand_rank(hole, ["Th", "2c", "3d", "2h"]) == HandRank.ONE_PAIR
+        assert hand_rank(hole, ["Th", "2c", "9h", "8h"]) == HandRank.STRAIGHT_FLUSH
+        assert hand_rank(hole, ["Th", "2c"]) is None
+
+
+class TestHandHelpers:
+    """Hand / GFX 헬퍼 테스트"""
+
+    def _hand(self, **kwargs) -> Hand:
+        return Hand(
+            table_id="feature_1",
+            hand_number=1,
+            players=[
+                PlayerInfo(seat=1, name="A", hole_cards=["Kc", "Kd"]),
+                PlayerInfo(seat=2, name="B", hole_cards=["9s", "8s"]),
+                PlayerInfo(seat=3, name="C"),
+            ],
+            community_cards=["Kh", "2s", "2d", "7s", "6s"],
+            **kwargs,
+        )
+
+    def test_best_hand_rank(self):
+        """공개된 플레이어 중 최고 핸드"""
+        assert best_hand_rank(self._hand()) == HandRank.FULL_HOUSE
+
+    def test_best_hand_rank_omaha_flop(self):
+        """플랍에서도 오마하 홀카드는 2장만 사용"""
+        hand = Hand(
+            table_id="feature_1",
+            hand_number=1,
+            players=[PlayerInfo(seat=1, name="A", hole_cards=["Ah", "Kh", "Qh", "Jh"])],
+            community_cards=["Th", "2c", "3d"],
+        )
+        assert best_hand_rank(hand) == HandRank.HIGH_CARD
+
+    def test_fill_hand_ranks(self):
+        """hand_rank 비어 있는 핸드만 채움"""
+        hands = [self._hand(), self._hand(hand_rank=HandRank.HIGH_CARD), self._hand()]
+        hands[2].community_cards = ["Kh", "2s"]
+
+        assert fill_hand_ranks(hands) == 1
+        assert hands[0].hand_rank == HandRank.FULL_HOUSE
+        assert hands[0].is_premium
+        assert hands[1].hand_rank == HandRank.HIGH_CARD
+        assert hands[2].hand_rank is None
+
+    def test_gfx_boards_run_it_twice(self):
+        """2번째 보드는 1번 보드의 공용 카드로 채움"""
+        hand = {"Events": [
+            {"Type": "BOARD_CARD", "BoardCards": ["2c", "3d", "4h"]},
+            {"Type": "BOARD_CARD", "BoardCards": ["5s"], "BoardNum": 1},
+            {"Type": "BOARD_CARD", "BoardCards": ["6s"], "BoardNum": 1},
+            {"Type": "BOARD_CARD", "BoardCards": ["Ks", "Kd"], "BoardNum": 2},
+        ]}
+
+        assert gfx_boards(hand) == [
+            ["2c", "3d", "4h", "5s", "6s"],
+            ["2c", "3d", "4h", "Ks", "Kd"],
+        ]
+
+
+class TestBatchEvaluation:
+    """NumPy 배치 평가 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_matches_scalar(self):
+        """배치 결과 = 단일 평가 결과 (빈 자리 -1 포함)"""
+        from shared.poker import encode_cards, evaluate_batch
+
+        rng = random.Random(11)
+        hands = [_random_cards(rng, rng.choice([5, 6, 7])) for _ in range(500)]
+        values = evaluate_batch([encode_cards(cards, 7) for cards in hands])
+
+        assert values.tolist() == [evaluate(cards) for cards in hands]
+
+    def test_too_few_cards(self):
+        """5장 미만은 0"""
+        from shared.poker import encode_cards, evaluate_batch
+
+        assert evaluate_batch([encode_cards(["As", "Kd"], 7)]).tolist() == [0]
+
+    def test_omaha_batch(self):
+        """오마하 배치 = 단일 평가"""
+        from shared.poker import encode_cards, evaluate_omaha_batch
+
+        rng = random.Random(13)
+        deals = [_random_cards(rng, 9) for _ in range(100)]
+        values = evaluate_omaha_batch(
+            [encode_cards(d[:4], 4) for d in deals],
+            [encode_cards(d[4:], 5) for d in deals],
+        )
+
+        assert values.tolist() == [evaluate_omaha(d[:4], d[4:]) for d in deals]
+
+    def test_rank_gfx_hands_multi_board(self):
+        """여러 보드 중 최고 핸드, 프리미엄 판정"""
+        from shared.poker import premium_mask, rank_gfx_hands
+
+        hands = [
+            {
+                "GameVariant": "HOLDEM",
+                "Players": [{"HoleCards": ["Ac", "Ad"]}, {"HoleCards": []}],
+                "Events": [
+                    {"Type": "BOARD_CARD", "BoardCards": ["2c", "7d", "9h", "Js", "3c"]},
+                    {"Type": "BOARD_CARD", "BoardCards": ["Ah", "As"], "BoardNum": 2},
+                ],
+            },
+            {
+                "GameVariant": "OMAHA",
+                "Players": [{"HoleCards": ["Ah", "Kh", "2c", "3d"]}],
+                "Events": [{"Type": "BOARD_CARD", "BoardCards": ["Qh", "Jh", "Th", "4c", "5d"]}],
+            },
+            {"HandNum": 3, "Players": [{"HoleCards": ["Ah", "Kh"]}]},
+        ]
+
+        values = rank_gfx_hands(hands)
+
+        assert rank_category(int(values[0])) == HandRank.FOUR_OF_A_KIND
+        assert rank_category(int(values[1])) == HandRank.ROYAL_FLUSH
+        assert values[2] == 0
+        assert premium_mask(values).tolist() == [True, True, False]
+
+
+class TestEquity:
+    """승률 계산 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def _engine(self, **kwargs):
+        from shared.poker import EquityEngine
+
+        return EquityEngine(**kwargs)
+
+    def test_river_exact(self):
+        """리버: 런아웃 1개, 결과 확정"""
+        result = self._engine().calculate(
+            [["As", "Ad"], ["Kc", "Qc"]], board=["2c", "7c", "9d", "Kh", "3s"]
+        )
+
+        assert result.exact is True
+        assert result.runouts == 1
+        assert result.win == [1.0, 0.0]
+
+    def test_turn_matches_scalar_enumeration(self):
+        """턴: 완전 열거 결과 = 단일 평가로 직접 센 값"""
+        hole = [["As", "Ad"], ["Kc", "Qc"], ["8h", "8s"]]
+        board = ["2c", "7c", "9d", "Kh"]
+        result = self._engine().calculate(hole, board=board, dead=["3s"])
+
+        known = {c for cards in hole for c in cards} | set(board) | {"3s"}
+        deck = [r + s for r in "23456789TJQKA" for s in "hdcs" if r + s not in known]
+        shares = [0.0, 0.0, 0.0]
+        for river in deck:
+            values = [evaluate(cards + board + [river]) for cards in hole]
+            winners = [p for p, v in enumerate(values) if v == min(values)]
+            for p in winners:
+                shares[p] += 1 / len(winners)
+
+        assert result.runouts == len(deck) == 41
+        assert result.equity == pytest.approx([s / len(deck) for s in shares])
+
+    def test_chop(self):
+        """보드 플레이 시 공동 승리"""
+        result = self._engine().calculate(
+            [["2c", "3d"], ["2h", "3s"]], board=["Ah", "Kh", "Qd", "Jc", "Tc"]
+        )
+
+        assert result.tie == [1.0, 1.0]
+        assert result.equity == [0.5, 0.5]
+
+    def test_preflop_monte_carlo(self):
+        """프리플랍: 고정 샘플 수, 같은 상태는 같은 결과 (고정 시드)"""
+        first = self._engine(samples=4000).calculate([["As", "Ad"], ["Kc", "Qc"]])
+        second = self._engine(samples=4000).calculate([["As", "Ad"], ["Kc", "Qc"]])
+
+        assert first.exact is False
+        assert first.runouts == 4000
+        assert first.equity == second.equity
+        assert first.equity[0] == pytest.approx(0.82, abs=0.03)
+        assert sum(first.equity) == pytest.approx(1.0)
+
+    def test_cache(self):
+        """홀카드/보드/데드카드 순서와 무관하게 캐시 적중"""
+        engine = self._engine()
+        first = engine.calculate([["As", "Ad"], ["Kc", "Qc"]], board=["2c", "7c", "9d"])
+        result = engine.calculate([["As", "Ad"], ["Kc", "Qc"]], board=["9d", "2c", "7c"])
+
+        assert result.cached is True
+        assert engine.get_stats()["hits"] == 1
+        assert first.board == ["2c", "7c", "9d"]
+        assert result.board == ["9d", "2c", "7c"]
+
+        swapped = engine.calculate([["Ad", "As"], ["Qc", "Kc"]], board=["2c", "7c", "9d"])
+        assert swapped.cached is True
+        assert swapped.equity == first.equity
+        assert swapped.hole_cards == [["Ad", "As"], ["Qc", "Kc"]]
+
+    def test_omaha(self):
+        """오마하 (홀카드 4장)"""
+        result = self._engine().calculate(
+            [["Ah", "Kh", "2c", "3d"], ["Qs", "Qd", "Jc", "Tc"]], board=["Qh", "Jh", "4h", "5s"]
+        )
+
+        assert result.runouts == 40
+        assert sum(result.equity) == pytest.approx(1.0)
+
+    def test_chunk_scales_with_players_and_combos(self, monkeypatch):
+        """청크 크기는 플레이어 수 × 조합 수에 반비례, 나누어 평가해도 결과 동일"""
+        from shared.poker import equity
+
+        holdem = ((0, 1), (2, 3))
+        omaha = tuple(tuple(range(p * 4, p * 4 + 4)) for p in range(6))
+        assert equity._chunk_runouts(holdem) == equity._CHUNK_EVALUATIONS // 2
+        assert equity._chunk_runouts(omaha) == equity._CHUNK_EVALUATIONS // 360
+
+        hole = [["Ah", "Kh", "2c", "3d"], ["Qs", "Qd", "Jc", "Tc"], ["9s", "8s", "7d", "6d"]]
+        whole = self._engine(samples=500).calculate(hole)
+        exact = self._engine().calculate(hole, board=["Qh", "Jh", "4h"])
+        monkeypatch.setattr(equity, "_CHUNK_EVALUATIONS", 1000)
+
+        assert self._engine(samples=500).calculate(hole).equity == whole.equity
+        chunked = self._engine().calculate(hole, board=["Qh", "Jh", "4h"])
+        assert chunked.equity == pytest.approx(exact.equity)
+
+    @pytest.mark.parametrize(
+        "hole, board",
+        [
+            ([["As", "Ad"]], []),
+            ([["As", "Ad"], ["As", "Kd"]], []),
+            ([["As", "Ad"], ["Kc", "Qc"]], ["2c"]),
+            ([["As", "Ad", "Kd"], ["Kc", "Qc"]], []),
+        ],
+    )
+    def test_invalid_state(self, hole, board):
+        """플레이어 수 / 중복 카드 / 보드 장수 / 홀카드 장수 오류"""
+        with pytest.raises(ValueError):
+            self._engine().calculate(hole, board=board)
+
+    async def test_async_single_flight(self):
+        """같은 상태의 동시 요청은 한 번만 계산"""
+        engine = self._engine(samples=2000)
+
+        results = await asyncio.gather(
+            *(engine.calculate_async([["As", "Ad"], ["Kc", "Qc"]]) for _ in range(5))
+        )
+
+        assert engine.get_stats()["cached_states"] == 1
+        assert all(r.equity == results[0].equity for r in results)
+
+    def test_layer_data(self):
+        """RenderInstruction.layer_data 형식"""
+        data = self._engine().calculate(
+            [["As", "Ad"], ["Kc", "Qc"]], board=["Kh", "2c", "9d", "7c", "3s"]
+        ).to_layer_data()
+
+        assert data["board"] == ["Kh", "2c", "9d", "7c", "3s"]
+
+        assert data["players"][0] == {
+            "hole_cards": ["As", "Ad"],
+            "win_percent": 100.0,
+            "tie_percent": 0.0,
+            "equity_percent": 100.0,
+        }
@@ -0,0 +1,251 @@
+"""프리미엄 핸드 피드 / fan-out 테스트"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from shared.db.repositories import HandsRepository
+from shared.feed import Broadcaster, PremiumHandFeed
+from shared.models.hand import HandRank, PremiumHand
+
+
+def entry(seq, rank="full_house", table_id="feature_1", hand_number=None, pot_size=1000):
+    rank = HandRank(rank)
+    return PremiumHand(
+        seq=seq,
+        hand_id=seq * 10,
+        table_id=table_id,
+        hand_number=hand_number if hand_number is not None else seq,
+        hand_rank=rank,
+        rank_order=rank.premium_order,
+        pot_size=pot_size,
+    )
+
+
+def seqs(entries):
+    return [e.seq for e in entries]
+
+
+class TestBroadcaster:
+    """구독자 fan-out"""
+
+    async def test_publish_to_all_subscribers(self):
+        broadcaster: Broadcaster[int] = Broadcaster()
+        first, second = broadcaster.subscribe(), broadcaster.subscribe()
+
+        assert broadcaster.publish(1) == 2
+        assert await first.get(timeout=1) == 1
+        assert await second.get(timeout=1) == 1
+
+        first.close()
+        assert broadcaster.publish(2) == 1
+        assert await first.get(timeout=0.01) is None
+
+    async def test_slow_subscriber_drops_oldest(self):
+        broadcaster: Broadcaster[int] = Broadcaster(maxsize=2)
+        subscription = broadcaster.subscribe()
+
+        for i in range(5):
+            broadcaster.publish(i)
+
+        assert subscription.get_nowait() == [3, 4]
+        assert subscription.dropped == 3
+
+    async def test_close_ends_iteration(self):
+        broadcaster: Broadcaster[int] = Broadcaster()
+        subscription = broadcaster.subscribe()
+        received = []
+
+        async def consume():
+            async for item in subscription:
+                received.append(item)
+
+        task = asyncio.create_task(consume())
+        broadcaster.publish(1)
+        await asyncio.sleep(0)
+        broadcaster.close()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert received == [1]
+        assert len(broadcaster) == 0
+
+
+class TestPremiumHandFeed:
+    """링 버퍼 조회"""
+
+    def test_latest_best_rank_first(self):
+        feed = PremiumHandFeed()
+        for item in [
+            entry(1, "full_house"), entry(2, "four_of_a_kind"), entry(3, "full_house"),
+            entry(4, "royal_flush"), entry(5, "four_of_a_kind"),
+        ]:
+            feed.add(item)
+
+        assert seqs(feed.latest(4)) == [4, 5, 2, 3]
+
+    def test_since_cursor(self):
+        feed = PremiumHandFeed(capacity=3)
+        for seq in (1, 2, 4, 7):  # seq 사이 빈 값 (롤백 등)
+            feed.add(entry(seq))
+
+        assert seqs(feed.since(2)) == [4, 7]
+        assert seqs(feed.since(4, limit=1)) == [7]
+        assert feed.since(7) == []
+        assert feed.since(0) is None  # seq 1은 버퍼에서 밀려남 → DB 조회
+
+    def test_duplicate_and_correction(self):
+        """같은 seq는 무시, 같은 핸드의 정정은 기존 항목 교체"""
+        feed = PremiumHandFeed()
+        feed.add(entry(1, "full_house", hand_number=42))
+        feed.add(entry(2, "straight_flush", hand_number=43))
+
+        assert feed.add(entry(2, "royal_flush", hand_number=99)) is False
+        assert feed.add(entry(3, "four_of_a_kind", hand_number=42)) is True
+
+        assert len(feed) == 2
+        assert [(e.seq, e.hand_rank) for e in feed.latest()] == [
+            (2, HandRank.STRAIGHT_FLUSH), (3, HandRank.FOUR_OF_A_KIND),
+        ]
+
+    def test_correction_after_eviction_replaces(self):
+        """전체 버퍼에서 밀려났어도 랭크별 버퍼에 남은 항목은 정정 시 교체 (latest 중복 없음)"""
+        feed = PremiumHandFeed(capacity=2)
+        feed.add(entry(1, "royal_flush", hand_number=42))
+        feed.add(entry(2, hand_number=43))
+        feed.add(entry(3, hand_number=44))  # seq 1은 전체 버퍼에서 밀려남
+
+        assert seqs(feed.latest()) == [1, 3, 2]
+        assert feed.add(entry(4, "straight_flush", hand_number=42)) is True
+        assert seqs(feed.latest()) == [4, 3, 2]
+
+    def test_remove_downgraded_hand(self):
+        """Full House 미만으로 정정된 핸드는 제거 (seq는 커서로 반영)"""
+        feed = PremiumHandFeed()
+        feed.add(entry(1, hand_number=42))
+        feed.add(entry(2, "four_of_a_kind", hand_number=43))
+
+        assert feed.remove(3, ("feature_1", 42)) is True
+        assert feed.remove(3, ("feature_1", 43)) is False  # 이미 받은 seq
+        assert feed.remove(4, ("feature_1", 99)) is False  # 보관하지 않은 핸드
+
+        assert seqs(feed.latest()) == [2]
+        assert seqs(feed.since(0)) == [2]
+        assert feed.last_seq == 4
+
+    async def test_subscribers_receive_new_hands(self):
+        feed = PremiumHandFeed()
+        subscription = feed.subscribe()
+
+        feed.add(entry(1))
+        feed.add(entry(1))  # 중복은 전달하지 않음
+
+        assert seqs(subscription.get_nowait()) == [1]
+
+    def test_from_notification(self):
+        hand = PremiumHand.from_notification({
+            "seq": 9, "hand_id": 90, "table_id": "feature_2", "hand_number": 7,
+            "hand_rank": "four_of_a_kind", "rank_order": 3, "pot_size": None,
+            "winner": "John", "created_at": 1738368000.0,
+        })
+
+        assert hand.hand_rank == HandRank.FOUR_OF_A_KIND
+        assert hand.pot_size == 0
+        assert hand.created_at == datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+def premium_row(seq, rank="full_house"):
+    return {
+        "seq": seq, "hand_id": seq * 10, "table_id": "feature_1", "hand_number": seq,
+        "hand_rank": rank, "rank_order": HandRank(rank).premium_order,
+        "pot_size": 500, "winner": None, "created_at": None,
+    }
+
+
+class PremiumTable:
+    """premium_hands 행을 메모리에 두고 피드 조회에 응답 (seq 순 목록)"""
+
+    def __init__(self, db, rows=()):
+        self.rows = list(rows)
+        db.on("seq > :cursor", self.since)
+        db.on("ORDER BY rank_order, seq DESC", self.feed)
+        db.on("ORDER BY seq DESC", self.recent)
+
+    def since(self, params):
+        return [r for r in self.rows if r["seq"] > params["cursor"]][: params["limit"]]
+
+    def feed(self, params):
+        ordered = sorted(self.rows, key=lambda r: (r["rank_order"], -r["seq"]))
+        return ordered[: params["limit"]]
+
+    def recent(self, params):
+        return list(reversed(self.rows))[: params["limit"]]
+
+
+class TestPremiumRepository:
+    """premium_hands 조회"""
+
+    async def test_feed(self, db):
+        PremiumTable(db, [
+            premium_row(1), premium_row(2, "royal_flush"), premium_row(3, "four_of_a_kind"),
+        ])
+
+        hands = await HandsRepository(db).get_premium_feed(limit=2)
+
+        assert seqs(hands) == [2, 3]
+        assert [h.hand_rank for h in hands] == [HandRank.ROYAL_FLUSH, HandRank.FOUR_OF_A_KIND]
+
+    async def test_since(self, db):
+        PremiumTable(db, [premium_row(i) for i in (3, 5, 8)])
+
+        hands = await HandsRepository(db).get_premium_since(3, limit=10)
+
+        assert seqs(hands) == [5, 8]
+        assert isinstance(hands[0], PremiumHand)
+
+
+class TestFeedSync:
+    """DB 동기화 / NOTIFY 반영"""
+
+    async def test_initial_sync_loads_recent_only(self, db):
+        table = PremiumTable(db, [premium_row(i) for i in range(1, 11)])
+        feed = PremiumHandFeed(capacity=4)
+
+        added = await feed.sync(HandsRepository(db))
+
+        assert added == 4
+        assert seqs(feed.since(6)) == [7, 8, 9, 10]
+        assert feed.since(5) is None
+
+        table.rows.append(premium_row(11, "royal_flush"))
+        assert await feed.sync(HandsRepository(db)) == 1
+        assert feed.latest(1)[0].seq == 11
+
+    async def test_follow_applies_notifications_and_resyncs(self, db, listener):
+        table = PremiumTable(db, [premium_row(1)])
+        feed = PremiumHandFeed()
+        subscription = feed.subscribe()
+
+        task = asyncio.create_task(feed.follow(HandsRepository(db), listener))
+        assert seqs([await subscription.get(timeout=1)]) == [1]
+
+        table.rows.extend([premium_row(2), premium_row(3)])
+        listener.notify(premium_row(2))
+        assert (await subscription.get(timeout=1)).seq == 2
+
+        # 재연결 → 알림을 놓쳤을 수 있으므로 DB에서 보정 (seq 3)
+        listener.notify({"reconnected": True})
+        assert (await subscription.get(timeout=1)).seq == 3
+
+        # Full House 미만으로 정정 → 제거 알림
+        del table.rows[0]
+        listener.notify({"seq": 4, "removed": True, "table_id": "feature_1", "hand_number": 1})
+        table.rows.append(premium_row(5))
+        listener.notify(premium_row(5))
+        assert (await subscription.get(timeout=1)).seq == 5
+        assert seqs(feed.latest()) == [5, 3, 2]
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert subscription.get_nowait() == []
@@ -0,0 +1,280 @@
+"""렌더 결과 캐시 테스트 (render_outputs를 흉내 내는 가짜 DB + 임시 출력 디렉토리)"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from shared.models.render_instruction import RenderInstruction, RenderOutput
+from shared.render import RenderCache, artifact_size
+
+
+class OutputStore:
+    """render_outputs / render_instructions.status 상태를 메모리에 두고 FakeDatabase에 연결"""
+
+    def __init__(self, db, rows=(), owners=None):
+        self.rows = [{"evicted": False, "hit_count": 0, **row} for row in rows]
+        self.statuses: dict[int, str] = {}
+        self.owners: dict[int, str] = dict(owners or {})  # processing 지시서 → 점유 워커
+        self.next_id = 500
+        db.on("JOIN render_outputs ro", self.find_cached)
+        db.on("GROUP BY output_path", self.list_cached)
+        db.on("SET evicted_at", self.mark_evicted)
+        db.on("hit_count = hit_count + 1", self.mark_hit)
+        db.on("INSERT INTO render_outputs", self.insert)
+        db.on("UPDATE render_instructions", self.update_status)
+
+    def live(self):
+        return [row for row in self.rows if not row["evicted"]]
+
+    def find_cached(self, params):
+        rows = [
+            r for r in self.live()
+            if r.get("template_name") == params["template_name"]
+            and r.get("content_hash") == params["content_hash"]
+            and r["instruction_id"] != params["exclude_instruction_id"]
+        ]
+        return rows[: params["limit"]]
+
+    def list_cached(self, params):
+        return [
+            {
+                "output_path": r["output_path"],
+                "file_size": r["file_size"],
+                "last_used_at": r["last_used_at"],
+            }
+            for r in sorted(self.live(), key=lambda r: r["last_used_at"])
+        ]
+
+    def mark_evicted(self, params):
+        evicted = [r for r in self.live() if r["output_path"] in params["paths"]]
+        for row in evicted:
+            row["evicted"] = True
+        return len(evicted)
+
+    def mark_hit(self, params):
+        row = self.get(params["id"])
+        row["hit_count"] += 1
+        return 1
+
+    def insert(self, params):
+        row = {**params, "id": self.next_id, "evicted": False, "hit_count": 0}
+        self.rows.append(row)
+        self.next_id += 1
+        return [{"id": row["id"]}]
+
+    def update_status(self, params):
+        if "worker_id" in params and self.owners.get(params["id"]) != params["worker_id"]:
+            return 0
+        self.statuses[params["id"]] = params["status"]
+        return 1
+
+    def get(self, output_id):
+        return next(r for r in self.rows if r["id"] == output_id)
+
+
+def output_row(id, path, size, source=None, **extra):
+    """render_outputs 행 (source: 이 결과를 만든 지시서와 같은 입력, 캐시 키)"""
+    return {
+        "id": id,
+        "instruction_id": id * 10,
+        "template_name": source.template_name if source else None,
+        "content_hash": source.content_hash() if source else None,
+        "output_path": str(path),
+        "file_size": size,
+        "frame_count": 150,
+        "status": "completed",
+        "completed_at": datetime(2025, 1, 20),
+        **extra,
+    }
+
+
+def write_file(path, size):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+@pytest.fixture
+def instruction():
+    return RenderInstruction(
+        id=42, template_name="blind_level", layer_data={"level": 12, "sb": 4000, "bb": 8000}
+    )
+
+
+class TestArtifactSize:
+    """출력물 크기 확인"""
+
+    def test_file_and_sequence_dir(self, tmp_path):
+        """단일 파일 / 이미지 시퀀스 디렉토리 합계 / 없으면 None"""
+        write_file(tmp_path / "a.mov", 100)
+        seq = tmp_path / "seq"
+        seq.mkdir()
+        write_file(seq / "0001.png", 30)
+        write_file(seq / "0002.png", 20)
+
+        assert artifact_size(tmp_path / "a.mov") == 100
+        assert artifact_size(seq) == 50
+        assert artifact_size(tmp_path / "missing.mov") is None
+
+
+class TestRenderCacheLookup:
+    """캐시 조회 / 적중 처리"""
+
+    async def test_hit_completes_without_render(self, db, tmp_path, instruction):
+        """파일이 있고 크기가 같으면 새 결과를 기록하고 지시서 완료 처리"""
+        path = write_file(tmp_path / "blind_12.mov", 256)
+        store = OutputStore(db, [output_row(7, path, 256, instruction)])
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        output = await cache.try_complete(instruction)
+
+        assert output is not None
+        assert output.id == 500
+        assert output.instruction_id == 42
+        assert output.cache_source_id == 7
+        assert output.output_path == str(path)
+
+        assert store.get(500)["cache_source_id"] == 7
+        assert store.statuses == {42: "completed"}
+        assert store.get(7)["hit_count"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_lease_lost(self, db, tmp_path, instruction):
+        """lease를 잃은 워커는 캐시 적중이어도 완료 / 결과 기록하지 않음"""
+        path = write_file(tmp_path / "blind_12.mov", 256)
+        store = OutputStore(db, [output_row(7, path, 256, instruction)], owners={42: "ae-node-2"})
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        instruction.worker_id = "ae-node-1"
+        assert await cache.try_complete(instruction) is None
+        assert store.statuses == {}
+        assert [r["id"] for r in store.rows] == [7]
+
+        instruction.worker_id = "ae-node-2"
+        assert (await cache.try_complete(instruction)).cache_source_id == 7
+        assert store.statuses == {42: "completed"}
+
+    async def test_other_input_or_own_output_is_not_reused(self, db, tmp_path, instruction):
+        """다른 입력의 결과, 같은 지시서가 만든 결과는 재사용하지 않음"""
+        path = write_file(tmp_path / "blind_12.mov", 256)
+        other = instruction.model_copy(update={"layer_data": {"level": 13}})
+        own = output_row(9, path, 256, instruction, instruction_id=instruction.id)
+        store = OutputStore(db, [output_row(7, path, 256, other), own])
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        assert await cache.try_complete(instruction) is None
+        assert store.statuses == {}
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_miss(self, db, tmp_path, instruction):
+        """같은 입력의 결과가 없으면 아무것도 쓰지 않음"""
+        store = OutputStore(db)
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        assert await cache.try_complete(instruction) is None
+        assert store.rows == []
+        assert store.statuses == {}
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_stale_candidates_are_evicted(self, db, tmp_path, instruction):
+        """파일이 없거나 크기가 다른 결과는 건너뛰고 evicted 표시 (다음 조회에서 제외)"""
+        missing = tmp_path / "gone.mov"
+        truncated = write_file(tmp_path / "truncated.mov", 10)
+        good = write_file(tmp_path / "good.mov", 64)
+        store = OutputStore(db, [
+            output_row(1, missing, 64, instruction),
+            output_row(2, truncated, 64, instruction),
+            output_row(3, good, 64, instruction),
+        ])
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        found = await cache.lookup(instruction)
+
+        assert found.id == 3
+        assert [r["id"] for r in store.live()] == [3]
+        assert cache.stats.stale == 2
+        assert cache.stats.hits == 1
+
+        assert (await cache.lookup(instruction)).id == 3
+        assert cache.stats.stale == 2
+
+    async def test_unknown_size_accepts_existing_file(self, db, tmp_path, instruction):
+        """file_size가 기록되지 않은(0) 결과는 파일 존재만 확인"""
+        path = write_file(tmp_path / "intro.mov", 99)
+        OutputStore(db, [output_row(5, path, 0, instruction)])
+
+        found = await RenderCache(db, output_dir=tmp_path).lookup(instruction)
+
+        assert found.id == 5
+
+    async def test_requires_stored_instruction(self, db, tmp_path):
+        """id 없는 지시서는 완료 처리할 수 없음"""
+        cache = RenderCache(db, output_dir=tmp_path)
+
+        with pytest.raises(ValueError):
+            await cache.try_complete(RenderInstruction(template_name="t"))
+
+
+class TestRenderCacheEvict:
+    """출력 디렉토리 LRU 정리"""
+
+    async def test_evicts_least_recently_used_until_under_limit(self, db, tmp_path):
+        """오래 안 쓴 결과부터 삭제, 한도 이하가 되면 중단"""
+        now = datetime(2025, 1, 26)
+        old = write_file(tmp_path / "old.mov", 100)
+        mid = write_file(tmp_path / "mid.mov", 100)
+        new = write_file(tmp_path / "new.mov", 100)
+        store = OutputStore(db, [
+            output_row(1, mid, 100, last_used_at=now - timedelta(days=2)),
+            output_row(2, new, 100, last_used_at=now),
+            output_row(3, old, 100, last_used_at=now - timedelta(days=3)),
+        ])
+        cache = RenderCache(db, output_dir=tmp_path, max_bytes=150)
+
+        result = await cache.evict()
+
+        assert result == {
+            "total_bytes": 300, "evicted_files": 2, "evicted_bytes": 200, "remaining_bytes": 100,
+        }
+        assert not old.exists() and not mid.exists() and new.exists()
+        assert [r["id"] for r in store.live()] == [2]
+
+    async def test_never_touches_files_outside_output_dir(self, db, tmp_path):
+        """output_dir 밖의 결과는 삭제 대상/합계에서 제외"""
+        managed = tmp_path / "renders"
+        managed.mkdir()
+        outside = write_file(tmp_path / "archive.mov", 1000)
+        inside = write_file(managed / "a.mov", 100)
+        store = OutputStore(db, [
+            output_row(1, outside, 1000, last_used_at=datetime(2025, 1, 1)),
+            output_row(2, inside, 100, last_used_at=datetime(2025, 1, 2)),
+        ])
+
+        result = await RenderCache(db, output_dir=managed, max_bytes=50).evict()
+
+        assert result["evicted_files"] == 1
+        assert outside.exists()
+        assert not inside.exists()
+        assert [r["id"] for r in store.live()] == [1]
+
+    async def test_disabled_without_limit(self, db, tmp_path, monkeypatch):
+        """max_bytes가 없으면 정리하지 않음"""
+        monkeypatch.delenv("RENDER_CACHE_MAX_BYTES", raising=False)
+        path = write_file(tmp_path / "a.mov", 100)
+        OutputStore(db, [output_row(1, path, 100, last_used_at=datetime(2025, 1, 1))])
+
+        result = await RenderCache(db, output_dir=tmp_path).evict()
+
+        assert result["evicted_files"] == 0
+        assert path.exists()
+
+
+class TestRenderOutputCacheFields:
+    """RenderOutput 캐시 필드 직렬화"""
+
+    def test_cache_source_round_trip(self):
+        output = RenderOutput(instruction_id=1, output_path="/nas/a.mov", cache_source_id=7)
+
+        assert output.to_db_dict()["cache_source_id"] == 7
+        assert RenderOutput.from_db_row({**output.to_db_dict(), "id": 2}).cache_source_id == 7
+        trusted = RenderOutput.from_trusted_row({"instruction_id": 1, "output_path": "/x"})
+        assert trusted.cache_source_id is None
@@ -0,0 +1,404 @@
+"""렌더 실패 재시도 / dead letter 테스트"""
+
+import random
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from shared.db.repositories import (
+    _DUE_PENDING,
+    _READY_PENDING,
+    _RETRY_DUE_PENDING,
+    RenderDeadLettersRepository,
+    RenderInstructionsRepository,
+)
+from shared.models.render_instruction import RenderInstruction, RenderStatus
+from shared.render import ErrorKind, RetryHandler, RetryPolicy, classify_error
+
+
+class RenderQueue:
+    """render_instructions / render_dead_letters 상태를 메모리에 두고 FakeDatabase에 연결"""
+
+    def __init__(self, db, **instruction):
+        self.instruction = {
+            "id": 7, "template_name": "player_intro", "status": "processing",
+            "retry_count": 0, "max_retries": 3, "retry_delay": None, "error_message": None,
+            "worker_id": None, "lease_expired": False,
+            **instruction,
+        }
+        self.dead_letters: list[dict] = []
+        db.on("WITH expired", self.reap_expired_leases)
+        db.on("retry_count = retry_count + 1", self.increment_retry)
+        db.on("INSERT INTO render_dead_letters", self.move_to_dead_letter)
+        db.on("UPDATE render_dead_letters", self.requeue)
+        db.on("GROUP BY error_kind", self.stats)
+
+    def owned(self, params):
+        """worker_id 조건 (update_status / increment_retry / move_to_dead_letter)"""
+        row = self.instruction
+        if "worker_id" not in params:
+            return True
+        return row["worker_id"] == params["worker_id"] and row["status"] == "processing"
+
+    def increment_retry(self, params):
+        row = self.instruction
+        if row["retry_count"] >= row["max_retries"] or not self.owned(params):
+            return 0
+        row.update(
+            status="pending", retry_count=row["retry_count"] + 1, worker_id=None,
+            retry_delay=params["delay_seconds"], error_message=params["error_message"],
+        )
+        return 1
+
+    def move_to_dead_letter(self, params):
+        if not self.owned(params):
+            return []
+        self.instruction.update(
+            status="failed", worker_id=None, error_message=params["error_message"]
+        )
+        self.dead_letters.append({
+            "id": 31 + len(self.dead_letters),
+            "instruction_id": self.instruction["id"],
+            "template_name": self.instruction["template_name"],
+            "error_kind": params["error_kind"],
+            "requeued": False,
+        })
+        return [{"id": self.dead_letters[-1]["id"]}]
+
+    def reap_expired_leases(self, params):
+        row = self.instruction
+        if row["status"] != "processing" or not row["lease_expired"]:
+            return [{"requeued": 0, "dead_lettered": 0}]
+        row.update(lease_expired=False)
+        if row["retry_count"] < row["max_retries"]:
+            row.update(
+                status="pending", retry_count=row["retry_count"] + 1, worker_id=None,
+                error_message=params["error_message"],
+            )
+            return [{"requeued": 1, "dead_lettered": 0}]
+        self.move_to_dead_letter({**params, "error_kind": "transient"})
+        return [{"requeued": 0, "dead_lettered": 1}]
+
+    def requeue(self, params):
+        requeued = []
+        for letter in self.dead_letters:
+            if letter["requeued"]:
+                continue
+            if params.get("template_name") not in (None, letter["template_name"]):
+                continue
+            if params.get("error_kind") not in (None, letter["error_kind"]):
+                continue
+            letter["requeued"] = True
+            requeued.append({"instruction_id": letter["instruction_id"]})
+        return requeued[: params["limit"]]
+
+    def stats(self, params):
+        counts: dict[str, int] = {}
+        for letter in self.dead_letters:
+            if not letter["requeued"]:
+                counts[letter["error_kind"]] = counts.get(letter["error_kind"], 0) + 1
+        return [{"error_kind": kind, "count": count} for kind, count in counts.items()]
+
+
+def failed_instruction(retry_count=0, max_retries=3, worker_id=None):
+    return RenderInstruction(
+        id=7, template_name="player_intro", retry_count=retry_count, max_retries=max_retries,
+        worker_id=worker_id,
+    )
+
+
+class TestClassifyError:
+    """오류 분류"""
+
+    @pytest.mark.parametrize("error", [
+        "Template 'player_intro_v2' not found",
+        "aerender: Composition main_comp not found in project",
+        "missing footage: /nas/flags/xx.png",
+        "Corrupt layer data in layer 'chip_count'",
+        KeyError("player_name"),
+        ValueError("invalid chip count"),
+    ])
+    def test_permanent(self, error):
+        assert classify_error(error) == ErrorKind.PERMANENT
+
+    @pytest.mark.parametrize("error", [
+        TimeoutError("aerender did not respond"),
+        ConnectionError("NAS unreachable"),
+        "After Effects crashed (exit code -1073741819)",
+        "out of memory",
+    ])
+    def test_transient(self, error):
+        assert classify_error(error) == ErrorKind.TRANSIENT
+
+    def test_pydantic_validation_error_is_permanent(self):
+        class Layer(BaseModel):
+            chips: int
+
+        with pytest.raises(Exception) as exc_info:
+            Layer(chips="lots")
+        assert classify_error(exc_info.value) == ErrorKind.PERMANENT
+
+
+class TestRetryPolicy:
+    """지수 백오프 + jitter"""
+
+    def test_exponential_with_bounded_jitter(self):
+        policy = RetryPolicy(base_seconds=10, factor=2, max_seconds=60, jitter=0.5)
+        rng = random.Random(1)
+
+        for attempt, ceiling in ((1, 10), (2, 20), (3, 40), (4, 60), (10, 60)):
+            delays = [policy.delay(attempt, rng) for _ in range(200)]
+            assert all(ceiling / 2 <= d <= ceiling for d in delays)
+            assert max(delays) - min(delays) > ceiling / 10  # 같은 값으로 몰리지 않음
+
+    def test_no_jitter(self):
+        policy = RetryPolicy(base_seconds=30, jitter=0)
+        assert [policy.delay(n) for n in (1, 2, 3)] == [30, 60, 120]
+
+
+class TestRetryHandler:
+    """실패 처리: 재시도 예약 / dead letter"""
+
+    async def test_transient_schedules_backoff(self, db):
+        queue = RenderQueue(db, retry_count=1)
+        handler = RetryHandler(db, RetryPolicy(base_seconds=30, jitter=0))
+
+        result = await handler.fail(failed_instruction(retry_count=1), TimeoutError("no response"))
+
+        assert result == {"action": "retry", "error_kind": "transient", "delay_seconds": 60}
+        assert queue.instruction["status"] == "pending"
+        assert queue.instruction["retry_count"] == 2
+        assert queue.instruction["retry_delay"] == 60
+        assert queue.instruction["error_message"] == "TimeoutError: no response"
+        assert queue.dead_letters == []
+
+    async def test_permanent_goes_straight_to_dead_letter(self, db):
+        queue = RenderQueue(db)
+        handler = RetryHandler(db, RetryPolicy())
+
+        result = await handler.fail(failed_instruction(), "Template 'x' not found")
+
+        assert result == {"action": "dead_letter", "error_kind": "permanent", "dead_letter_id": 31}
+        assert queue.instruction["retry_count"] == 0
+        assert queue.instruction["status"] == "failed"
+        assert queue.instruction["error_message"] == "Template 'x' not found"
+        assert [d["error_kind"] for d in queue.dead_letters] == ["permanent"]
+
+    async def test_exhausted_retries(self, db):
+        """모델 기준으로 재시도 소진 → dead letter"""
+        queue = RenderQueue(db, retry_count=3)
+
+        result = await RetryHandler(db).fail(failed_instruction(retry_count=3), "crashed")
+
+        assert result["action"] == "dead_letter"
+        assert queue.instruction["retry_count"] == 3
+        assert queue.instruction["status"] == "failed"
+
+    async def test_retry_rejected_by_db(self, db):
+        """다른 워커가 먼저 재시도 횟수를 올려 DB 조건이 맞지 않으면 → dead letter"""
+        queue = RenderQueue(db, retry_count=3)
+
+        result = await RetryHandler(db).fail(failed_instruction(retry_count=2), "crashed")
+
+        assert result == {"action": "dead_letter", "error_kind": "transient", "dead_letter_id": 31}
+        assert queue.instruction["status"] == "failed"
+
+
+    async def test_owner_guard(self, db):
+        """점유한 워커가 실패 처리하면 재시도 예약"""
+        queue = RenderQueue(db, worker_id="ae-node-1")
+
+        result = await RetryHandler(db).fail(failed_instruction(worker_id="ae-node-1"), "timeout")
+
+        assert result["action"] == "retry"
+        assert queue.instruction["retry_count"] == 1
+        assert queue.instruction["worker_id"] is None
+
+    @pytest.mark.parametrize("retry_count", [0, 3])
+    async def test_lease_lost(self, db, retry_count):
+        """lease 만료로 다른 워커가 재점유한 작업은 재시도 / dead letter 모두 하지 않음"""
+        queue = RenderQueue(db, worker_id="ae-node-2", retry_count=retry_count)
+        instruction = failed_instruction(retry_count=retry_count, worker_id="ae-node-1")
+
+        result = await RetryHandler(db).fail(instruction, "timeout")
+
+        assert result == {"action": "lease_lost", "error_kind": "transient"}
+        assert queue.instruction["status"] == "processing"
+        assert queue.instruction["worker_id"] == "ae-node-2"
+        assert queue.instruction["retry_count"] == retry_count
+        assert queue.dead_letters == []
+
+
+class TestReapExpiredLeases:
+    """만료된 lease 회수"""
+
+    async def test_requeues_and_counts_attempt(self, db):
+        queue = RenderQueue(db, worker_id="ae-node-1", lease_expired=True, retry_count=1)
+
+        assert await RenderInstructionsRepository(db).reap_expired_leases() == 1
+
+        assert queue.instruction["status"] == "pending"
+        assert queue.instruction["retry_count"] == 2
+        assert queue.instruction["worker_id"] is None
+        assert queue.dead_letters == []
+
+    async def test_exhausted_goes_to_dead_letter(self, db):
+        """매번 워커를 죽이는 작업이 무한히 재점유되지 않음"""
+        queue = RenderQueue(db, worker_id="ae-node-1", lease_expired=True, retry_count=3)
+
+        assert await RenderInstructionsRepository(db).reap_expired_leases() == 1
+
+        assert queue.instruction["status"] == "failed"
+        assert queue.instruction["error_message"] == "lease expired"
+        assert [(d["instruction_id"], d["error_kind"]) for d in queue.dead_letters] == [
+            (7, "transient")
+        ]
+
+    async def test_nothing_expired(self, db):
+        queue = RenderQueue(db)
+
+        assert await RenderInstructionsRepository(db).reap_expired_leases() == 0
+        assert queue.instruction["status"] == "processing"
+
+
+    async def test_reap_query_dead_letters_only_exhausted(self, db, caplog):
+        """회수는 시도 한 번: 남은 재시도가 있으면 pending, 소진했으면 failed + dead letter"""
+        db.on("WITH expired", [{"requeued": 2, "dead_lettered": 1}])
+
+        assert await RenderInstructionsRepository(db).reap_expired_leases() == 3
+
+        query, params = db.calls[0]
+        query = " ".join(query.split())
+        expired = "WHERE status = 'processing' AND lease_expires_at < NOW() FOR UPDATE SKIP LOCKED"
+        assert expired in query
+        assert "retry_count = ri.retry_count + 1" in query
+        assert "WHERE ri.id = expired.id AND ri.retry_count < ri.max_retries" in query
+        assert "WHERE ri.id = expired.id AND ri.retry_count >= ri.max_retries" in query
+        dead_letter = "SELECT id, template_name, 'transient', :error_message, retry_count"
+        assert dead_letter + " FROM failed" in query
+        assert params == {"error_message": "lease expired"}
+        assert "exhausted retries" in caplog.text
+
+
+def claimed_row(id, priority, minute, **row):
+    return {
+        "id": id, "template_name": "player_intro", "layer_data_json": "{}",
+        "output_settings_json": "{}", "status": "processing", "priority": priority,
+        "worker_id": "ae-node-1", "created_at": datetime(2025, 2, 1, 12, minute),
+        **row,
+    }
+
+
+class TestClaimLease:
+    """claim_batch 점유 / renew_lease 연장"""
+
+    async def test_claim_batch_skip_locked(self, db):
+        """한 문장으로 잠그고 점유 (잠긴 행은 건너뜀), lease 시간은 초 단위 float"""
+        db.on("WITH claimable", [])
+
+        assert await RenderInstructionsRepository(db).claim_batch(
+            "ae-node-1", n=3, lease_seconds=90
+        ) == []
+
+        [(query, params)] = db.calls
+        query = " ".join(query.split())
+        assert query.count("FOR UPDATE SKIP LOCKED") == 2
+        assert "SET status = 'processing', started_at = NOW(), worker_id = :worker_id" in query
+        assert "lease_expires_at = NOW() + make_interval(secs => :lease_seconds)" in query
+        assert "RETURNING ri.id" in query
+        assert params == {"n": 3, "worker_id": "ae-node-1", "lease_seconds": 90.0}
+
+    async def test_claim_batch_orders_by_priority_then_age(self, db):
+        """RETURNING 순서는 보장되지 않으므로 (priority, created_at) 순으로 정렬해 반환"""
+        db.on("WITH claimable", [
+            claimed_row(3, priority=5, minute=0),
+            claimed_row(1, priority=1, minute=9),
+            claimed_row(2, priority=1, minute=3),
+        ])
+
+        claimed = await RenderInstructionsRepository(db).claim_batch("ae-node-1", n=3)
+
+        assert [inst.id for inst in claimed] == [2, 1, 3]
+        assert all(inst.status == RenderStatus.PROCESSING for inst in claimed)
+        assert all(inst.worker_id == "ae-node-1" for inst in claimed)
+
+    async def test_renew_lease_only_by_owner(self, db):
+        """점유한 워커의 processing 작업만 연장 (회수된 뒤에는 False → 작업 중단)"""
+        owner = {"id": 7, "worker_id": "ae-node-1"}
+        db.on(
+            "SET lease_expires_at",
+            lambda params: int({"id": params["id"], "worker_id": params["worker_id"]} == owner),
+            method="execute_write",
+        )
+        repo = RenderInstructionsRepository(db)
+
+        assert await repo.renew_lease(7, "ae-node-1", lease_seconds=30) is True
+        assert await repo.renew_lease(7, "ae-node-2") is False
+
+        query, params = db.calls[0]
+        assert "WHERE id = :id AND worker_id = :worker_id AND status = 'processing'" in query
+        assert params == {"id": 7, "worker_id": "ae-node-1", "lease_seconds": 30.0}
+
+
+class TestDueFiltering:
+    """재시도 대기 중인 작업은 점유/조회 대상에서 제외"""
+
+    async def test_claim_queries_skip_not_yet_due(self, db):
+        repo = RenderInstructionsRepository(db)
+
+        await repo.claim_batch("ae-node-1", n=2)
+        await repo.get_pending()
+        await repo.get_pending_summaries()
+        await repo.get_schedulable()
+        await repo.claim_ids("ae-node-1", [1, 2])
+
+        # 대기 조건은 DB에서만 평가되므로 모든 점유/조회가 같은 조건을 쓰는지 확인
+        assert len(db.calls) == 5
+        for query, _ in db.calls[:4]:
+            assert _READY_PENDING in query and _RETRY_DUE_PENDING in query
+        assert _DUE_PENDING in db.calls[4][0]
+
+    async def test_priority_poll_reads_each_index_in_order(self, db):
+        await RenderInstructionsRepository(db).claim_batch("ae-node-1", n=2)
+
+        # 갈래마다 (priority, created_at) 순 LIMIT + SKIP LOCKED, OR 조건 없음
+        query = " ".join(db.calls[0][0].split())
+        branch = "ORDER BY priority ASC, created_at ASC LIMIT :n FOR UPDATE SKIP LOCKED"
+        assert query.count(branch) == 2
+        assert "UNION ALL" in query
+        assert _DUE_PENDING not in query
+
+
+class TestDeadLetters:
+    """dead letter 조회 / 일괄 재등록"""
+
+    async def dead_letters(self, db):
+        queue = RenderQueue(db)
+        for instruction_id, template, kind in (
+            (7, "player_intro", "permanent"),
+            (8, "player_intro", "transient"),
+            (9, "leaderboard", "permanent"),
+        ):
+            queue.instruction.update(id=instruction_id, template_name=template)
+            await RenderInstructionsRepository(db).move_to_dead_letter(instruction_id, "x", kind)
+        return queue
+
+    async def test_requeue_filters(self, db):
+        queue = await self.dead_letters(db)
+        repo = RenderDeadLettersRepository(db)
+
+        requeued = await repo.requeue(template_name="player_intro", error_kind="permanent")
+
+        assert requeued == [7]
+        assert await repo.requeue(template_name="player_intro", error_kind="permanent") == []
+        assert [d["instruction_id"] for d in queue.dead_letters if not d["requeued"]] == [8, 9]
+
+    async def test_stats(self, db):
+        await self.dead_letters(db)
+        repo = RenderDeadLettersRepository(db)
+        await repo.requeue(template_name="leaderboard")
+
+        assert await repo.get_stats() == {
+            "total": 2, "by_kind": {"permanent": 1, "transient": 1},
+        }
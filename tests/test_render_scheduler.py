@@ -0,0 +1,258 @@
+"""렌더 스케줄러 / 시뮬레이터 테스트"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from shared.models.render_instruction import RenderInstructionSummary
+from shared.render import (
+    CostModel,
+    RenderScheduler,
+    SchedulerPolicy,
+    SimJob,
+    compare,
+    select_jobs,
+    simulate,
+)
+
+NOW = datetime(2025, 1, 20, 20, 0, 0)
+
+
+def job(id, template="leaderboard", priority=5, waited=0.0, deadline_in=None):
+    return RenderInstructionSummary(
+        id=id,
+        template_name=template,
+        priority=priority,
+        created_at=NOW - timedelta(seconds=waited),
+        deadline_at=NOW + timedelta(seconds=deadline_in) if deadline_in is not None else None,
+    )
+
+
+def ids(jobs):
+    return [j.id for j in jobs]
+
+
+class TestSelectJobs:
+    """작업 선택 순서"""
+
+    def test_baseline_matches_claim_batch_order(self):
+        """baseline 정책은 기존 priority, created_at 순서"""
+        candidates = [
+            job(1, priority=5, waited=10),
+            job(2, priority=3, waited=5),
+            job(3, priority=5, waited=600),
+            job(4, priority=8, waited=10_000, deadline_in=60),
+        ]
+
+        selected = select_jobs(candidates, 4, NOW, SchedulerPolicy.baseline())
+
+        assert ids(selected) == [2, 3, 1, 4]
+
+    def test_aging_prevents_starvation(self):
+        """오래 기다린 저우선순위 작업이 새 고우선순위 작업보다 먼저"""
+        policy = SchedulerPolicy(aging_seconds=60, use_deadlines=False)
+        candidates = [job(1, priority=3, waited=0), job(2, priority=9, waited=3600)]
+
+        assert ids(select_jobs(candidates, 1, NOW, policy)) == [2]
+        assert ids(select_jobs(candidates, 1, NOW, SchedulerPolicy.baseline())) == [1]
+
+    def test_urgent_deadline_first(self):
+        """마감 여유가 적은 작업이 우선순위와 무관하게 먼저, 여유가 적은 순"""
+        policy = SchedulerPolicy(urgent_window_seconds=300)
+        costs = CostModel(estimates={"player_intro": 60, "leaderboard": 10})
+        candidates = [
+            job(1, priority=1, waited=30),
+            job(2, template="player_intro", priority=7, deadline_in=200),   # 여유 140초
+            job(3, priority=7, deadline_in=100),                             # 여유 90초
+            job(4, priority=2, deadline_in=3600),                            # 여유 많음 → 일반
+        ]
+
+        selected = select_jobs(candidates, 4, NOW, policy, costs)
+
+        assert ids(selected) == [3, 2, 1, 4]
+
+    def test_missed_deadline_is_not_urgent(self):
+        """이미 늦은 작업은 긴급 대상에서 빠지고 일반 순서를 따름"""
+        policy = SchedulerPolicy(aging_seconds=None)
+        candidates = [job(1, priority=5, deadline_in=-30), job(2, priority=3)]
+
+        assert ids(select_jobs(candidates, 2, NOW, policy)) == [2, 1]
+
+    def test_template_caps(self):
+        """템플릿별 동시 실행 제한 (이미 실행 중인 수 포함)"""
+        policy = SchedulerPolicy(template_caps={"leaderboard": 2})
+        candidates = [job(i, priority=1, waited=100 - i) for i in range(1, 5)]
+        candidates.append(job(9, template="sponsor", priority=9))
+
+        assert ids(select_jobs(candidates, 4, NOW, policy)) == [1, 2, 9]
+        assert ids(select_jobs(candidates, 4, NOW, policy, running={"leaderboard": 1})) == [1, 9]
+
+    def test_invalid_cap(self):
+        with pytest.raises(ValueError):
+            SchedulerPolicy(template_caps={"leaderboard": 0})
+
+    def test_policy_from_env(self, monkeypatch):
+        monkeypatch.setenv("RENDER_TEMPLATE_CAPS", "leaderboard=2, player_intro=1")
+        monkeypatch.setenv("RENDER_SCHEDULER_AGING_SECONDS", "0")
+
+        policy = SchedulerPolicy.from_env()
+
+        assert policy.template_caps == {"leaderboard": 2, "player_intro": 1}
+        assert policy.aging_seconds is None
+
+
+class TestCostModel:
+    """템플릿별 예상 렌더 시간"""
+
+    def test_load_and_observe(self):
+        costs = CostModel(default_seconds=30, alpha=0.5)
+        costs.load([
+            {"template_name": "leaderboard", "count": 10, "mean_seconds": 8.0, "p90_seconds": 12.0},
+        ])
+
+        assert costs.estimate("leaderboard") == 12.0
+        assert costs.estimate("unknown") == 30
+
+        costs.observe("leaderboard", 20.0)
+        assert costs.estimate("leaderboard") == 16.0
+        costs.observe("player_intro", 45.0)
+        assert costs.estimate("player_intro") == 45.0
+
+
+class RenderQueue:
+    """render_instructions 상태를 메모리에 두고 스케줄러 쿼리에 응답"""
+
+    def __init__(self, db, rows, durations=()):
+        self.rows = rows
+        db.on("percentile_cont(0.9)", list(durations))
+        db.on("GROUP BY template_name", self.running_counts)
+        db.on("UNION", self.pending)
+        db.on("id = ANY(:ids)", self.claim_ids)
+
+    def pending(self, params):
+        return [r for r in self.rows if r["status"] == "pending"]
+
+    def running_counts(self, params):
+        counts: dict[str, int] = {}
+        for row in self.rows:
+            if row["status"] == "processing":
+                counts[row["template_name"]] = counts.get(row["template_name"], 0) + 1
+        return [{"template_name": t, "count": c} for t, c in counts.items()]
+
+    def claim_ids(self, params):
+        # 저장 순서로 반환해도 claim_ids가 선택 순서로 정렬
+        claimed = []
+        for row in self.rows:
+            if row["id"] in params["ids"] and row["status"] == "pending":
+                row.update(status="processing", worker_id=params["worker_id"])
+                claimed.append(dict(row))
+        return claimed
+
+    def status(self):
+        return {r["id"]: (r["status"], r.get("worker_id")) for r in self.rows}
+
+
+def queued_row(id, template, priority, waited, deadline_in=None, status="pending"):
+    now = datetime.now().astimezone()
+    return {
+        "id": id,
+        "template_name": template,
+        "status": status,
+        "priority": priority,
+        "deadline_at": now + timedelta(seconds=deadline_in) if deadline_in else None,
+        "created_at": now - timedelta(seconds=waited),
+    }
+
+
+class TestRenderScheduler:
+    """RenderScheduler.claim"""
+
+    async def test_claims_selected_ids_in_schedule_order(self, db):
+        queue = RenderQueue(
+            db,
+            rows=[
+                queued_row(1, "leaderboard", 2, 10),
+                queued_row(2, "leaderboard", 2, 20),
+                queued_row(3, "blind_level", 6, 5, deadline_in=120),
+                queued_row(4, "leaderboard", 1, 600, status="processing"),
+            ],
+            durations=[
+                {"template_name": "blind_level", "count": 5, "mean_seconds": 20, "p90_seconds": 30},
+            ],
+        )
+        scheduler = RenderScheduler(db, SchedulerPolicy(template_caps={"leaderboard": 2}))
+
+        claimed = await scheduler.claim("ae-node-1", n=3)
+
+        # 마감 임박 blind_level 먼저, leaderboard는 실행 중 1개 + 1개까지
+        assert [inst.id for inst in claimed] == [3, 2]
+        assert queue.status()[1] == ("pending", None)
+        assert queue.status()[2] == ("processing", "ae-node-1")
+        assert queue.status()[3] == ("processing", "ae-node-1")
+        assert scheduler.costs.estimate("blind_level") == 30
+
+    async def test_no_candidates(self, db):
+        queue = RenderQueue(db, rows=[queued_row(1, "leaderboard", 2, 10, status="completed")])
+        scheduler = RenderScheduler(db, SchedulerPolicy(), costs=CostModel())
+
+        assert await scheduler.claim("ae-node-1") == []
+        assert queue.status() == {1: ("completed", None)}
+
+
+class TestSimulator:
+    """기록된 큐 재생"""
+
+    def day(self):
+        """1대의 노드에 저우선순위 리더보드가 몰린 상황 + 송출 시각이 있는 블라인드 카드"""
+        jobs = [
+            SimJob(id=i, template_name="leaderboard", priority=5,
+                   created_at=NOW + timedelta(seconds=i), duration_seconds=60)
+            for i in range(1, 11)
+        ]
+        jobs.append(SimJob(
+            id=100, template_name="blind_level", priority=6,
+            created_at=NOW + timedelta(seconds=30),
+            deadline_at=NOW + timedelta(seconds=300), duration_seconds=30,
+        ))
+        jobs.append(SimJob(
+            id=200, template_name="sponsor", priority=9,
+            created_at=NOW + timedelta(seconds=5), duration_seconds=10,
+        ))
+        return jobs
+
+    def test_scheduler_meets_deadline_baseline_misses(self):
+        costs = CostModel(estimates={"blind_level": 30, "leaderboard": 60})
+
+        baseline, scheduled = compare(
+            self.day(),
+            {"baseline": SchedulerPolicy.baseline(), "scheduler": SchedulerPolicy()},
+            workers=1,
+            costs=costs,
+        )
+
+        assert baseline.deadline_jobs == scheduled.deadline_jobs == 1
+        assert baseline.late == 1 and baseline.on_time_rate == 0
+        assert scheduled.on_time == 1 and scheduled.on_time_rate == 1
+        assert baseline.jobs == scheduled.jobs == 12
+
+    def test_aging_reduces_max_wait_for_low_priority(self):
+        """aging이 있으면 priority 9 작업이 전체 큐 뒤로 밀리지 않음"""
+        policy = SchedulerPolicy(aging_seconds=30, use_deadlines=False)
+
+        baseline = simulate(self.day(), SchedulerPolicy.baseline(), workers=1)
+        aged = simulate(self.day(), policy, workers=1)
+
+        assert aged.wait_by_priority[9]["max_seconds"] < baseline.wait_by_priority[9]["max_seconds"]
+        assert baseline.makespan_seconds == aged.makespan_seconds
+
+    def test_from_history_row(self):
+        row = {
+            "id": 1, "template_name": "leaderboard", "priority": 5,
+            "created_at": NOW, "deadline_at": None,
+            "started_at": NOW + timedelta(seconds=5), "completed_at": NOW + timedelta(seconds=47),
+        }
+        failed = {**row, "id": 2, "started_at": None, "completed_at": None}
+        costs = CostModel(estimates={"leaderboard": 12})
+
+        assert SimJob.from_history_row(row).duration_seconds == 42
+        assert SimJob.from_history_row(failed, costs).duration_seconds == 12
@@ -0,0 +1,695 @@
+"""Repository 테스트 (SQL 실행을 기록하는 가짜 DB 사용)"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from shared.db.repositories import (
+    _RENDER_OUTPUT_COLUMNS,
+    HandsRepository,
+    RenderInstructionsRepository,
+    RenderOutputsRepository,
+    TournamentsRepository,
+    diff_standings,
+    select_list,
+)
+from shared.leaderboard import Leaderboard, LeaderboardRegistry
+from shared.models.hand import Hand, HandSummary
+from shared.models.render_instruction import RenderInstruction, RenderInstructionSummary
+from shared.models.tournament import BlindLevel, PlayerStanding, Tournament
+
+
+class FakeDatabase:
+    """실행된 쿼리와 파라미터를 기록하는 Database 대역"""
+
+    def __init__(self, rows=None):
+        self.calls: list[tuple[str, object]] = []
+        self.rows = rows or []
+
+    async def execute(self, query, params=None):
+        self.calls.append((query, params))
+        return self.rows
+
+    async def execute_write(self, query, params=None):
+        self.calls.append((query, params))
+        return 0
+
+    async def execute_write_returning(self, query, params=None):
+        self.calls.append((query, params))
+        return []
+
+    async def execute_many(self, query, params_list):
+        self.calls.append((query, list(params_list)))
+        return len(params_list)
+
+
+class TestHandsInsertMany:
+    """HandsRepository.insert_many 테스트"""
+
+    async def test_chunks_and_serializes(self):
+        """chunk_size 단위 executemany + JSON 컬럼 직렬화"""
+        db = FakeDatabase()
+        repo = HandsRepository(db)
+        hands = (Hand(table_id="feature_1", hand_number=i) for i in range(1, 6))
+
+        stats = await repo.insert_many(hands, chunk_size=2)
+
+        assert stats["rows"] == 5
+        assert stats["chunks"] == 3
+        assert [len(params) for _, params in db.calls] == [2, 2, 1]
+        query, params = db.calls[0]
+        assert "DO NOTHING" in query
+        assert params[0]["players_json"] == "[]"
+
+    async def test_update_on_conflict(self):
+        """on_conflict="update"는 DO UPDATE"""
+        db = FakeDatabase()
+        repo = HandsRepository(db)
+
+        await repo.insert_many([Hand(table_id="t", hand_number=1)], on_conflict="update")
+
+        assert "DO UPDATE SET" in db.calls[0][0]
+
+    async def test_invalid_on_conflict(self):
+        """지원하지 않는 충돌 처리"""
+        repo = HandsRepository(FakeDatabase())
+
+        with pytest.raises(ValueError):
+            await repo.insert_many([], on_conflict="replace")
+
+
+class TestProjection:
+    """컬럼 프로젝션 / 요약 조회 테스트"""
+
+    def test_select_list(self):
+        """JSON 컬럼은 텍스트로 조회"""
+        assert select_list(["id", "players_json"]) == "id, players_json::text AS players_json"
+        assert select_list(["id", "layer_data_json"], alias="ri") == (
+            "ri.id, ri.layer_data_json::text AS layer_data_json"
+        )
+
+    async def test_pending_summaries_skip_json(self):
+        """요약 조회는 JSON 컬럼을 가져오지 않음"""
+        db = FakeDatabase(rows=[
+            {"id": 1, "template_name": "leaderboard", "status": "pending", "priority": 2,
+             "trigger_type": None, "retry_count": 0, "worker_id": None, "created_at": None},
+        ])
+        repo = RenderInstructionsRepository(db)
+
+        summaries = await repo.get_pending_summaries(limit=20)
+
+        query, params = db.calls[0]
+        assert "_json" not in query
+        assert "SELECT * FROM render_instructions" not in query
+        assert params == {"limit": 20}
+        assert isinstance(summaries[0], RenderInstructionSummary)
+        assert summaries[0].template_name == "leaderboard"
+        assert summaries[0].trigger_type == ""
+
+    async def test_render_outputs_projection(self):
+        """렌더링 결과 조회는 컬럼 프로젝션 + 검증 생략 생성"""
+        db = FakeDatabase(rows=[
+            {"id": 3, "instruction_id": 7, "output_path": "/nas/out/7.mov", "file_size": 1024,
+             "frame_count": 300, "status": "completed", "error_message": None,
+             "cache_source_id": None, "created_at": None, "completed_at": None},
+        ])
+        repo = RenderOutputsRepository(db)
+
+        output = await repo.get_by_instruction_id(7)
+        recent = await repo.get_recent(limit=5)
+
+        for query, _ in db.calls:
+            assert "SELECT *" not in query
+            assert select_list(_RENDER_OUTPUT_COLUMNS) in query
+        assert db.calls[1][1] == {"limit": 5}
+        assert output.output_path == "/nas/out/7.mov"
+        assert recent[0].frame_count == 300
+
+    async def test_recent_hands_decode_on_access(self):
+        """전체 조회는 JSON 텍스트를 받아 접근 시 디코딩"""
+        db = FakeDatabase(rows=[{
+            "id": 5, "table_id": "feature_1", "hand_number": 42, "source": "rfid",
+            "hand_rank": "flush", "pot_size": 1000, "winner": None,
+            "players_json": '[{"seat": 1, "name": "John"}]',
+            "community_cards_json": '["Ah", "Kh", "2h"]',
+            "actions_json": "[]",
+            "duration_seconds": None, "created_at": None, "updated_at": None,
+        }])
+        repo = HandsRepository(db)
+
+        hands = await repo.get_recent(limit=1)
+
+        assert "players_json::text AS players_json" in db.calls[0][0]
+        hand = hands[0]
+        assert hand.players.loaded is False
+        assert hand.community_cards == ["Ah", "Kh", "2h"]
+        assert hand.players[0].name == "John"
+        assert hand.to_db_dict()["players_json"] == [
+            {"seat": 1, "name": "John", "stack": 0, "hole_cards": []}
+        ]
+
+    async def test_premium_summaries(self):
+        """프리미엄 요약 조회"""
+        db = FakeDatabase(rows=[
+            {"id": 1, "table_id": "feature_1", "hand_number": 7, "hand_rank": "four_of_a_kind",
+             "pot_size": None, "winner": "John", "created_at": None},
+        ])
+        repo = HandsRepository(db)
+
+        summaries = await repo.get_premium_summaries(limit=5)
+
+        assert "players_json" not in db.calls[0][0]
+        assert isinstance(summaries[0], HandSummary)
+        assert summaries[0].is_premium is True
+        assert summaries[0].pot_size == 0
+
+
+class KeysetFakeDatabase(FakeDatabase):
+    """(created_at, id) keyset 페이지 조회를 흉내 내는 Database 대역 (stream 지원)"""
+
+    def __init__(self, rows):
+        super().__init__(rows=sorted(rows, key=lambda r: (r["created_at"], r["id"])))
+
+    async def stream(self, query, params=None, batch_size=1000):
+        self.calls.append((query, params))
+        rows = self.rows
+        if "after_id" in params:
+            after = (params["after_created_at"], params["after_id"])
+            rows = [r for r in rows if (r["created_at"], r["id"]) > after]
+        if "table_id" in params:
+            rows = [r for r in rows if r["table_id"] == params["table_id"]]
+        if "since" in params:
+            rows = [r for r in rows if r["created_at"] >= params["since"]]
+        rows = rows[: params["page_size"]]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+
+def hand_rows(count: int, tables: int = 1) -> list[dict]:
+    base = datetime(2025, 1, 1, 12, 0)
+    return [
+        {
+            "id": i + 1, "table_id": f"feature_{i % tables + 1}", "hand_number": i + 1,
+            "source": "rfid", "hand_rank": None, "pot_size": 0, "winner": None,
+            "players_json": "[]", "community_cards_json": "[]", "actions_json": "[]",
+            "duration_seconds": None,
+            # 같은 created_at이 겹쳐도 id로 순서 결정
+            "created_at": base + timedelta(seconds=i // 2),
+            "updated_at": None,
+        }
+        for i in range(count)
+    ]
+
+
+class TestIterHands:
+    """HandsRepository.iter_hands keyset 스트리밍 테스트"""
+
+    async def test_pages_through_all_rows(self):
+        """keyset 페이지로 전체 순회 (중복/누락 없음)"""
+        db = KeysetFakeDatabase(hand_rows(25))
+        repo = HandsRepository(db)
+
+        ids = [hand.id async for hand in repo.iter_hands(batch=4, page_size=10)]
+
+        assert ids == list(range(1, 26))
+        assert len(db.calls) == 3
+        first_query, first_params = db.calls[0]
+        assert "after_id" not in first_params
+        assert "OFFSET" not in first_query
+        assert "ORDER BY created_at, id" in first_query
+        assert "(created_at, id) > (:after_created_at, :after_id)" in db.calls[1][0]
+        assert db.calls[1][1]["after_id"] == 10
+
+    async def test_exact_page_multiple(self):
+        """행 수가 페이지 크기의 배수여도 종료"""
+        db = KeysetFakeDatabase(hand_rows(20))
+        repo = HandsRepository(db)
+
+        ids = [hand.id async for hand in repo.iter_hands(page_size=10)]
+
+        assert ids == list(range(1, 21))
+        assert len(db.calls) == 3  # 마지막 빈 페이지로 종료 확인
+
+    async def test_filters(self):
+        """since / table_id 조건"""
+        rows = hand_rows(30, tables=2)
+        since = rows[10]["created_at"]
+        db = KeysetFakeDatabase(rows)
+        repo = HandsRepository(db)
+
+        hands = [h async for h in repo.iter_hands(since=since, table_id="feature_2", page_size=4)]
+
+        assert hands and all(h.table_id == "feature_2" for h in hands)
+        assert all(h.created_at >= since for h in hands)
+        expected = [
+            r["id"] for r in rows
+            if r["table_id"] == "feature_2" and r["created_at"] >= since
+        ]
+        assert [h.id for h in hands] == expected
+        query, params = db.calls[0]
+        assert "created_at >= :since" in query and "table_id = :table_id" in query
+        assert params["table_id"] == "feature_2"
+
+    async def test_early_break_stops_paging(self):
+        """소비자가 중단하면 다음 페이지를 조회하지 않음"""
+        db = KeysetFakeDatabase(hand_rows(50))
+        repo = HandsRepository(db)
+
+        async for hand in repo.iter_hands(batch=2, page_size=10):
+            if hand.id == 3:
+                break
+
+        assert len(db.calls) == 1
+
+    async def test_iter_outputs(self):
+        """render_outputs 스트리밍"""
+        base = datetime(2025, 1, 1)
+        db = KeysetFakeDatabase([
+            {"id": i, "instruction_id": i, "output_path": f"/out/{i}.mov", "file_size": None,
+             "frame_count": None, "status": "completed", "error_message": None,
+             "created_at": base + timedelta(minutes=i), "completed_at": None}
+            for i in range(1, 8)
+        ])
+        repo = RenderOutputsRepository(db)
+
+        outputs = [o async for o in repo.iter_outputs(page_size=3)]
+
+        assert [o.id for o in outputs] == list(range(1, 8))
+        assert outputs[0].file_size == 0
+        assert "FROM render_outputs" in db.calls[0][0]
+
+
+UPDATED_AT = datetime(2025, 1, 20, 12, 0, tzinfo=timezone.utc)
+
+
+class StoredTournamentDatabase(FakeDatabase):
+    """저장된 토너먼트 / 리더보드 행을 돌려주는 Database 대역"""
+
+    def __init__(self, stored=None, updated=True, leaderboard_rows=None):
+        super().__init__()
+        self.stored = stored
+        self.updated = updated
+        self.leaderboard_rows = leaderboard_rows or []
+
+    async def execute(self, query, params=None):
+        self.calls.append((query, params))
+        if "FROM tournament_leaderboard" in query:
+            return self.leaderboard_rows
+        if "FROM tournaments" in query:
+            return [self.stored] if self.stored else []
+        return []
+
+    async def execute_write_returning(self, query, params=None):
+        self.calls.append((query, params))
+        if query.lstrip().startswith("UPDATE") and not self.updated:
+            return []
+        return [{"id": 9, "updated_at": UPDATED_AT}]
+
+    def find(self, prefix: str) -> list[tuple[str, object]]:
+        """prefix로 시작하는 쿼리 호출"""
+        return [(q, p) for q, p in self.calls if q.lstrip().startswith(prefix)]
+
+
+def make_tournament(remaining: int = 300, chips_bump: dict = None) -> Tournament:
+    chips_bump = chips_bump or {}
+    return Tournament(
+        name="Main Event",
+        event_code="WSOP2025-001",
+        remaining_players=remaining,
+        current_level=12,
+        current_blinds=BlindLevel(level=12, small_blind=4000, big_blind=8000, ante=8000),
+        standings=[
+            PlayerStanding(rank=r, name=f"Player {r}", chips=1_000_000 - r + chips_bump.get(r, 0))
+            for r in range(1, remaining + 1)
+        ],
+    )
+
+
+def stored_row(tournament: Tournament) -> dict:
+    """DB에 저장된 형태 (JSON 컬럼은 ::text)"""
+    import json
+
+    db_dict = tournament.to_db_dict()
+    return {
+        "id": 9,
+        "name": db_dict["name"],
+        "total_entries": db_dict["total_entries"],
+        "remaining_players": db_dict["remaining_players"],
+        "current_level": db_dict["current_level"],
+        "current_blinds_json": json.dumps(db_dict["current_blinds_json"]),
+        "standings_json": json.dumps(db_dict["standings_json"]),
+        "updated_at": UPDATED_AT,
+    }
+
+
+class TestTournamentUpsertDiff:
+    """TournamentsRepository.upsert_diff 테스트"""
+
+    def test_diff_standings(self):
+        """같은 길이면 바뀐 인덱스만, 길이가 다르면 None"""
+        old = [{"rank": 1, "chips": 10}, {"rank": 2, "chips": 5}]
+
+        assert diff_standings(old, old) == {}
+        changed = {"rank": 2, "chips": 7}
+        assert diff_standings(old, [old[0], changed]) == {1: changed}
+        assert diff_standings(old, old[:1]) is None
+
+    async def test_skip_noop(self):
+        """변경 없으면 쓰기 생략"""
+        tournament = make_tournament()
+        db = StoredTournamentDatabase(stored_row(tournament))
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        stats = await repo.upsert_diff(make_tournament())
+
+        assert stats["action"] == "skipped"
+        assert stats["bytes_written"] == 0
+        assert stats["bytes_saved"] == stats["bytes_full"] > 0
+        assert len(db.calls) == 1  # SELECT만
+
+    async def test_patch_changed_players(self):
+        """칩 변동 플레이어만 jsonb_set 패치"""
+        db = StoredTournamentDatabase(stored_row(make_tournament()))
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        stats = await repo.upsert_diff(make_tournament(chips_bump={5: 100, 42: -100}))
+
+        assert stats["action"] == "updated"
+        assert stats["changed_columns"] == ["standings_json"]
+        assert stats["standings_patched"] == 2
+        assert stats["bytes_saved"] > stats["bytes_written"] * 10
+
+        [(query, params)] = db.find("UPDATE tournaments")
+        assert query.count("jsonb_set(") == 2
+        assert "'{4}'" in query and "'{41}'" in query
+        assert params["standings_length"] == 300
+        assert "name" not in params
+
+    async def test_elimination_replaces_standings(self):
+        """플레이어 수가 바뀌면 standings_json 전체 교체"""
+        db = StoredTournamentDatabase(stored_row(make_tournament()))
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        stats = await repo.upsert_diff(make_tournament(remaining=299))
+
+        [(query, params)] = db.find("UPDATE tournaments")
+        assert "jsonb_set" not in query
+        assert "standings_json = :standings_json" in query
+        assert "remaining_players = :remaining_players" in query
+        assert "current_blinds_json" not in query
+        assert stats["standings_patched"] is None
+        assert set(stats["changed_columns"]) == {"remaining_players", "standings_json"}
+
+    async def test_insert_when_missing(self):
+        """저장된 행이 없으면 upsert"""
+        db = StoredTournamentDatabase()
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        stats = await repo.upsert_diff(make_tournament(remaining=3))
+
+        assert stats["action"] == "inserted"
+        assert stats["id"] == 9
+        assert stats["bytes_saved"] == 0
+        assert db.find("INSERT INTO tournaments")
+
+    async def test_stale_patch_falls_back_to_upsert(self):
+        """패치 조건이 맞지 않으면 (동시 변경) 전체 upsert"""
+        db = StoredTournamentDatabase(stored_row(make_tournament()), updated=False)
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        stats = await repo.upsert_diff(make_tournament(chips_bump={1: 5}))
+
+        assert db.find("INSERT INTO tournaments")
+        assert stats["bytes_saved"] == 0
+
+
+class TestTournamentLeaderboard:
+    """upsert 시 리더보드 인덱스/테이블 갱신 테스트"""
+
+    @staticmethod
+    def leaderboard_rows(tournament: Tournament) -> list[dict]:
+        return [
+            {"player_name": s.name, "nationality": s.nationality, "chips": s.chips,
+             "table_id": s.table_id, "seat": s.seat}
+            for s in tournament.standings
+        ]
+
+    async def test_upsert_diff_writes_changed_players_only(self):
+        """바뀐 플레이어만 tournament_leaderboard에 기록"""
+        stored = make_tournament(remaining=50)
+        db = StoredTournamentDatabase(
+            stored_row(stored), leaderboard_rows=self.leaderboard_rows(stored)
+        )
+        registry = LeaderboardRegistry()
+        repo = TournamentsRepository(db, leaderboards=registry)
+
+        await repo.upsert_diff(make_tournament(remaining=49, chips_bump={10: 5_000}))
+
+        [(_, params_list)] = db.find("INSERT INTO tournament_leaderboard")
+        assert [p["player_name"] for p in params_list] == ["Player 10"]
+        [(_, params)] = db.find("DELETE FROM tournament_leaderboard")
+        assert params["names"] == ["Player 50"]
+
+        board = registry.get("WSOP2025-001")
+        assert board.rank_of("Player 10") == 1
+        assert board.updated_at == UPDATED_AT
+        assert len(board) == 49
+
+    async def test_stale_board_reloaded_before_diff(self):
+        """다른 프로세스가 갱신했으면 테이블에서 다시 로드한 뒤 비교"""
+        ours = make_tournament(remaining=5)
+        theirs = make_tournament(remaining=5, chips_bump={2: 500})
+        db = StoredTournamentDatabase(
+            stored_row(theirs), leaderboard_rows=self.leaderboard_rows(theirs)
+        )
+        registry = LeaderboardRegistry()
+        registry.put(Leaderboard(
+            "WSOP2025-001", ours.standings, UPDATED_AT - timedelta(seconds=10), tournament_id=9
+        ))
+        repo = TournamentsRepository(db, leaderboards=registry)
+
+        await repo.upsert_diff(ours)
+
+        assert len(db.find("SELECT player_name")) == 1
+        [(_, params_list)] = db.find("INSERT INTO tournament_leaderboard")
+        assert [p["player_name"] for p in params_list] == ["Player 2"]
+        assert params_list[0]["chips"] == ours.standings[1].chips
+
+    async def test_get_leaderboard_uses_memory_until_updated(self):
+        """updated_at이 같으면 메모리 인덱스, 바뀌면 다시 로드"""
+        tournament = make_tournament(remaining=5)
+        db = StoredTournamentDatabase(
+            stored_row(tournament), leaderboard_rows=self.leaderboard_rows(tournament)
+        )
+        repo = TournamentsRepository(db, leaderboards=LeaderboardRegistry())
+
+        board = await repo.get_leaderboard("WSOP2025-001")
+        assert board.top(1)[0]["name"] == "Player 1"
+        assert await repo.get_leaderboard("WSOP2025-001") is board
+        assert len(db.find("SELECT player_name")) == 1
+
+        db.stored = {**db.stored, "updated_at": UPDATED_AT + timedelta(seconds=5)}
+        reloaded = await repo.get_leaderboard("WSOP2025-001")
+        assert reloaded is not board
+        assert len(db.find("SELECT player_name")) == 2
+
+    async def test_get_leaderboard_missing(self):
+        """토너먼트가 없으면 None"""
+        repo = TournamentsRepository(StoredTournamentDatabase(), leaderboards=LeaderboardRegistry())
+
+        assert await repo.get_leaderboard("NOPE") is None
+
+
+class EnqueueFakeDatabase(FakeDatabase):
+    """중복 조회 / 병합 / 저장 결과를 지정하는 Database 대역"""
+
+    def __init__(
+        self,
+        existing=None,
+        coalesced=None,
+        inserted=True,
+        existing_after_conflict=None,
+        coalesce_conflict=False,
+    ):
+        super().__init__()
+        self.existing = existing
+        self.coalesced = coalesced
+        self.inserted = inserted
+        self.existing_after_conflict = existing_after_conflict
+        self.coalesce_conflict = coalesce_conflict
+
+    async def execute(self, query, params=None):
+        self.calls.append((query, params))
+        writes = [q for q, _ in self.calls if "INSERT" in q or "UPDATE" in q]
+        if self.existing_after_conflict and writes:
+            return [self.existing_after_conflict]
+        return [self.existing] if self.existing else []
+
+    async def execute_write_returning(self, query, params=None):
+        self.calls.append((query, params))
+        if "UPDATE render_instructions" in query:
+            if self.coalesce_conflict:
+                orig = Exception("uq_render_instructions_active_content")
+                raise IntegrityError(query, params, orig)
+            return [{"id": self.coalesced}] if self.coalesced else []
+        return [{"id": 11, "notified": ""}] if self.inserted else []
+
+
+def leaderboard_instruction(**layer_data) -> RenderInstruction:
+    return RenderInstruction(
+        template_name="leaderboard",
+        layer_data=layer_data or {"rows": [["John", 1000]]},
+        trigger_type="leaderboard",
+        trigger_id="WSOP2025-001",
+    )
+
+
+class TestRenderEnqueue:
+    """RenderInstructionsRepository.enqueue 중복 제거 / 병합 테스트"""
+
+    def test_content_hash(self):
+        """layer_data 키 순서와 무관, 내용이 바뀌면 다른 해시"""
+        a = RenderInstruction(template_name="t", layer_data={"a": 1, "b": 2})
+        b = RenderInstruction(template_name="t", layer_data={"b": 2, "a": 1})
+        c = RenderInstruction(template_name="t", layer_data={"a": 1, "b": 3})
+        lazy = RenderInstruction.from_trusted_row(
+            {"template_name": "t", "layer_data_json": '{"a": 1, "b": 2}'}
+        )
+
+        assert a.content_hash() == b.content_hash() == lazy.content_hash()
+        assert a.content_hash() != c.content_hash()
+        assert len(a.content_hash()) == 64
+
+    async def test_attach_to_active_job(self):
+        """진행 중인 같은 작업에 합류"""
+        db = EnqueueFakeDatabase(
+            existing={"id": 3, "status": "processing", "output_id": None, "output_path": None}
+        )
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(leaderboard_instruction())
+
+        assert result["action"] == "duplicate" and result["id"] == 3
+        assert len(db.calls) == 1
+        query, params = db.calls[0]
+        assert "content_hash = :content_hash" in query
+        assert params["content_hash"] == leaderboard_instruction().content_hash()
+        assert await repo.insert(leaderboard_instruction()) == 3
+
+    async def test_reuse_completed_output(self):
+        """완료된 작업의 결과 재사용"""
+        db = EnqueueFakeDatabase(
+            existing={"id": 2, "status": "completed", "output_id": 7, "output_path": "/out/a.mov"}
+        )
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(leaderboard_instruction())
+
+        assert result["action"] == "reused_output"
+        assert (result["output_id"], result["output_path"]) == (7, "/out/a.mov")
+
+    async def test_insert_new(self):
+        """중복이 없으면 저장 (진행 중 유니크 인덱스로 경합 방지)"""
+        db = EnqueueFakeDatabase()
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(leaderboard_instruction())
+
+        assert result == {
+            "id": 11, "action": "inserted", "content_hash": result["content_hash"],
+            "output_id": None, "output_path": None,
+        }
+        query, params = db.calls[-1]
+        assert "ON CONFLICT (template_name, content_hash)" in query
+        assert params["content_hash"] == result["content_hash"]
+
+    async def test_reuse_disabled(self):
+        """reuse_outputs=False면 완료 작업은 조회하지 않음"""
+        db = EnqueueFakeDatabase()
+        repo = RenderInstructionsRepository(db)
+
+        await repo.enqueue(leaderboard_instruction(), reuse_outputs=False)
+
+        assert "ri.status = 'completed' AND" not in db.calls[0][0]
+
+    async def test_coalesce_pending_leaderboard(self):
+        """병합 창 안의 같은 트리거 pending 작업을 새 내용으로 교체"""
+        db = EnqueueFakeDatabase(coalesced=5)
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(
+            leaderboard_instruction(rows=[["Jane", 2000]]), coalesce_window=30
+        )
+
+        assert result["action"] == "coalesced" and result["id"] == 5
+        query, params = db.calls[-1]
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert params["coalesce_window"] == 30.0
+        assert params["trigger_id"] == "WSOP2025-001"
+        assert "AND NOT EXISTS" in query
+        assert not any("INSERT" in q for q, _ in db.calls)
+
+    async def test_coalesce_conflict_joins_duplicate(self):
+        """병합 중 동시 등록된 같은 내용과 유니크 충돌하면 그 작업에 합류"""
+        db = EnqueueFakeDatabase(
+            coalesce_conflict=True,
+            existing_after_conflict={
+                "id": 8, "status": "pending", "output_id": None, "output_path": None,
+            },
+        )
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(
+            leaderboard_instruction(rows=[["Jane", 2000]]), coalesce_window=30
+        )
+
+        assert result["action"] == "duplicate" and result["id"] == 8
+        assert not any("INSERT" in q for q, _ in db.calls)
+
+    async def test_coalesce_conflict_without_duplicate_raises(self):
+        """충돌했는데 진행 중 작업이 없으면 (다른 제약) 예외 전파"""
+        db = EnqueueFakeDatabase(coalesce_conflict=True)
+        repo = RenderInstructionsRepository(db)
+
+        with pytest.raises(IntegrityError):
+            await repo.enqueue(leaderboard_instruction(), coalesce_window=30)
+
+    async def test_coalesce_requires_trigger(self):
+        """trigger_type이 없으면 병합하지 않음"""
+        db = EnqueueFakeDatabase()
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(
+            RenderInstruction(template_name="lower_third"), coalesce_window=30
+        )
+
+        assert result["action"] == "inserted"
+        assert not any("UPDATE" in q for q, _ in db.calls)
+
+    async def test_concurrent_duplicate(self):
+        """동시 등록으로 저장이 무시되면 먼저 저장된 작업 반환"""
+        db = EnqueueFakeDatabase(
+            inserted=False,
+            existing_after_conflict={
+                "id": 8, "status": "pending", "output_id": None, "output_path": None,
+            },
+        )
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(leaderboard_instruction())
+
+        assert result["action"] == "duplicate" and result["id"] == 8
+
+    async def test_force_without_dedup(self):
+        """dedup=False면 중복 조회 없이 저장 (content_hash 없음)"""
+        db = EnqueueFakeDatabase(
+            existing={"id": 3, "status": "pending", "output_id": None, "output_path": None}
+        )
+        repo = RenderInstructionsRepository(db)
+
+        result = await repo.enqueue(leaderboard_instruction(), dedup=False)
+
+        assert result["action"] == "inserted"
+        assert len(db.calls) == 1
+        assert db.calls[0][1]["content_hash"] is None
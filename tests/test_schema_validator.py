@@ -0,0 +1,293 @@
+"""SchemaValidator 테스트 (컴파일 모드 ↔ 기본 검증기 동일성)"""
+
+import copy
+import os
+import random
+
+import pytest
+
+from shared.validators import SchemaValidator
+from shared.validators.compiled import UnsupportedSchemaError, compile_schema
+from shared.validators.schema_validator import SCHEMA_BASE_PATH
+
+# 스키마별 유효한 기준 문서 (변형하여 컨포먼스 코퍼스 생성)
+VALID_DOCUMENTS = {
+    "gfx/hand": {
+        "HandNum": 3,
+        "GameVariant": "HOLDEM",
+        "Duration": "PT2M56.26S",
+        "NumBoards": 1,
+        "Players": [
+            {"PlayerNum": 1, "Name": "Alice", "HoleCards": ["As", "Kd"],
+             "Stats": {"VPIPPercent": 20.5}},
+        ],
+        "Events": [
+            {"Type": "BET", "PlayerNum": 1, "BetAmt": 100},
+            {"Type": "BOARD_CARD", "BoardCards": ["2c", "3d", "4h"]},
+            {"Type": "WIN", "PlayerNum": 1, "WonAmt": 5},
+        ],
+        "FlopDrawBlinds": {"ButtonPlayerNum": 1, "AnteType": "NONE"},
+    },
+    "gfx/session": {"ID": 638961999170907267, "Type": "FEATURE_TABLE", "Hands": [{"HandNum": 1}]},
+    "render/instruction": {
+        "template_name": "leaderboard",
+        "layer_data": {},
+        "output_settings": {"format": "mp4", "width": 1920},
+        "priority": 3,
+        "status": "pending",
+    },
+    "wsop/tournament": {
+        "name": "Main Event",
+        "event_code": "WSOP2025-001",
+        "event_type": "HOLDEM",
+        "blinds": [{"level": 1, "small_blind": 100, "big_blind": 200}],
+        "payouts": [{"position": 1, "amount": 100}],
+        "standings": [{"rank": 1, "name": "Alice", "nationality": "KR", "chips": 10}],
+        "source": "csv",
+    },
+}
+
+# 변형 시 대입할 값 (bool/int 구분, 정수형 float, 길이 제한 등 경계 포함)
+MUTATION_VALUES = [
+    None, True, False, 0, -1, 1.0, 1.5, 11, "", "x", "ZZ", "As", "BET", "WIN",
+    "BOARD_CARD", [], [1], ["As", "Kh", "Qd", "Jc", "Tc"], {}, {"a": 1}, 2**40, "a" * 300,
+]
+
+
+def _paths(doc, prefix=()):
+    yield prefix
+    if isinstance(doc, dict):
+        for key, value in doc.items():
+            yield from _paths(value, prefix + (key,))
+    elif isinstance(doc, list):
+        for index, value in enumerate(doc):
+            yield from _paths(value, prefix + (index,))
+
+
+def _mutate(doc, rng):
+    doc = copy.deepcopy(doc)
+    paths = [path for path in _paths(doc) if path]
+    for _ in range(rng.randint(1, 3)):
+        path = rng.choice(paths)
+        parent = doc
+        try:
+            for key in path[:-1]:
+                parent = parent[key]
+            if isinstance(parent, dict) and rng.random() < 0.15:
+                parent.pop(path[-1], None)
+            else:
+                parent[path[-1]] = copy.deepcopy(rng.choice(MUTATION_VALUES))
+        except (KeyError, IndexError, TypeError):
+            pass
+    return doc
+
+
+def _corpus(schema_id, size=300, seed=2025):
+    rng = random.Random(seed)
+    base = VALID_DOCUMENTS[schema_id]
+    yield base
+    for _ in range(size):
+        yield _mutate(base, rng)
+
+
+@pytest.fixture
+def compiled_mode():
+    SchemaValidator.set_compiled_mode(True)
+    yield
+    SchemaValidator.set_compiled_mode(False)
+
+
+class TestSchemaValidator:
+    """기본 검증기 테스트"""
+
+    def test_relative_refs_resolved(self):
+        """다른 파일의 $ref (player.schema.json, ../common/...) 해석"""
+        valid, errors = SchemaValidator.validate(
+            {"HandNum": 1, "Players": [{"PlayerNum": 1, "Name": "A", "HoleCards": ["Zz"]}]},
+            "gfx/hand",
+        )
+
+        assert valid is False
+        assert errors == [
+            "[Players -> 0 -> HoleCards -> 0] 'Zz' does not match '^([2-9TJQKA])([hdcs])$'"
+        ]
+
+
+class TestSchemaRegistry:
+    """registry.json 기반 인덱스 / 지연 로드 / 번들 테스트"""
+
+    def setup_method(self):
+        SchemaValidator.clear_cache()
+
+    def teardown_method(self):
+        SchemaValidator.clear_cache()
+
+    def test_list_schemas_matches_files(self):
+        """registry.json 목록이 실제 스키마 파일과 일치"""
+        files = sorted(
+            str(path.relative_to(SCHEMA_BASE_PATH)).replace(os.sep, "/").replace(".schema.json", "")
+            for path in SCHEMA_BASE_PATH.rglob("*.schema.json")
+        )
+
+        assert SchemaValidator.list_schemas() == files
+
+    def test_ids_match_index(self):
+        """각 스키마의 $id가 인덱스 URI와 일치 (지연 $ref 해석의 전제)"""
+        for schema_id in SchemaValidator.list_schemas():
+            schema = SchemaValidator.load_schema(schema_id)
+            assert SchemaValidator._uris[schema["$id"]] == schema_id
+
+    def test_lazy_loading(self):
+        """참조되는 스키마만 로드"""
+        SchemaValidator.validate({"template_name": "x", "layer_data": {}}, "render/instruction")
+
+        assert sorted(SchemaValidator._schemas) == ["common/enums", "render/instruction"]
+
+    def test_bundle_round_trip(self, tmp_path):
+        """번들 저장 후 로드 시 파일을 읽지 않고 스키마 캐시 구성"""
+        bundle = tmp_path / "schemas.pickle"
+        assert SchemaValidator.build_bundle(bundle) == len(SchemaValidator.list_schemas())
+
+        SchemaValidator.clear_cache()
+        assert SchemaValidator.load_bundle(bundle) is True
+        assert sorted(SchemaValidator._schemas) == SchemaValidator.list_schemas()
+
+        valid, errors = SchemaValidator.validate({"HandNum": True}, "gfx/hand")
+        assert valid is False
+        assert errors == ["[HandNum] True is not of type 'integer'"]
+
+    def test_stale_bundle_ignored(self, tmp_path, monkeypatch):
+        """스키마 파일이 바뀐 번들은 무시"""
+        bundle = tmp_path / "schemas.pickle"
+        SchemaValidator.build_bundle(bundle)
+        SchemaValidator.clear_cache()
+
+        fingerprint = SchemaValidator._fingerprint()
+        fingerprint[0] = (fingerprint[0][0], fingerprint[0][1] + 1, fingerprint[0][2])
+        monkeypatch.setattr(SchemaValidator, "_fingerprint", classmethod(lambda cls: fingerprint))
+
+        assert SchemaValidator.load_bundle(bundle) is False
+
+        assert SchemaValidator._schemas == {}
+
+    def test_missing_bundle(self, tmp_path):
+        """번들 파일이 없으면 False (일반 로드로 진행)"""
+        assert SchemaValidator.load_bundle(tmp_path / "missing.pickle") is False
+
+
+class TestCompiledValidator:
+    """컴파일 모드 컨포먼스 테스트"""
+
+    @pytest.mark.parametrize("schema_id", sorted(VALID_DOCUMENTS))
+    def test_conformance_corpus(self, schema_id):
+        """변형 코퍼스에서 기본 검증기와 같은 에러 (순서/경로/메시지 포함)"""
+        for doc in _corpus(schema_id):
+            SchemaValidator.set_compiled_mode(False)
+            expected = SchemaValidator.validate(doc, schema_id)
+            SchemaValidator.set_compiled_mode(True)
+            try:
+                actual = SchemaValidator.validate(doc, schema_id)
+                fast = SchemaValidator.is_valid(doc, schema_id)
+            finally:
+                SchemaValidator.set_compiled_mode(False)
+
+            assert actual == expected, doc
+            assert fast is expected[0], doc
+
+    def test_all_schemas_compile(self):
+        """등록된 모든 스키마가 컴파일 가능"""
+        for schema_id in SchemaValidator.list_schemas():
+            assert SchemaValidator.get_compiled(schema_id) is not None, schema_id
+
+    def test_is_valid(self, compiled_mode):
+        """boolean 경로"""
+        assert SchemaValidator.is_valid({"HandNum": 1}, "gfx/hand") is True
+        assert SchemaValidator.is_valid({"HandNum": True}, "gfx/hand") is False
+        assert SchemaValidator.is_valid({"HandNum": 2.0}, "gfx/hand") is True
+
+    def test_inline_schema_matches_jsonschema(self):
+        """enum/const 비교 규칙, 추가 속성 에러 순서가 Draft202012Validator와 동일"""
+        from jsonschema import Draft202012Validator
+
+        schema = {
+            "$id": "https://example/inline",
+            "type": "object",
+            "properties": {
+                "flag": {"const": True},
+                "mode": {"enum": [1, [0, False], {"a": None}]},
+                "meta": {"type": "object", "additionalProperties": False},
+            },
+            "additionalProperties": {"type": "integer"},
+        }
+        compiled = compile_schema(schema, SchemaValidator._get_registry())
+        expected = Draft202012Validator(schema)
+
+        for doc in (
+            {"flag": True, "mode": [0, False], "z": 1},
+            {"flag": 1, "mode": 1.0},
+            {"mode": True},
+            {"mode": [False, 0]},
+            {"mode": {"a": None}, "meta": {"b": 1}},
+            {"meta": {"x": 1, "b": 2, "a": 3}},
+            {"z": "a", "b": "b", "y": None, "flag": False},
+        ):
+            # jsonschema는 추가 속성을 set으로 모아 순서가 실행마다 다를 수 있음
+            errors = [
+                (tuple(e.absolute_path), e.message) for e in expected.iter_errors(doc)
+            ]
+            assert sorted(compiled.iter_errors(doc)) == sorted(errors), doc
+            assert compiled.is_valid(doc) is (not errors), doc
+
+        # 컴파일 검증기는 키워드 순서 (properties → additionalProperties), 추가 속성은 문서 순서
+        doc = {"z": "a", "b": "b", "y": None, "flag": False}
+        assert [path for path, _ in compiled.iter_errors(doc)] == [
+            ("flag",), ("z",), ("b",), ("y",)
+        ]
+
+    def test_unsupported_keyword(self):
+        """지원하지 않는 키워드는 UnsupportedSchemaError"""
+        with pytest.raises(UnsupportedSchemaError):
+            compile_schema(
+                {"$id": "https://example/x", "oneOf": [{"type": "string"}]},
+                SchemaValidator._get_registry(),
+            )
+
+
+class TestValidateMany:
+    """일괄 검증 테스트"""
+
+    def _items(self):
+        return [
+            {"HandNum": 1},
+            {"HandNum": True},
+            {"HandNum": 3, "Players": [{"PlayerNum": 1, "Name": "A", "HoleCards": ["Zz"]}]},
+            {"HandNum": 4},
+        ]
+
+    def test_inline_indexed_paths(self):
+        """순서 유지 + 에러 경로 앞에 항목 인덱스"""
+        results = SchemaValidator.validate_many(self._items(), "gfx/hand", workers=1)
+
+        assert [valid for valid, _ in results] == [True, False, False, True]
+        assert results[1][1] == ["[1 -> HandNum] True is not of type 'integer'"]
+        assert results[2][1] == [
+            "[2 -> Players -> 0 -> HoleCards -> 0] 'Zz' does not match '^([2-9TJQKA])([hdcs])$'"
+        ]
+
+    def test_process_pool_matches_inline(self):
+        """프로세스 풀 결과가 단일 프로세스 결과와 동일"""
+        items = self._items() * 5
+
+        inline = SchemaValidator.validate_many(items, "gfx/hand", workers=1)
+        pooled = SchemaValidator.validate_many(items, "gfx/hand", workers=2, chunk_size=3)
+
+        assert pooled == inline
+
+    def test_empty(self):
+        """빈 목록"""
+        assert SchemaValidator.validate_many([], "gfx/hand") == []
+
+    def test_invalid_chunk_size(self):
+        """chunk_size 검증"""
+        with pytest.raises(ValueError):
+            SchemaValidator.validate_many(self._items(), "gfx/hand", workers=2, chunk_size=0)